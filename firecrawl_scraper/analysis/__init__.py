@@ -20,6 +20,7 @@ from .insight_rules import (
     GridRankingRule,
     RuleEngine,
 )
+from .feature_table import FeatureTable
 from .scoring import OpportunityScorer, PriorityCalculator
 from .matrix_builder import MatrixBuilder
 
@@ -35,6 +36,7 @@ __all__ = [
     'ContentDepthRule',
     'GridRankingRule',
     'RuleEngine',
+    'FeatureTable',
     'OpportunityScorer',
     'PriorityCalculator',
     'MatrixBuilder',
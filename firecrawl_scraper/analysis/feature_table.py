@@ -0,0 +1,276 @@
+"""
+Feature Table - competitor features extracted once, shared by all rules
+
+Rules used to walk every CompetitorProfile to compute the same counts,
+averages and leaders. FeatureTable extracts each declared feature into a
+column in a single pass over the profiles and caches the aggregates, so
+ScoreStage and every InsightRule read from the same table.
+
+Columns are NumPy float arrays when NumPy is installed (plain lists
+otherwise). A missing value is NaN; a feature is "present" for a
+competitor when it is neither missing nor zero - the same truthiness the
+rules always used (`if c.trust_signals.review_count`).
+
+Usage:
+    table = FeatureTable(competitors, ['review_count', 'chat_widget'])
+    table.count('chat_widget')        # competitors offering chat
+    table.mean('review_count')        # average over competitors with reviews
+    table.leader('review_count')      # row of the review leader
+"""
+
+import logging
+import math
+import time
+from typing import Any, Callable, Dict, Iterable, List, Optional
+
+from ..models import CompetitorProfile
+
+try:
+    import numpy as np
+    HAS_NUMPY = True
+except ImportError:
+    HAS_NUMPY = False
+
+logger = logging.getLogger(__name__)
+
+
+REPLAY_INDICATORS = ('multiple endings', 'replay', 'different outcomes', 'new experience')
+
+
+def _avg_grid_rank(profile: CompetitorProfile) -> Optional[float]:
+    ranks = profile.grid_performance
+    return sum(ranks.values()) / len(ranks) if ranks else None
+
+
+def _has_replay_value(profile: CompetitorProfile) -> bool:
+    return any(
+        any(ind in feat.lower() for ind in REPLAY_INDICATORS)
+        for feat in profile.trust_signals.unique_features
+    )
+
+
+# Feature name -> extractor. Lists are stored as their length, flags as 0/1.
+FEATURES: Dict[str, Callable[[CompetitorProfile], Any]] = {
+    # Trust
+    'review_count': lambda c: c.trust_signals.review_count,
+    'rating': lambda c: c.trust_signals.rating,
+    'certifications': lambda c: len(c.trust_signals.certifications),
+    'licenses_shown': lambda c: c.trust_signals.licenses_shown,
+    'insurance_shown': lambda c: c.trust_signals.insurance_shown,
+    'certs_or_licenses': lambda c: bool(c.trust_signals.certifications) or c.trust_signals.licenses_shown,
+    'before_after_gallery': lambda c: c.trust_signals.before_after_gallery,
+    'warranty_language': lambda c: bool(c.trust_signals.warranty_guarantee_language),
+    'team_visible': lambda c: c.trust_signals.team_photos or c.trust_signals.owner_visible,
+    'experience_photos': lambda c: c.trust_signals.experience_photos,
+    'promo_video': lambda c: c.trust_signals.promo_video,
+    'unique_features': lambda c: len(c.trust_signals.unique_features),
+    'awards_shown': lambda c: len(c.trust_signals.awards_shown),
+    'experience_count': lambda c: c.trust_signals.experience_count,
+    'replay_value': _has_replay_value,
+    'credentials_shown': lambda c: len(c.trust_signals.credentials_shown),
+    'board_certifications': lambda c: len(c.trust_signals.board_certifications),
+    # Conversion
+    'sticky_cta': lambda c: c.conversion_mechanics.sticky_cta or c.conversion_mechanics.sticky_call,
+    'chat_widget': lambda c: c.conversion_mechanics.chat_widget,
+    'form_length': lambda c: c.conversion_mechanics.form_length,
+    'phone_clickable': lambda c: c.conversion_mechanics.phone_clickable,
+    'online_booking': lambda c: c.conversion_mechanics.online_booking,
+    'availability_calendar': lambda c: c.conversion_mechanics.availability_calendar,
+    'group_booking_options': lambda c: c.conversion_mechanics.group_booking_options,
+    'party_packages': lambda c: c.conversion_mechanics.party_packages,
+    'corporate_booking': lambda c: c.conversion_mechanics.corporate_booking,
+    'gift_cards': lambda c: c.conversion_mechanics.gift_cards,
+    'online_scheduling': lambda c: c.conversion_mechanics.online_scheduling,
+    'patient_portal': lambda c: c.conversion_mechanics.patient_portal,
+    # Content / structure
+    'deep_service_pages': lambda c: sum(
+        1 for p in c.seo_structure.service_pages if p.word_count and p.word_count > 1500
+    ),
+    'blog_active': lambda c: c.seo_structure.blog_active,
+    'schema_markup': lambda c: len(c.seo_structure.schema_markup),
+    # Local SEO / backlinks
+    'service_area_pages': lambda c: len(c.seo_structure.service_area_pages),
+    'avg_grid_rank': _avg_grid_rank,
+    'domain_authority': lambda c: c.backlinks.domain_authority,
+}
+
+
+class FeatureTable:
+    """
+    Columnar view of competitor features with cached aggregates
+
+    Rows follow the order of `competitors`, so a row index maps straight
+    back to its CompetitorProfile.
+    """
+
+    def __init__(
+        self,
+        competitors: List[CompetitorProfile],
+        features: Optional[Iterable[str]] = None
+    ):
+        """
+        Args:
+            competitors: Profiles to tabulate
+            features: Feature names to extract up front (default: all).
+                Other features are extracted on first use.
+        """
+        self.competitors = list(competitors)
+        self._raw: Dict[str, List[Any]] = {}
+        self._columns: Dict[str, Any] = {}
+        self._cache: Dict[tuple, Any] = {}
+        self.build_seconds = 0.0
+        self.ensure(FEATURES if features is None else features)
+
+    def __len__(self) -> int:
+        return len(self.competitors)
+
+    @property
+    def features(self) -> List[str]:
+        return list(self._columns)
+
+    def ensure(self, features: Iterable[str]):
+        """Extract any missing features in one pass over the profiles"""
+        missing = [name for name in dict.fromkeys(features) if name not in self._columns]
+        if not missing:
+            return
+        unknown = [name for name in missing if name not in FEATURES]
+        if unknown:
+            raise ValueError(f"Unknown competitor features: {', '.join(unknown)}")
+
+        started = time.perf_counter()
+        extractors = [FEATURES[name] for name in missing]
+        raw: List[List[Any]] = [[] for _ in missing]
+        for profile in self.competitors:
+            for values, extract in zip(raw, extractors):
+                values.append(extract(profile))
+
+        for name, values in zip(missing, raw):
+            column = [math.nan if v is None else float(v) for v in values]
+            self._raw[name] = values
+            self._columns[name] = np.array(column, dtype=float) if HAS_NUMPY else column
+
+        elapsed = time.perf_counter() - started
+        self.build_seconds += elapsed
+        logger.debug(f"Feature table: {len(missing)} features x {len(self)} competitors in {elapsed * 1000:.1f}ms")
+
+    # ========================================================================
+    # COLUMNS
+    # ========================================================================
+
+    def column(self, name: str):
+        """Feature column (NaN where missing)"""
+        if name not in self._columns:
+            self.ensure([name])
+        return self._columns[name]
+
+    def value(self, name: str, row: int) -> Any:
+        """Original (unconverted) feature value of one competitor"""
+        self.column(name)
+        return self._raw[name][row]
+
+    def mask(self, name: str):
+        """Per-row presence: not missing and not zero"""
+        key = ('mask', name)
+        if key not in self._cache:
+            col = self.column(name)
+            if HAS_NUMPY:
+                self._cache[key] = ~np.isnan(col) & (col != 0)
+            else:
+                self._cache[key] = [v == v and v != 0 for v in col]
+        return self._cache[key]
+
+    def rows(self, name: str, at_most: Optional[float] = None) -> List[int]:
+        """Rows where the feature is present (and <= at_most, if given)"""
+        key = ('rows', name, at_most)
+        if key not in self._cache:
+            col, mask = self.column(name), self.mask(name)
+            if HAS_NUMPY:
+                if at_most is not None:
+                    mask = mask & (col <= at_most)
+                rows = np.flatnonzero(mask).tolist()
+            else:
+                rows = [
+                    i for i, (v, present) in enumerate(zip(col, mask))
+                    if present and (at_most is None or v <= at_most)
+                ]
+            self._cache[key] = rows
+        return self._cache[key]
+
+    def profiles(self, name: str) -> List[CompetitorProfile]:
+        """Competitors for which the feature is present"""
+        return [self.competitors[i] for i in self.rows(name)]
+
+    # ========================================================================
+    # AGGREGATES
+    # ========================================================================
+
+    def count(self, name: str) -> int:
+        """Number of competitors for which the feature is present"""
+        key = ('count', name)
+        if key not in self._cache:
+            mask = self.mask(name)
+            self._cache[key] = int(mask.sum()) if HAS_NUMPY else sum(mask)
+        return self._cache[key]
+
+    def mean(self, name: str, present_only: bool = True) -> Optional[float]:
+        """
+        Average of the feature.
+
+        Args:
+            present_only: Average only competitors where it is present;
+                otherwise missing values count as zero over all rows.
+
+        Returns:
+            None when there is nothing to average
+        """
+        key = ('mean', name, present_only)
+        if key not in self._cache:
+            col = self.column(name)
+            if present_only:
+                values = self._present(name)
+            elif HAS_NUMPY:
+                values = np.nan_to_num(col)
+            else:
+                values = [v if v == v else 0.0 for v in col]
+            if len(values) == 0:
+                result = None
+            elif HAS_NUMPY:
+                result = float(np.mean(values))
+            else:
+                result = sum(values) / len(values)
+            self._cache[key] = result
+        return self._cache[key]
+
+    def max(self, name: str) -> Optional[float]:
+        """Largest present value, or None"""
+        key = ('max', name)
+        if key not in self._cache:
+            values = self._present(name)
+            if len(values) == 0:
+                result = None
+            else:
+                result = float(np.max(values)) if HAS_NUMPY else max(values)
+            self._cache[key] = result
+        return self._cache[key]
+
+    def leader(self, name: str) -> Optional[int]:
+        """Row with the largest present value (first on ties), or None"""
+        key = ('leader', name)
+        if key not in self._cache:
+            rows = self.rows(name)
+            if not rows:
+                result = None
+            elif HAS_NUMPY:
+                col = self.column(name)
+                result = int(np.argmax(np.where(self.mask(name), col, -np.inf)))
+            else:
+                col = self.column(name)
+                result = max(rows, key=lambda i: col[i])
+            self._cache[key] = result
+        return self._cache[key]
+
+    def _present(self, name: str):
+        col = self.column(name)
+        if HAS_NUMPY:
+            return col[self.mask(name)]
+        return [col[i] for i in self.rows(name)]
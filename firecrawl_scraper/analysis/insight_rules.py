@@ -8,8 +8,9 @@ Vertical-aware: Rules are dispatched based on client vertical type.
 """
 
 import logging
+import time
 from abc import ABC, abstractmethod
-from typing import List, Optional, Dict, Any, Type
+from typing import List, Optional, Dict, Any, Tuple, Type
 from datetime import datetime
 import uuid
 
@@ -28,20 +29,33 @@ from ..models.entities import (
     ENTERTAINMENT_VERTICALS,
     HEALTHCARE_VERTICALS,
 )
+from .feature_table import FeatureTable
 
 logger = logging.getLogger(__name__)
 
 
 class InsightRule(ABC):
-    """Base class for insight rules"""
+    """
+    Base class for insight rules
+
+    Rules declare the competitor `features` they read and evaluate against
+    a shared FeatureTable instead of walking the profiles themselves.
+    """
 
     rule_id: str = "base_rule"
     category: FindingCategory = FindingCategory.TRUST
     description: str = "Base insight rule"
+    features: Tuple[str, ...] = ()
 
-    def __init__(self, client: Client, competitors: List[CompetitorProfile]):
+    def __init__(
+        self,
+        client: Client,
+        competitors: List[CompetitorProfile],
+        table: Optional[FeatureTable] = None
+    ):
         self.client = client
         self.competitors = competitors
+        self.table = table if table is not None else FeatureTable(competitors, self.features)
         self.findings: List[Finding] = []
 
     @abstractmethod
@@ -80,20 +94,13 @@ class BacklinkGapRule(InsightRule):
     rule_id = "backlink_gap"
     category = FindingCategory.BACKLINKS
     description = "Compare domain authority and backlink profiles"
+    features = ('domain_authority',)
 
     def evaluate(self) -> List[Finding]:
         findings = []
 
-        authorities = [
-            c.backlinks.domain_authority
-            for c in self.competitors
-            if c.backlinks.domain_authority
-        ]
-
-        if authorities:
-            avg_authority = sum(authorities) / len(authorities)
-            max_authority = max(authorities)
-
+        avg_authority = self.table.mean('domain_authority')
+        if avg_authority is not None:
             findings.append(self._create_finding(
                 finding_type=FindingType.PATTERN,
                 observation=f"Competitor average domain authority: {avg_authority:.0f}/100",
@@ -102,14 +109,13 @@ class BacklinkGapRule(InsightRule):
             ))
 
             # Find authority leader
-            leader = max(self.competitors, key=lambda c: c.backlinks.domain_authority or 0)
-            if leader.backlinks.domain_authority:
-                findings.append(self._create_finding(
-                    finding_type=FindingType.THREAT,
-                    observation=f"{leader.domain} leads with authority {leader.backlinks.domain_authority}/100",
-                    severity=Severity.HIGH,
-                    competitor_refs=[leader.id]
-                ))
+            leader = self.table.competitors[self.table.leader('domain_authority')]
+            findings.append(self._create_finding(
+                finding_type=FindingType.THREAT,
+                observation=f"{leader.domain} leads with authority {leader.backlinks.domain_authority}/100",
+                severity=Severity.HIGH,
+                competitor_refs=[leader.id]
+            ))
 
         return findings
 
@@ -120,20 +126,13 @@ class ReviewVisibilityRule(InsightRule):
     rule_id = "review_visibility"
     category = FindingCategory.TRUST
     description = "Compare review counts and ratings across competitors"
+    features = ('review_count', 'rating')
 
     def evaluate(self) -> List[Finding]:
         findings = []
 
-        reviews = [
-            (c, c.trust_signals.review_count)
-            for c in self.competitors
-            if c.trust_signals.review_count
-        ]
-
-        if reviews:
-            review_counts = [r[1] for r in reviews]
-            avg_reviews = sum(review_counts) / len(review_counts)
-
+        avg_reviews = self.table.mean('review_count')
+        if avg_reviews is not None:
             findings.append(self._create_finding(
                 finding_type=FindingType.PATTERN,
                 observation=f"Average competitor review count: {avg_reviews:.0f}",
@@ -142,29 +141,23 @@ class ReviewVisibilityRule(InsightRule):
             ))
 
             # Check for review leaders
-            leader = max(reviews, key=lambda x: x[1])
+            leader = self.table.competitors[self.table.leader('review_count')]
             findings.append(self._create_finding(
                 finding_type=FindingType.PATTERN,
-                observation=f"{leader[0].domain} leads with {leader[1]} reviews",
+                observation=f"{leader.domain} leads with {leader.trust_signals.review_count} reviews",
                 severity=Severity.MEDIUM,
-                competitor_refs=[leader[0].id]
+                competitor_refs=[leader.id]
             ))
 
         # Check rating patterns
-        ratings = [
-            c.trust_signals.rating
-            for c in self.competitors
-            if c.trust_signals.rating
-        ]
-        if ratings:
-            avg_rating = sum(ratings) / len(ratings)
-            if avg_rating >= 4.5:
-                findings.append(self._create_finding(
-                    finding_type=FindingType.PATTERN,
-                    observation=f"High rating standard in market (avg: {avg_rating:.1f})",
-                    severity=Severity.MEDIUM,
-                    data_points=DataPoints(benchmark=avg_rating)
-                ))
+        avg_rating = self.table.mean('rating')
+        if avg_rating is not None and avg_rating >= 4.5:
+            findings.append(self._create_finding(
+                finding_type=FindingType.PATTERN,
+                observation=f"High rating standard in market (avg: {avg_rating:.1f})",
+                severity=Severity.MEDIUM,
+                data_points=DataPoints(benchmark=avg_rating)
+            ))
 
         return findings
 
@@ -175,35 +168,36 @@ class CertificationCheckRule(InsightRule):
     rule_id = "certification_check"
     category = FindingCategory.TRUST
     description = "Analyze certification and license display patterns"
+    features = ('certifications', 'licenses_shown', 'insurance_shown')
 
     def evaluate(self) -> List[Finding]:
         findings = []
 
-        with_certs = [c for c in self.competitors if c.trust_signals.certifications]
-        with_licenses = [c for c in self.competitors if c.trust_signals.licenses_shown]
-        with_insurance = [c for c in self.competitors if c.trust_signals.insurance_shown]
+        with_certs = self.table.count('certifications')
+        with_licenses = self.table.count('licenses_shown')
+        with_insurance = self.table.count('insurance_shown')
 
-        total = len(self.competitors)
+        total = len(self.table)
 
-        if len(with_certs) >= total * 0.5:
+        if with_certs >= total * 0.5:
             findings.append(self._create_finding(
                 finding_type=FindingType.PATTERN,
-                observation=f"{len(with_certs)}/{total} competitors display certifications",
+                observation=f"{with_certs}/{total} competitors display certifications",
                 severity=Severity.MEDIUM,
                 details="Certification visibility is industry standard"
             ))
 
-        if len(with_licenses) >= total * 0.5:
+        if with_licenses >= total * 0.5:
             findings.append(self._create_finding(
                 finding_type=FindingType.PATTERN,
-                observation=f"{len(with_licenses)}/{total} competitors show licenses",
+                observation=f"{with_licenses}/{total} competitors show licenses",
                 severity=Severity.MEDIUM
             ))
 
-        if len(with_insurance) >= total * 0.5:
+        if with_insurance >= total * 0.5:
             findings.append(self._create_finding(
                 finding_type=FindingType.PATTERN,
-                observation=f"{len(with_insurance)}/{total} competitors mention insurance",
+                observation=f"{with_insurance}/{total} competitors mention insurance",
                 severity=Severity.LOW
             ))
 
@@ -216,21 +210,22 @@ class GalleryPresenceRule(InsightRule):
     rule_id = "gallery_presence"
     category = FindingCategory.TRUST
     description = "Analyze visual proof and gallery usage"
+    features = ('before_after_gallery',)
 
     def evaluate(self) -> List[Finding]:
         findings = []
 
-        with_gallery = [c for c in self.competitors if c.trust_signals.before_after_gallery]
-        total = len(self.competitors)
+        with_gallery = self.table.count('before_after_gallery')
+        total = len(self.table)
 
-        if len(with_gallery) >= total * 0.5:
+        if with_gallery >= total * 0.5:
             findings.append(self._create_finding(
                 finding_type=FindingType.PATTERN,
-                observation=f"{len(with_gallery)}/{total} competitors have before/after galleries",
+                observation=f"{with_gallery}/{total} competitors have before/after galleries",
                 severity=Severity.HIGH,
                 details="Visual proof is table stakes in this industry"
             ))
-        elif len(with_gallery) < total * 0.3:
+        elif with_gallery < total * 0.3:
             findings.append(self._create_finding(
                 finding_type=FindingType.OPPORTUNITY,
                 observation="Few competitors have before/after galleries",
@@ -247,27 +242,25 @@ class ServiceAreaCoverageRule(InsightRule):
     rule_id = "service_area_coverage"
     category = FindingCategory.LOCAL_SEO
     description = "Compare service area page strategies"
+    features = ('service_area_pages',)
 
     def evaluate(self) -> List[Finding]:
         findings = []
 
-        area_counts = [
-            (c, len(c.seo_structure.service_area_pages))
-            for c in self.competitors
-        ]
-
-        if area_counts:
-            max_count = max(area_counts, key=lambda x: x[1])
-            if max_count[1] >= 5:
+        if len(self.table):
+            leader = self.table.leader('service_area_pages')
+            max_count = self.table.value('service_area_pages', leader) if leader is not None else 0
+            if max_count >= 5:
+                comp = self.table.competitors[leader]
                 findings.append(self._create_finding(
                     finding_type=FindingType.PATTERN,
-                    observation=f"{max_count[0].domain} has {max_count[1]} service area pages",
+                    observation=f"{comp.domain} has {max_count} service area pages",
                     severity=Severity.HIGH,
-                    competitor_refs=[max_count[0].id],
+                    competitor_refs=[comp.id],
                     details="Strong local SEO strategy"
                 ))
 
-            avg_pages = sum(a[1] for a in area_counts) / len(area_counts)
+            avg_pages = self.table.mean('service_area_pages', present_only=False)
             findings.append(self._create_finding(
                 finding_type=FindingType.PATTERN,
                 observation=f"Average service area pages: {avg_pages:.1f}",
@@ -284,20 +277,18 @@ class StickyCTARule(InsightRule):
     rule_id = "sticky_cta"
     category = FindingCategory.CONVERSION
     description = "Analyze sticky CTA and conversion element usage"
+    features = ('sticky_cta',)
 
     def evaluate(self) -> List[Finding]:
         findings = []
 
-        with_sticky = [
-            c for c in self.competitors
-            if c.conversion_mechanics.sticky_cta or c.conversion_mechanics.sticky_call
-        ]
-        total = len(self.competitors)
+        with_sticky = self.table.count('sticky_cta')
+        total = len(self.table)
 
-        if len(with_sticky) >= total * 0.5:
+        if with_sticky >= total * 0.5:
             findings.append(self._create_finding(
                 finding_type=FindingType.PATTERN,
-                observation=f"{len(with_sticky)}/{total} competitors use sticky CTAs",
+                observation=f"{with_sticky}/{total} competitors use sticky CTAs",
                 severity=Severity.HIGH,
                 details="Sticky CTAs are conversion standard"
             ))
@@ -311,17 +302,21 @@ class ChatWidgetRule(InsightRule):
     rule_id = "chat_widget"
     category = FindingCategory.CONVERSION
     description = "Analyze live chat and instant communication adoption"
+    features = ('chat_widget',)
 
     def evaluate(self) -> List[Finding]:
         findings = []
 
-        with_chat = [c for c in self.competitors if c.conversion_mechanics.chat_widget]
+        with_chat = self.table.count('chat_widget')
 
-        if len(with_chat) >= 2:
-            chat_providers = [c.conversion_mechanics.chat_provider for c in with_chat if c.conversion_mechanics.chat_provider]
+        if with_chat >= 2:
+            chat_providers = [
+                c.conversion_mechanics.chat_provider for c in self.table.profiles('chat_widget')
+                if c.conversion_mechanics.chat_provider
+            ]
             findings.append(self._create_finding(
                 finding_type=FindingType.OPPORTUNITY,
-                observation=f"{len(with_chat)} competitors offer live chat",
+                observation=f"{with_chat} competitors offer live chat",
                 severity=Severity.MEDIUM,
                 details=f"Chat providers used: {', '.join(set(chat_providers)) if chat_providers else 'various'}"
             ))
@@ -335,22 +330,19 @@ class ContentDepthRule(InsightRule):
     rule_id = "content_depth"
     category = FindingCategory.CONTENT
     description = "Compare content depth across service pages"
+    features = ('deep_service_pages',)
 
     def evaluate(self) -> List[Finding]:
         findings = []
 
-        for comp in self.competitors:
-            deep_pages = [
-                p for p in comp.seo_structure.service_pages
-                if p.word_count and p.word_count > 1500
-            ]
-            if deep_pages:
-                findings.append(self._create_finding(
-                    finding_type=FindingType.PATTERN,
-                    observation=f"{comp.domain} has {len(deep_pages)} in-depth service pages (>1500 words)",
-                    severity=Severity.MEDIUM,
-                    competitor_refs=[comp.id]
-                ))
+        for row in self.table.rows('deep_service_pages'):
+            comp = self.table.competitors[row]
+            findings.append(self._create_finding(
+                finding_type=FindingType.PATTERN,
+                observation=f"{comp.domain} has {self.table.value('deep_service_pages', row)} in-depth service pages (>1500 words)",
+                severity=Severity.MEDIUM,
+                competitor_refs=[comp.id]
+            ))
 
         return findings
 
@@ -361,21 +353,21 @@ class GridRankingRule(InsightRule):
     rule_id = "grid_ranking"
     category = FindingCategory.LOCAL_SEO
     description = "Identify local pack dominators and threats"
+    features = ('avg_grid_rank',)
 
     def evaluate(self) -> List[Finding]:
         findings = []
 
-        for comp in self.competitors:
-            if comp.grid_performance:
-                avg_rank = sum(comp.grid_performance.values()) / len(comp.grid_performance)
-                if avg_rank <= 3:
-                    findings.append(self._create_finding(
-                        finding_type=FindingType.THREAT,
-                        observation=f"{comp.domain} dominates local pack (avg rank: {avg_rank:.1f})",
-                        severity=Severity.CRITICAL,
-                        competitor_refs=[comp.id],
-                        data_points=DataPoints(competitor_values={comp.domain: avg_rank})
-                    ))
+        for row in self.table.rows('avg_grid_rank', at_most=3):
+            comp = self.table.competitors[row]
+            avg_rank = self.table.value('avg_grid_rank', row)
+            findings.append(self._create_finding(
+                finding_type=FindingType.THREAT,
+                observation=f"{comp.domain} dominates local pack (avg rank: {avg_rank:.1f})",
+                severity=Severity.CRITICAL,
+                competitor_refs=[comp.id],
+                data_points=DataPoints(competitor_values={comp.domain: avg_rank})
+            ))
 
         return findings
 
@@ -390,27 +382,28 @@ class ExperiencePhotoRule(InsightRule):
     rule_id = "experience_photo"
     category = FindingCategory.TRUST
     description = "Analyze experience/room photo quality and coverage"
+    features = ('experience_photos', 'promo_video')
 
     def evaluate(self) -> List[Finding]:
         findings = []
 
-        with_photos = [c for c in self.competitors if c.trust_signals.experience_photos]
-        total = len(self.competitors)
+        with_photos = self.table.count('experience_photos')
+        total = len(self.table)
 
-        if len(with_photos) >= total * 0.5:
+        if with_photos >= total * 0.5:
             findings.append(self._create_finding(
                 finding_type=FindingType.PATTERN,
-                observation=f"{len(with_photos)}/{total} competitors showcase experience photos",
+                observation=f"{with_photos}/{total} competitors showcase experience photos",
                 severity=Severity.HIGH,
                 details="Experience photos are table stakes for entertainment venues"
             ))
 
         # Check for promo videos
-        with_video = [c for c in self.competitors if c.trust_signals.promo_video]
-        if len(with_video) >= total * 0.3:
+        with_video = self.table.count('promo_video')
+        if with_video >= total * 0.3:
             findings.append(self._create_finding(
                 finding_type=FindingType.OPPORTUNITY,
-                observation=f"{len(with_video)}/{total} competitors have promo videos",
+                observation=f"{with_video}/{total} competitors have promo videos",
                 severity=Severity.HIGH,
                 details="Video content drives higher engagement and conversions"
             ))
@@ -424,23 +417,24 @@ class OnlineBookingRule(InsightRule):
     rule_id = "online_booking"
     category = FindingCategory.CONVERSION
     description = "Analyze online booking adoption and quality"
+    features = ('online_booking', 'availability_calendar')
 
     def evaluate(self) -> List[Finding]:
         findings = []
 
-        with_booking = [c for c in self.competitors if c.conversion_mechanics.online_booking]
-        total = len(self.competitors)
+        with_booking = self.table.count('online_booking')
+        total = len(self.table)
 
-        if len(with_booking) >= total * 0.5:
+        if with_booking >= total * 0.5:
             findings.append(self._create_finding(
                 finding_type=FindingType.PATTERN,
-                observation=f"{len(with_booking)}/{total} competitors have online booking",
+                observation=f"{with_booking}/{total} competitors have online booking",
                 severity=Severity.CRITICAL,
                 details="Online booking is essential for entertainment businesses"
             ))
 
             # Check booking providers
-            providers = [c.conversion_mechanics.booking_provider for c in with_booking
+            providers = [c.conversion_mechanics.booking_provider for c in self.table.profiles('online_booking')
                         if c.conversion_mechanics.booking_provider]
             if providers:
                 findings.append(self._create_finding(
@@ -450,11 +444,11 @@ class OnlineBookingRule(InsightRule):
                 ))
 
         # Check availability calendar
-        with_calendar = [c for c in self.competitors if c.conversion_mechanics.availability_calendar]
-        if len(with_calendar) >= 2:
+        with_calendar = self.table.count('availability_calendar')
+        if with_calendar >= 2:
             findings.append(self._create_finding(
                 finding_type=FindingType.PATTERN,
-                observation=f"{len(with_calendar)} competitors show real-time availability",
+                observation=f"{with_calendar} competitors show real-time availability",
                 severity=Severity.HIGH,
                 details="Real-time availability reduces booking friction"
             ))
@@ -468,37 +462,37 @@ class GroupPackagesRule(InsightRule):
     rule_id = "group_packages"
     category = FindingCategory.CONVERSION
     description = "Analyze group booking and event package offerings"
+    features = ('party_packages', 'corporate_booking', 'gift_cards')
 
     def evaluate(self) -> List[Finding]:
         findings = []
 
-        with_group = [c for c in self.competitors if c.conversion_mechanics.group_booking_options]
-        with_party = [c for c in self.competitors if c.conversion_mechanics.party_packages]
-        with_corporate = [c for c in self.competitors if c.conversion_mechanics.corporate_booking]
-        total = len(self.competitors)
+        with_party = self.table.count('party_packages')
+        with_corporate = self.table.count('corporate_booking')
+        total = len(self.table)
 
-        if len(with_party) >= total * 0.5:
+        if with_party >= total * 0.5:
             findings.append(self._create_finding(
                 finding_type=FindingType.PATTERN,
-                observation=f"{len(with_party)}/{total} competitors offer birthday/party packages",
+                observation=f"{with_party}/{total} competitors offer birthday/party packages",
                 severity=Severity.HIGH,
                 details="Party packages are a major revenue stream for entertainment venues"
             ))
 
-        if len(with_corporate) >= 2:
+        if with_corporate >= 2:
             findings.append(self._create_finding(
                 finding_type=FindingType.OPPORTUNITY,
-                observation=f"{len(with_corporate)} competitors target corporate team building",
+                observation=f"{with_corporate} competitors target corporate team building",
                 severity=Severity.HIGH,
                 details="Corporate bookings = higher ticket value, weekday revenue"
             ))
 
         # Check gift cards
-        with_giftcards = [c for c in self.competitors if c.conversion_mechanics.gift_cards]
-        if len(with_giftcards) >= total * 0.3:
+        with_giftcards = self.table.count('gift_cards')
+        if with_giftcards >= total * 0.3:
             findings.append(self._create_finding(
                 finding_type=FindingType.PATTERN,
-                observation=f"{len(with_giftcards)} competitors sell gift cards",
+                observation=f"{with_giftcards} competitors sell gift cards",
                 severity=Severity.MEDIUM,
                 details="Gift cards = prepaid revenue + new customer acquisition"
             ))
@@ -512,12 +506,16 @@ class UniqueExperienceRule(InsightRule):
     rule_id = "unique_experience"
     category = FindingCategory.TRUST
     description = "Identify unique experience features that drive competitive advantage"
+    features = ('unique_features', 'awards_shown', 'experience_count')
 
     def evaluate(self) -> List[Finding]:
         findings = []
 
-        for comp in self.competitors:
-            if comp.trust_signals.unique_features:
+        with_features = set(self.table.rows('unique_features'))
+        with_awards = set(self.table.rows('awards_shown'))
+        for row in sorted(with_features | with_awards):
+            comp = self.table.competitors[row]
+            if row in with_features:
                 findings.append(self._create_finding(
                     finding_type=FindingType.THREAT,
                     observation=f"{comp.domain} differentiators: {', '.join(comp.trust_signals.unique_features[:3])}",
@@ -525,7 +523,7 @@ class UniqueExperienceRule(InsightRule):
                     competitor_refs=[comp.id]
                 ))
 
-            if comp.trust_signals.awards_shown:
+            if row in with_awards:
                 findings.append(self._create_finding(
                     finding_type=FindingType.THREAT,
                     observation=f"{comp.domain} displays {len(comp.trust_signals.awards_shown)} awards",
@@ -535,15 +533,14 @@ class UniqueExperienceRule(InsightRule):
                 ))
 
         # Check experience counts
-        exp_counts = [(c, c.trust_signals.experience_count) for c in self.competitors
-                     if c.trust_signals.experience_count]
-        if exp_counts:
-            max_exp = max(exp_counts, key=lambda x: x[1])
+        leader = self.table.leader('experience_count')
+        if leader is not None:
+            comp = self.table.competitors[leader]
             findings.append(self._create_finding(
                 finding_type=FindingType.PATTERN,
-                observation=f"{max_exp[0].domain} leads with {max_exp[1]} experiences",
+                observation=f"{comp.domain} leads with {comp.trust_signals.experience_count} experiences",
                 severity=Severity.MEDIUM,
-                competitor_refs=[max_exp[0].id]
+                competitor_refs=[comp.id]
             ))
 
         return findings
@@ -555,25 +552,20 @@ class RepeatVisitRule(InsightRule):
     rule_id = "repeat_visit"
     category = FindingCategory.CONVERSION
     description = "Analyze repeat visit and replay value features"
+    features = ('replay_value',)
 
     def evaluate(self) -> List[Finding]:
         findings = []
 
-        # Check for multiple endings/replay value in unique features
-        replay_indicators = ['multiple endings', 'replay', 'different outcomes', 'new experience']
-        for comp in self.competitors:
-            has_replay = any(
-                any(ind in feat.lower() for ind in replay_indicators)
-                for feat in comp.trust_signals.unique_features
-            )
-            if has_replay:
-                findings.append(self._create_finding(
-                    finding_type=FindingType.THREAT,
-                    observation=f"{comp.domain} promotes replay value/multiple outcomes",
-                    severity=Severity.HIGH,
-                    competitor_refs=[comp.id],
-                    details="Multiple endings increase customer lifetime value"
-                ))
+        # Multiple endings/replay value in unique features (see REPLAY_INDICATORS)
+        for comp in self.table.profiles('replay_value'):
+            findings.append(self._create_finding(
+                finding_type=FindingType.THREAT,
+                observation=f"{comp.domain} promotes replay value/multiple outcomes",
+                severity=Severity.HIGH,
+                competitor_refs=[comp.id],
+                details="Multiple endings increase customer lifetime value"
+            ))
 
         return findings
 
@@ -588,26 +580,27 @@ class CredentialDisplayRule(InsightRule):
     rule_id = "credential_display"
     category = FindingCategory.TRUST
     description = "Analyze credential and certification display patterns"
+    features = ('credentials_shown', 'board_certifications')
 
     def evaluate(self) -> List[Finding]:
         findings = []
 
-        with_creds = [c for c in self.competitors if c.trust_signals.credentials_shown]
-        with_certs = [c for c in self.competitors if c.trust_signals.board_certifications]
-        total = len(self.competitors)
+        with_creds = self.table.count('credentials_shown')
+        with_certs = self.table.count('board_certifications')
+        total = len(self.table)
 
-        if len(with_creds) >= total * 0.5:
+        if with_creds >= total * 0.5:
             findings.append(self._create_finding(
                 finding_type=FindingType.PATTERN,
-                observation=f"{len(with_creds)}/{total} competitors display practitioner credentials",
+                observation=f"{with_creds}/{total} competitors display practitioner credentials",
                 severity=Severity.HIGH,
                 details="Credential visibility is essential for healthcare trust"
             ))
 
-        if len(with_certs) >= total * 0.3:
+        if with_certs >= total * 0.3:
             findings.append(self._create_finding(
                 finding_type=FindingType.PATTERN,
-                observation=f"{len(with_certs)}/{total} competitors highlight board certifications",
+                observation=f"{with_certs}/{total} competitors highlight board certifications",
                 severity=Severity.MEDIUM
             ))
 
@@ -620,26 +613,27 @@ class OnlineSchedulingRule(InsightRule):
     rule_id = "online_scheduling"
     category = FindingCategory.CONVERSION
     description = "Analyze online scheduling and patient portal adoption"
+    features = ('online_scheduling', 'patient_portal')
 
     def evaluate(self) -> List[Finding]:
         findings = []
 
-        with_scheduling = [c for c in self.competitors if c.conversion_mechanics.online_scheduling]
-        with_portal = [c for c in self.competitors if c.conversion_mechanics.patient_portal]
-        total = len(self.competitors)
+        with_scheduling = self.table.count('online_scheduling')
+        with_portal = self.table.count('patient_portal')
+        total = len(self.table)
 
-        if len(with_scheduling) >= total * 0.5:
+        if with_scheduling >= total * 0.5:
             findings.append(self._create_finding(
                 finding_type=FindingType.PATTERN,
-                observation=f"{len(with_scheduling)}/{total} competitors offer online scheduling",
+                observation=f"{with_scheduling}/{total} competitors offer online scheduling",
                 severity=Severity.CRITICAL,
                 details="Online scheduling is expected in modern healthcare"
             ))
 
-        if len(with_portal) >= 2:
+        if with_portal >= 2:
             findings.append(self._create_finding(
                 finding_type=FindingType.PATTERN,
-                observation=f"{len(with_portal)} competitors have patient portals",
+                observation=f"{with_portal} competitors have patient portals",
                 severity=Severity.MEDIUM
             ))
 
@@ -725,46 +719,67 @@ class RuleEngine:
         OnlineSchedulingRule,
     ]
 
-    def __init__(self, client: Client, competitors: List[CompetitorProfile]):
+    def __init__(
+        self,
+        client: Client,
+        competitors: List[CompetitorProfile],
+        table: Optional[FeatureTable] = None
+    ):
         self.client = client
         self.competitors = competitors
         # Get rules appropriate for this client's vertical
         self.rules = get_rules_for_vertical(client.vertical)
+        # One feature table shared by every rule (and by ScoreStage)
+        self.table = table if table is not None else FeatureTable(competitors, [])
+        self.timings: Dict[str, float] = {}
 
     def run_all_rules(self) -> List[Finding]:
         """Run vertical-appropriate rules and return findings"""
-        all_findings = []
-
-        for rule_class in self.rules:
-            try:
-                rule = rule_class(self.client, self.competitors)
-                findings = rule.evaluate()
-                all_findings.extend(findings)
-                logger.info(f"Rule {rule.rule_id}: {len(findings)} findings")
-            except Exception as e:
-                logger.error(f"Rule {rule_class.rule_id} failed: {e}")
-
-        return all_findings
+        return self._evaluate(self.rules)
 
     def run_rule(self, rule_id: str) -> List[Finding]:
         """Run a specific rule by ID"""
         for rule_class in self.ALL_RULES:
             if rule_class.rule_id == rule_id:
-                rule = rule_class(self.client, self.competitors)
-                return rule.evaluate()
+                return self._evaluate([rule_class])
         return []
 
     def run_all_rules_universal(self) -> List[Finding]:
         """Run all rules regardless of vertical (legacy behavior)"""
+        return self._evaluate(self.ALL_RULES)
+
+    def get_timings(self) -> Dict[str, float]:
+        """Seconds spent per rule in the last run, plus feature extraction"""
+        return {'feature_table': self.table.build_seconds, **self.timings}
+
+    def _evaluate(self, rule_classes: List[Type[InsightRule]]) -> List[Finding]:
+        """
+        Evaluate rules in one pass over a shared feature table.
+
+        The features all rules declare are extracted together up front, so
+        each rule only reads cached columns and aggregates.
+        """
+        self.table.ensure(f for rule_class in rule_classes for f in rule_class.features)
+        self.timings = {}
         all_findings = []
 
-        for rule_class in self.ALL_RULES:
+        for rule_class in rule_classes:
+            started = time.perf_counter()
             try:
-                rule = rule_class(self.client, self.competitors)
+                rule = rule_class(self.client, self.competitors, table=self.table)
                 findings = rule.evaluate()
                 all_findings.extend(findings)
                 logger.info(f"Rule {rule.rule_id}: {len(findings)} findings")
             except Exception as e:
                 logger.error(f"Rule {rule_class.rule_id} failed: {e}")
+            finally:
+                self.timings[rule_class.rule_id] = time.perf_counter() - started
+
+        slowest = max(self.timings.items(), key=lambda item: item[1], default=None)
+        if slowest:
+            logger.debug(
+                f"Evaluated {len(rule_classes)} rules in {sum(self.timings.values()) * 1000:.1f}ms "
+                f"(slowest: {slowest[0]} {slowest[1] * 1000:.1f}ms)"
+            )
 
         return all_findings
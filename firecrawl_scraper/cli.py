@@ -41,6 +41,7 @@ from tqdm import tqdm
 
 from .config import Config
 from .core.firecrawl_client import EnhancedFirecrawlClient
+from .core.dataforseo_client import DataForSEOClient
 
 # Skills system imports
 try:
@@ -381,6 +382,15 @@ RESEARCH_TYPE_ALIASES = {
 # CLI COMMANDS
 # ============================================================================
 
+async def _run_command(cmd_func, args):
+    """Run a command, then release pooled HTTP sessions before the loop closes"""
+    try:
+        return await cmd_func(args)
+    finally:
+        await EnhancedFirecrawlClient.close_all()
+        await DataForSEOClient.close_all()
+
+
 async def cmd_scrape(args):
     """Scrape single URL with Spark 1 Pro"""
     client = EnhancedFirecrawlClient()
@@ -629,10 +639,13 @@ async def cmd_batch(args):
         urls=urls,
         formats=['markdown'],
         only_main_content=True,
-        on_progress=on_progress
+        on_progress=on_progress,
+        shard_size=args.shard_size,
+        max_concurrent_shards=args.max_shards,
+        max_credits=args.max_credits
     )
 
-    if result.get('success'):
+    if result.get('success') or result.get('data'):
         data = result.get('data', [])
 
         output_dir = Config.OUTPUT_DIR / 'batches'
@@ -645,9 +658,13 @@ async def cmd_batch(args):
         with open(output_path, 'w', encoding='utf-8') as f:
             json.dump(result, f, indent=2, default=str)
 
-        print(f"\nSUCCESS!")
+        print(f"\nSUCCESS!" if result.get('success') else f"\nPARTIAL SUCCESS")
         print(f"URLs processed: {len(data)}")
         print(f"Credits used: {result.get('creditsUsed', len(data))}")
+        if result.get('shards', 1) > 1:
+            print(f"Shards: {result['shards']} ({len(result.get('failed_shards', []))} failed)")
+        if result.get('skipped_urls'):
+            print(f"Skipped (credit budget): {len(result['skipped_urls'])} URLs")
         print(f"Saved to: {output_path}")
     else:
         print(f"FAILED: {result.get('error', 'Unknown error')}")
@@ -1469,6 +1486,9 @@ Available research types: general, competitor, uiux, psychology, app_dev, ai_too
     # Batch command
     batch_parser = subparsers.add_parser('batch', help='Batch process from file')
     batch_parser.add_argument('file', help='CSV/JSON/TXT file with URLs')
+    batch_parser.add_argument('--shard-size', type=int, default=1000, help='Max URLs per batch job')
+    batch_parser.add_argument('--max-shards', type=int, default=4, help='Shard jobs running at once')
+    batch_parser.add_argument('--max-credits', type=int, help='Credit budget (skip shards beyond it)')
 
     # SEO Audit command
     seo_parser = subparsers.add_parser('seo-audit', help='Full SEO audit')
@@ -1550,7 +1570,7 @@ Available research types: general, competitor, uiux, psychology, app_dev, ai_too
 
     cmd_func = commands.get(args.command)
     if cmd_func:
-        return asyncio.run(cmd_func(args))
+        return asyncio.run(_run_command(cmd_func, args))
     else:
         parser.print_help()
         return 1
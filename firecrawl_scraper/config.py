@@ -185,6 +185,8 @@ class Config:
     DATAFORSEO_LOGIN = os.getenv('DATAFORSEO_LOGIN')
     DATAFORSEO_PASSWORD = os.getenv('DATAFORSEO_PASSWORD')
     DATAFORSEO_ENABLED = os.getenv('DATAFORSEO_ENABLED', 'false').lower() == 'true'
+    # Standard queue (task_post/task_get) instead of live endpoints: cheaper, results in minutes
+    DATAFORSEO_QUEUED = os.getenv('DATAFORSEO_QUEUED', 'false').lower() == 'true'
 
     # DataForSEO Module Toggles
     SEO_SERP_ENABLED = os.getenv('SEO_SERP_ENABLED', 'true').lower() == 'true'
@@ -312,6 +314,7 @@ class Config:
         print("-" * 60)
         print("DataForSEO Settings:")
         print(f"DataForSEO Enabled: {cls.DATAFORSEO_ENABLED}")
+        print(f"DataForSEO Queued Mode: {cls.DATAFORSEO_QUEUED}")
         print(f"DataForSEO Login: {'*' * 10}{cls.DATAFORSEO_LOGIN[-10:] if cls.DATAFORSEO_LOGIN else 'NOT SET'}")
         print(f"SEO SERP Module: {cls.SEO_SERP_ENABLED}")
         print(f"SEO Keywords Module: {cls.SEO_KEYWORDS_ENABLED}")
@@ -379,6 +382,7 @@ class Config:
             'media_extraction_enabled': cls.MEDIA_EXTRACTION_ENABLED,
             # DataForSEO settings
             'dataforseo_enabled': cls.DATAFORSEO_ENABLED,
+            'dataforseo_queued': cls.DATAFORSEO_QUEUED,
             'seo_serp_enabled': cls.SEO_SERP_ENABLED,
             'seo_keywords_enabled': cls.SEO_KEYWORDS_ENABLED,
             'seo_backlinks_enabled': cls.SEO_BACKLINKS_ENABLED,
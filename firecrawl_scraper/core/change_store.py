@@ -0,0 +1,390 @@
+#!/usr/bin/env python3
+"""
+Change Store - SQLite persistence for ChangeTracker
+
+Single-file embedded store (WAL mode) with indexed tables for:
+- tracked_urls: tracking configuration and latest state per URL
+- snapshots: content snapshots (newest N kept per URL)
+- changes: detected change records
+- blobs: full snapshot content, zlib-compressed and keyed by content hash
+  (identical content is stored once and dropped when no snapshot uses it)
+
+Replaces the one-JSON-file-per-URL layout; `migrate_json_dir()` imports
+that layout once.
+
+Usage:
+    from firecrawl_scraper.core.change_store import ChangeStore
+
+    store = ChangeStore(Config.CHANGE_TRACKING_DIR / 'change_tracking.db')
+    store.upsert_tracked({'url': 'https://example.com', 'check_interval': 3600})
+"""
+
+import json
+import logging
+import sqlite3
+import zlib
+from pathlib import Path
+from typing import Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS tracked_urls (
+    url TEXT PRIMARY KEY,
+    check_interval INTEGER NOT NULL DEFAULT 86400,
+    last_checked TEXT,
+    last_hash TEXT,
+    last_content_length INTEGER NOT NULL DEFAULT 0,
+    change_count INTEGER NOT NULL DEFAULT 0,
+    consecutive_failures INTEGER NOT NULL DEFAULT 0,
+    next_check_at REAL
+);
+
+CREATE TABLE IF NOT EXISTS snapshots (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    url TEXT NOT NULL,
+    content_hash TEXT NOT NULL,
+    content_length INTEGER NOT NULL,
+    timestamp TEXT NOT NULL,
+    markdown_preview TEXT NOT NULL DEFAULT ''
+);
+CREATE INDEX IF NOT EXISTS idx_snapshots_url ON snapshots (url, id);
+CREATE INDEX IF NOT EXISTS idx_snapshots_hash ON snapshots (content_hash);
+
+CREATE TABLE IF NOT EXISTS blobs (
+    hash TEXT PRIMARY KEY,
+    size INTEGER NOT NULL,
+    data BLOB NOT NULL
+);
+
+CREATE TABLE IF NOT EXISTS changes (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    url TEXT NOT NULL,
+    detected_at TEXT NOT NULL,
+    previous_hash TEXT NOT NULL,
+    current_hash TEXT NOT NULL,
+    content_length_change INTEGER NOT NULL,
+    diff_summary TEXT NOT NULL DEFAULT '',
+    full_diff TEXT NOT NULL DEFAULT ''
+);
+CREATE INDEX IF NOT EXISTS idx_changes_url ON changes (url, id);
+
+CREATE TABLE IF NOT EXISTS meta (
+    key TEXT PRIMARY KEY,
+    value TEXT
+);
+"""
+
+TRACKED_COLUMNS = ('url', 'check_interval', 'last_checked', 'last_hash',
+                   'last_content_length', 'change_count', 'consecutive_failures',
+                   'next_check_at')
+
+SNAPSHOT_COLUMNS = ('url', 'content_hash', 'content_length', 'timestamp', 'markdown_preview')
+CHANGE_COLUMNS = ('url', 'detected_at', 'previous_hash', 'current_hash',
+                  'content_length_change', 'diff_summary', 'full_diff')
+
+# Columns added after the first schema version: name -> definition
+ADDED_COLUMNS = {
+    'consecutive_failures': 'INTEGER NOT NULL DEFAULT 0',
+    'next_check_at': 'REAL',
+}
+
+
+class ChangeStore:
+    """SQLite-backed storage for tracked URLs, snapshots and change records"""
+
+    def __init__(self, db_path: Path, max_snapshots: int = 10):
+        """
+        Args:
+            db_path: SQLite database file (created if missing)
+            max_snapshots: Snapshots kept per URL (oldest pruned)
+        """
+        self.db_path = Path(db_path)
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self.max_snapshots = max_snapshots
+
+        self.conn = sqlite3.connect(str(self.db_path))
+        self.conn.row_factory = sqlite3.Row
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        self.conn.executescript(SCHEMA)
+        self._upgrade_schema()
+        self.conn.commit()
+
+    def close(self):
+        """Close the database connection"""
+        self.conn.close()
+
+    # ========================================================================
+    # TRACKED URLS
+    # ========================================================================
+
+    def upsert_tracked(self, tracked: Dict):
+        """Insert or update a tracked URL row (keys from TRACKED_COLUMNS)"""
+        values = {col: tracked.get(col) for col in TRACKED_COLUMNS}
+        values['check_interval'] = values['check_interval'] or 86400
+        values['last_content_length'] = values['last_content_length'] or 0
+        values['change_count'] = values['change_count'] or 0
+        values['consecutive_failures'] = values['consecutive_failures'] or 0
+
+        columns = ', '.join(TRACKED_COLUMNS)
+        placeholders = ', '.join(f':{col}' for col in TRACKED_COLUMNS)
+        updates = ', '.join(f'{col} = excluded.{col}' for col in TRACKED_COLUMNS if col != 'url')
+
+        with self.conn:
+            self.conn.execute(
+                f"INSERT INTO tracked_urls ({columns}) VALUES ({placeholders}) "
+                f"ON CONFLICT(url) DO UPDATE SET {updates}",
+                values
+            )
+
+    def get_tracked(self, url: str) -> Optional[Dict]:
+        """Tracked URL row, or None"""
+        row = self.conn.execute("SELECT * FROM tracked_urls WHERE url = ?", (url,)).fetchone()
+        return dict(row) if row else None
+
+    def has_url(self, url: str) -> bool:
+        return self.conn.execute(
+            "SELECT 1 FROM tracked_urls WHERE url = ?", (url,)
+        ).fetchone() is not None
+
+    def list_urls(self) -> List[str]:
+        """All tracked URLs in insertion order"""
+        return [row[0] for row in self.conn.execute("SELECT url FROM tracked_urls ORDER BY rowid")]
+
+    def iter_tracked(self):
+        """Iterate tracked URL rows without loading history"""
+        for row in self.conn.execute("SELECT * FROM tracked_urls ORDER BY rowid"):
+            yield dict(row)
+
+    def iter_schedule(self):
+        """Yield (url, next_check_at, last_checked, check_interval) for every URL"""
+        yield from self.conn.execute(
+            "SELECT url, next_check_at, last_checked, check_interval FROM tracked_urls"
+        )
+
+    def iter_due(self, now: float):
+        """
+        Yield (url, next_check_at, last_checked, check_interval) for URLs
+        due by `now`, soonest first. URLs without a next_check_at (never
+        scheduled) are included; their due time comes from last_checked.
+        """
+        yield from self.conn.execute(
+            "SELECT url, next_check_at, last_checked, check_interval FROM tracked_urls "
+            "WHERE next_check_at IS NULL OR next_check_at <= ? ORDER BY next_check_at, rowid",
+            (now,)
+        )
+
+    def count_tracked(self) -> int:
+        return self.conn.execute("SELECT COUNT(*) FROM tracked_urls").fetchone()[0]
+
+    def delete_url(self, url: str) -> bool:
+        """Remove a URL and its history"""
+        with self.conn:
+            cursor = self.conn.execute("DELETE FROM tracked_urls WHERE url = ?", (url,))
+            hashes = self._delete_snapshots("WHERE url = ?", (url,))
+            self.conn.execute("DELETE FROM changes WHERE url = ?", (url,))
+            self._drop_orphan_blobs(hashes)
+        return cursor.rowcount > 0
+
+    # ========================================================================
+    # SNAPSHOTS & CHANGES
+    # ========================================================================
+
+    def add_snapshot(self, snapshot: Dict, content: Optional[str] = None):
+        """
+        Append a snapshot and prune the URL to max_snapshots.
+
+        Args:
+            snapshot: Snapshot row (keys from SNAPSHOT_COLUMNS)
+            content: Full content, stored as a blob under snapshot['content_hash']
+        """
+        with self.conn:
+            if content is not None:
+                self._insert_blob(snapshot['content_hash'], content)
+            self._insert_snapshot(snapshot)
+            pruned = self._delete_snapshots(
+                "WHERE url = ? AND id NOT IN "
+                "(SELECT id FROM snapshots WHERE url = ? ORDER BY id DESC LIMIT ?)",
+                (snapshot['url'], snapshot['url'], self.max_snapshots)
+            )
+            self._drop_orphan_blobs(pruned)
+
+    def get_snapshots(self, url: str, limit: int = 10) -> List[Dict]:
+        """Snapshots for a URL, newest first"""
+        rows = self.conn.execute(
+            "SELECT * FROM snapshots WHERE url = ? ORDER BY id DESC LIMIT ?", (url, limit)
+        )
+        return [self._row_without_id(row) for row in rows]
+
+    def get_snapshot(self, url: str, content_hash: str) -> Optional[Dict]:
+        """Newest snapshot of a URL with the given content hash, or None"""
+        row = self.conn.execute(
+            "SELECT * FROM snapshots WHERE url = ? AND content_hash = ? ORDER BY id DESC LIMIT 1",
+            (url, content_hash)
+        ).fetchone()
+        return self._row_without_id(row) if row else None
+
+    def get_blob(self, content_hash: str) -> Optional[str]:
+        """Full content stored for a hash, or None if not kept"""
+        row = self.conn.execute("SELECT data FROM blobs WHERE hash = ?", (content_hash,)).fetchone()
+        return zlib.decompress(row[0]).decode('utf-8') if row else None
+
+    def get_blob_stats(self) -> Dict:
+        """Blob count with raw and compressed sizes"""
+        row = self.conn.execute(
+            "SELECT COUNT(*), COALESCE(SUM(size), 0), COALESCE(SUM(LENGTH(data)), 0) FROM blobs"
+        ).fetchone()
+        return {'blobs': row[0], 'content_bytes': row[1], 'stored_bytes': row[2]}
+
+    def add_change(self, change: Dict):
+        """Append a change record"""
+        with self.conn:
+            self._insert_change(change)
+
+    def get_changes(self, url: str, limit: int = 50) -> List[Dict]:
+        """Change records for a URL, newest first"""
+        rows = self.conn.execute(
+            "SELECT * FROM changes WHERE url = ? ORDER BY id DESC LIMIT ?", (url, limit)
+        )
+        return [self._row_without_id(row) for row in rows]
+
+    def get_summary(self) -> Dict:
+        """Aggregate counts for tracking statistics"""
+        row = self.conn.execute(
+            "SELECT COUNT(*), COALESCE(SUM(change_count), 0), "
+            "COALESCE(SUM(CASE WHEN change_count > 0 THEN 1 ELSE 0 END), 0) FROM tracked_urls"
+        ).fetchone()
+        return {
+            'total_tracked': row[0],
+            'total_changes_detected': row[1],
+            'urls_with_changes': row[2]
+        }
+
+    # ========================================================================
+    # MIGRATION
+    # ========================================================================
+
+    def migrate_json_dir(self, json_dir: Path, force: bool = False) -> int:
+        """
+        Import the legacy one-file-per-URL JSON layout once.
+
+        Args:
+            json_dir: Directory containing `<url_hash>.json` files
+            force: Re-import even if a previous migration was recorded
+
+        Returns:
+            Number of URLs imported
+        """
+        if not force and self._get_meta('json_migrated'):
+            return 0
+
+        imported = 0
+        with self.conn:
+            for file_path in sorted(Path(json_dir).glob("*.json")):
+                try:
+                    with open(file_path) as f:
+                        data = json.load(f)
+                except Exception as e:
+                    logger.warning(f"Failed to load tracking data from {file_path}: {e}")
+                    continue
+
+                if 'url' not in data:
+                    continue
+                url = data['url']
+
+                self._drop_orphan_blobs(self._delete_snapshots("WHERE url = ?", (url,)))
+                self.conn.execute("DELETE FROM changes WHERE url = ?", (url,))
+                self.conn.execute(
+                    f"INSERT OR REPLACE INTO tracked_urls ({', '.join(TRACKED_COLUMNS)}) "
+                    f"VALUES ({', '.join('?' for _ in TRACKED_COLUMNS)})",
+                    (
+                        url,
+                        data.get('check_interval') or 86400,
+                        data.get('last_checked'),
+                        data.get('last_hash'),
+                        data.get('last_content_length') or 0,
+                        data.get('change_count') or 0,
+                        0,
+                        None,
+                    )
+                )
+                for snapshot in data.get('snapshots', [])[-self.max_snapshots:]:
+                    self._insert_snapshot({**snapshot, 'url': url})
+                for change in data.get('changes', []):
+                    self._insert_change({**change, 'url': url})
+                imported += 1
+
+            self._set_meta('json_migrated', '1')
+
+        if imported:
+            logger.info(f"Migrated {imported} tracked URLs from JSON into {self.db_path.name}")
+        return imported
+
+    # ========================================================================
+    # INTERNALS
+    # ========================================================================
+
+    def _upgrade_schema(self):
+        """Add columns missing from databases created by older versions"""
+        existing = {row[1] for row in self.conn.execute("PRAGMA table_info(tracked_urls)")}
+        for column, definition in ADDED_COLUMNS.items():
+            if column not in existing:
+                self.conn.execute(f"ALTER TABLE tracked_urls ADD COLUMN {column} {definition}")
+        self.conn.execute(
+            "CREATE INDEX IF NOT EXISTS idx_tracked_next_check ON tracked_urls (next_check_at)"
+        )
+
+    def _insert_blob(self, content_hash: str, content: str):
+        data = content.encode('utf-8')
+        self.conn.execute(
+            "INSERT OR IGNORE INTO blobs (hash, size, data) VALUES (?, ?, ?)",
+            (content_hash, len(data), zlib.compress(data, 6))
+        )
+
+    def _delete_snapshots(self, where: str, params: tuple) -> set:
+        """Delete matching snapshots, returning the content hashes they referenced"""
+        hashes = {row[0] for row in self.conn.execute(
+            f"SELECT content_hash FROM snapshots {where}", params
+        )}
+        self.conn.execute(f"DELETE FROM snapshots {where}", params)
+        return hashes
+
+    def _drop_orphan_blobs(self, hashes: set):
+        """Delete blobs no longer referenced by any snapshot"""
+        for content_hash in hashes:
+            self.conn.execute(
+                "DELETE FROM blobs WHERE hash = ? AND NOT EXISTS "
+                "(SELECT 1 FROM snapshots WHERE content_hash = ?)",
+                (content_hash, content_hash)
+            )
+
+    def _insert_snapshot(self, snapshot: Dict):
+        self.conn.execute(
+            f"INSERT INTO snapshots ({', '.join(SNAPSHOT_COLUMNS)}) "
+            f"VALUES ({', '.join('?' for _ in SNAPSHOT_COLUMNS)})",
+            tuple(snapshot.get(col, '') if col == 'markdown_preview' else snapshot.get(col)
+                  for col in SNAPSHOT_COLUMNS)
+        )
+
+    def _insert_change(self, change: Dict):
+        self.conn.execute(
+            f"INSERT INTO changes ({', '.join(CHANGE_COLUMNS)}) "
+            f"VALUES ({', '.join('?' for _ in CHANGE_COLUMNS)})",
+            tuple(change.get(col, '') if col in ('diff_summary', 'full_diff') else change.get(col)
+                  for col in CHANGE_COLUMNS)
+        )
+
+    @staticmethod
+    def _row_without_id(row: sqlite3.Row) -> Dict:
+        data = dict(row)
+        data.pop('id', None)
+        return data
+
+    def _get_meta(self, key: str) -> Optional[str]:
+        row = self.conn.execute("SELECT value FROM meta WHERE key = ?", (key,)).fetchone()
+        return row[0] if row else None
+
+    def _set_meta(self, key: str, value: str):
+        self.conn.execute("INSERT OR REPLACE INTO meta (key, value) VALUES (?, ?)", (key, value))
@@ -5,7 +5,7 @@ Change Tracker - Website Content Monitoring System
 Track changes to websites over time with:
 - Content hash comparison for change detection
 - Diff generation for modified content
-- Change history persistence
+- Change history persistence (SQLite, see change_store.py)
 - Webhook/email notifications
 - Scheduled monitoring support
 
@@ -19,22 +19,19 @@ Usage:
 
 import asyncio
 import hashlib
-import json
+import heapq
 import logging
+import random
+import time
 from datetime import datetime
 from pathlib import Path
 from typing import Dict, List, Optional, Callable
 from dataclasses import dataclass, field, asdict
 
-logger = logging.getLogger(__name__)
+from .change_store import ChangeStore
+from .content_diff import diff_blocks, format_diff, summarize_diff
 
-# Try to import diff library
-try:
-    from diff_match_patch import diff_match_patch
-    HAS_DIFF_LIB = True
-except ImportError:
-    HAS_DIFF_LIB = False
-    logger.warning("diff-match-patch not installed. Diff generation disabled.")
+logger = logging.getLogger(__name__)
 
 
 @dataclass
@@ -44,7 +41,7 @@ class ContentSnapshot:
     content_hash: str
     content_length: int
     timestamp: str
-    markdown_preview: str = ""  # First 500 chars
+    markdown_preview: str = ""  # First 500 chars (full content kept as a blob)
 
     def to_dict(self) -> Dict:
         return asdict(self)
@@ -67,19 +64,39 @@ class ChangeRecord:
 
 @dataclass
 class TrackedURL:
-    """Configuration for a tracked URL"""
+    """
+    Configuration for a tracked URL
+
+    Snapshot and change history live in the ChangeStore tables; `snapshots`
+    and `changes` are only populated by the legacy JSON layout.
+    """
     url: str
     check_interval: int = 86400  # Default 24 hours
     last_checked: Optional[str] = None
     last_hash: Optional[str] = None
     last_content_length: int = 0
     change_count: int = 0
+    consecutive_failures: int = 0
+    next_check_at: Optional[float] = None  # Unix time the URL is next due
     snapshots: List[Dict] = field(default_factory=list)
     changes: List[Dict] = field(default_factory=list)
 
     def to_dict(self) -> Dict:
         return asdict(self)
 
+    @classmethod
+    def from_row(cls, row: Dict) -> 'TrackedURL':
+        return cls(
+            url=row['url'],
+            check_interval=row['check_interval'],
+            last_checked=row['last_checked'],
+            last_hash=row['last_hash'],
+            last_content_length=row['last_content_length'],
+            change_count=row['change_count'],
+            consecutive_failures=row.get('consecutive_failures') or 0,
+            next_check_at=row.get('next_check_at')
+        )
+
 
 class ChangeTracker:
     """
@@ -87,17 +104,23 @@ class ChangeTracker:
 
     Features:
     - Track content changes for multiple URLs
-    - Generate diffs showing what changed
-    - Persist change history to disk
+    - Generate block-level diffs of the full content between any two snapshots
+    - Persist change history to a single SQLite file (lazy per-URL loading)
     - Support for notifications via webhook
-    - Scheduled monitoring support
+    - Scheduled monitoring: next-due priority queue, bounded concurrent
+      checks, jittered intervals and back-off for failing URLs
     """
 
+    DB_FILENAME = "change_tracking.db"
+
     def __init__(
         self,
         api_key: str,
         storage_dir: Optional[Path] = None,
-        on_change: Optional[Callable[[ChangeRecord], None]] = None
+        on_change: Optional[Callable[[ChangeRecord], None]] = None,
+        max_concurrent: int = 5,
+        jitter: float = 0.1,
+        max_backoff: int = 7 * 86400
     ):
         """
         Initialize change tracker.
@@ -106,6 +129,11 @@ class ChangeTracker:
             api_key: Firecrawl API key
             storage_dir: Directory for persisting tracking data
             on_change: Callback function when changes are detected
+            max_concurrent: Maximum URLs checked at the same time
+            jitter: Random +/- fraction applied to each check interval so
+                URLs tracked together don't stay in lockstep
+            max_backoff: Upper bound (seconds) for the retry delay of URLs
+                that keep failing
         """
         # Import here to avoid circular imports
         from firecrawl_scraper.core.firecrawl_client import EnhancedFirecrawlClient
@@ -116,44 +144,45 @@ class ChangeTracker:
         self.storage_dir.mkdir(parents=True, exist_ok=True)
 
         self.on_change = on_change
-        self.tracked_urls: Dict[str, TrackedURL] = {}
-
-        # Load existing tracking data
-        self._load_tracking_data()
-
-        # Diff generator
-        if HAS_DIFF_LIB:
-            self.differ = diff_match_patch()
-
-    def _url_hash(self, url: str) -> str:
-        """Generate hash for URL (used as filename)"""
-        return hashlib.sha256(url.encode()).hexdigest()[:16]
-
-    def _get_storage_path(self, url: str) -> Path:
-        """Get storage path for URL tracking data"""
-        return self.storage_dir / f"{self._url_hash(url)}.json"
-
-    def _load_tracking_data(self):
-        """Load existing tracking data from disk"""
-        for file_path in self.storage_dir.glob("*.json"):
-            try:
-                with open(file_path) as f:
-                    data = json.load(f)
-                    if 'url' in data:
-                        self.tracked_urls[data['url']] = TrackedURL(**data)
-            except Exception as e:
-                logger.warning(f"Failed to load tracking data from {file_path}: {e}")
 
-    def _save_tracking_data(self, url: str):
-        """Save tracking data for URL to disk"""
-        if url not in self.tracked_urls:
-            return
+        # Scheduling
+        self.max_concurrent = max(1, max_concurrent)
+        self.jitter = jitter
+        self.max_backoff = max_backoff
+        self._schedule: Optional[List[tuple]] = None  # (due_at, url) heap while monitoring
+
+        # Tracked URLs are loaded from the store on first access
+        self.store = ChangeStore(self.storage_dir / self.DB_FILENAME)
+        self._tracked: Dict[str, TrackedURL] = {}
+
+        # One-shot import of the legacy one-JSON-file-per-URL layout
+        self.store.migrate_json_dir(self.storage_dir)
+
+    @property
+    def tracked_urls(self) -> Dict[str, TrackedURL]:
+        """All tracked URLs (history not loaded). Reads the whole table."""
+        return {row['url']: self._get_tracked(row['url'], row) for row in self.store.iter_tracked()}
+
+    def _get_tracked(self, url: str, row: Optional[Dict] = None) -> Optional[TrackedURL]:
+        """Load a tracked URL from the store on first access"""
+        tracked = self._tracked.get(url)
+        if tracked is None:
+            row = row or self.store.get_tracked(url)
+            if row is None:
+                return None
+            tracked = TrackedURL.from_row(row)
+            self._tracked[url] = tracked
+        return tracked
 
-        tracked = self.tracked_urls[url]
-        file_path = self._get_storage_path(url)
+    def close(self):
+        """Close the tracking database"""
+        self.store.close()
 
-        with open(file_path, 'w') as f:
-            json.dump(tracked.to_dict(), f, indent=2)
+    def _save_tracking_data(self, url: str):
+        """Persist tracking state for URL"""
+        tracked = self._tracked.get(url)
+        if tracked is not None:
+            self.store.upsert_tracked(tracked.to_dict())
 
     def track_url(
         self,
@@ -170,40 +199,47 @@ class ChangeTracker:
         Returns:
             TrackedURL configuration object
         """
-        if url not in self.tracked_urls:
-            self.tracked_urls[url] = TrackedURL(
+        tracked = self._get_tracked(url)
+        if tracked is None:
+            tracked = TrackedURL(
                 url=url,
                 check_interval=check_interval
             )
+            self._tracked[url] = tracked
             self._save_tracking_data(url)
+            if self._schedule is not None:
+                heapq.heappush(self._schedule, (0.0, url))
             logger.info(f"Now tracking: {url}")
         else:
             logger.info(f"Already tracking: {url}")
 
-        return self.tracked_urls[url]
+        return tracked
 
     def untrack_url(self, url: str) -> bool:
         """
         Remove URL from tracking list.
 
+        A running monitor_continuously drops the URL from its queue; a
+        check already in flight is discarded.
+
         Args:
             url: URL to stop tracking
 
         Returns:
             True if URL was being tracked
         """
-        if url in self.tracked_urls:
-            del self.tracked_urls[url]
-            file_path = self._get_storage_path(url)
-            if file_path.exists():
-                file_path.unlink()
+        self._tracked.pop(url, None)
+        if self._schedule is not None:
+            self._schedule = [entry for entry in self._schedule if entry[1] != url]
+            heapq.heapify(self._schedule)
+        if self.store.delete_url(url):
             logger.info(f"Stopped tracking: {url}")
             return True
         return False
 
     def get_tracked_urls(self) -> List[str]:
         """Get list of all tracked URLs"""
-        return list(self.tracked_urls.keys())
+        return self.store.list_urls()
 
     async def check_url(
         self,
@@ -220,25 +256,36 @@ class ChangeTracker:
         Returns:
             ChangeRecord if changes detected, None otherwise
         """
-        if url not in self.tracked_urls:
-            self.track_url(url)
+        tracked = self._get_tracked(url) or self.track_url(url)
 
-        tracked = self.tracked_urls[url]
-
-        # Check if enough time has passed
-        if not force and tracked.last_checked:
-            last_check = datetime.fromisoformat(tracked.last_checked)
-            elapsed = (datetime.now() - last_check).total_seconds()
-            if elapsed < tracked.check_interval:
-                logger.debug(f"Skipping {url} - checked {elapsed:.0f}s ago")
+        # Check if the URL is due
+        if not force:
+            wait = self._due_at(tracked) - time.time()
+            if wait > 0:
+                logger.debug(f"Skipping {url} - next check in {wait:.0f}s")
                 return None
 
-        # Scrape current content
+        return await self._check_tracked(tracked)
+
+    async def _check_tracked(self, tracked: TrackedURL) -> Optional[ChangeRecord]:
+        """Scrape a tracked URL, record a snapshot and any change, and reschedule it"""
+        url = tracked.url
+
+        # Scrape current content (never from the response cache)
         logger.info(f"Checking for changes: {url}")
-        result = await self.client.scrape(url=url, formats=['markdown'])
+        try:
+            result = await self.client.scrape(url=url, formats=['markdown'], cache_policy='bypass')
+        except Exception as e:
+            result = {'success': False, 'error': str(e)}
+
+        if self._tracked.get(url) is not tracked:
+            logger.info(f"{url} was untracked during its check - discarding result")
+            return None
 
         if not result.get('success'):
             logger.error(f"Failed to scrape {url}: {result.get('error')}")
+            self._schedule_next(tracked, success=False)
+            self._save_tracking_data(url)
             return None
 
         # Extract content
@@ -271,14 +318,20 @@ class ChangeTracker:
             # Generate diff summary
             diff_summary = f"Content length changed by {length_change:+d} characters"
 
-            # Generate full diff if library available and we have previous content
+            # Generate full diff if the previous content is stored
             full_diff = ""
-            if HAS_DIFF_LIB and tracked.snapshots:
+            prev_content = self.store.get_blob(tracked.last_hash)
+            if prev_content is not None:
                 try:
-                    prev_content = tracked.snapshots[-1].get('markdown_preview', '')
-                    diffs = self.differ.diff_main(prev_content, snapshot.markdown_preview)
-                    self.differ.diff_cleanupSemantic(diffs)
-                    full_diff = self.differ.diff_prettyHtml(diffs)
+                    ops = await asyncio.get_running_loop().run_in_executor(
+                        None, diff_blocks, prev_content, content
+                    )
+                    stats = summarize_diff(ops)
+                    diff_summary += (
+                        f" ({stats['blocks_changed']} blocks changed, "
+                        f"{stats['blocks_added']} added, {stats['blocks_removed']} removed)"
+                    )
+                    full_diff = format_diff(ops)
                 except Exception as e:
                     logger.warning(f"Failed to generate diff: {e}")
 
@@ -293,7 +346,7 @@ class ChangeTracker:
             )
 
             # Store change record
-            tracked.changes.append(change_record.to_dict())
+            self.store.add_change(change_record.to_dict())
             tracked.change_count += 1
 
             logger.info(f"Change detected at {url}: {diff_summary}")
@@ -306,13 +359,12 @@ class ChangeTracker:
         tracked.last_checked = now
         tracked.last_hash = current_hash
         tracked.last_content_length = current_length
+        self._schedule_next(tracked, success=True)
 
-        # Store snapshot (keep last 10)
-        tracked.snapshots.append(snapshot.to_dict())
-        if len(tracked.snapshots) > 10:
-            tracked.snapshots = tracked.snapshots[-10:]
+        # Store snapshot with its full content (store keeps last 10)
+        self.store.add_snapshot(snapshot.to_dict(), content=content)
 
-        # Persist to disk
+        # Persist tracking state
         self._save_tracking_data(url)
 
         return change_record
@@ -322,27 +374,87 @@ class ChangeTracker:
         force: bool = False
     ) -> List[ChangeRecord]:
         """
-        Check all tracked URLs for changes.
+        Check all due tracked URLs for changes, up to max_concurrent at a time.
 
         Args:
             force: Check all URLs regardless of interval
 
         Returns:
-            List of detected changes
+            List of detected changes (in tracking order when forced,
+            otherwise soonest due first)
         """
-        changes = []
+        if force:
+            urls = self.store.list_urls()
+        else:
+            now = time.time()
+            urls = [
+                url for url, *schedule in self.store.iter_due(now)
+                if self._schedule_due_at(*schedule) <= now
+            ]
 
-        for url in self.tracked_urls.keys():
-            try:
-                change = await self.check_url(url, force=force)
-                if change:
-                    changes.append(change)
-            except Exception as e:
-                logger.error(f"Error checking {url}: {e}")
+        results = await self._check_urls(urls)
+        changes = [change for change in results if change]
 
-        logger.info(f"Checked {len(self.tracked_urls)} URLs, found {len(changes)} changes")
+        logger.info(f"Checked {len(urls)} URLs, found {len(changes)} changes")
         return changes
 
+    async def _check_urls(self, urls: List[str]) -> List[Optional[ChangeRecord]]:
+        """Check URLs concurrently (bounded), returning results in input order"""
+        semaphore = asyncio.Semaphore(self.max_concurrent)
+
+        async def check(url: str) -> Optional[ChangeRecord]:
+            async with semaphore:
+                # Never re-track a URL untracked since it was queued
+                tracked = self._get_tracked(url)
+                if tracked is None:
+                    logger.debug(f"Skipping {url} - no longer tracked")
+                    return None
+                try:
+                    return await self._check_tracked(tracked)
+                except Exception as e:
+                    logger.error(f"Error checking {url}: {e}")
+                    return None
+
+        return await asyncio.gather(*[check(url) for url in urls])
+
+    # ========================================================================
+    # SCHEDULING
+    # ========================================================================
+
+    def _due_at(self, tracked: TrackedURL) -> float:
+        """Unix time a URL is next due (0 = immediately)"""
+        return self._schedule_due_at(tracked.next_check_at, tracked.last_checked, tracked.check_interval)
+
+    @staticmethod
+    def _schedule_due_at(next_check_at: Optional[float], last_checked: Optional[str], check_interval: int) -> float:
+        """Due time from a URL's schedule columns (0 = immediately)"""
+        if next_check_at is not None:
+            return next_check_at
+        if last_checked:
+            return datetime.fromisoformat(last_checked).timestamp() + check_interval
+        return 0.0
+
+    def _schedule_next(self, tracked: TrackedURL, success: bool):
+        """Set the next due time: jittered interval on success, back-off on failure"""
+        if success:
+            tracked.consecutive_failures = 0
+            delay = tracked.check_interval * (1 + random.uniform(-self.jitter, self.jitter))
+        else:
+            tracked.consecutive_failures += 1
+            backoff = tracked.check_interval * (2 ** tracked.consecutive_failures)
+            delay = min(backoff, max(tracked.check_interval, self.max_backoff))
+            logger.info(
+                f"{tracked.url} failed {tracked.consecutive_failures}x in a row, "
+                f"retrying in {delay:.0f}s"
+            )
+        tracked.next_check_at = time.time() + delay
+
+    def _load_schedule(self) -> List[tuple]:
+        """Build a (due_at, url) min-heap of every tracked URL from the store"""
+        schedule = [(self._schedule_due_at(*row), url) for url, *row in self.store.iter_schedule()]
+        heapq.heapify(schedule)
+        return schedule
+
     def get_change_history(
         self,
         url: str,
@@ -358,11 +470,7 @@ class ChangeTracker:
         Returns:
             List of change records (newest first)
         """
-        if url not in self.tracked_urls:
-            return []
-
-        changes = self.tracked_urls[url].changes
-        return list(reversed(changes[-limit:]))
+        return self.store.get_changes(url, limit=limit)
 
     def get_snapshots(
         self,
@@ -379,28 +487,81 @@ class ChangeTracker:
         Returns:
             List of snapshots (newest first)
         """
-        if url not in self.tracked_urls:
-            return []
+        return self.store.get_snapshots(url, limit=limit)
 
-        snapshots = self.tracked_urls[url].snapshots
-        return list(reversed(snapshots[-limit:]))
+    def get_snapshot_content(self, url: str, content_hash: str) -> Optional[str]:
+        """
+        Get the full stored content of a URL's snapshot.
+
+        Args:
+            url: Tracked URL
+            content_hash: Snapshot content hash
+
+        Returns:
+            Content, or None if no snapshot of the URL has that hash
+        """
+        if self.store.get_snapshot(url, content_hash) is None:
+            return None
+        return self.store.get_blob(content_hash)
+
+    def diff_snapshots(
+        self,
+        url: str,
+        from_hash: Optional[str] = None,
+        to_hash: Optional[str] = None,
+        context: int = 1
+    ) -> Optional[Dict]:
+        """
+        Diff two stored snapshots of a URL.
+
+        Hashes match `content_hash` of get_snapshots() and the
+        previous_hash/current_hash of change records.
+
+        Args:
+            url: Tracked URL
+            from_hash: Older snapshot (default: second newest)
+            to_hash: Newer snapshot (default: newest)
+            context: Unchanged blocks shown around each change
+
+        Returns:
+            Dict with from/to hashes, block/char counts and the rendered diff,
+            or None if either snapshot's content is not stored
+        """
+        if from_hash is None or to_hash is None:
+            recent = self.store.get_snapshots(url, limit=2)
+            if to_hash is None and recent:
+                to_hash = recent[0]['content_hash']
+            if from_hash is None and len(recent) > 1:
+                from_hash = recent[1]['content_hash']
+        if from_hash is None or to_hash is None:
+            return None
+
+        old_content = self.get_snapshot_content(url, from_hash)
+        new_content = self.get_snapshot_content(url, to_hash)
+        if old_content is None or new_content is None:
+            return None
+
+        ops = diff_blocks(old_content, new_content)
+        return {
+            'url': url,
+            'from_hash': from_hash,
+            'to_hash': to_hash,
+            **summarize_diff(ops),
+            'diff': format_diff(ops, context=context)
+        }
 
     def get_tracking_stats(self) -> Dict:
         """Get statistics about tracked URLs"""
-        total_changes = sum(t.change_count for t in self.tracked_urls.values())
-        urls_with_changes = sum(1 for t in self.tracked_urls.values() if t.change_count > 0)
-
         return {
-            'total_tracked': len(self.tracked_urls),
-            'total_changes_detected': total_changes,
-            'urls_with_changes': urls_with_changes,
+            **self.store.get_summary(),
+            'content_storage': self.store.get_blob_stats(),
             'tracked_urls': [
                 {
-                    'url': t.url,
-                    'last_checked': t.last_checked,
-                    'change_count': t.change_count
+                    'url': row['url'],
+                    'last_checked': row['last_checked'],
+                    'change_count': row['change_count']
                 }
-                for t in self.tracked_urls.values()
+                for row in self.store.iter_tracked()
             ]
         }
 
@@ -412,24 +573,53 @@ class ChangeTracker:
         """
         Continuously monitor tracked URLs.
 
+        URLs sit in a priority queue ordered by next-due time. Each cycle
+        checks the URLs that are due (up to max_concurrent at a time), then
+        sleeps until the next URL is due instead of rescanning every URL.
+
         Args:
-            interval: Check interval in seconds
+            interval: Longest idle sleep in seconds between cycles
             max_iterations: Maximum number of check cycles (None = infinite)
         """
         iteration = 0
-
-        while max_iterations is None or iteration < max_iterations:
-            logger.info(f"Starting monitoring cycle {iteration + 1}")
-
-            changes = await self.check_all_tracked()
-
-            if changes:
-                logger.info(f"Detected {len(changes)} changes in cycle {iteration + 1}")
-
-            iteration += 1
-
-            if max_iterations is None or iteration < max_iterations:
-                logger.info(f"Next check in {interval} seconds")
-                await asyncio.sleep(interval)
+        self._schedule = self._load_schedule()
+
+        try:
+            while max_iterations is None or iteration < max_iterations:
+                now = time.time()
+                due = []
+                while self._schedule and self._schedule[0][0] <= now:
+                    _, url = heapq.heappop(self._schedule)
+                    if url not in due and self._get_tracked(url) is not None:
+                        due.append(url)
+
+                if due:
+                    logger.info(f"Starting monitoring cycle {iteration + 1}: {len(due)} URLs due")
+                    results = await self._check_urls(due)
+                    changes = [change for change in results if change]
+
+                    if changes:
+                        logger.info(f"Detected {len(changes)} changes in cycle {iteration + 1}")
+
+                    # Re-queue checked URLs at their new due time
+                    for url in due:
+                        tracked = self._get_tracked(url)
+                        if tracked is not None:
+                            heapq.heappush(self._schedule, (self._due_at(tracked), url))
+
+                    iteration += 1
+                    if max_iterations is not None and iteration >= max_iterations:
+                        break
+
+                if self._schedule:
+                    sleep_for = min(interval, max(0.0, self._schedule[0][0] - time.time()))
+                else:
+                    sleep_for = interval
+
+                if sleep_for > 0:
+                    logger.info(f"Next check in {sleep_for:.0f} seconds")
+                    await asyncio.sleep(sleep_for)
+        finally:
+            self._schedule = None
 
         logger.info("Monitoring complete")
@@ -0,0 +1,150 @@
+#!/usr/bin/env python3
+"""
+Block-level content diffing for change tracking
+
+Markdown is split into paragraph blocks; paragraphs longer than
+`max_block` characters are cut further at content-defined boundaries
+found with a rolling (gear) hash, so an insertion only disturbs the
+blocks around it. Blocks are compared by digest, which keeps diffs of
+large pages (hundreds of KB) to a sequence match over a few thousand
+short keys instead of a character-level diff.
+
+Usage:
+    from firecrawl_scraper.core.content_diff import diff_blocks, format_diff, summarize_diff
+
+    ops = diff_blocks(old_markdown, new_markdown)
+    print(summarize_diff(ops))
+    print(format_diff(ops))
+"""
+
+import hashlib
+import random
+import re
+from difflib import SequenceMatcher
+from typing import Dict, List, Tuple
+
+# (tag, old_blocks, new_blocks) with tag in equal / insert / delete / replace
+DiffOp = Tuple[str, List[str], List[str]]
+
+_PARAGRAPH_BREAK = re.compile(r'\n\s*\n')
+
+# Gear table for the rolling hash (fixed seed so boundaries are stable across runs)
+_GEAR = [random.Random(0x5EED + i).getrandbits(32) for i in range(256)]
+_HASH_MASK = 0xFFFFFFFF
+
+
+def _split_long_block(block: str, max_block: int) -> List[str]:
+    """Cut an oversized block at content-defined boundaries (rolling gear hash)"""
+    target = max(64, max_block // 2)
+    boundary_mask = (1 << max(1, target.bit_length() - 1)) - 1
+    min_size = target // 4
+
+    chunks = []
+    start = 0
+    h = 0
+    for i, char in enumerate(block):
+        h = ((h << 1) + _GEAR[ord(char) & 0xFF]) & _HASH_MASK
+        size = i + 1 - start
+        if (size >= min_size and (h & boundary_mask) == 0) or size >= max_block:
+            chunks.append(block[start:i + 1])
+            start = i + 1
+            h = 0
+    if start < len(block):
+        chunks.append(block[start:])
+    return chunks
+
+
+def split_blocks(text: str, max_block: int = 4096) -> List[str]:
+    """Split text into paragraph blocks, chunking paragraphs over max_block chars"""
+    blocks = []
+    for paragraph in _PARAGRAPH_BREAK.split(text or ''):
+        paragraph = paragraph.strip('\n')
+        if not paragraph:
+            continue
+        if len(paragraph) > max_block:
+            blocks.extend(_split_long_block(paragraph, max_block))
+        else:
+            blocks.append(paragraph)
+    return blocks
+
+
+def _digest(block: str) -> bytes:
+    return hashlib.blake2b(block.encode('utf-8'), digest_size=16).digest()
+
+
+def diff_blocks(old: str, new: str, max_block: int = 4096) -> List[DiffOp]:
+    """
+    Block-level diff of two texts.
+
+    Returns:
+        List of (tag, old_blocks, new_blocks) covering both texts in order
+    """
+    old_blocks = split_blocks(old, max_block)
+    new_blocks = split_blocks(new, max_block)
+
+    matcher = SequenceMatcher(
+        None,
+        [_digest(b) for b in old_blocks],
+        [_digest(b) for b in new_blocks],
+        autojunk=False
+    )
+    return [
+        (tag, old_blocks[i1:i2], new_blocks[j1:j2])
+        for tag, i1, i2, j1, j2 in matcher.get_opcodes()
+    ]
+
+
+def summarize_diff(ops: List[DiffOp]) -> Dict[str, int]:
+    """Count added / removed / changed blocks and characters"""
+    summary = {'blocks_added': 0, 'blocks_removed': 0, 'blocks_changed': 0,
+               'chars_added': 0, 'chars_removed': 0}
+    for tag, old_blocks, new_blocks in ops:
+        if tag == 'equal':
+            continue
+        if tag == 'insert':
+            summary['blocks_added'] += len(new_blocks)
+        elif tag == 'delete':
+            summary['blocks_removed'] += len(old_blocks)
+        else:
+            changed = min(len(old_blocks), len(new_blocks))
+            summary['blocks_changed'] += changed
+            summary['blocks_added'] += len(new_blocks) - changed
+            summary['blocks_removed'] += len(old_blocks) - changed
+        summary['chars_added'] += sum(len(b) for b in new_blocks)
+        summary['chars_removed'] += sum(len(b) for b in old_blocks)
+    return summary
+
+
+def format_diff(ops: List[DiffOp], context: int = 1) -> str:
+    """
+    Render ops as a readable block diff.
+
+    Removed blocks are prefixed with '- ', added blocks with '+ ', and up
+    to `context` unchanged blocks are kept around each change.
+    """
+    if all(tag == 'equal' for tag, _, _ in ops):
+        return ''
+
+    lines = []
+    last = len(ops) - 1
+    for index, (tag, old_blocks, new_blocks) in enumerate(ops):
+        if tag != 'equal':
+            lines.extend(_prefix('- ', old_blocks))
+            lines.extend(_prefix('+ ', new_blocks))
+            continue
+
+        lead = old_blocks[:context] if index > 0 else []
+        trail = old_blocks[-context:] if index < last and context else []
+        if index > 0 and index < last and len(old_blocks) <= 2 * context:
+            lines.extend(_prefix('  ', old_blocks))
+            continue
+
+        lines.extend(_prefix('  ', lead))
+        if len(old_blocks) > len(lead) + len(trail):
+            lines.append('@@')
+        lines.extend(_prefix('  ', trail))
+    return '\n'.join(lines)
+
+
+def _prefix(marker: str, blocks: List[str]) -> List[str]:
+    return [marker + line for block in blocks for line in block.split('\n')]
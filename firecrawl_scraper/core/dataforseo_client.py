@@ -22,14 +22,20 @@ Usage:
 import os
 import base64
 import asyncio
+import hashlib
 import json
 import logging
-from typing import Dict, List, Any, Optional, Union
+import weakref
+from typing import AsyncIterator, Dict, List, Any, Optional, Union
 from dataclasses import dataclass, field
 from datetime import datetime
 
 import aiohttp
 
+from .rate_limiter import RateGovernor, RateLimitError, TokenBucket, get_governor, parse_retry_after
+from .single_flight import get_single_flight
+from .task_queue import TaskQueue
+
 logger = logging.getLogger(__name__)
 
 
@@ -42,6 +48,7 @@ class DataForSEOStats:
     total_cost: float = 0.0
     endpoint_usage: Dict[str, int] = field(default_factory=dict)
     endpoint_costs: Dict[str, float] = field(default_factory=dict)
+    coalesced_requests: int = 0  # Served by an identical request in flight
 
 
 class DataForSEOClient:
@@ -54,10 +61,16 @@ class DataForSEOClient:
     - Automatic retry with exponential backoff
     - Cost tracking
     - Task-based API support (POST task, GET results)
+    - Standard-queue mode for SERP/keyword calls (`queued=True`): cheaper
+      task_post/tasks_ready/task_get instead of live endpoints
+    - Pooled keep-alive HTTP session (use `async with` or `await aclose()`)
     """
 
     BASE_URL = "https://api.dataforseo.com/v3"
 
+    # Live clients, so entry points can release pooled sessions on exit
+    _instances: 'weakref.WeakSet[DataForSEOClient]' = weakref.WeakSet()
+
     # API cost estimates (approximate, varies by endpoint)
     COSTS = {
         'serp_google_organic': 0.002,
@@ -73,13 +86,28 @@ class DataForSEOClient:
         'labs_keyword_ideas': 0.05,
     }
 
+    # Tasks accepted per POST. Live endpoints take a single task per call;
+    # standard-queue task_post endpoints accept up to 100.
+    LIVE_TASK_LIMIT = 1
+    TASK_POST_LIMIT = 100
+
+    # Pages returned per /on_page/pages request at most
+    ONPAGE_PAGE_LIMIT = 1000
+
     def __init__(
         self,
         login: Optional[str] = None,
         password: Optional[str] = None,
         max_retries: int = 3,
         retry_delay: float = 1.0,
-        timeout: int = 120
+        timeout: int = 120,
+        max_connections: int = 30,
+        max_connections_per_host: int = 30,
+        keepalive_timeout: float = 30.0,
+        governor: Optional[RateGovernor] = None,
+        queued: bool = False,
+        queue_poll_interval: float = 10.0,
+        queue_max_wait: float = 3600.0
     ):
         """
         Initialize DataForSEO client.
@@ -90,6 +118,16 @@ class DataForSEOClient:
             max_retries: Maximum retry attempts
             retry_delay: Base delay for exponential backoff (seconds)
             timeout: Request timeout (seconds)
+            max_connections: Total connections kept in the pool
+            max_connections_per_host: Connections per host in the pool
+            keepalive_timeout: Seconds an idle connection is kept open
+            governor: Rate/concurrency limits (defaults to the process-wide
+                'dataforseo' governor shared by all clients)
+            queued: Run SERP/keyword calls through the standard queue by
+                default (per-call `queued=` overrides)
+            queue_poll_interval: Seconds between tasks_ready checks
+            queue_max_wait: Seconds before a queued task that is never
+                reported ready is fetched directly or failed
         """
         self.login = login or os.getenv('DATAFORSEO_LOGIN')
         self.password = password or os.getenv('DATAFORSEO_PASSWORD')
@@ -107,15 +145,114 @@ class DataForSEOClient:
         # Create auth header (HTTP Basic Auth)
         credentials = f"{self.login}:{self.password}"
         self._auth_header = base64.b64encode(credentials.encode()).decode()
+        self._headers = {
+            'Authorization': f'Basic {self._auth_header}',
+            'Content-Type': 'application/json'
+        }
 
         self.stats = DataForSEOStats()
 
+        # Pooled aiohttp session (created lazily inside the running loop)
+        self.max_connections = max_connections
+        self.max_connections_per_host = max_connections_per_host
+        self.keepalive_timeout = keepalive_timeout
+        self._session: Optional[aiohttp.ClientSession] = None
+        self._session_loop: Optional[asyncio.AbstractEventLoop] = None
+
+        # Account limits shared with every other client in the process
+        self.governor = governor or get_governor('dataforseo')
+
+        # Identical concurrent requests (from any client on the same
+        # account) share one API call
+        self.flights = get_single_flight('dataforseo')
+        self._account_key = hashlib.sha256(credentials.encode()).hexdigest()[:16]
+
+        # Standard-queue execution (task_post -> tasks_ready -> task_get)
+        self.queued = queued
+        self.queue = TaskQueue(self, poll_interval=queue_poll_interval, max_wait=queue_max_wait)
+
+        DataForSEOClient._instances.add(self)
+
     def _get_headers(self) -> Dict[str, str]:
         """Get HTTP headers with authentication"""
-        return {
-            'Authorization': f'Basic {self._auth_header}',
-            'Content-Type': 'application/json'
-        }
+        return self._headers
+
+    # ========================================================================
+    # SESSION LIFECYCLE
+    # ========================================================================
+
+    async def __aenter__(self) -> 'DataForSEOClient':
+        self._get_session()
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        await self.aclose()
+
+    def _get_session(self) -> aiohttp.ClientSession:
+        """
+        Return the shared pooled session, creating it on first use.
+
+        Reopened when closed or when called from a different event loop;
+        a session left open by another loop is released first.
+        """
+        loop = asyncio.get_running_loop()
+        session = self._session
+
+        if session is not None and not session.closed and self._session_loop is loop:
+            return session
+        self._release_stale_session(session, self._session_loop)
+
+        connector = aiohttp.TCPConnector(
+            limit=self.max_connections,
+            limit_per_host=self.max_connections_per_host,
+            keepalive_timeout=self.keepalive_timeout,
+            ttl_dns_cache=300
+        )
+        self._session = aiohttp.ClientSession(
+            connector=connector,
+            headers=self._headers,
+            timeout=aiohttp.ClientTimeout(total=self.timeout)
+        )
+        self._session_loop = loop
+        return self._session
+
+    @staticmethod
+    def _release_stale_session(
+        session: Optional[aiohttp.ClientSession],
+        loop: Optional[asyncio.AbstractEventLoop]
+    ) -> None:
+        """
+        Release a session opened in another event loop.
+
+        Closed on its own loop when that loop is still open; otherwise
+        detached, with its connector's connections dropped.
+        """
+        if session is None or session.closed:
+            return
+        if loop is not None and not loop.is_closed():
+            asyncio.run_coroutine_threadsafe(session.close(), loop)
+            return
+        connector = session.connector
+        session.detach()
+        if connector is not None and not connector.closed:
+            connector._close()  # Nothing left to await once the loop is closed
+
+    async def aclose(self) -> None:
+        """Stop the task queue and close the pooled HTTP session"""
+        await self.queue.close()
+
+        session = self._session
+        self._session = None
+        self._session_loop = None
+
+        if session is not None and not session.closed:
+            await session.close()
+
+    @classmethod
+    async def close_all(cls) -> None:
+        """Close the pooled sessions of every live client"""
+        for client in list(cls._instances):
+            await client.aclose()
 
     # ========================================================================
     # CORE REQUEST METHOD
@@ -131,6 +268,14 @@ class DataForSEOClient:
         """
         Make authenticated request to DataForSEO API.
 
+        Each attempt goes through the shared rate governor; every task in a
+        POST counts against its tasks-per-minute budget. A 429 pauses all
+        requests until the Retry-After deadline.
+
+        Concurrent identical requests (same account, endpoint and payload)
+        share one API call; callers that joined get a copy marked 'coalesced' with
+        cost 0, so the charge is only counted once.
+
         Args:
             endpoint: API endpoint path (e.g., '/serp/google/organic/live/advanced')
             method: HTTP method (GET or POST)
@@ -140,24 +285,95 @@ class DataForSEOClient:
         Returns:
             Dict with 'success', 'data', 'cost' keys
         """
+        key = self._request_key(endpoint, method, data)
+        result, shared = await self.flights.do(
+            key, lambda: self._send(endpoint, method, data, cost_key)
+        )
+        if shared:
+            self.stats.coalesced_requests += 1
+            result['coalesced'] = True
+            result['cost'] = 0
+        return result
+
+    async def _call(
+        self,
+        endpoint: str,
+        data: List[Dict],
+        cost_key: Optional[str] = None,
+        queued: Optional[bool] = None
+    ) -> Dict:
+        """
+        Run a single-task call live or through the standard queue.
+
+        Args:
+            queued: Use the standard queue (default: the client's mode).
+                Endpoints without a queue equivalent always run live.
+        """
+        if self._use_queue(endpoint, queued):
+            return await self.queue.submit(endpoint, data[0], cost_key)
+        return await self._request(endpoint, data=data, cost_key=cost_key)
+
+    def _use_queue(self, endpoint: str, queued: Optional[bool]) -> bool:
+        return (self.queued if queued is None else queued) and self.queue.supports(endpoint)
+
+    def _request_key(self, endpoint: str, method: str, data: Optional[List[Dict]]) -> str:
+        """
+        Canonical key of a request for in-flight de-duplication
+
+        Scoped to the client's credentials: another account's identical
+        request must be charged to, and return task ids owned by, that account.
+        """
+        if data and len(data) == 1:
+            # A lone task's tag only routes its result (see
+            # _split_batch_response), so identical live queries from
+            # different batches still share one call
+            data = [{k: v for k, v in data[0].items() if k != 'tag'}]
+        canonical = json.dumps(
+            {'account': self._account_key, 'endpoint': endpoint, 'method': method, 'data': data},
+            sort_keys=True,
+            separators=(',', ':'),
+            default=str
+        )
+        return hashlib.sha256(canonical.encode('utf-8')).hexdigest()
+
+    async def _send(
+        self,
+        endpoint: str,
+        method: str,
+        data: Optional[List[Dict]],
+        cost_key: Optional[str]
+    ) -> Dict:
+        """Perform one request with retries (see _request)"""
         url = f"{self.BASE_URL}{endpoint}"
         self.stats.total_requests += 1
 
         if cost_key:
             self.stats.endpoint_usage[cost_key] = self.stats.endpoint_usage.get(cost_key, 0) + 1
 
+        tasks = len(data) if method != 'GET' and data else 0
+
         for attempt in range(self.max_retries):
             try:
-                async with aiohttp.ClientSession() as session:
-                    timeout = aiohttp.ClientTimeout(total=self.timeout)
+                async with self.governor.request(credits=tasks):
+                    session = self._get_session()
 
                     if method == 'GET':
-                        async with session.get(url, headers=self._get_headers(), timeout=timeout) as response:
+                        async with session.get(url) as response:
                             return await self._handle_response(response, cost_key)
                     else:
-                        async with session.post(url, headers=self._get_headers(), json=data, timeout=timeout) as response:
+                        async with session.post(url, json=data) as response:
                             return await self._handle_response(response, cost_key)
 
+            except RateLimitError as e:
+                if attempt < self.max_retries - 1:
+                    if e.retry_after is None:
+                        await asyncio.sleep(self.retry_delay * (2 ** attempt))
+                    logger.warning(f"Rate limited by DataForSEO, retrying: {e}")
+                else:
+                    self.stats.failed_requests += 1
+                    logger.error(f"Rate limited after {self.max_retries} attempts: {e}")
+                    return {'success': False, 'error': str(e), 'status_code': 429}
+
             except Exception as e:
                 if attempt < self.max_retries - 1:
                     delay = self.retry_delay * (2 ** attempt)
@@ -172,6 +388,12 @@ class DataForSEOClient:
 
     async def _handle_response(self, response, cost_key: Optional[str] = None) -> Dict:
         """Handle API response"""
+        if response.status == 429:
+            retry_after = parse_retry_after(response.headers.get('Retry-After'))
+            if retry_after is not None:
+                self.governor.pause(retry_after)
+            raise RateLimitError("DataForSEO rate limit hit (HTTP 429)", retry_after)
+
         try:
             data = await response.json()
         except (aiohttp.ContentTypeError, json.JSONDecodeError) as e:
@@ -213,6 +435,221 @@ class DataForSEOClient:
                 'status_code': response.status
             }
 
+    # ========================================================================
+    # MULTI-TASK BATCHING
+    # ========================================================================
+
+    def get_task_limit(self, endpoint: str) -> int:
+        """Maximum number of task objects an endpoint accepts per POST"""
+        if endpoint.rstrip('/').endswith('/task_post'):
+            return self.TASK_POST_LIMIT
+        return self.LIVE_TASK_LIMIT
+
+    async def batch_request(
+        self,
+        endpoint: str,
+        tasks: List[Dict],
+        cost_key: Optional[str] = None,
+        max_tasks_per_request: Optional[int] = None,
+        max_concurrent: int = 5,
+        rate_limiter: Optional[TokenBucket] = None,
+        semaphore: Optional[asyncio.Semaphore] = None,
+        queued: Optional[bool] = None
+    ) -> Dict[str, Dict]:
+        """
+        Send many task objects to one endpoint, packing as many per POST as
+        the endpoint allows, and demultiplex results by task tag.
+
+        In queued mode the tasks go through the standard queue instead
+        (up to TASK_POST_LIMIT per task_post) and the call returns once
+        every result has been collected.
+
+        Each task is given a `tag` (its index, unless the caller set one);
+        DataForSEO echoes it back in `task['data']['tag']`.
+
+        Args:
+            endpoint: API endpoint path
+            tasks: Task objects (same shape as the single-call `data` items)
+            cost_key: Key for cost tracking
+            max_tasks_per_request: Override for the endpoint task limit
+            max_concurrent: Maximum POSTs in flight
+            rate_limiter: Optional token bucket acquired before each POST
+            semaphore: Shared semaphore to use instead of max_concurrent, so
+                callers can put several batches under one in-flight budget
+            queued: Use the standard queue (default: the client's mode)
+
+        Returns:
+            Dict mapping tag -> response shaped like `_request()` output,
+            with `data` holding that task only
+        """
+        tagged = []
+        for i, task in enumerate(tasks):
+            task = dict(task)
+            task.setdefault('tag', str(i))
+            tagged.append(task)
+
+        if self._use_queue(endpoint, queued):
+            responses = await asyncio.gather(*[
+                self.queue.submit(endpoint, task, cost_key) for task in tagged
+            ])
+            return {task['tag']: response for task, response in zip(tagged, responses)}
+
+        limit = max(1, max_tasks_per_request or self.get_task_limit(endpoint))
+        chunks = [tagged[i:i + limit] for i in range(0, len(tagged), limit)]
+        semaphore = semaphore or asyncio.Semaphore(max(1, max_concurrent))
+        results: Dict[str, Dict] = {}
+        completed_chunks = 0
+
+        async def send(chunk: List[Dict]):
+            nonlocal completed_chunks
+            async with semaphore:
+                if rate_limiter:
+                    await rate_limiter.acquire()
+                response = await self._request(endpoint, data=chunk, cost_key=cost_key)
+
+            results.update(self._split_batch_response(response, chunk))
+
+            # Progress logging
+            completed_chunks += 1
+            if completed_chunks % 10 == 0:
+                logger.info(f"Batch progress: {completed_chunks}/{len(chunks)} requests to {endpoint}")
+
+        await asyncio.gather(*[send(chunk) for chunk in chunks])
+        return results
+
+    @staticmethod
+    def _split_batch_response(response: Dict, chunk: List[Dict]) -> Dict[str, Dict]:
+        """Map each task in a multi-task response back to its request tag"""
+        tags = [task['tag'] for task in chunk]
+
+        if not response.get('success'):
+            return {tag: response for tag in tags}
+
+        split = {}
+        for position, task in enumerate(response.get('data') or []):
+            tag = (task.get('data') or {}).get('tag')
+            if len(tags) == 1 or (tag is None and position < len(tags)):
+                # A single-task response may echo another caller's tag when coalesced
+                tag = tags[position] if position < len(tags) else None
+            if tag is None:
+                continue
+            split[str(tag)] = {
+                **response,
+                'data': [task],
+                'cost': 0 if response.get('coalesced') else task.get('cost', 0),
+                'status_code': task.get('status_code'),
+                'status_message': task.get('status_message')
+            }
+
+        for tag in tags:
+            if tag not in split:
+                split[tag] = {'success': False, 'error': 'Task missing from batch response'}
+
+        return split
+
+    async def serp_google_organic_batch(
+        self,
+        queries: List[Dict],
+        language_code: str = "en",
+        device: str = "desktop",
+        depth: int = 100,
+        max_concurrent: int = 5,
+        semaphore: Optional[asyncio.Semaphore] = None,
+        queued: Optional[bool] = None
+    ) -> Dict[str, Dict]:
+        """
+        Google organic results for many keyword/location pairs.
+
+        Args:
+            queries: Dicts with `keyword`, `location_name` and optional `tag`
+            language_code: Default language code
+            device: Default device type
+            depth: Default number of results
+            queued: Use the standard queue (default: the client's mode)
+
+        Returns:
+            Dict mapping tag -> response in the serp_google_organic() shape
+        """
+        tasks = [{
+            "language_code": language_code,
+            "device": device,
+            "depth": depth,
+            **query
+        } for query in queries]
+
+        return await self.batch_request(
+            '/serp/google/organic/live/advanced',
+            tasks,
+            cost_key='serp_google_organic',
+            max_concurrent=max_concurrent,
+            semaphore=semaphore,
+            queued=queued
+        )
+
+    async def serp_google_maps_by_coordinates_batch(
+        self,
+        keyword: str,
+        coordinates: List[tuple],
+        zoom: int = 17,
+        language_code: str = "en",
+        depth: int = 20,
+        max_concurrent: int = 5,
+        rate_limiter: Optional[TokenBucket] = None,
+        queued: Optional[bool] = None
+    ) -> Dict[str, Dict]:
+        """
+        Google Maps results for one keyword at many coordinates.
+
+        Tasks are tagged with the coordinate index ("0", "1", ...).
+
+        Returns:
+            Dict mapping tag -> response in the serp_google_maps_by_coordinates() shape
+        """
+        tasks = [{
+            "keyword": keyword,
+            "location_coordinate": f"{lat:.7f},{lng:.7f},{zoom}",
+            "language_code": language_code,
+            "depth": depth,
+            "tag": str(i)
+        } for i, (lat, lng) in enumerate(coordinates)]
+
+        return await self.batch_request(
+            '/serp/google/maps/live/advanced',
+            tasks,
+            cost_key='serp_google_maps',
+            max_concurrent=max_concurrent,
+            rate_limiter=rate_limiter,
+            queued=queued
+        )
+
+    async def keywords_google_ads_batch(
+        self,
+        keyword_groups: List[List[str]],
+        location_code: int = 2840,
+        language_code: str = "en",
+        max_concurrent: int = 5,
+        queued: Optional[bool] = None
+    ) -> Dict[str, Dict]:
+        """
+        Google Ads keyword data for several keyword lists (max 1000 each).
+
+        Tasks are tagged with the group index ("0", "1", ...).
+        """
+        tasks = [{
+            "keywords": keywords[:1000],
+            "location_code": location_code,
+            "language_code": language_code,
+            "tag": str(i)
+        } for i, keywords in enumerate(keyword_groups)]
+
+        return await self.batch_request(
+            '/keywords_data/google_ads/search_volume/live',
+            tasks,
+            cost_key='keywords_google_ads',
+            max_concurrent=max_concurrent,
+            queued=queued
+        )
+
     # ========================================================================
     # SERP API - Search Engine Results
     # ========================================================================
@@ -223,7 +660,8 @@ class DataForSEOClient:
         location_name: str = "United States",
         language_code: str = "en",
         device: str = "desktop",
-        depth: int = 100
+        depth: int = 100,
+        queued: Optional[bool] = None
     ) -> Dict:
         """
         Get Google organic search results for a keyword.
@@ -234,6 +672,7 @@ class DataForSEOClient:
             language_code: Language code (e.g., "en", "es", "de")
             device: Device type ("desktop" or "mobile")
             depth: Number of results to return (10-700)
+            queued: Use the standard queue (default: the client's mode)
 
         Returns:
             Dict with SERP data including rankings, snippets, URLs
@@ -246,17 +685,19 @@ class DataForSEOClient:
             "depth": depth
         }]
 
-        return await self._request(
+        return await self._call(
             '/serp/google/organic/live/advanced',
             data=data,
-            cost_key='serp_google_organic'
+            cost_key='serp_google_organic',
+            queued=queued
         )
 
     async def serp_google_maps(
         self,
         keyword: str,
         location_name: str = "United States",
-        language_code: str = "en"
+        language_code: str = "en",
+        queued: Optional[bool] = None
     ) -> Dict:
         """Get Google Maps/Local results"""
         data = [{
@@ -265,17 +706,19 @@ class DataForSEOClient:
             "language_code": language_code
         }]
 
-        return await self._request(
+        return await self._call(
             '/serp/google/maps/live/advanced',
             data=data,
-            cost_key='serp_google_maps'
+            cost_key='serp_google_maps',
+            queued=queued
         )
 
     async def serp_bing_organic(
         self,
         keyword: str,
         location_name: str = "United States",
-        language_code: str = "en"
+        language_code: str = "en",
+        queued: Optional[bool] = None
     ) -> Dict:
         """Get Bing organic search results"""
         data = [{
@@ -284,10 +727,11 @@ class DataForSEOClient:
             "language_code": language_code
         }]
 
-        return await self._request(
+        return await self._call(
             '/serp/bing/organic/live/advanced',
             data=data,
-            cost_key='serp_bing_organic'
+            cost_key='serp_bing_organic',
+            queued=queued
         )
 
     # ========================================================================
@@ -301,7 +745,8 @@ class DataForSEOClient:
         longitude: float,
         zoom: int = 17,
         language_code: str = "en",
-        depth: int = 20
+        depth: int = 20,
+        queued: Optional[bool] = None
     ) -> Dict:
         """
         Get Google Maps results at specific coordinates.
@@ -314,6 +759,7 @@ class DataForSEOClient:
             zoom: Map zoom level (3-21, 17 recommended for local)
             language_code: Language code
             depth: Number of results to return
+            queued: Use the standard queue (default: the client's mode)
 
         Returns:
             Dict with local pack results at the specified location
@@ -328,10 +774,11 @@ class DataForSEOClient:
             "depth": depth
         }]
 
-        return await self._request(
+        return await self._call(
             '/serp/google/maps/live/advanced',
             data=data,
-            cost_key='serp_google_maps'
+            cost_key='serp_google_maps',
+            queued=queued
         )
 
     def build_geo_grid(
@@ -382,106 +829,144 @@ class DataForSEOClient:
         grid_coords: list,
         language_code: str = "en",
         depth: int = 20,
-        delay_between_requests: float = 0.1
+        delay_between_requests: Optional[float] = None,
+        max_concurrent: int = 5,
+        requests_per_second: Optional[float] = None
     ) -> Dict:
         """
         Query Google Maps for entire grid.
 
+        Grid points are sent as tagged tasks through batch_request (up to
+        `max_concurrent` requests in flight, paced by a token bucket). Results
+        and competitor aggregation are built in grid_index order, so output
+        does not depend on completion order.
+
         Args:
             keyword: Search keyword
             grid_coords: List of (lat, lng) tuples from build_geo_grid
             language_code: Language code
             depth: Results per grid point
-            delay_between_requests: Delay between API calls
+            delay_between_requests: Minimum spacing between API calls, used as
+                the request rate when requests_per_second is not given
+            max_concurrent: Maximum grid points queried in parallel
+            requests_per_second: Token-bucket rate for grid requests. Account
+                limits are enforced by the shared governor either way; this
+                only slows the grid further.
 
         Returns:
             Dict with grid_results (list), heatmap_data, and all competitors found
         """
-        results = []
-        all_competitors = {}  # Track all businesses found and their positions
-
         logger.info(f"Querying local search grid: {len(grid_coords)} points for '{keyword}'")
 
-        for i, (lat, lng) in enumerate(grid_coords):
-            try:
-                response = await self.serp_google_maps_by_coordinates(
-                    keyword=keyword,
-                    latitude=lat,
-                    longitude=lng,
-                    language_code=language_code,
-                    depth=depth
-                )
-
-                grid_point_result = {
-                    'lat': lat,
-                    'lng': lng,
-                    'grid_index': i,
-                    'success': response.get('success', False),
-                    'rankings': []
-                }
-
-                if response.get('success'):
-                    # Extract rankings from response (null-safe iteration)
-                    tasks = response.get('data') or []
-                    for task in tasks:
-                        task_results = task.get('result') or []
-                        for result_set in task_results:
-                            items = result_set.get('items') or []
-                            for rank, item in enumerate(items, 1):
-                                if item.get('type') in ['maps_search', 'maps_paid']:
-                                    business_name = item.get('title', 'Unknown')
-                                    rating_data = item.get('rating') or {}
-                                    grid_point_result['rankings'].append({
-                                        'position': rank,
-                                        'title': business_name,
-                                        'rating': rating_data.get('value'),
-                                        'reviews_count': rating_data.get('votes_count'),
-                                        'address': item.get('address'),
-                                        'domain': item.get('domain'),
-                                        'phone': item.get('phone'),
-                                        'place_id': item.get('place_id'),
-                                        'cid': item.get('cid'),
-                                        'is_paid': item.get('type') == 'maps_paid'
-                                    })
-
-                                    # Track competitor across all grid points
-                                    if business_name not in all_competitors:
-                                        all_competitors[business_name] = {
-                                            'name': business_name,
-                                            'positions': [],
-                                            'avg_position': 0,
-                                            'grid_presence': 0,
-                                            'rating': rating_data.get('value'),
-                                            'reviews_count': rating_data.get('votes_count'),
-                                            'domain': item.get('domain'),
-                                            'phone': item.get('phone')
-                                        }
-                                    all_competitors[business_name]['positions'].append({
-                                        'grid_index': i,
-                                        'lat': lat,
-                                        'lng': lng,
-                                        'position': rank
-                                    })
-
-                results.append(grid_point_result)
-
-                if delay_between_requests > 0:
-                    await asyncio.sleep(delay_between_requests)
-
-                # Progress logging
-                if (i + 1) % 10 == 0:
-                    logger.info(f"Grid progress: {i + 1}/{len(grid_coords)} points queried")
+        if requests_per_second is None and delay_between_requests:
+            requests_per_second = 1.0 / delay_between_requests
+        bucket = TokenBucket(requests_per_second) if requests_per_second else None
 
-            except Exception as e:
-                logger.error(f"Grid point {i} ({lat}, {lng}) failed: {e}")
+        try:
+            responses = await self.serp_google_maps_by_coordinates_batch(
+                keyword=keyword,
+                coordinates=grid_coords,
+                language_code=language_code,
+                depth=depth,
+                max_concurrent=max_concurrent,
+                rate_limiter=bucket
+            )
+        except Exception as e:
+            logger.error(f"Grid query for '{keyword}' failed: {e}")
+            responses = {}
+
+        results = []
+        for i, (lat, lng) in enumerate(grid_coords):
+            response = responses.get(str(i))
+            if response is None:
                 results.append({
                     'lat': lat,
                     'lng': lng,
                     'grid_index': i,
                     'success': False,
-                    'error': str(e),
+                    'error': 'No response for grid point',
                     'rankings': []
                 })
+                continue
+            results.append(self._parse_grid_point(response, i, lat, lng))
+
+        sorted_competitors = self._aggregate_grid_competitors(results)
+
+        return {
+            'keyword': keyword,
+            'grid_size': len(grid_coords),
+            'grid_results': results,
+            'competitors': sorted_competitors,
+            'total_competitors_found': len(sorted_competitors),
+            'cost': self.stats.total_cost
+        }
+
+    @staticmethod
+    def _parse_grid_point(response: Dict, grid_index: int, lat: float, lng: float) -> Dict:
+        """Convert a maps-by-coordinates response into a grid point result"""
+        grid_point_result = {
+            'lat': lat,
+            'lng': lng,
+            'grid_index': grid_index,
+            'success': response.get('success', False),
+            'rankings': []
+        }
+
+        if response.get('success'):
+            # Extract rankings from response (null-safe iteration)
+            tasks = response.get('data') or []
+            for task in tasks:
+                task_results = task.get('result') or []
+                for result_set in task_results:
+                    items = result_set.get('items') or []
+                    for rank, item in enumerate(items, 1):
+                        if item.get('type') in ['maps_search', 'maps_paid']:
+                            rating_data = item.get('rating') or {}
+                            grid_point_result['rankings'].append({
+                                'position': rank,
+                                'title': item.get('title', 'Unknown'),
+                                'rating': rating_data.get('value'),
+                                'reviews_count': rating_data.get('votes_count'),
+                                'address': item.get('address'),
+                                'domain': item.get('domain'),
+                                'phone': item.get('phone'),
+                                'place_id': item.get('place_id'),
+                                'cid': item.get('cid'),
+                                'is_paid': item.get('type') == 'maps_paid'
+                            })
+
+        return grid_point_result
+
+    @staticmethod
+    def _aggregate_grid_competitors(grid_results: List[Dict]) -> List[Dict]:
+        """
+        Track every business across grid points and rank by visibility.
+
+        Points are walked in grid_index order so ties in the ranking resolve
+        the same way on every run.
+        """
+        all_competitors = {}  # Track all businesses found and their positions
+
+        for point in sorted(grid_results, key=lambda p: p['grid_index']):
+            for ranking in point.get('rankings', []):
+                business_name = ranking['title']
+                if business_name not in all_competitors:
+                    all_competitors[business_name] = {
+                        'name': business_name,
+                        'positions': [],
+                        'avg_position': 0,
+                        'grid_presence': 0,
+                        'rating': ranking.get('rating'),
+                        'reviews_count': ranking.get('reviews_count'),
+                        'domain': ranking.get('domain'),
+                        'phone': ranking.get('phone')
+                    }
+                all_competitors[business_name]['positions'].append({
+                    'grid_index': point['grid_index'],
+                    'lat': point['lat'],
+                    'lng': point['lng'],
+                    'position': ranking['position']
+                })
 
         # Calculate competitor statistics
         for name, data in all_competitors.items():
@@ -492,20 +977,11 @@ class DataForSEOClient:
                 data['avg_position'] = sum(positions) / len(positions) if positions else 0
 
         # Sort competitors by grid presence (most visible first)
-        sorted_competitors = sorted(
+        return sorted(
             all_competitors.values(),
             key=lambda x: (-x['grid_presence'], x['avg_position'])
         )
 
-        return {
-            'keyword': keyword,
-            'grid_size': len(grid_coords),
-            'grid_results': results,
-            'competitors': sorted_competitors,
-            'total_competitors_found': len(all_competitors),
-            'cost': self.stats.total_cost
-        }
-
     # ========================================================================
     # BUSINESS DATA API - Google My Business
     # ========================================================================
@@ -643,7 +1119,8 @@ class DataForSEOClient:
         self,
         keywords: List[str],
         location_code: int = 2840,  # USA
-        language_code: str = "en"
+        language_code: str = "en",
+        queued: Optional[bool] = None
     ) -> Dict:
         """
         Get keyword data from Google Ads.
@@ -652,6 +1129,7 @@ class DataForSEOClient:
             keywords: List of keywords (max 1000)
             location_code: Location code (2840 = USA)
             language_code: Language code
+            queued: Use the standard queue (default: the client's mode)
 
         Returns:
             Dict with search volume, CPC, competition for each keyword
@@ -662,10 +1140,11 @@ class DataForSEOClient:
             "language_code": language_code
         }]
 
-        return await self._request(
+        return await self._call(
             '/keywords_data/google_ads/search_volume/live',
             data=data,
-            cost_key='keywords_google_ads'
+            cost_key='keywords_google_ads',
+            queued=queued
         )
 
     async def keywords_for_site(
@@ -673,7 +1152,8 @@ class DataForSEOClient:
         target: str,
         location_code: int = 2840,
         language_code: str = "en",
-        include_serp_info: bool = True
+        include_serp_info: bool = True,
+        queued: Optional[bool] = None
     ) -> Dict:
         """
         Get keywords that a domain ranks for.
@@ -683,6 +1163,7 @@ class DataForSEOClient:
             location_code: Location code
             language_code: Language code
             include_serp_info: Include SERP position data
+            queued: Use the standard queue (default: the client's mode)
 
         Returns:
             Dict with keywords, positions, search volumes
@@ -694,10 +1175,11 @@ class DataForSEOClient:
             "include_serp_info": include_serp_info
         }]
 
-        return await self._request(
+        return await self._call(
             '/keywords_data/google_ads/keywords_for_site/live',
             data=data,
-            cost_key='keywords_for_site'
+            cost_key='keywords_for_site',
+            queued=queued
         )
 
     # ========================================================================
@@ -854,33 +1336,42 @@ class DataForSEOClient:
     async def onpage_pages(
         self,
         task_id: str,
-        limit: int = 100
+        limit: int = 100,
+        offset: int = 0,
+        filters: Optional[List] = None
     ) -> Dict:
         """
         Get OnPage crawled pages.
 
         Args:
             task_id: Task ID from task_post
-            limit: Number of pages to return
+            limit: Number of pages to return (max ONPAGE_PAGE_LIMIT)
+            offset: Number of pages to skip
+            filters: Optional DataForSEO filter expression
 
         Returns:
             Dict with page-level SEO data
         """
-        data = [{
+        task = {
             "id": task_id,
-            "limit": limit
-        }]
+            "limit": limit,
+            "offset": offset
+        }
+        if filters:
+            task["filters"] = filters
 
         return await self._request(
             '/on_page/pages',
-            data=data,
-            cost_key='onpage_pages'
+            data=[task],
+            cost_key='onpage_pages_filtered' if filters else 'onpage_pages'
         )
 
     async def onpage_pages_by_resource(
         self,
         task_id: str,
-        resource_type: str = "broken"
+        resource_type: str = "broken",
+        limit: int = 100,
+        offset: int = 0
     ) -> Dict:
         """
         Get pages filtered by resource type.
@@ -888,18 +1379,97 @@ class DataForSEOClient:
         Args:
             task_id: Task ID from task_post
             resource_type: Filter type ("broken", "redirect", "duplicate_content", etc.)
+            limit: Number of pages to return
+            offset: Number of pages to skip
         """
-        data = [{
-            "id": task_id,
-            "filters": [["resource_type", "=", resource_type]]
-        }]
-
-        return await self._request(
-            '/on_page/pages',
-            data=data,
-            cost_key='onpage_pages_filtered'
+        return await self.onpage_pages(
+            task_id,
+            limit=limit,
+            offset=offset,
+            filters=[["resource_type", "=", resource_type]]
         )
 
+    async def iter_onpage_pages(
+        self,
+        task_id: str,
+        resource_type: Optional[str] = None,
+        page_size: int = ONPAGE_PAGE_LIMIT,
+        max_concurrent: int = 4,
+        max_items: Optional[int] = None
+    ) -> AsyncIterator[Dict]:
+        """
+        Stream every crawled page of an OnPage task, following offsets until exhausted
+
+        The first request reports the total; the remaining offsets are then
+        fetched in a sliding window of `max_concurrent` requests and yielded
+        in offset order. Retrieval stops at the total or at the first short
+        page, whichever comes first.
+
+        Args:
+            task_id: Task ID from task_post
+            resource_type: Only pages of this resource type (see onpage_pages_by_resource)
+            page_size: Pages per request (max ONPAGE_PAGE_LIMIT)
+            max_concurrent: Requests in flight at once
+            max_items: Stop after this many pages
+
+        Yields:
+            One dict per request: 'success', 'offset', 'items',
+            'total_items_count' and 'cost'. A failed request yields
+            'success': False with 'error' and ends the stream.
+        """
+        page_size = max(1, min(page_size, self.ONPAGE_PAGE_LIMIT))
+        window = max(1, max_concurrent)
+
+        async def fetch(offset: int) -> Dict:
+            limit = page_size if max_items is None else min(page_size, max_items - offset)
+            if resource_type:
+                response = await self.onpage_pages_by_resource(task_id, resource_type, limit=limit, offset=offset)
+            else:
+                response = await self.onpage_pages(task_id, limit=limit, offset=offset)
+
+            if not response.get('success'):
+                return {'success': False, 'offset': offset, 'error': response.get('error')}
+            task = (response.get('data') or [{}])[0]
+            if task.get('status_code') not in (None, 20000):
+                return {'success': False, 'offset': offset, 'error': task.get('status_message')}
+
+            result = (task.get('result') or [{}])[0] or {}
+            return {
+                'success': True,
+                'offset': offset,
+                'items': result.get('items') or [],
+                'total_items_count': result.get('total_items_count'),
+                'limit': limit,
+                'cost': response.get('cost', 0)
+            }
+
+        # The first page reports how many there are in total
+        first = await fetch(0)
+        yield first
+        if not first['success'] or len(first['items']) < first['limit']:
+            return
+
+        total = first['total_items_count']
+        if max_items is not None:
+            total = max_items if total is None else min(total, max_items)
+
+        tasks: Dict[int, asyncio.Future] = {}
+        next_offset = offset = page_size
+        try:
+            while total is None or offset < total:
+                while (total is None or next_offset < total) and len(tasks) < window:
+                    tasks[next_offset] = asyncio.ensure_future(fetch(next_offset))
+                    next_offset += page_size
+
+                page = await tasks.pop(offset)
+                yield page
+                if not page['success'] or len(page['items']) < page['limit']:
+                    return  # Failed or exhausted
+                offset += page_size
+        finally:
+            for task in tasks.values():
+                task.cancel()
+
     # ========================================================================
     # DATAFORSEO LABS API - Competitor Intelligence
     # ========================================================================
@@ -1080,7 +1650,10 @@ class DataForSEOClient:
             'success_rate': f"{(self.stats.successful_requests / max(1, self.stats.total_requests) * 100):.2f}%",
             'total_cost': f"${self.stats.total_cost:.4f}",
             'endpoint_usage': self.stats.endpoint_usage,
-            'endpoint_costs': {k: f"${v:.4f}" for k, v in self.stats.endpoint_costs.items()}
+            'endpoint_costs': {k: f"${v:.4f}" for k, v in self.stats.endpoint_costs.items()},
+            'coalesced_requests': self.stats.coalesced_requests,
+            'task_queue': self.queue.get_stats(),
+            'rate_governor': self.governor.get_stats()
         }
 
     def reset_stats(self):
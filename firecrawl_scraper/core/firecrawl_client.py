@@ -19,11 +19,12 @@ import os
 import time
 import asyncio
 import json
-from typing import Dict, List, Any, Optional, Callable, Union
+from typing import Dict, List, Any, AsyncIterator, Optional, Callable, Union
 from dataclasses import dataclass, field
 from datetime import datetime
 import logging
 import hashlib
+import weakref
 
 # HTTP clients
 import requests
@@ -37,6 +38,11 @@ except ImportError:
     HAS_FIRECRAWL_SDK = False
     logging.warning("Firecrawl SDK not installed. Install with: pip install firecrawl-py>=4.0.0")
 
+from .response_cache import ResponseCache, CACHE_USE, CACHE_BYPASS, CACHE_POLICIES
+from .job_multiplexer import JobMultiplexer
+from .rate_limiter import RateGovernor, RateLimitError, get_governor, parse_retry_after
+from .single_flight import get_single_flight
+
 # Pydantic for schema validation
 try:
     from pydantic import BaseModel
@@ -61,6 +67,15 @@ class FirecrawlStats:
     retry_count: int = 0
     rate_limit_hits: int = 0
 
+    # Response cache (hits cost no credits)
+    cache_hits: int = 0
+    cache_misses: int = 0
+    credits_saved: int = 0
+    cache_hits_by_endpoint: Dict[str, int] = field(default_factory=dict)
+
+    # Calls served by an identical request already in flight
+    coalesced_requests: int = 0
+
     endpoint_usage: Dict[str, int] = field(default_factory=lambda: {
         'scrape': 0, 'crawl': 0, 'map': 0, 'extract': 0,
         'search': 0, 'batch_scrape': 0
@@ -177,17 +192,37 @@ class EnhancedFirecrawlClient:
     - Exponential backoff retry
     - Rate limit handling
     - Cost estimation and tracking
+    - Pooled keep-alive HTTP session (use `async with` or `await close()`)
+    - Streaming crawl/batch results (`crawl_stream`, `batch_scrape_stream`)
+    - One adaptive poller for all in-flight crawl/batch/extract jobs (`jobs`)
     """
 
     # API v2 base URL
     BASE_URL = "https://api.firecrawl.dev/v2"
 
+    # Job states that end polling
+    TERMINAL_JOB_STATUSES = ('completed', 'failed', 'cancelled')
+
+    # Live clients, so entry points can release pooled sessions on exit
+    _instances: 'weakref.WeakSet[EnhancedFirecrawlClient]' = weakref.WeakSet()
+
     def __init__(
         self,
         api_key: Optional[str] = None,
         max_retries: int = 3,
         retry_delay: int = 2000,
-        timeout: int = 60000
+        timeout: int = 60000,
+        max_connections: int = 100,
+        max_connections_per_host: int = 20,
+        keepalive_timeout: float = 30.0,
+        dns_cache_ttl: int = 300,
+        cache_dir: Optional[str] = None,
+        cache_max_size_mb: float = 512,
+        cache_ttls: Optional[Dict[str, int]] = None,
+        cache_policy: str = CACHE_USE,
+        poll_min_interval: float = 1.0,
+        poll_max_interval: float = 30.0,
+        governor: Optional[RateGovernor] = None
     ):
         """
         Initialize Firecrawl client
@@ -197,6 +232,19 @@ class EnhancedFirecrawlClient:
             max_retries: Maximum retry attempts
             retry_delay: Base delay for exponential backoff (ms)
             timeout: Request timeout (ms)
+            max_connections: Total connections kept in the pool
+            max_connections_per_host: Connections per host in the pool
+            keepalive_timeout: Seconds an idle connection is kept open
+            dns_cache_ttl: Seconds resolved DNS entries are cached
+            cache_dir: Directory for the scrape/map/crawl response cache
+                (defaults to FIRECRAWL_CACHE_DIR env var; disabled if unset)
+            cache_max_size_mb: Size bound for the response cache (LRU eviction)
+            cache_ttls: Per-endpoint TTL overrides in seconds {'scrape': 3600}
+            cache_policy: Default policy - 'use', 'refresh' or 'bypass'
+            poll_min_interval: Job status poll interval for new/progressing jobs (s)
+            poll_max_interval: Poll interval ceiling for stalled jobs (s)
+            governor: Rate/concurrency limits (defaults to the process-wide
+                'firecrawl' governor shared by all clients)
         """
         self.api_key = api_key or os.getenv('FIRECRAWL_API_KEY')
         if not self.api_key:
@@ -229,6 +277,116 @@ class EnhancedFirecrawlClient:
         # Content hash cache for change tracking
         self._content_hashes: Dict[str, str] = {}
 
+        # Pooled aiohttp session (created lazily inside the running loop)
+        self.max_connections = max_connections
+        self.max_connections_per_host = max_connections_per_host
+        self.keepalive_timeout = keepalive_timeout
+        self.dns_cache_ttl = dns_cache_ttl
+        self._http_session: Optional[aiohttp.ClientSession] = None
+        self._http_session_loop: Optional[asyncio.AbstractEventLoop] = None
+
+        # Persistent response cache
+        if cache_policy not in CACHE_POLICIES:
+            raise ValueError(f"cache_policy must be one of {CACHE_POLICIES}, got: {cache_policy}")
+        cache_dir = cache_dir or os.getenv('FIRECRAWL_CACHE_DIR')
+        self.cache = ResponseCache(cache_dir, cache_max_size_mb, cache_ttls) if cache_dir else None
+        self.cache_policy = cache_policy
+
+        # Shared adaptive poller for async jobs
+        self.jobs = JobMultiplexer(self, min_interval=poll_min_interval, max_interval=poll_max_interval)
+
+        # Plan limits shared with every other client in the process
+        self.governor = governor or get_governor('firecrawl')
+
+        # Identical concurrent requests (from any client on the same
+        # API key) share one API call
+        self.flights = get_single_flight('firecrawl')
+        self._account_key = hashlib.sha256(self.api_key.encode()).hexdigest()[:16]
+
+        EnhancedFirecrawlClient._instances.add(self)
+
+    # ========================================================================
+    # SESSION LIFECYCLE
+    # ========================================================================
+
+    async def __aenter__(self) -> 'EnhancedFirecrawlClient':
+        self._get_http_session()
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        await self.close()
+
+    def _get_http_session(self) -> aiohttp.ClientSession:
+        """
+        Return the shared pooled session, creating it on first use.
+
+        A session is bound to the event loop it was created in, so a new one
+        is opened if the previous session was closed or belongs to another
+        loop (e.g. successive asyncio.run() calls). A session left open by
+        another loop is released first.
+        """
+        loop = asyncio.get_running_loop()
+        session = self._http_session
+
+        if session is not None and not session.closed and self._http_session_loop is loop:
+            return session
+        self._release_stale_session(session, self._http_session_loop)
+
+        connector = aiohttp.TCPConnector(
+            limit=self.max_connections,
+            limit_per_host=self.max_connections_per_host,
+            keepalive_timeout=self.keepalive_timeout,
+            ttl_dns_cache=self.dns_cache_ttl,
+            enable_cleanup_closed=True
+        )
+        self._http_session = aiohttp.ClientSession(
+            connector=connector,
+            headers={
+                'Authorization': f'Bearer {self.api_key}',
+                'Content-Type': 'application/json'
+            },
+            timeout=aiohttp.ClientTimeout(total=self.timeout)
+        )
+        self._http_session_loop = loop
+        return self._http_session
+
+    @staticmethod
+    def _release_stale_session(
+        session: Optional[aiohttp.ClientSession],
+        loop: Optional[asyncio.AbstractEventLoop]
+    ) -> None:
+        """
+        Release a session opened in another event loop.
+
+        It cannot be awaited from the current loop: if its own loop is still
+        open the close is scheduled there, otherwise (the loop is gone) the
+        session is detached and its connector's connections dropped.
+        """
+        if session is None or session.closed:
+            return
+        if loop is not None and not loop.is_closed():
+            asyncio.run_coroutine_threadsafe(session.close(), loop)
+            return
+        connector = session.connector
+        session.detach()
+        if connector is not None and not connector.closed:
+            connector._close()  # Nothing left to await once the loop is closed
+
+    async def close(self) -> None:
+        """Close the pooled HTTP session and release its connections"""
+        session = self._http_session
+        self._http_session = None
+        self._http_session_loop = None
+
+        if session is not None and not session.closed:
+            await session.close()
+
+    @classmethod
+    async def close_all(cls) -> None:
+        """Close the pooled sessions of every live client"""
+        for client in list(cls._instances):
+            await client.close()
+
     # ========================================================================
     # SCRAPE ENDPOINT (with Actions support)
     # ========================================================================
@@ -247,7 +405,8 @@ class EnhancedFirecrawlClient:
         mobile: bool = False,
         skip_tls_verification: bool = False,
         remove_base64_images: bool = False,
-        extract: Optional[Dict] = None
+        extract: Optional[Dict] = None,
+        cache_policy: Optional[str] = None
     ) -> Dict:
         """
         Scrape single URL with v2 features including Actions
@@ -269,13 +428,11 @@ class EnhancedFirecrawlClient:
             skip_tls_verification: Skip TLS verification
             remove_base64_images: Remove base64 images from output
             extract: LLM extraction config {'schema': {}, 'prompt': ''}
+            cache_policy: Response cache policy override ('use', 'refresh', 'bypass')
 
         Returns:
-            Dict with 'success', 'data', 'creditsUsed'
+            Dict with 'success', 'data', 'creditsUsed' ('fromCache' on cache hits)
         """
-        self.stats.total_requests += 1
-        self.stats.endpoint_usage['scrape'] += 1
-
         payload = {
             'url': url,
             'formats': formats or ['markdown'],
@@ -303,19 +460,31 @@ class EnhancedFirecrawlClient:
         if extract:
             payload['extract'] = extract
 
-        result = await self._execute_with_retry(
-            endpoint='/scrape',
-            payload=payload,
-            method='POST'
-        )
+        cached = await self._cache_lookup('scrape', payload, cache_policy)
+        if cached is not None:
+            return cached
 
-        if result.get('success'):
-            credits = self._estimate_scrape_credits(result, actions)
-            result['creditsUsed'] = credits
-            self.stats.credits_by_endpoint['scrape'] += credits
-            self.stats.total_credits_used += credits
+        async def fetch() -> Dict:
+            self.stats.total_requests += 1
+            self.stats.endpoint_usage['scrape'] += 1
 
-        return result
+            result = await self._execute_with_retry(
+                endpoint='/scrape',
+                payload=payload,
+                method='POST',
+                credits=1
+            )
+
+            if result.get('success'):
+                credits = self._estimate_scrape_credits(result, actions)
+                result['creditsUsed'] = credits
+                self.stats.credits_by_endpoint['scrape'] += credits
+                self.stats.total_credits_used += credits
+                await self._cache_store('scrape', payload, result, cache_policy)
+
+            return result
+
+        return await self._coalesce('scrape', payload, fetch)
 
     # ========================================================================
     # CRAWL ENDPOINT
@@ -332,7 +501,8 @@ class EnhancedFirecrawlClient:
         allow_external_links: bool = False,
         allow_subdomains: bool = False,
         ignore_sitemap: bool = False,
-        webhook: Optional[str] = None
+        webhook: Optional[str] = None,
+        cache_policy: Optional[str] = None
     ) -> Dict:
         """
         Crawl website with v2 API
@@ -348,13 +518,11 @@ class EnhancedFirecrawlClient:
             allow_subdomains: Allow following subdomain links
             ignore_sitemap: Skip sitemap discovery
             webhook: Webhook URL for progress updates
+            cache_policy: Response cache policy override ('use', 'refresh', 'bypass')
 
         Returns:
             Dict with 'success', 'data', 'creditsUsed', 'status'
         """
-        self.stats.total_requests += 1
-        self.stats.endpoint_usage['crawl'] += 1
-
         payload = {
             'url': url,
             'limit': limit,
@@ -376,19 +544,34 @@ class EnhancedFirecrawlClient:
         if webhook:
             payload['webhook'] = webhook
 
-        # Start crawl job
-        result = await self._execute_with_retry(
-            endpoint='/crawl',
-            payload=payload,
-            method='POST'
-        )
+        cached = await self._cache_lookup('crawl', payload, cache_policy)
+        if cached is not None:
+            return cached
+
+        async def fetch() -> Dict:
+            self.stats.total_requests += 1
+            self.stats.endpoint_usage['crawl'] += 1
+
+            async with self.governor.job():
+                # Start crawl job
+                result = await self._execute_with_retry(
+                    endpoint='/crawl',
+                    payload=payload,
+                    method='POST',
+                    credits=limit
+                )
 
-        if result.get('success') and result.get('id'):
-            # Poll for completion
-            job_id = result['id']
-            result = await self._poll_job_status(f'/crawl/{job_id}', 'crawl')
+                if result.get('success') and result.get('id'):
+                    # Poll for completion
+                    job_id = result['id']
+                    result = await self._poll_job_status(f'/crawl/{job_id}', 'crawl')
 
-        return result
+                if result.get('success'):
+                    await self._cache_store('crawl', payload, result, cache_policy)
+
+            return result
+
+        return await self._coalesce('crawl', payload, fetch)
 
     async def crawl_async(
         self,
@@ -411,7 +594,8 @@ class EnhancedFirecrawlClient:
         result = await self._execute_with_retry(
             endpoint='/crawl',
             payload=payload,
-            method='POST'
+            method='POST',
+            credits=payload.get('limit', 0)
         )
 
         if result.get('success'):
@@ -442,8 +626,17 @@ class EnhancedFirecrawlClient:
 
         return payload
 
-    async def get_crawl_status(self, job_id: str) -> Dict:
-        """Get crawl job status"""
+    async def get_crawl_status(self, job_id: str, offset: Optional[int] = None) -> Dict:
+        """
+        Get crawl job status
+
+        Args:
+            job_id: Crawl job ID
+            offset: If set, 'data' holds only the documents after this many
+                already-received ones (all pages, following `next`)
+        """
+        if offset is not None:
+            return await self._fetch_job_update(f'/crawl/{job_id}', offset)
         return await self._execute_with_retry(
             endpoint=f'/crawl/{job_id}',
             payload={},
@@ -458,6 +651,47 @@ class EnhancedFirecrawlClient:
             method='DELETE'
         )
 
+    async def crawl_stream(
+        self,
+        url: str,
+        buffer_size: int = 100,
+        timeout: float = 5000.0,
+        on_progress: Optional[Callable[[int, int], None]] = None,
+        on_complete: Optional[Callable[[Dict], None]] = None,
+        **kwargs
+    ) -> AsyncIterator[Dict]:
+        """
+        Crawl and yield each page as soon as it appears in the job status
+
+        Pages are not collected; each is yielded once and then dropped, so
+        memory stays bounded by `buffer_size` regardless of crawl size.
+        Breaking out of the loop stops polling (the job keeps running).
+
+        Args:
+            url: Base URL to crawl
+            buffer_size: Pages fetched ahead of the consumer before polling pauses
+            timeout: Seconds to wait for the job before giving up
+            on_progress: Callback function(completed, total)
+            on_complete: Callback with the final job summary (no 'data')
+            **kwargs: Same as crawl()
+
+        Yields:
+            Page documents
+        """
+        self.stats.total_requests += 1
+        self.stats.endpoint_usage['crawl'] += 1
+
+        async with self.governor.job():
+            job_id = await self.crawl_async(url, **kwargs)
+            async for doc in self._stream_job(
+                f'/crawl/{job_id}', 'crawl',
+                timeout=timeout,
+                buffer_size=buffer_size,
+                on_progress=on_progress,
+                on_complete=on_complete
+            ):
+                yield doc
+
     # ========================================================================
     # BATCH SCRAPE ENDPOINT (NEW in v2)
     # ========================================================================
@@ -469,50 +703,207 @@ class EnhancedFirecrawlClient:
         only_main_content: bool = True,
         actions: Optional[List[Dict]] = None,
         webhook: Optional[str] = None,
-        on_progress: Optional[Callable[[int, int], None]] = None
+        on_progress: Optional[Callable[[int, int], None]] = None,
+        shard_size: int = 1000,
+        max_concurrent_shards: int = 4,
+        max_credits: Optional[int] = None,
+        shard_retries: int = 2
     ) -> Dict:
         """
         Batch scrape multiple URLs asynchronously
 
+        Lists longer than `shard_size` are split into shard jobs that run
+        concurrently (see batch_scrape_sharded), so one failing job no
+        longer fails the whole list.
+
         Args:
-            urls: List of URLs to scrape (up to 10,000)
+            urls: List of URLs to scrape (up to 10,000 per shard)
             formats: Output formats for all URLs
             only_main_content: Extract only main content
             actions: Actions to perform on each page
             webhook: Webhook URL for progress updates
             on_progress: Callback function(completed, total)
+            shard_size: Maximum URLs per batch job
+            max_concurrent_shards: Shard jobs running at once
+            max_credits: Credit budget; shards that would exceed it are skipped
+            shard_retries: Retries per failed shard (its own URLs only)
 
         Returns:
             Dict with 'success', 'data', 'creditsUsed', 'total', 'completed'
+            (plus 'shards', 'failed_shards', 'skipped_urls' when sharded)
         """
         self.stats.total_requests += 1
         self.stats.endpoint_usage['batch_scrape'] += 1
 
-        payload = {
-            'urls': urls,
+        job_options = {
             'formats': formats or ['markdown'],
-            'onlyMainContent': only_main_content
+            'only_main_content': only_main_content,
+            'actions': actions,
+            'webhook': webhook
         }
 
-        if actions:
-            payload['actions'] = actions
-        if webhook:
-            payload['webhook'] = webhook
+        if len(urls) > shard_size or max_credits is not None:
+            summary: Dict = {}
+            data = [doc async for doc in self.batch_scrape_sharded(
+                urls,
+                shard_size=shard_size,
+                max_concurrent_shards=max_concurrent_shards,
+                max_credits=max_credits,
+                shard_retries=shard_retries,
+                on_progress=on_progress,
+                on_complete=summary.update,
+                **job_options
+            )]
+            return {**summary, 'data': data}
+
+        return await self._run_batch_shard(urls, job_options, retries=0, on_progress=on_progress)
+
+    async def batch_scrape_sharded(
+        self,
+        urls: List[str],
+        shard_size: int = 1000,
+        max_concurrent_shards: int = 4,
+        max_credits: Optional[int] = None,
+        shard_retries: int = 2,
+        on_progress: Optional[Callable[[int, int], None]] = None,
+        on_complete: Optional[Callable[[Dict], None]] = None,
+        **job_options
+    ) -> AsyncIterator[Dict]:
+        """
+        Batch scrape a URL list as concurrent shard jobs, yielding results in shard order
 
-        # Start batch job
-        result = await self._execute_with_retry(
-            endpoint='/batch/scrape',
-            payload=payload,
-            method='POST'
-        )
+        Shards run in a sliding window of `max_concurrent_shards`; results of
+        shards that finish early are held until the preceding shards have
+        been yielded. A failed shard is retried with only its own URLs.
 
-        if result.get('success') and result.get('id'):
-            job_id = result['id']
-            result = await self._poll_job_status(
-                f'/batch/scrape/{job_id}',
-                'batch_scrape',
-                on_progress=on_progress
-            )
+        Args:
+            urls: URLs to scrape
+            shard_size: Maximum URLs per batch job
+            max_concurrent_shards: Shard jobs running at once
+            max_credits: Credit budget (1 credit per URL is reserved when a
+                shard starts); shards that would exceed it are skipped
+            shard_retries: Retries per failed shard
+            on_progress: Callback function(completed, total) across all shards
+            on_complete: Callback with the run summary (no 'data')
+            **job_options: formats, only_main_content, actions, webhook
+
+        Yields:
+            Scraped documents
+        """
+        shard_size = max(1, shard_size)
+        shards = [urls[i:i + shard_size] for i in range(0, len(urls), shard_size)]
+        window = max(1, max_concurrent_shards)
+
+        shard_completed = [0] * len(shards)
+        budget = {'spent': 0, 'reserved': 0}
+        summary = {
+            'success': True,
+            'creditsUsed': 0,
+            'total': len(urls),
+            'completed': 0,
+            'shards': len(shards),
+            'failed_shards': [],
+            'skipped_urls': []
+        }
+
+        def shard_progress(index: int):
+            def update(completed: int, total: int):
+                shard_completed[index] = completed
+                if on_progress:
+                    on_progress(sum(shard_completed), len(urls))
+            return update
+
+        async def run_shard(index: int) -> Dict:
+            shard = shards[index]
+            if max_credits is not None:
+                if budget['spent'] + budget['reserved'] + len(shard) > max_credits:
+                    return {'success': False, 'skipped': True, 'error': 'Credit budget exhausted'}
+                budget['reserved'] += len(shard)
+            try:
+                result = await self._run_batch_shard(
+                    shard, job_options, retries=shard_retries, on_progress=shard_progress(index)
+                )
+                # Charged as the shard finishes (not when it is yielded), so a
+                # shard starting meanwhile never sees its credits as free
+                budget['spent'] += result.get('creditsUsed', 0) or 0
+                return result
+            finally:
+                if max_credits is not None:
+                    budget['reserved'] -= len(shard)
+
+        tasks: Dict[int, asyncio.Future] = {}
+        next_shard = 0
+        try:
+            for index in range(len(shards)):
+                while next_shard < len(shards) and next_shard < index + window:
+                    tasks[next_shard] = asyncio.ensure_future(run_shard(next_shard))
+                    next_shard += 1
+
+                result = await tasks.pop(index)
+                summary['creditsUsed'] += result.get('creditsUsed', 0) or 0
+
+                if result.get('skipped'):
+                    summary['success'] = False
+                    summary['skipped_urls'].extend(shards[index])
+                    continue
+                if not result.get('success'):
+                    summary['success'] = False
+                    summary['failed_shards'].append({
+                        'index': index,
+                        'urls': shards[index],
+                        'error': result.get('error', result.get('status'))
+                    })
+
+                documents = result.pop('data', None) or []
+                summary['completed'] += result.get('completed', len(documents))
+                for doc in documents:
+                    yield doc
+                del documents, result
+        finally:
+            for task in tasks.values():
+                task.cancel()
+
+        if summary['skipped_urls']:
+            logger.warning(f"Batch credit budget reached: {len(summary['skipped_urls'])} URLs skipped")
+        if on_complete:
+            on_complete(summary)
+
+    async def _run_batch_shard(
+        self,
+        urls: List[str],
+        job_options: Dict,
+        retries: int = 2,
+        on_progress: Optional[Callable[[int, int], None]] = None
+    ) -> Dict:
+        """Run one batch job to completion, retrying the whole job on failure"""
+        result: Dict = {}
+        for attempt in range(retries + 1):
+            if attempt:
+                delay = self.retry_delay * (2 ** (attempt - 1))
+                logger.warning(
+                    f"Batch shard of {len(urls)} URLs failed ({result.get('error', result.get('status'))}). "
+                    f"Retrying in {delay}s... (attempt {attempt}/{retries})"
+                )
+                await asyncio.sleep(delay)
+                self.stats.retry_count += 1
+
+            async with self.governor.job():
+                try:
+                    job_id = await self.batch_scrape_async(urls, **job_options)
+                except Exception as e:
+                    result = {'success': False, 'error': str(e)}
+                    continue
+                if not job_id:
+                    result = {'success': False, 'error': 'Batch scrape returned no job ID'}
+                    continue
+
+                result = await self._poll_job_status(
+                    f'/batch/scrape/{job_id}',
+                    'batch_scrape',
+                    on_progress=on_progress
+                )
+            if result.get('success'):
+                break
 
         return result
 
@@ -545,15 +936,25 @@ class EnhancedFirecrawlClient:
         result = await self._execute_with_retry(
             endpoint='/batch/scrape',
             payload=payload,
-            method='POST'
+            method='POST',
+            credits=len(urls)
         )
 
         if result.get('success'):
             return result.get('id')
         raise Exception(f"Failed to start batch scrape: {result.get('error')}")
 
-    async def get_batch_status(self, job_id: str) -> Dict:
-        """Get batch scrape job status"""
+    async def get_batch_status(self, job_id: str, offset: Optional[int] = None) -> Dict:
+        """
+        Get batch scrape job status
+
+        Args:
+            job_id: Batch job ID
+            offset: If set, 'data' holds only the results after this many
+                already-received ones (see get_crawl_status)
+        """
+        if offset is not None:
+            return await self._fetch_job_update(f'/batch/scrape/{job_id}', offset)
         return await self._execute_with_retry(
             endpoint=f'/batch/scrape/{job_id}',
             payload={},
@@ -568,6 +969,45 @@ class EnhancedFirecrawlClient:
             method='DELETE'
         )
 
+    async def batch_scrape_stream(
+        self,
+        urls: List[str],
+        buffer_size: int = 100,
+        timeout: float = 5000.0,
+        on_progress: Optional[Callable[[int, int], None]] = None,
+        on_complete: Optional[Callable[[Dict], None]] = None,
+        **kwargs
+    ) -> AsyncIterator[Dict]:
+        """
+        Batch scrape and yield each result as soon as it is available
+
+        Same streaming semantics as crawl_stream().
+
+        Args:
+            urls: List of URLs to scrape
+            buffer_size: Results fetched ahead of the consumer before polling pauses
+            timeout: Seconds to wait for the job before giving up
+            on_progress: Callback function(completed, total)
+            on_complete: Callback with the final job summary (no 'data')
+            **kwargs: Same as batch_scrape()
+
+        Yields:
+            Scraped documents
+        """
+        self.stats.total_requests += 1
+        self.stats.endpoint_usage['batch_scrape'] += 1
+
+        async with self.governor.job():
+            job_id = await self.batch_scrape_async(urls, **kwargs)
+            async for doc in self._stream_job(
+                f'/batch/scrape/{job_id}', 'batch_scrape',
+                timeout=timeout,
+                buffer_size=buffer_size,
+                on_progress=on_progress,
+                on_complete=on_complete
+            ):
+                yield doc
+
     # ========================================================================
     # MAP ENDPOINT (Enhanced v2.7 - 15x Faster)
     # ========================================================================
@@ -579,7 +1019,8 @@ class EnhancedFirecrawlClient:
         limit: int = 5000,
         ignore_sitemap: bool = False,
         include_subdomains: bool = False,
-        ignore_query_parameters: bool = True  # v2.7: improves mapping speed
+        ignore_query_parameters: bool = True,  # v2.7: improves mapping speed
+        cache_policy: Optional[str] = None
     ) -> Dict:
         """
         Fast URL discovery with v2 API (v2.7 enhanced - 15x faster)
@@ -591,13 +1032,11 @@ class EnhancedFirecrawlClient:
             ignore_sitemap: Skip sitemap
             include_subdomains: Include subdomain URLs
             ignore_query_parameters: Skip URL query params for faster mapping
+            cache_policy: Response cache policy override ('use', 'refresh', 'bypass')
 
         Returns:
             Dict with 'success', 'links', 'creditsUsed'
         """
-        self.stats.total_requests += 1
-        self.stats.endpoint_usage['map'] += 1
-
         payload = {
             'url': url,
             'limit': min(limit, 100000)  # v2.7: 100k limit
@@ -612,19 +1051,31 @@ class EnhancedFirecrawlClient:
         if ignore_query_parameters:
             payload['ignoreQueryParameters'] = True  # v2.7 feature
 
-        result = await self._execute_with_retry(
-            endpoint='/map',
-            payload=payload,
-            method='POST'
-        )
+        cached = await self._cache_lookup('map', payload, cache_policy)
+        if cached is not None:
+            return cached
 
-        if result.get('success'):
-            credits = 1  # Map costs 1 credit
-            result['creditsUsed'] = credits
-            self.stats.credits_by_endpoint['map'] += credits
-            self.stats.total_credits_used += credits
+        async def fetch() -> Dict:
+            self.stats.total_requests += 1
+            self.stats.endpoint_usage['map'] += 1
 
-        return result
+            result = await self._execute_with_retry(
+                endpoint='/map',
+                payload=payload,
+                method='POST',
+                credits=1
+            )
+
+            if result.get('success'):
+                credits = 1  # Map costs 1 credit
+                result['creditsUsed'] = credits
+                self.stats.credits_by_endpoint['map'] += credits
+                self.stats.total_credits_used += credits
+                await self._cache_store('map', payload, result, cache_policy)
+
+            return result
+
+        return await self._coalesce('map', payload, fetch)
 
     async def map_fast(
         self,
@@ -748,7 +1199,7 @@ class EnhancedFirecrawlClient:
             schema: JSON Schema or Pydantic model for structured data
             system_prompt: Custom system prompt for LLM
             allow_external_links: Allow following external links
-            poll_interval: Seconds between status checks
+            poll_interval: Initial seconds between status checks (adaptive after)
             max_poll_time: Maximum seconds to wait for completion
             model: LLM model - 'spark-1-pro' (quality) or 'spark-1' (fast)
 
@@ -780,27 +1231,24 @@ class EnhancedFirecrawlClient:
         if system_prompt:
             payload['systemPrompt'] = system_prompt
 
-        # Initial POST request - returns job ID
-        result = await self._execute_with_retry(
-            endpoint='/extract',
-            payload=payload,
-            method='POST'
-        )
-
-        # If we got a job ID, poll for completion
-        if result.get('success') and result.get('id') and not result.get('data'):
-            job_id = result['id']
-            logger.debug(f"Extract job started: {job_id}")
+        async with self.governor.job():
+            # Initial POST request - returns job ID
+            result = await self._execute_with_retry(
+                endpoint='/extract',
+                payload=payload,
+                method='POST'
+            )
 
-            elapsed = 0.0
-            while elapsed < max_poll_time:
-                await asyncio.sleep(poll_interval)
-                elapsed += poll_interval
+            # If we got a job ID, wait for completion
+            if result.get('success') and result.get('id') and not result.get('data'):
+                job_id = result['id']
+                logger.debug(f"Extract job started: {job_id}")
 
-                status = await self._execute_with_retry(
-                    endpoint=f'/extract/{job_id}',
-                    payload={},
-                    method='GET'
+                status = await self.jobs.watch(
+                    f'/extract/{job_id}', 'extract',
+                    incremental=False,
+                    timeout=max_poll_time,
+                    min_interval=poll_interval
                 )
 
                 if status.get('status') == 'completed':
@@ -810,15 +1258,12 @@ class EnhancedFirecrawlClient:
                     if status.get('creditsUsed'):
                         result['creditsUsed'] = status['creditsUsed']
                     logger.debug(f"Extract completed: {job_id}")
-                    break
-                elif status.get('status') == 'failed':
+                elif status.get('status') in ('failed', 'cancelled'):
                     result['success'] = False
                     result['error'] = status.get('error', 'Extraction failed')
-                    break
-
-            if elapsed >= max_poll_time:
-                result['success'] = False
-                result['error'] = 'Extract polling timeout'
+                else:
+                    result['success'] = False
+                    result['error'] = 'Extract polling timeout'
 
         if result.get('success') and result.get('creditsUsed'):
             self.stats.credits_by_endpoint['extract'] += result['creditsUsed']
@@ -851,9 +1296,6 @@ class EnhancedFirecrawlClient:
         Returns:
             Dict with 'success', 'data' (search results)
         """
-        self.stats.total_requests += 1
-        self.stats.endpoint_usage['search'] += 1
-
         payload = {
             'query': query,
             'limit': min(limit, 10),
@@ -864,23 +1306,30 @@ class EnhancedFirecrawlClient:
         if scrape_options:
             payload['scrapeOptions'] = scrape_options
 
-        result = await self._execute_with_retry(
-            endpoint='/search',
-            payload=payload,
-            method='POST'
-        )
+        async def fetch() -> Dict:
+            self.stats.total_requests += 1
+            self.stats.endpoint_usage['search'] += 1
 
-        if result.get('success'):
-            # Search: 1 credit per result + scraping costs
-            credits = len(result.get('data', []))
-            if scrape_options:
-                credits += len(result.get('data', []))
+            result = await self._execute_with_retry(
+                endpoint='/search',
+                payload=payload,
+                method='POST',
+                credits=payload['limit']
+            )
 
-            result['creditsUsed'] = credits
-            self.stats.credits_by_endpoint['search'] += credits
-            self.stats.total_credits_used += credits
+            if result.get('success'):
+                # Search: 1 credit per result + scraping costs
+                credits = len(result.get('data', []))
+                if scrape_options:
+                    credits += len(result.get('data', []))
 
-        return result
+                result['creditsUsed'] = credits
+                self.stats.credits_by_endpoint['search'] += credits
+                self.stats.total_credits_used += credits
+
+            return result
+
+        return await self._coalesce('search', payload, fetch)
 
     # ========================================================================
     # CHANGE TRACKING
@@ -933,57 +1382,210 @@ class EnhancedFirecrawlClient:
             'previous_hash': prev_hash
         }
 
+    # ========================================================================
+    # RESPONSE CACHE
+    # ========================================================================
+
+    def _resolve_cache_policy(self, cache_policy: Optional[str]) -> str:
+        policy = cache_policy or self.cache_policy
+        if policy not in CACHE_POLICIES:
+            raise ValueError(f"cache_policy must be one of {CACHE_POLICIES}, got: {policy}")
+        return policy
+
+    async def _cache_lookup(
+        self,
+        endpoint: str,
+        payload: Dict,
+        cache_policy: Optional[str] = None
+    ) -> Optional[Dict]:
+        """Return a cached response for this request, or None on miss"""
+        if self.cache is None or self._resolve_cache_policy(cache_policy) != CACHE_USE:
+            return None
+
+        key = self.cache.make_key(endpoint, payload)
+        loop = asyncio.get_running_loop()
+        cached = await loop.run_in_executor(None, self.cache.get, key, self.cache.ttl_for(endpoint))
+
+        if cached is None:
+            self.stats.cache_misses += 1
+            return None
+
+        self.stats.cache_hits += 1
+        self.stats.cache_hits_by_endpoint[endpoint] = self.stats.cache_hits_by_endpoint.get(endpoint, 0) + 1
+        self.stats.credits_saved += cached.get('creditsUsed', 0) or 0
+
+        return {**cached, 'creditsUsed': 0, 'fromCache': True}
+
+    async def _cache_store(
+        self,
+        endpoint: str,
+        payload: Dict,
+        result: Dict,
+        cache_policy: Optional[str] = None
+    ) -> None:
+        """Persist a successful response unless the policy bypasses the cache"""
+        if self.cache is None or self._resolve_cache_policy(cache_policy) == CACHE_BYPASS:
+            return
+
+        key = self.cache.make_key(endpoint, payload)
+        loop = asyncio.get_running_loop()
+        await loop.run_in_executor(None, self.cache.set, key, result)
+
     # ========================================================================
     # JOB POLLING
     # ========================================================================
 
+    async def _coalesce(self, endpoint: str, payload: Dict, fetch: Callable) -> Dict:
+        """
+        Run fetch() once for concurrent identical requests.
+
+        Callers that join a request already in flight get a copy of its
+        result marked 'coalesced' with creditsUsed 0 - the credits were
+        charged once, to the caller that made the request. Only clients
+        using the same API key share requests, since the credits (and any
+        job ids in the result) belong to the key's account.
+        """
+        key = f"{self._account_key}:{ResponseCache.make_key(endpoint, payload)}"
+        result, shared = await self.flights.do(key, fetch)
+        if shared:
+            self.stats.coalesced_requests += 1
+            result['coalesced'] = True
+            if 'creditsUsed' in result:
+                result['creditsUsed'] = 0
+        return result
+
     async def _poll_job_status(
         self,
         endpoint: str,
         job_type: str,
-        poll_interval: int = 5,
-        max_polls: int = 1000,
+        timeout: float = 5000.0,
         on_progress: Optional[Callable[[int, int], None]] = None
     ) -> Dict:
-        """Poll job status until completion"""
-        for _ in range(max_polls):
-            status = await self._execute_with_retry(
-                endpoint=endpoint,
-                payload={},
-                method='GET'
-            )
+        """Wait for a job via the shared multiplexer and return its final result"""
+        def on_update(status: Dict, documents: List[Dict]):
+            if on_progress and status.get('total'):
+                on_progress(status.get('completed', 0), status.get('total'))
+            logger.debug(f"Job progress: {status.get('completed', 0)}/{status.get('total', '?')}")
+
+        status = await self.jobs.watch(endpoint, job_type, on_update=on_update, timeout=timeout)
+
+        if status.get('status') in self.TERMINAL_JOB_STATUSES:
+            return {
+                **self._record_job_completion(job_type, status),
+                'data': status.get('data', [])
+            }
+        return {'success': False, 'error': status.get('error', 'Polling timeout exceeded')}
+
+    async def _fetch_job_update(self, endpoint: str, offset: int) -> Dict:
+        """
+        Fetch job status with only the documents added after `offset`
+
+        Requests the status with `skip=offset` and follows the `next`
+        cursor through the remaining result pages, so each document is
+        transferred once over the life of a job.
+
+        Returns:
+            Status dict whose 'data' holds the new documents, in job order
+        """
+        status = await self._execute_with_retry(
+            endpoint=f'{endpoint}?skip={offset}' if offset else endpoint,
+            payload={},
+            method='GET'
+        )
+        documents = status.pop('data', None) or []
+        next_url = status.pop('next', None)
+
+        while next_url:
+            page = await self._execute_with_retry(endpoint=next_url, payload={}, method='GET')
+            if not page.get('success'):
+                # Keep what arrived; the next poll resumes from the new offset
+                logger.warning(f"Failed to fetch job results page: {page.get('error')}")
+                break
+            documents.extend(page.get('data') or [])
+            next_url = page.get('next')
+
+        status['data'] = documents
+        return status
+
+    async def _stream_job(
+        self,
+        endpoint: str,
+        job_type: str,
+        timeout: float = 5000.0,
+        buffer_size: int = 100,
+        on_progress: Optional[Callable[[int, int], None]] = None,
+        on_complete: Optional[Callable[[Dict], None]] = None
+    ) -> AsyncIterator[Dict]:
+        """
+        Yield a job's documents as they appear in its status
 
-            job_status = status.get('status', 'unknown')
+        The job is polled by the shared multiplexer, which hands new
+        documents to a bounded queue. When the consumer falls behind the
+        queue fills up and the job's next poll waits (backpressure). Polls
+        only fetch documents past the received offset, and documents are
+        not collected, so nothing already yielded is kept.
+        """
+        queue: asyncio.Queue = asyncio.Queue(maxsize=max(1, buffer_size))
+        finishers = []
 
-            # Call progress callback if provided
+        async def on_update(status: Dict, documents: List[Dict]):
+            for doc in documents:
+                await queue.put(('doc', doc))
             if on_progress and status.get('total'):
                 on_progress(status.get('completed', 0), status.get('total'))
 
-            if job_status in ['completed', 'failed', 'cancelled']:
-                completed = status.get('completed', 0)
-                credits = completed
-
-                self.stats.credits_by_endpoint[job_type] += credits
-                self.stats.total_credits_used += credits
+        def on_finished(future: asyncio.Future):
+            if future.cancelled():
+                return
+            if future.exception() is not None:
+                item = ('error', future.exception())
+            elif future.result().get('status') in self.TERMINAL_JOB_STATUSES:
+                item = ('done', self._record_job_completion(job_type, future.result()))
+            else:
+                item = ('done', {'success': False, 'error': future.result().get('error')})
+            # The queue may be full; the put completes once the consumer catches up
+            finishers.append(asyncio.ensure_future(queue.put(item)))
 
-                if job_status == 'completed':
-                    self.stats.successful_requests += 1
+        job = self.jobs.watch(endpoint, job_type, collect=False, on_update=on_update, timeout=timeout)
+        job.add_done_callback(on_finished)
+        try:
+            while True:
+                kind, item = await queue.get()
+                if kind == 'doc':
+                    yield item
+                elif kind == 'error':
+                    raise item
                 else:
-                    self.stats.failed_requests += 1
-
-                return {
-                    'success': job_status == 'completed',
-                    'data': status.get('data', []),
-                    'creditsUsed': credits,
-                    'status': job_status,
-                    'total': status.get('total', 0),
-                    'completed': completed
-                }
-
-            logger.info(f"Job progress: {status.get('completed', 0)}/{status.get('total', '?')}")
-            await asyncio.sleep(poll_interval)
+                    if on_complete:
+                        on_complete(item)
+                    return
+        finally:
+            if not job.done():
+                job.cancel()
+            for finisher in finishers:
+                finisher.cancel()
+
+    def _record_job_completion(self, job_type: str, status: Dict) -> Dict:
+        """Record credits/outcome of a finished job and return its summary"""
+        job_status = status.get('status', 'unknown')
+        completed = status.get('completed', 0)
+        credits = completed
+
+        self.stats.credits_by_endpoint[job_type] += credits
+        self.stats.total_credits_used += credits
+
+        if job_status == 'completed':
+            self.stats.successful_requests += 1
+        else:
+            self.stats.failed_requests += 1
 
-        return {'success': False, 'error': 'Polling timeout exceeded'}
+        return {
+            'success': job_status == 'completed',
+            'creditsUsed': credits,
+            'status': job_status,
+            'total': status.get('total', 0),
+            'completed': completed
+        }
 
     # ========================================================================
     # RETRY LOGIC
@@ -994,49 +1596,60 @@ class EnhancedFirecrawlClient:
         endpoint: str,
         payload: Dict,
         method: str = 'POST',
-        attempt: int = 1
+        attempt: int = 1,
+        credits: float = 0
     ) -> Dict:
         """
         Execute request with exponential backoff retry
 
+        Every attempt goes through the shared rate governor; a 429 with a
+        Retry-After header pauses all requests to the API until then.
+
         Args:
-            endpoint: API endpoint path
+            endpoint: API endpoint path (or absolute URL)
             payload: Request payload
             method: HTTP method (GET, POST, DELETE)
             attempt: Current retry attempt
+            credits: Credits the request is expected to consume (reserved
+                against the governor's credits-per-minute budget)
         """
-        url = f"{self.BASE_URL}{endpoint}"
+        # Absolute URLs come from pagination cursors (`next`)
+        url = endpoint if endpoint.startswith('http') else f"{self.BASE_URL}{endpoint}"
 
         try:
-            async with aiohttp.ClientSession() as session:
-                headers = {
-                    'Authorization': f'Bearer {self.api_key}',
-                    'Content-Type': 'application/json'
-                }
+            async with self.governor.request(credits=credits):
+                session = self._get_http_session()
 
                 if method == 'GET':
-                    async with session.get(url, headers=headers, timeout=aiohttp.ClientTimeout(total=self.timeout)) as response:
+                    async with session.get(url) as response:
                         return await self._handle_response(response)
                 elif method == 'DELETE':
-                    async with session.delete(url, headers=headers, timeout=aiohttp.ClientTimeout(total=self.timeout)) as response:
+                    async with session.delete(url) as response:
                         return await self._handle_response(response)
                 else:  # POST
-                    async with session.post(url, headers=headers, json=payload, timeout=aiohttp.ClientTimeout(total=self.timeout)) as response:
+                    async with session.post(url, json=payload) as response:
                         return await self._handle_response(response)
 
-        except Exception as e:
-            error_msg = str(e)
-
-            # Handle rate limiting
-            if "429" in error_msg or "rate limit" in error_msg.lower():
-                self.stats.rate_limit_hits += 1
+        except RateLimitError as e:
+            self.stats.rate_limit_hits += 1
 
-                if attempt < self.max_retries:
+            if attempt < self.max_retries:
+                if e.retry_after is not None:
+                    # The governor holds every caller until the server's deadline
+                    logger.warning(f"Rate limit hit. Retrying after {e.retry_after:.1f}s... (attempt {attempt}/{self.max_retries})")
+                else:
                     backoff_delay = self.retry_delay * (2 ** attempt)
                     logger.warning(f"Rate limit hit. Retrying in {backoff_delay}s... (attempt {attempt}/{self.max_retries})")
                     await asyncio.sleep(backoff_delay)
-                    self.stats.retry_count += 1
-                    return await self._execute_with_retry(endpoint, payload, method, attempt + 1)
+                self.stats.retry_count += 1
+                return await self._execute_with_retry(endpoint, payload, method, attempt + 1, credits)
+
+            self.stats.failed_requests += 1
+            logger.error(f"All {self.max_retries} retries exhausted: {e}")
+            return {'success': False, 'error': str(e)}
+
+        except Exception as e:
+            error_msg = str(e)
 
             # Retry transient errors
             if attempt < self.max_retries:
@@ -1044,7 +1657,7 @@ class EnhancedFirecrawlClient:
                 logger.warning(f"Request failed. Retrying in {delay}s... (attempt {attempt}/{self.max_retries})")
                 await asyncio.sleep(delay)
                 self.stats.retry_count += 1
-                return await self._execute_with_retry(endpoint, payload, method, attempt + 1)
+                return await self._execute_with_retry(endpoint, payload, method, attempt + 1, credits)
 
             self.stats.failed_requests += 1
             logger.error(f"All {self.max_retries} retries exhausted: {error_msg}")
@@ -1061,7 +1674,10 @@ class EnhancedFirecrawlClient:
                 'timestamp': datetime.now().isoformat()
             }
         elif response.status == 429:
-            raise Exception("Rate limit hit")
+            retry_after = parse_retry_after(response.headers.get('Retry-After'))
+            if retry_after is not None:
+                self.governor.pause(retry_after)
+            raise RateLimitError("Rate limit hit", retry_after)
         elif response.status == 402:
             self.stats.failed_requests += 1
             return {'success': False, 'error': 'Quota exceeded'}
@@ -1208,7 +1824,13 @@ Extract all available information accurately."""
             'retry_count': self.stats.retry_count,
             'rate_limit_hits': self.stats.rate_limit_hits,
             'endpoint_usage': self.stats.endpoint_usage,
-            'credits_by_endpoint': self.stats.credits_by_endpoint
+            'credits_by_endpoint': self.stats.credits_by_endpoint,
+            'cache_hits': self.stats.cache_hits,
+            'cache_misses': self.stats.cache_misses,
+            'credits_saved': self.stats.credits_saved,
+            'cache_hits_by_endpoint': self.stats.cache_hits_by_endpoint,
+            'coalesced_requests': self.stats.coalesced_requests,
+            'rate_governor': self.governor.get_stats()
         }
 
     def reset_stats(self):
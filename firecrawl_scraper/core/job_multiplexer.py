@@ -0,0 +1,265 @@
+#!/usr/bin/env python3
+"""
+Firecrawl Job Multiplexer - one scheduler for all in-flight async jobs
+
+Crawl, batch-scrape and extract jobs are registered with `watch()`, which
+returns a future for the job's final status. A single scheduler task
+polls every registered job on its own adaptive interval instead of each
+job running a fixed-interval polling loop:
+
+- New jobs are polled quickly (min_interval)
+- Jobs that make progress are polled no later than their ETA
+- Jobs whose progress stalls back off towards max_interval
+
+Usage:
+    client = EnhancedFirecrawlClient()
+    future = client.jobs.watch(f'/crawl/{job_id}', 'crawl')
+    status = await future   # final status dict with collected 'data'
+"""
+
+import asyncio
+import heapq
+import itertools
+import logging
+import time
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class WatchedJob:
+    """Polling state of one registered job"""
+    endpoint: str
+    job_type: str
+    future: asyncio.Future
+    incremental: bool = True  # Fetch only new documents by offset (crawl/batch)
+    collect: bool = True      # Keep documents for the final status
+    on_update: Optional[Callable] = None
+    interval: float = 1.0
+    deadline: Optional[float] = None
+    offset: int = 0
+    data: List[Any] = field(default_factory=list)
+    last_completed: int = 0
+    started_at: float = field(default_factory=time.monotonic)
+    task: Optional[asyncio.Task] = None  # Poll in progress
+
+
+class JobMultiplexer:
+    """
+    Adaptive poller shared by all jobs of an EnhancedFirecrawlClient
+
+    The scheduler keeps a heap of (next_poll_at, job). Each due job is
+    polled in its own task, so a slow consumer (e.g. a stream applying
+    backpressure in on_update) only delays that job's next poll.
+    """
+
+    TERMINAL_STATUSES = ('completed', 'failed', 'cancelled')
+
+    def __init__(
+        self,
+        client,
+        min_interval: float = 1.0,
+        max_interval: float = 30.0,
+        backoff_factor: float = 1.5,
+        max_concurrent_polls: int = 10
+    ):
+        """
+        Args:
+            client: EnhancedFirecrawlClient used for status requests
+            min_interval: Poll interval for new or fast-progressing jobs (seconds)
+            max_interval: Upper bound for stalled jobs (seconds)
+            backoff_factor: Interval growth per poll without progress
+            max_concurrent_polls: Status requests in flight at once
+        """
+        self.client = client
+        self.min_interval = min_interval
+        self.max_interval = max_interval
+        self.backoff_factor = backoff_factor
+        self.max_concurrent_polls = max_concurrent_polls
+
+        self._heap: List[tuple] = []
+        self._counter = itertools.count()
+        self._in_flight = 0
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._wakeup: Optional[asyncio.Event] = None
+        self._semaphore: Optional[asyncio.Semaphore] = None
+        self._runner: Optional[asyncio.Task] = None
+        self._poll_tasks: set = set()
+
+    @property
+    def active_jobs(self) -> int:
+        """Jobs registered and not yet finished"""
+        return len(self._heap) + self._in_flight
+
+    def watch(
+        self,
+        endpoint: str,
+        job_type: str,
+        incremental: bool = True,
+        collect: bool = True,
+        on_update: Optional[Callable] = None,
+        timeout: Optional[float] = None,
+        min_interval: Optional[float] = None
+    ) -> asyncio.Future:
+        """
+        Register a job and return a future for its final status.
+
+        Args:
+            endpoint: Status endpoint, e.g. '/crawl/<id>'
+            job_type: Stats key ('crawl', 'batch_scrape', 'extract')
+            incremental: Fetch only documents past the received offset
+                (crawl/batch). Extract jobs return their result as a whole.
+            collect: Keep received documents in the final status 'data'
+            on_update: Callback(status, new_documents) after each poll; may
+                be a coroutine function
+            timeout: Seconds before the future resolves with a timeout error
+            min_interval: First poll interval override for this job
+
+        Returns:
+            Future resolving to the final status dict. Cancelling it stops
+            polling the job.
+        """
+        self._ensure_loop()
+        now = time.monotonic()
+        job = WatchedJob(
+            endpoint=endpoint,
+            job_type=job_type,
+            future=self._loop.create_future(),
+            incremental=incremental,
+            collect=collect,
+            on_update=on_update,
+            interval=min_interval or self.min_interval,
+            deadline=now + timeout if timeout else None
+        )
+        job.future.add_done_callback(lambda future: self._on_job_done(job))
+        # First poll right away: fast jobs may already be done
+        self._schedule(job, now)
+        return job.future
+
+    # ========================================================================
+    # SCHEDULER
+    # ========================================================================
+
+    def _ensure_loop(self):
+        """Bind scheduler state to the running loop and start the scheduler"""
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop:
+            # Jobs from a previous (closed) loop cannot be resumed
+            self._loop = loop
+            self._heap = []
+            self._in_flight = 0
+            self._wakeup = asyncio.Event()
+            self._semaphore = asyncio.Semaphore(self.max_concurrent_polls)
+            self._runner = None
+            self._poll_tasks = set()
+        if self._runner is None or self._runner.done():
+            self._runner = loop.create_task(self._run())
+
+    def _schedule(self, job: WatchedJob, at: float):
+        heapq.heappush(self._heap, (at, next(self._counter), job))
+        self._wakeup.set()
+
+    async def _run(self):
+        """Pop due jobs and poll each in its own task until no jobs remain"""
+        while self._heap or self._in_flight:
+            now = time.monotonic()
+            while self._heap and self._heap[0][0] <= now:
+                _, _, job = heapq.heappop(self._heap)
+                if job.future.done():
+                    continue  # Cancelled by the waiter
+                self._in_flight += 1
+                task = job.task = asyncio.ensure_future(self._poll(job))
+                self._poll_tasks.add(task)
+                task.add_done_callback(self._poll_tasks.discard)
+
+            self._wakeup.clear()
+            if not self._heap and not self._in_flight:
+                break  # Only cancelled jobs were left
+            delay = self._heap[0][0] - now if self._heap else None
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), timeout=delay)
+            except asyncio.TimeoutError:
+                pass
+
+    async def _poll(self, job: WatchedJob):
+        """Poll one job once, then resolve or reschedule it"""
+        try:
+            async with self._semaphore:
+                if job.incremental:
+                    status = await self.client._fetch_job_update(job.endpoint, job.offset)
+                else:
+                    status = await self.client._execute_with_retry(
+                        endpoint=job.endpoint, payload={}, method='GET'
+                    )
+
+            documents = status.pop('data', None) if job.incremental else None
+            if documents:
+                job.offset += len(documents)
+                if job.collect:
+                    job.data.extend(documents)
+
+            if job.on_update:
+                update = job.on_update(status, documents or [])
+                if asyncio.iscoroutine(update):
+                    await update
+            del documents
+
+            job_status = status.get('status')
+            if job_status in self.TERMINAL_STATUSES:
+                if job.incremental:
+                    status['data'] = job.data
+                self._resolve(job, status)
+            elif job.deadline is not None and time.monotonic() >= job.deadline:
+                self._resolve(job, {
+                    'success': False,
+                    'status': 'timeout',
+                    'error': f'{job.job_type} polling timeout exceeded',
+                    'data': job.data
+                })
+            else:
+                job.interval = self._next_interval(job, status)
+                next_at = time.monotonic() + job.interval
+                if job.deadline is not None:
+                    next_at = min(next_at, job.deadline)
+                self._schedule(job, next_at)
+
+        except Exception as e:
+            if not job.future.done():
+                job.future.set_exception(e)
+        finally:
+            self._in_flight -= 1
+            self._wakeup.set()
+
+    def _next_interval(self, job: WatchedJob, status: Dict) -> float:
+        """
+        Adaptive interval: grow gently while progressing but never past the
+        ETA; back off faster when progress stalls.
+        """
+        now = time.monotonic()
+        completed = status.get('completed') or 0
+        total = status.get('total') or 0
+
+        if completed > job.last_completed:
+            rate = completed / max(now - job.started_at, 1e-6)
+            interval = job.interval * self.backoff_factor
+            if total > completed and rate > 0:
+                eta = (total - completed) / rate
+                interval = min(interval, eta)
+            job.last_completed = completed
+        else:
+            interval = job.interval * self.backoff_factor ** 2
+
+        return max(self.min_interval, min(self.max_interval, interval))
+
+    @staticmethod
+    def _on_job_done(job: WatchedJob):
+        # A cancelled waiter must not leave a poll blocked in on_update
+        if job.future.cancelled() and job.task is not None and not job.task.done():
+            job.task.cancel()
+
+    @staticmethod
+    def _resolve(job: WatchedJob, status: Dict):
+        if not job.future.done():
+            job.future.set_result(status)
@@ -0,0 +1,335 @@
+#!/usr/bin/env python3
+"""
+Async rate limiting primitives
+
+Token-bucket limiter used to pace outgoing API calls without the fixed
+per-request sleeps that serialize concurrent work, a per-domain limiter
+for politeness towards scraped sites, and process-wide per-API governors
+shared by all API clients.
+
+Usage:
+    from firecrawl_scraper.core.rate_limiter import TokenBucket, get_governor
+
+    bucket = TokenBucket(rate=10)  # 10 requests/second, bursts of 10
+    await bucket.acquire()
+
+    async with get_governor('firecrawl').request(credits=1):
+        ...
+"""
+
+import asyncio
+import logging
+import os
+import time
+from contextlib import asynccontextmanager
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+
+class TokenBucket:
+    """
+    Asyncio token bucket
+
+    Tokens refill continuously at `rate` per second up to `capacity`.
+    `acquire()` waits until enough tokens are available, so any number of
+    concurrent callers are paced to the configured rate.
+    """
+
+    def __init__(self, rate: float, capacity: Optional[float] = None):
+        """
+        Args:
+            rate: Tokens added per second (must be > 0)
+            capacity: Maximum burst size (defaults to max(1, rate))
+        """
+        if rate <= 0:
+            raise ValueError(f"TokenBucket rate must be positive, got: {rate}")
+
+        self.rate = float(rate)
+        self.capacity = float(capacity) if capacity else max(1.0, self.rate)
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+        self._lock: Optional[asyncio.Lock] = None
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    async def acquire(self, tokens: float = 1.0) -> None:
+        """Wait until `tokens` are available and consume them"""
+        if self._lock is None:
+            self._lock = asyncio.Lock()
+        tokens = min(tokens, self.capacity)
+
+        # Holding the lock while sleeping keeps waiters in FIFO order
+        async with self._lock:
+            while True:
+                self._refill()
+                if self._tokens >= tokens:
+                    self._tokens -= tokens
+                    return
+                await asyncio.sleep((tokens - self._tokens) / self.rate)
+
+
+class DomainLimiter:
+    """
+    Per-domain politeness limiter
+
+    Caps concurrent requests to each domain and spaces request starts on
+    the same domain by at least `min_interval` seconds. Different domains
+    never wait on each other.
+
+    Usage:
+        limiter = DomainLimiter(min_interval=2.0)
+        async with limiter.slot('example.com'):
+            ...
+    """
+
+    def __init__(self, min_interval: float = 0.0, max_per_domain: int = 1):
+        """
+        Args:
+            min_interval: Minimum seconds between request starts per domain
+            max_per_domain: Maximum in-flight requests per domain
+        """
+        self.min_interval = max(0.0, min_interval)
+        self.max_per_domain = max(1, max_per_domain)
+        self._semaphores: Dict[str, asyncio.Semaphore] = {}
+        self._locks: Dict[str, asyncio.Lock] = {}
+        self._last_start: Dict[str, float] = {}
+
+    @asynccontextmanager
+    async def slot(self, domain: str):
+        """Hold one of the domain's request slots for the duration of the block"""
+        semaphore = self._semaphores.get(domain)
+        if semaphore is None:
+            semaphore = self._semaphores[domain] = asyncio.Semaphore(self.max_per_domain)
+            self._locks[domain] = asyncio.Lock()
+
+        async with semaphore:
+            if self.min_interval:
+                async with self._locks[domain]:
+                    wait = self._last_start.get(domain, float('-inf')) + self.min_interval - time.monotonic()
+                    if wait > 0:
+                        await asyncio.sleep(wait)
+                    self._last_start[domain] = time.monotonic()
+            yield
+
+
+class RateLimitError(Exception):
+    """HTTP 429 from an API, with the server's Retry-After delay if given"""
+
+    def __init__(self, message: str = "Rate limit hit", retry_after: Optional[float] = None):
+        super().__init__(message)
+        self.retry_after = retry_after
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """Retry-After header (delta-seconds or HTTP-date) as seconds from now"""
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if retry_at is None:
+        return None
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=timezone.utc)
+    return max(0.0, (retry_at - datetime.now(timezone.utc)).total_seconds())
+
+
+class RateGovernor:
+    """
+    Process-wide limiter for one API
+
+    Every request of every client for the API goes through `request()`,
+    so nested fan-out (pipelines calling batch helpers calling clients)
+    cannot overshoot the plan limits:
+
+    - requests_per_second: token bucket on request starts
+    - max_concurrent: requests in flight
+    - max_concurrent_jobs: async jobs (crawl/batch/extract) running at once
+    - credits_per_minute: token bucket on the credits a request reserves
+    - Retry-After: a 429 pauses all callers until the server's deadline
+
+    Use `get_governor('firecrawl')` / `get_governor('dataforseo')` for the
+    shared instances. Primitives are rebuilt when used from a new event
+    loop (e.g. successive asyncio.run() calls).
+    """
+
+    def __init__(
+        self,
+        name: str,
+        requests_per_second: Optional[float] = None,
+        max_concurrent: Optional[int] = None,
+        max_concurrent_jobs: Optional[int] = None,
+        credits_per_minute: Optional[float] = None
+    ):
+        self.name = name
+        self.requests_per_second = requests_per_second
+        self.max_concurrent = max_concurrent
+        self.max_concurrent_jobs = max_concurrent_jobs
+        self.credits_per_minute = credits_per_minute
+
+        self._paused_until = 0.0
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._request_bucket: Optional[TokenBucket] = None
+        self._credit_bucket: Optional[TokenBucket] = None
+        self._request_slots: Optional[asyncio.Semaphore] = None
+        self._job_slots: Optional[asyncio.Semaphore] = None
+
+        self.stats = {
+            'requests': 0,
+            'jobs': 0,
+            'credits_reserved': 0.0,
+            'rate_limit_pauses': 0,
+            'wait_seconds': 0.0
+        }
+
+    def configure(self, **limits) -> 'RateGovernor':
+        """Change limits (requests_per_second, max_concurrent, max_concurrent_jobs, credits_per_minute)"""
+        for key, value in limits.items():
+            if key not in ('requests_per_second', 'max_concurrent', 'max_concurrent_jobs', 'credits_per_minute'):
+                raise ValueError(f"Unknown {self.name} rate limit: {key}")
+            setattr(self, key, value)
+        self._loop = None  # Rebuild primitives on next use
+        return self
+
+    def _bind_loop(self):
+        loop = asyncio.get_running_loop()
+        if self._loop is loop:
+            return
+        self._loop = loop
+        self._request_bucket = TokenBucket(self.requests_per_second) if self.requests_per_second else None
+        self._credit_bucket = (
+            TokenBucket(self.credits_per_minute / 60.0, capacity=self.credits_per_minute)
+            if self.credits_per_minute else None
+        )
+        self._request_slots = asyncio.Semaphore(self.max_concurrent) if self.max_concurrent else None
+        self._job_slots = asyncio.Semaphore(self.max_concurrent_jobs) if self.max_concurrent_jobs else None
+
+    def pause(self, seconds: float):
+        """Hold all new requests for `seconds` (e.g. from a Retry-After header)"""
+        until = time.monotonic() + max(0.0, seconds)
+        if until > self._paused_until:
+            self._paused_until = until
+            self.stats['rate_limit_pauses'] += 1
+
+    async def _wait_for_pause(self):
+        while True:
+            wait = self._paused_until - time.monotonic()
+            if wait <= 0:
+                return
+            await asyncio.sleep(wait)
+
+    @asynccontextmanager
+    async def request(self, credits: float = 0):
+        """
+        Hold a request slot for the duration of the block.
+
+        Args:
+            credits: Credits the request is expected to consume (reserved
+                against credits_per_minute before it starts)
+        """
+        self._bind_loop()
+        started = time.monotonic()
+
+        await self._wait_for_pause()
+        if credits and self._credit_bucket is not None:
+            await self._credit_bucket.acquire(credits)
+        if self._request_bucket is not None:
+            await self._request_bucket.acquire()
+
+        slots = self._request_slots
+        if slots is not None:
+            await slots.acquire()
+        try:
+            # A 429 may have arrived while this request was queued
+            await self._wait_for_pause()
+            self.stats['requests'] += 1
+            self.stats['credits_reserved'] += credits
+            self.stats['wait_seconds'] += time.monotonic() - started
+            yield
+        finally:
+            if slots is not None:
+                slots.release()
+
+    @asynccontextmanager
+    async def job(self):
+        """Hold one of the API's concurrent-job slots (crawl/batch/extract)"""
+        self._bind_loop()
+        slots = self._job_slots
+        if slots is not None:
+            await slots.acquire()
+        try:
+            self.stats['jobs'] += 1
+            yield
+        finally:
+            if slots is not None:
+                slots.release()
+
+    def get_stats(self) -> Dict:
+        return {
+            'name': self.name,
+            'requests_per_second': self.requests_per_second,
+            'max_concurrent': self.max_concurrent,
+            'max_concurrent_jobs': self.max_concurrent_jobs,
+            'credits_per_minute': self.credits_per_minute,
+            **self.stats
+        }
+
+
+def _env_number(name: str, default: Optional[float], cast=float) -> Optional[float]:
+    """Positive number from an env var; the default if unset or malformed, None if <= 0"""
+    value = os.getenv(name)
+    if value is None or value == '':
+        return default
+    try:
+        number = cast(value)
+    except ValueError:
+        logger.warning(f"Ignoring {name}={value!r}: not a valid number, using default {default}")
+        return default
+    return number if number > 0 else None
+
+
+# Default plan limits per API: limit -> (env var override, default, type).
+# Env vars are read when the governor is first created, not at import.
+GOVERNOR_DEFAULTS = {
+    'firecrawl': {
+        'requests_per_second': ('FIRECRAWL_REQUESTS_PER_SECOND', 8.0, float),
+        'max_concurrent': ('FIRECRAWL_MAX_CONCURRENT', 50, int),
+        'max_concurrent_jobs': ('FIRECRAWL_MAX_CONCURRENT_JOBS', 10, int),
+        'credits_per_minute': ('FIRECRAWL_CREDITS_PER_MINUTE', None, float),
+    },
+    'dataforseo': {
+        'requests_per_second': ('DATAFORSEO_REQUESTS_PER_SECOND', 30.0, float),
+        'max_concurrent': ('DATAFORSEO_MAX_CONCURRENT', 30, int),
+        'credits_per_minute': ('DATAFORSEO_TASKS_PER_MINUTE', 2000.0, float),
+    },
+}
+
+_GOVERNORS: Dict[str, RateGovernor] = {}
+
+
+def get_governor(name: str) -> RateGovernor:
+    """Shared RateGovernor for an API, created on first use"""
+    governor = _GOVERNORS.get(name)
+    if governor is None:
+        limits = {
+            limit: _env_number(env_var, default, cast)
+            for limit, (env_var, default, cast) in GOVERNOR_DEFAULTS.get(name, {}).items()
+        }
+        governor = _GOVERNORS[name] = RateGovernor(name, **limits)
+    return governor
+
+
+def configure_governor(name: str, **limits) -> RateGovernor:
+    """Change the shared limits for an API (affects every client using it)"""
+    return get_governor(name).configure(**limits)
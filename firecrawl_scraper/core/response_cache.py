@@ -0,0 +1,238 @@
+#!/usr/bin/env python3
+"""
+Persistent Firecrawl Response Cache
+
+Content-addressed on-disk cache for Firecrawl API responses:
+- Keys are SHA256 hashes of the endpoint plus the normalized request payload
+- Per-endpoint TTLs (scrape, map, crawl, ...)
+- Size-bounded LRU eviction (least recently read entries go first)
+- Entries stored as gzip-compressed JSON, written atomically
+
+Usage:
+    from firecrawl_scraper.core.response_cache import ResponseCache
+
+    cache = ResponseCache('./data/_cache', max_size_mb=512)
+    key = cache.make_key('scrape', payload)
+    cached = cache.get(key, ttl=86400)
+    if cached is None:
+        cache.set(key, result)
+"""
+
+import gzip
+import hashlib
+import json
+import logging
+import os
+import threading
+import time
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Dict, Optional
+from urllib.parse import urlsplit, urlunsplit
+
+logger = logging.getLogger(__name__)
+
+
+# Cache policies accepted by EnhancedFirecrawlClient endpoints
+CACHE_USE = 'use'          # Read from cache, write on miss
+CACHE_REFRESH = 'refresh'  # Skip the read, overwrite with a fresh response
+CACHE_BYPASS = 'bypass'    # Neither read nor write
+CACHE_POLICIES = (CACHE_USE, CACHE_REFRESH, CACHE_BYPASS)
+
+# Default time-to-live per endpoint (seconds)
+DEFAULT_TTLS = {
+    'scrape': 24 * 3600,
+    'crawl': 24 * 3600,
+    'map': 7 * 24 * 3600,
+}
+
+
+def normalize_url(url: str) -> str:
+    """Lowercase scheme/host and drop the fragment so equivalent URLs share a key"""
+    try:
+        parts = urlsplit(url.strip())
+    except (AttributeError, ValueError):
+        return url
+    path = parts.path or '/'
+    return urlunsplit((parts.scheme.lower(), parts.netloc.lower(), path, parts.query, ''))
+
+
+def _normalize_payload(value: Any, key: Optional[str] = None) -> Any:
+    """Recursively normalize a payload for hashing"""
+    if isinstance(value, dict):
+        return {k: _normalize_payload(v, k) for k, v in value.items() if v is not None}
+    if isinstance(value, list):
+        items = [_normalize_payload(v) for v in value]
+        # Output formats are a set; action sequences and URL lists keep order
+        if key == 'formats':
+            return sorted(items, key=lambda v: json.dumps(v, sort_keys=True))
+        return items
+    if isinstance(value, str) and key == 'url':
+        return normalize_url(value)
+    return value
+
+
+class ResponseCache:
+    """
+    Size-bounded LRU cache of API responses on disk
+
+    Thread-safe, so the async client can run reads/writes in an executor.
+    """
+
+    def __init__(
+        self,
+        cache_dir: str,
+        max_size_mb: float = 512,
+        ttls: Optional[Dict[str, int]] = None
+    ):
+        """
+        Args:
+            cache_dir: Directory for cache entries (created if missing)
+            max_size_mb: Total size bound for all entries
+            ttls: Per-endpoint TTL overrides in seconds
+        """
+        self.cache_dir = Path(cache_dir)
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self.max_bytes = int(max_size_mb * 1024 * 1024)
+        self.ttls = {**DEFAULT_TTLS, **(ttls or {})}
+
+        self._lock = threading.Lock()
+        self._index: Optional['OrderedDict[str, int]'] = None  # key -> size, LRU first
+        self._total_bytes = 0
+
+    # ========================================================================
+    # KEYS
+    # ========================================================================
+
+    @staticmethod
+    def make_key(endpoint: str, payload: Dict) -> str:
+        """Canonical SHA256 of endpoint + normalized payload"""
+        canonical = json.dumps(
+            {'endpoint': endpoint, 'payload': _normalize_payload(payload)},
+            sort_keys=True,
+            separators=(',', ':'),
+            default=str
+        )
+        return hashlib.sha256(canonical.encode('utf-8')).hexdigest()
+
+    def ttl_for(self, endpoint: str) -> Optional[int]:
+        """TTL in seconds for an endpoint (None = never expires)"""
+        return self.ttls.get(endpoint)
+
+    # ========================================================================
+    # READ / WRITE
+    # ========================================================================
+
+    def get(self, key: str, ttl: Optional[int] = None) -> Optional[Dict]:
+        """Return the cached response, or None if missing or older than ttl"""
+        path = self._path(key)
+        with self._lock:
+            self._load_index()
+            if key not in self._index:
+                return None
+
+            try:
+                with gzip.open(path, 'rt', encoding='utf-8') as f:
+                    entry = json.load(f)
+            except (OSError, ValueError) as e:
+                logger.debug(f"Dropping unreadable cache entry {key[:12]}: {e}")
+                self._remove(key)
+                return None
+
+            if ttl is not None and time.time() - entry.get('stored_at', 0) > ttl:
+                self._remove(key)
+                return None
+
+            # Mark as most recently used (mtime persists LRU order across runs)
+            self._index.move_to_end(key)
+            try:
+                os.utime(path, None)
+            except OSError:
+                pass
+
+            return entry.get('response')
+
+    def set(self, key: str, response: Dict) -> None:
+        """Store a response and evict least recently used entries over the size bound"""
+        path = self._path(key)
+        tmp_path = path.with_suffix('.tmp')
+        entry = {'stored_at': time.time(), 'response': response}
+
+        with self._lock:
+            self._load_index()
+            try:
+                with gzip.open(tmp_path, 'wt', encoding='utf-8') as f:
+                    json.dump(entry, f, default=str)
+                os.replace(tmp_path, path)
+            except OSError as e:
+                logger.warning(f"Failed to write cache entry {key[:12]}: {e}")
+                return
+
+            if key in self._index:
+                self._total_bytes -= self._index.pop(key)
+            size = path.stat().st_size
+            self._index[key] = size
+            self._total_bytes += size
+
+            self._evict()
+
+    def delete(self, key: str) -> None:
+        """Remove a single entry"""
+        with self._lock:
+            self._load_index()
+            self._remove(key)
+
+    def clear(self) -> None:
+        """Remove every entry"""
+        with self._lock:
+            self._load_index()
+            for key in list(self._index):
+                self._remove(key)
+
+    def get_stats(self) -> Dict:
+        """Entry count and on-disk size"""
+        with self._lock:
+            self._load_index()
+            return {
+                'entries': len(self._index),
+                'size_bytes': self._total_bytes,
+                'max_bytes': self.max_bytes
+            }
+
+    # ========================================================================
+    # INTERNALS
+    # ========================================================================
+
+    def _path(self, key: str) -> Path:
+        return self.cache_dir / f"{key}.json.gz"
+
+    def _load_index(self) -> None:
+        """Build the LRU index from the directory on first use (oldest mtime first)"""
+        if self._index is not None:
+            return
+
+        entries = []
+        for path in self.cache_dir.glob('*.json.gz'):
+            try:
+                stat = path.stat()
+            except OSError:
+                continue
+            entries.append((stat.st_mtime, path.name[:-len('.json.gz')], stat.st_size))
+
+        entries.sort()
+        self._index = OrderedDict((key, size) for _, key, size in entries)
+        self._total_bytes = sum(size for _, _, size in entries)
+
+    def _remove(self, key: str) -> None:
+        size = self._index.pop(key, None)
+        if size is not None:
+            self._total_bytes -= size
+        try:
+            self._path(key).unlink()
+        except OSError:
+            pass
+
+    def _evict(self) -> None:
+        while self._total_bytes > self.max_bytes and len(self._index) > 1:
+            oldest = next(iter(self._index))
+            self._remove(oldest)
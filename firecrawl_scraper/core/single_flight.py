@@ -0,0 +1,97 @@
+#!/usr/bin/env python3
+"""
+Single-flight request coalescing
+
+Concurrent calls with the same key share one execution: the first caller
+starts the work, later callers wait for its result instead of issuing an
+identical API request (and paying for it again). Nothing is cached once
+the call completes - that is ResponseCache's job.
+
+Usage:
+    from firecrawl_scraper.core.single_flight import get_single_flight
+
+    flights = get_single_flight('firecrawl')
+    result, shared = await flights.do(key, lambda: fetch(url))
+"""
+
+import asyncio
+from typing import Any, Awaitable, Callable, Dict, Optional, Tuple
+
+
+class SingleFlight:
+    """
+    In-flight de-duplication of identical async calls
+
+    The shared call runs in its own task, so a waiter being cancelled
+    does not cancel the work other waiters depend on.
+    """
+
+    def __init__(self, name: str):
+        self.name = name
+        self._flights: Dict[str, asyncio.Future] = {}
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self.stats = {'calls': 0, 'coalesced': 0}
+
+    @property
+    def in_flight(self) -> int:
+        return len(self._flights)
+
+    async def do(self, key: str, call: Callable[[], Awaitable[Any]]) -> Tuple[Any, bool]:
+        """
+        Run `call()` unless a call with the same key is already in flight.
+
+        Args:
+            key: Canonical request key
+            call: Zero-argument coroutine function performing the request
+
+        Returns:
+            (result, shared) - shared is True when the result came from
+            another caller's request. Shared dict results are shallow
+            copies, so callers may update top-level keys independently.
+        """
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop:
+            # Flights of a previous (closed) loop can never complete here
+            self._loop = loop
+            self._flights = {}
+
+        self.stats['calls'] += 1
+        flight = self._flights.get(key)
+        shared = flight is not None
+        if shared:
+            self.stats['coalesced'] += 1
+        else:
+            flight = asyncio.ensure_future(call())
+            self._flights[key] = flight
+            flight.add_done_callback(lambda done: self._finish(key, done))
+
+        result = await asyncio.shield(flight)
+        if shared and isinstance(result, dict):
+            result = dict(result)
+        return result, shared
+
+    def _finish(self, key: str, flight: asyncio.Future):
+        if self._flights.get(key) is flight:
+            del self._flights[key]
+        # Nobody may be left waiting; mark a failure as retrieved
+        if not flight.cancelled():
+            flight.exception()
+
+    def get_stats(self) -> Dict:
+        return {'name': self.name, 'in_flight': self.in_flight, **self.stats}
+
+
+_FLIGHTS: Dict[str, SingleFlight] = {}
+
+
+def get_single_flight(name: str) -> SingleFlight:
+    """
+    Process-wide SingleFlight for an API, so separate clients coalesce too
+
+    Keys must include the caller's credentials (clients prefix an account
+    hash) so requests of different accounts never share a result.
+    """
+    flights = _FLIGHTS.get(name)
+    if flights is None:
+        flights = _FLIGHTS[name] = SingleFlight(name)
+    return flights
@@ -0,0 +1,323 @@
+#!/usr/bin/env python3
+"""
+DataForSEO Standard Queue - task_post / tasks_ready / task_get execution
+
+Live endpoints answer within the request but cost the most per task.
+The standard queue is cheaper and takes up to 100 tasks per POST; results
+are collected once DataForSEO reports them ready. TaskQueue runs that
+cycle for any number of callers:
+
+- `submit()` queues one task and returns a future for its result
+- Tasks submitted together (within flush_delay) share task_post calls
+- One poller per loop checks tasks_ready for every endpoint with tasks
+  outstanding and fetches ready results with parallel task_get calls
+
+Futures resolve to the same shape as the live call (`_request()` output
+with `data` holding that one task), with the cost charged at posting.
+
+Usage:
+    client = DataForSEOClient(queued=True)
+    result = await client.serp_google_organic('plumber', 'Austin,Texas,United States')
+
+    # or submit directly
+    future = client.queue.submit('/serp/google/organic/live/advanced', task)
+    result = await future
+"""
+
+import asyncio
+import logging
+import time
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+
+# Live endpoint -> (queue base path, result path under the base)
+QUEUE_ENDPOINTS: Dict[str, Tuple[str, str]] = {
+    '/serp/google/organic/live/advanced': ('/serp/google/organic', 'task_get/advanced'),
+    '/serp/google/maps/live/advanced': ('/serp/google/maps', 'task_get/advanced'),
+    '/serp/bing/organic/live/advanced': ('/serp/bing/organic', 'task_get/advanced'),
+    '/keywords_data/google_ads/search_volume/live': ('/keywords_data/google_ads/search_volume', 'task_get'),
+    '/keywords_data/google_ads/keywords_for_site/live': ('/keywords_data/google_ads/keywords_for_site', 'task_get'),
+}
+
+# DataForSEO task status codes
+TASK_CREATED = 20100
+TASK_PENDING = (40601, 40602)  # Task Handed / Task In Queue
+
+# tasks_ready lists at most this many tasks per call
+READY_PAGE_SIZE = 1000
+
+
+@dataclass
+class PendingTask:
+    """A task waiting to be posted"""
+    task: Dict
+    future: asyncio.Future
+    cost_key: Optional[str] = None
+
+
+@dataclass
+class PostedTask:
+    """A posted task waiting for its result"""
+    endpoint: str
+    task_id: str
+    cost: float = 0.0
+    posted_at: float = field(default_factory=time.monotonic)
+    futures: List[asyncio.Future] = field(default_factory=list)
+
+
+class TaskQueue:
+    """
+    Standard-queue executor shared by all queued calls of a DataForSEOClient
+
+    Outstanding tasks are indexed by task id. A task posted twice (an
+    identical POST coalesced by the client) resolves every waiter.
+    """
+
+    def __init__(
+        self,
+        client,
+        poll_interval: float = 10.0,
+        max_wait: float = 3600.0,
+        flush_delay: float = 0.05,
+        max_concurrent_gets: int = 10
+    ):
+        """
+        Args:
+            client: DataForSEOClient used for task_post/tasks_ready/task_get
+            poll_interval: Seconds between tasks_ready checks
+            max_wait: Seconds after posting before a task that never shows
+                up as ready is fetched directly (and failed if still pending)
+            flush_delay: Seconds to gather submissions into shared task_posts
+            max_concurrent_gets: task_get requests in flight at once
+        """
+        self.client = client
+        self.poll_interval = poll_interval
+        self.max_wait = max_wait
+        self.flush_delay = flush_delay
+        self.max_concurrent_gets = max_concurrent_gets
+
+        self._pending: Dict[str, List[PendingTask]] = {}
+        self._posted: Dict[str, PostedTask] = {}
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._flushers: Dict[str, asyncio.Task] = {}
+        self._poller: Optional[asyncio.Task] = None
+        self._semaphore: Optional[asyncio.Semaphore] = None
+        self.stats = {
+            'submitted': 0, 'posts': 0, 'ready_checks': 0,
+            'collected': 0, 'failed': 0, 'expired': 0
+        }
+
+    @staticmethod
+    def supports(endpoint: str) -> bool:
+        """Whether a live endpoint has a standard-queue equivalent"""
+        return endpoint in QUEUE_ENDPOINTS
+
+    @property
+    def outstanding(self) -> int:
+        """Tasks submitted and not yet resolved"""
+        return sum(len(tasks) for tasks in self._pending.values()) + len(self._posted)
+
+    def submit(self, endpoint: str, task: Dict, cost_key: Optional[str] = None) -> asyncio.Future:
+        """
+        Queue one task for a live endpoint's standard-queue equivalent.
+
+        Args:
+            endpoint: Live endpoint path (see QUEUE_ENDPOINTS)
+            task: Task object, as sent to the live endpoint
+            cost_key: Key for cost tracking
+
+        Returns:
+            Future resolving to a response in the live call's shape
+        """
+        if endpoint not in QUEUE_ENDPOINTS:
+            raise ValueError(f"No standard-queue endpoint for {endpoint}")
+
+        self._ensure_loop()
+        future = self._loop.create_future()
+        self._pending.setdefault(endpoint, []).append(PendingTask(task, future, cost_key))
+        self.stats['submitted'] += 1
+
+        if endpoint not in self._flushers:
+            self._flushers[endpoint] = self._loop.create_task(self._flush(endpoint))
+        return future
+
+    async def close(self):
+        """Stop posting and polling; unresolved futures are cancelled"""
+        tasks = [*self._flushers.values(), *([self._poller] if self._poller else [])]
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+        for pending in self._pending.values():
+            for entry in pending:
+                entry.future.cancel()
+        for posted in self._posted.values():
+            for future in posted.futures:
+                future.cancel()
+        self._pending, self._posted, self._flushers, self._poller = {}, {}, {}, None
+
+    def get_stats(self) -> Dict:
+        return {**self.stats, 'outstanding': self.outstanding}
+
+    def _ensure_loop(self):
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop:
+            # Tasks of a previous (closed) loop cannot be awaited here
+            self._loop = loop
+            self._pending, self._posted, self._flushers, self._poller = {}, {}, {}, None
+            self._semaphore = asyncio.Semaphore(max(1, self.max_concurrent_gets))
+
+    # ========================================================================
+    # POSTING
+    # ========================================================================
+
+    async def _flush(self, endpoint: str):
+        """Post everything submitted for an endpoint, up to the task limit per POST"""
+        await asyncio.sleep(self.flush_delay)
+        self._flushers.pop(endpoint, None)
+        pending = [entry for entry in self._pending.pop(endpoint, []) if not entry.future.done()]
+
+        base, _ = QUEUE_ENDPOINTS[endpoint]
+        post_endpoint = f"{base}/task_post"
+        limit = self.client.get_task_limit(post_endpoint)
+        chunks = [pending[i:i + limit] for i in range(0, len(pending), limit)]
+        await asyncio.gather(*[self._post(endpoint, post_endpoint, chunk) for chunk in chunks])
+
+    async def _post(self, endpoint: str, post_endpoint: str, chunk: List[PendingTask]):
+        try:
+            response = await self.client._request(
+                post_endpoint,
+                data=[entry.task for entry in chunk],
+                cost_key=chunk[0].cost_key
+            )
+        except Exception as e:
+            response = {'success': False, 'error': str(e)}
+        self.stats['posts'] += 1
+
+        if not response.get('success'):
+            for entry in chunk:
+                self._fail(entry.future, response)
+            return
+
+        # Tasks come back in the order they were posted
+        tasks = response.get('data') or []
+        for position, entry in enumerate(chunk):
+            task = tasks[position] if position < len(tasks) else None
+            if not task or task.get('status_code') != TASK_CREATED or not task.get('id'):
+                self._fail(entry.future, {
+                    'success': False,
+                    'error': (task or {}).get('status_message', 'Task missing from task_post response'),
+                    'status_code': (task or {}).get('status_code')
+                })
+                continue
+
+            posted = self._posted.get(task['id'])
+            if posted is None:
+                cost = 0 if response.get('coalesced') else task.get('cost', 0)
+                posted = self._posted[task['id']] = PostedTask(endpoint, task['id'], cost)
+            posted.futures.append(entry.future)
+
+        if self._posted and (self._poller is None or self._poller.done()):
+            self._poller = self._loop.create_task(self._poll())
+
+    # ========================================================================
+    # POLLING
+    # ========================================================================
+
+    async def _poll(self):
+        """Check tasks_ready and collect results until nothing is outstanding"""
+        while self._posted:
+            ready = await self._check_ready()
+            if ready:
+                await asyncio.gather(*[self._collect(task_id) for task_id in ready])
+
+            expired = [
+                task_id for task_id, posted in self._posted.items()
+                if time.monotonic() - posted.posted_at >= self.max_wait
+            ]
+            if expired:
+                self.stats['expired'] += len(expired)
+                await asyncio.gather(*[self._collect(task_id, expired=True) for task_id in expired])
+
+            if self._posted and len(ready) < READY_PAGE_SIZE:
+                await asyncio.sleep(self.poll_interval)
+
+    async def _check_ready(self) -> List[str]:
+        """Ids of our outstanding tasks that tasks_ready reports complete"""
+        bases = {QUEUE_ENDPOINTS[posted.endpoint][0] for posted in self._posted.values()}
+
+        async def check(base: str) -> List[str]:
+            self.stats['ready_checks'] += 1
+            try:
+                response = await self.client._request(f"{base}/tasks_ready", method='GET')
+            except Exception as e:
+                logger.warning(f"tasks_ready check failed for {base}: {e}")
+                return []
+            if not response.get('success'):
+                logger.warning(f"tasks_ready check failed for {base}: {response.get('error')}")
+                return []
+            return [
+                item.get('id')
+                for task in response.get('data') or []
+                for item in task.get('result') or []
+                if item.get('id') in self._posted
+            ]
+
+        ready = await asyncio.gather(*[check(base) for base in bases])
+        return list(dict.fromkeys(task_id for ids in ready for task_id in ids))
+
+    async def _collect(self, task_id: str, expired: bool = False):
+        """
+        Fetch one task's result and resolve its waiters.
+
+        A failed or still-pending task_get leaves the task outstanding for
+        the next poll; its waiters only fail once the task has expired.
+        """
+        posted = self._posted.pop(task_id, None)
+        if posted is None:
+            return
+
+        base, result_path = QUEUE_ENDPOINTS[posted.endpoint]
+        try:
+            async with self._semaphore:
+                response = await self.client._request(f"{base}/{result_path}/{task_id}", method='GET')
+        except Exception as e:
+            response = {'success': False, 'error': str(e)}
+
+        task = (response.get('data') or [None])[0] if response.get('success') else None
+        if task is None or task.get('status_code') in TASK_PENDING:
+            error = response.get('error') or (task or {}).get('status_message')
+            if not expired:
+                # Already paid for - retry on the next poll
+                logger.warning(f"task_get failed for {task_id}, retrying: {error}")
+                duplicate = self._posted.get(task_id)
+                if duplicate is not None:
+                    posted.futures.extend(duplicate.futures)
+                self._posted[task_id] = posted
+                return
+
+            error = f"Task not ready after {self.max_wait:.0f}s"
+            for future in posted.futures:
+                self._fail(future, {'success': False, 'error': error, 'task_id': task_id})
+            return
+
+        result = {
+            **response,
+            'data': [task],
+            'cost': posted.cost,
+            'status_code': task.get('status_code'),
+            'status_message': task.get('status_message')
+        }
+        self.stats['collected'] += 1
+        for i, future in enumerate(posted.futures):
+            if not future.done():
+                # Only the first waiter is charged, as with coalesced live calls
+                future.set_result(result if i == 0 else {**result, 'cost': 0, 'coalesced': True})
+
+    def _fail(self, future: asyncio.Future, response: Dict):
+        self.stats['failed'] += 1
+        if not future.done():
+            future.set_result(response)
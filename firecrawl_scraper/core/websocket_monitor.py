@@ -5,6 +5,7 @@ WebSocket Monitor - Real-Time Crawl Progress Monitoring
 Provides real-time updates for crawl jobs using WebSocket connections:
 - Live progress tracking
 - Event-driven callbacks
+- Many concurrent jobs share the client's adaptive job poller
 - Progress bar integration
 - Auto-reconnection support
 
@@ -19,7 +20,6 @@ Usage:
     )
 """
 
-import asyncio
 import json
 import logging
 from typing import Dict, List, Optional, Callable, Any
@@ -117,6 +117,7 @@ class WebSocketMonitor:
         on_error: Optional[Callable[[Dict], None]] = None,
         on_complete: Optional[Callable[[CrawlProgress], None]] = None,
         show_progress_bar: bool = True,
+        keep_documents: bool = True,
         **kwargs
     ) -> Dict:
         """
@@ -131,6 +132,9 @@ class WebSocketMonitor:
             on_error: Callback for errors
             on_complete: Callback when crawl completes
             show_progress_bar: Show tqdm progress bar
+            keep_documents: Collect pages into the result's 'data'. Pass False
+                when on_page consumes them, so large crawls aren't held in
+                memory (or use EnhancedFirecrawlClient.crawl_stream)
             **kwargs: Additional crawl options
 
         Returns:
@@ -172,7 +176,8 @@ class WebSocketMonitor:
                 on_page=on_page,
                 on_progress=on_progress,
                 on_error=on_error,
-                pbar=pbar
+                pbar=pbar,
+                keep_documents=keep_documents
             )
 
             # Call completion callback
@@ -193,24 +198,27 @@ class WebSocketMonitor:
         on_progress: Optional[Callable] = None,
         on_error: Optional[Callable] = None,
         pbar: Optional[Any] = None,
-        poll_interval: int = 2
+        poll_interval: float = 2,
+        keep_documents: bool = True
     ) -> Dict:
         """
         Poll job status and trigger callbacks.
 
         This simulates real-time monitoring via polling.
         If Firecrawl adds WebSocket support, this would be replaced.
+        The job is polled by the client's shared multiplexer (adaptive
+        interval starting at poll_interval); each poll only fetches pages
+        past the number already received.
         """
-        seen_pages = set()
         last_completed = 0
 
-        while True:
-            status = await self.client.get_crawl_status(job_id)
+        def on_update(status: Dict, documents: List[Dict]):
+            nonlocal last_completed
 
             # Update progress
-            progress.status = status.get('status', 'unknown')
-            progress.total = status.get('total', 0)
-            progress.completed = status.get('completed', 0)
+            progress.status = status.get('status', progress.status)
+            progress.total = status.get('total', progress.total)
+            progress.completed = status.get('completed', progress.completed)
             progress.credits_used = status.get('creditsUsed', progress.completed)
 
             # Update progress bar
@@ -225,37 +233,36 @@ class WebSocketMonitor:
                 last_completed = progress.completed
 
             # Process new pages
-            data = status.get('data', [])
-            for doc in data:
-                # Get unique identifier for the page
-                page_url = doc.get('url') or doc.get('metadata', {}).get('sourceURL', '')
-                if page_url and page_url not in seen_pages:
-                    seen_pages.add(page_url)
+            for doc in documents:
+                if keep_documents:
                     progress.documents.append(doc)
 
-                    # Call page callback
-                    if on_page:
-                        try:
-                            on_page(doc)
-                        except Exception as e:
-                            logger.error(f"Error in on_page callback: {e}")
-
-            # Check if complete
-            if progress.status in ['completed', 'failed', 'cancelled']:
-                if progress.status == 'failed' and on_error:
-                    on_error({'status': 'failed', 'job_id': job_id})
-
-                return {
-                    'success': progress.status == 'completed',
-                    'data': progress.documents,
-                    'creditsUsed': progress.credits_used,
-                    'status': progress.status,
-                    'total': progress.total,
-                    'completed': progress.completed,
-                    'elapsed_seconds': progress.elapsed_time
-                }
-
-            await asyncio.sleep(poll_interval)
+                # Call page callback
+                if on_page:
+                    try:
+                        on_page(doc)
+                    except Exception as e:
+                        logger.error(f"Error in on_page callback: {e}")
+
+        await self.client.jobs.watch(
+            f'/crawl/{job_id}', 'crawl',
+            collect=False,
+            on_update=on_update,
+            min_interval=poll_interval
+        )
+
+        if progress.status == 'failed' and on_error:
+            on_error({'status': 'failed', 'job_id': job_id})
+
+        return {
+            'success': progress.status == 'completed',
+            'data': progress.documents,
+            'creditsUsed': progress.credits_used,
+            'status': progress.status,
+            'total': progress.total,
+            'completed': progress.completed,
+            'elapsed_seconds': progress.elapsed_time
+        }
 
     async def batch_scrape_and_watch(
         self,
@@ -263,6 +270,10 @@ class WebSocketMonitor:
         on_page: Optional[Callable[[Dict], None]] = None,
         on_progress: Optional[Callable[[int, int], None]] = None,
         show_progress_bar: bool = True,
+        keep_documents: bool = True,
+        shard_size: int = 1000,
+        max_concurrent_shards: int = 4,
+        max_credits: Optional[int] = None,
         **kwargs
     ) -> Dict:
         """
@@ -273,39 +284,59 @@ class WebSocketMonitor:
             on_page: Callback for each scraped page
             on_progress: Callback for progress updates
             show_progress_bar: Show progress bar
+            keep_documents: Collect results into the result's 'data'
+                (see crawl_and_watch)
+            shard_size: Lists longer than this run as concurrent shard jobs
+                (pages then arrive in shard order)
+            max_concurrent_shards: Shard jobs running at once
+            max_credits: Credit budget for sharded runs
             **kwargs: Additional scrape options
 
         Returns:
             Dict with batch results
         """
-        # Start batch job
-        job_id = await self.client.batch_scrape_async(urls=urls, **kwargs)
-
-        logger.info(f"Started batch scrape job: {job_id}")
-
         # Create progress bar
         pbar = None
         if show_progress_bar and HAS_TQDM:
             pbar = tqdm(total=len(urls), desc="Batch scraping", unit="url")
 
-        progress = CrawlProgress(
-            job_id=job_id,
-            status='scraping',
-            total=len(urls),
-            completed=0,
-            failed=0,
-            credits_used=0,
-            start_time=datetime.now(),
-            documents=[]
-        )
-
         try:
+            if len(urls) > shard_size or max_credits is not None:
+                return await self._watch_sharded_batch(
+                    urls,
+                    on_page=on_page,
+                    on_progress=on_progress,
+                    pbar=pbar,
+                    keep_documents=keep_documents,
+                    shard_size=shard_size,
+                    max_concurrent_shards=max_concurrent_shards,
+                    max_credits=max_credits,
+                    **kwargs
+                )
+
+            # Start batch job
+            job_id = await self.client.batch_scrape_async(urls=urls, **kwargs)
+
+            logger.info(f"Started batch scrape job: {job_id}")
+
+            progress = CrawlProgress(
+                job_id=job_id,
+                status='scraping',
+                total=len(urls),
+                completed=0,
+                failed=0,
+                credits_used=0,
+                start_time=datetime.now(),
+                documents=[]
+            )
+
             result = await self._poll_batch_with_callbacks(
                 job_id=job_id,
                 progress=progress,
                 on_page=on_page,
                 on_progress=on_progress,
-                pbar=pbar
+                pbar=pbar,
+                keep_documents=keep_documents
             )
             return result
 
@@ -313,6 +344,62 @@ class WebSocketMonitor:
             if pbar:
                 pbar.close()
 
+    async def _watch_sharded_batch(
+        self,
+        urls: List[str],
+        on_page: Optional[Callable] = None,
+        on_progress: Optional[Callable] = None,
+        pbar: Optional[Any] = None,
+        keep_documents: bool = True,
+        **kwargs
+    ) -> Dict:
+        """Run a sharded batch via the client, forwarding pages and progress"""
+        progress = CrawlProgress(
+            job_id='sharded',
+            status='scraping',
+            total=len(urls),
+            completed=0,
+            failed=0,
+            credits_used=0,
+            start_time=datetime.now(),
+            documents=[]
+        )
+        summary: Dict = {}
+
+        def shard_progress(completed: int, total: int):
+            progress.completed = completed
+            if pbar:
+                pbar.n = completed
+                pbar.refresh()
+            if on_progress:
+                on_progress(completed, total)
+
+        async for doc in self.client.batch_scrape_sharded(
+            urls,
+            on_progress=shard_progress,
+            on_complete=summary.update,
+            **kwargs
+        ):
+            if keep_documents:
+                progress.documents.append(doc)
+            if on_page:
+                try:
+                    on_page(doc)
+                except Exception as e:
+                    logger.error(f"Error in on_page callback: {e}")
+
+        return {
+            'success': summary.get('success', False),
+            'data': progress.documents,
+            'creditsUsed': summary.get('creditsUsed', 0),
+            'status': 'completed' if summary.get('success') else 'partial',
+            'total': progress.total,
+            'completed': summary.get('completed', progress.completed),
+            'failed_shards': summary.get('failed_shards', []),
+            'skipped_urls': summary.get('skipped_urls', []),
+            'elapsed_seconds': progress.elapsed_time
+        }
+
     async def _poll_batch_with_callbacks(
         self,
         job_id: str,
@@ -320,18 +407,18 @@ class WebSocketMonitor:
         on_page: Optional[Callable] = None,
         on_progress: Optional[Callable] = None,
         pbar: Optional[Any] = None,
-        poll_interval: int = 2
+        poll_interval: float = 2,
+        keep_documents: bool = True
     ) -> Dict:
-        """Poll batch job status with callbacks"""
-        seen_pages = set()
+        """Poll batch job status with callbacks (shared multiplexer, incremental)"""
         last_completed = 0
 
-        while True:
-            status = await self.client.get_batch_status(job_id)
+        def on_update(status: Dict, documents: List[Dict]):
+            nonlocal last_completed
 
-            progress.status = status.get('status', 'unknown')
+            progress.status = status.get('status', progress.status)
             progress.total = status.get('total', progress.total)
-            progress.completed = status.get('completed', 0)
+            progress.completed = status.get('completed', progress.completed)
             progress.credits_used = progress.completed
 
             # Update progress bar
@@ -345,32 +432,32 @@ class WebSocketMonitor:
                 last_completed = progress.completed
 
             # Process new results
-            data = status.get('data', [])
-            for doc in data:
-                page_url = doc.get('url') or doc.get('metadata', {}).get('sourceURL', '')
-                if page_url and page_url not in seen_pages:
-                    seen_pages.add(page_url)
+            for doc in documents:
+                if keep_documents:
                     progress.documents.append(doc)
 
-                    if on_page:
-                        try:
-                            on_page(doc)
-                        except Exception as e:
-                            logger.error(f"Error in on_page callback: {e}")
-
-            # Check if complete
-            if progress.status in ['completed', 'failed', 'cancelled']:
-                return {
-                    'success': progress.status == 'completed',
-                    'data': progress.documents,
-                    'creditsUsed': progress.credits_used,
-                    'status': progress.status,
-                    'total': progress.total,
-                    'completed': progress.completed,
-                    'elapsed_seconds': progress.elapsed_time
-                }
-
-            await asyncio.sleep(poll_interval)
+                if on_page:
+                    try:
+                        on_page(doc)
+                    except Exception as e:
+                        logger.error(f"Error in on_page callback: {e}")
+
+        await self.client.jobs.watch(
+            f'/batch/scrape/{job_id}', 'batch_scrape',
+            collect=False,
+            on_update=on_update,
+            min_interval=poll_interval
+        )
+
+        return {
+            'success': progress.status == 'completed',
+            'data': progress.documents,
+            'creditsUsed': progress.credits_used,
+            'status': progress.status,
+            'total': progress.total,
+            'completed': progress.completed,
+            'elapsed_seconds': progress.elapsed_time
+        }
 
 
 class ProgressDisplay:
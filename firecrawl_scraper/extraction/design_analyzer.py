@@ -15,15 +15,69 @@ import asyncio
 import json
 import logging
 import base64
+import hashlib
+import os
+import re
 import aiohttp
+from concurrent.futures import Executor, ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 from pathlib import Path
-from typing import Dict, List, Optional, Any
+from typing import Dict, List, Optional, Any, Tuple
 from datetime import datetime
+from urllib.parse import urlparse
 
 from ..core.firecrawl_client import EnhancedFirecrawlClient
 
 logger = logging.getLogger(__name__)
 
+# Try to import PIL for perceptual hashes and thumbnails
+try:
+    from PIL import Image
+    HAS_PIL = True
+except ImportError:
+    HAS_PIL = False
+
+
+# ============================================================================
+# SCREENSHOT PROCESSING
+# ============================================================================
+
+DOWNLOAD_CHUNK_SIZE = 256 * 1024
+BASE64_CHUNK_SIZE = 4 * 256 * 1024  # Multiple of 4: chunks decode independently
+PHASH_SIZE = 16  # 256-bit difference hash
+
+
+def _hamming(hash_a: str, hash_b: str) -> int:
+    return bin(int(hash_a, 16) ^ int(hash_b, 16)).count('1')
+
+
+def _process_screenshot(path: str, thumbnail_width: Optional[int]) -> Dict[str, Any]:
+    """
+    Perceptual hash (dHash) and optional downscaled thumbnail of a saved
+    screenshot. Module-level so it can run in a worker process.
+    """
+    with Image.open(path) as img:
+        info: Dict[str, Any] = {"width": img.width, "height": img.height}
+
+        gray = img.convert('L').resize((PHASH_SIZE + 1, PHASH_SIZE), Image.LANCZOS)
+        pixels = list(gray.getdata())
+        bits = 0
+        for row in range(PHASH_SIZE):
+            offset = row * (PHASH_SIZE + 1)
+            for col in range(PHASH_SIZE):
+                bits = (bits << 1) | (pixels[offset + col] > pixels[offset + col + 1])
+        info["phash"] = f"{bits:0{PHASH_SIZE * PHASH_SIZE // 4}x}"
+
+        if thumbnail_width and img.width > thumbnail_width:
+            height = max(1, round(img.height * thumbnail_width / img.width))
+            thumb_path = Path(path).with_name(f"{Path(path).stem}_thumb.jpg")
+            img.resize((thumbnail_width, height), Image.LANCZOS).convert('RGB').save(
+                thumb_path, 'JPEG', quality=80, optimize=True
+            )
+            info["thumbnail"] = str(thumb_path)
+
+    return info
+
 
 # ============================================================================
 # LLM EXTRACTION SCHEMAS
@@ -263,22 +317,144 @@ ANIMATION_SCHEMA = {
 }
 
 
+# ============================================================================
+# LLM EXTRACTION PROMPTS
+# ============================================================================
+
+DESIGN_SYSTEM_PROMPT = """Analyze this website and extract the complete design system.
+Focus on:
+1. Color palette (primary, secondary, accent, backgrounds, text colors)
+2. Typography (fonts, sizes, weights, line heights)
+3. Spacing patterns (padding, margins, container widths)
+4. Overall visual style classification
+
+Be specific with hex colors and exact font names where possible."""
+
+COMPONENT_PROMPT = """Analyze the UI components and layout patterns on this page.
+Extract details about:
+1. Navigation (type, style, items, mobile behavior)
+2. Hero section (type, content, height, visual elements)
+3. Content sections (layout, columns, backgrounds)
+4. Footer (style, columns, features)
+
+Focus on patterns that can be recreated in code."""
+
+CTA_PROMPT = """Analyze all call-to-action elements and conversion points.
+For each CTA identify:
+1. Button/link text
+2. Visual style (color, shape, size)
+3. Position on page
+4. Purpose/action
+5. Whether it uses urgency language
+
+Also analyze the booking/conversion flow if present."""
+
+PSYCHOLOGY_PROMPT = """Analyze the psychological design techniques used on this page.
+Look for:
+1. Emotional triggers (fear, excitement, curiosity elements)
+2. Trust signals (reviews, badges, testimonials, awards)
+3. Social proof elements (review counts, user photos)
+4. Scarcity/urgency indicators (limited time, availability)
+5. Cognitive load assessment (is the page overwhelming?)
+6. User journey friction points (barriers to conversion)
+
+Rate the visual hierarchy clarity from 1-10."""
+
+ANIMATION_PROMPT = """Analyze animations and interactive elements on this page.
+Identify:
+1. Page transition effects
+2. Scroll-triggered animations (fade, slide, parallax)
+3. Hover effects on buttons and cards
+4. Micro-interactions (loading states, form feedback)
+5. 3D elements (if any - Three.js, WebGL, CSS 3D)
+6. Whether animations might cause performance issues"""
+
+# Analysis sections in result order: section -> (prompt, schema)
+DESIGN_SECTIONS = {
+    "design_system": (DESIGN_SYSTEM_PROMPT, DESIGN_SYSTEM_SCHEMA),
+    "components": (COMPONENT_PROMPT, COMPONENT_SCHEMA),
+    "ctas": (CTA_PROMPT, CTA_SCHEMA),
+    "psychology": (PSYCHOLOGY_PROMPT, PSYCHOLOGY_SCHEMA),
+    "animations": (ANIMATION_PROMPT, ANIMATION_SCHEMA),
+}
+
+# All sections as one extract job: the page is fetched, rendered and
+# billed once instead of once per section
+FUSED_DESIGN_SCHEMA = {
+    "type": "object",
+    "properties": {name: schema for name, (_, schema) in DESIGN_SECTIONS.items()}
+}
+
+FUSED_DESIGN_PROMPT = (
+    "Analyze this page's design. Fill each top-level field of the schema "
+    "following its own instructions below.\n\n"
+    + "\n\n".join(f"[{name}]\n{prompt}" for name, (prompt, _) in DESIGN_SECTIONS.items())
+)
+
+
 class DesignAnalyzer:
     """
     Comprehensive UI/UX design analyzer using Firecrawl's
     screenshot and LLM extraction capabilities.
     """
 
-    def __init__(self, client: EnhancedFirecrawlClient):
+    def __init__(
+        self,
+        client: EnhancedFirecrawlClient,
+        fused: bool = True,
+        thumbnail_width: Optional[int] = None,
+        dedup_screenshots: bool = True,
+        dedup_threshold: Optional[int] = None,
+        max_workers: Optional[int] = None
+    ):
         """
         Initialize the design analyzer.
 
         Args:
             client: Configured EnhancedFirecrawlClient instance
+            fused: Extract all design sections with one composite extract
+                job per page (default) instead of one job per section
+            thumbnail_width: Also save a downscaled JPEG thumbnail of each
+                screenshot at this width (requires Pillow)
+            dedup_screenshots: Keep one file for byte-identical screenshots
+                captured across pages
+            dedup_threshold: Also treat same-sized screenshots whose
+                perceptual hashes differ by at most this many bits as
+                identical (requires Pillow). Off by default: pages built on
+                one template can hash alike.
+            max_workers: Processes for hashing/thumbnails (CPU count by default)
         """
         self.client = client
+        self.fused = fused
         self.results: Dict[str, Any] = {}
 
+        self.thumbnail_width = thumbnail_width
+        self.dedup_screenshots = dedup_screenshots
+        self.dedup_threshold = dedup_threshold
+        self.max_workers = max_workers
+        self._executor: Optional[Executor] = None
+        self._use_processes = True
+
+        # Screenshots saved so far: sha256 -> entry, plus perceptual entries
+        self._screenshots_by_digest: Dict[str, Dict[str, Any]] = {}
+        self._screenshots_by_phash: List[Dict[str, Any]] = []
+
+        # Pooled session for screenshot downloads (no API credentials)
+        self._download_session: Optional[aiohttp.ClientSession] = None
+        self._download_session_loop: Optional[asyncio.AbstractEventLoop] = None
+
+    async def close(self) -> None:
+        """Close the download session and the screenshot worker pool"""
+        session = self._download_session
+        self._download_session = None
+        self._download_session_loop = None
+        if session is not None and not session.closed:
+            await session.close()
+
+        if self._executor is not None:
+            self._executor.shutdown(wait=False)
+            self._executor = None
+
     async def capture_screenshots(
         self,
         url: str,
@@ -288,6 +464,8 @@ class DesignAnalyzer:
         """
         Capture full-page screenshots for desktop and mobile viewports.
 
+        Both viewports are captured concurrently and streamed to disk.
+
         Args:
             url: URL to capture
             output_dir: Directory to save screenshots
@@ -306,107 +484,175 @@ class DesignAnalyzer:
             "mobile": None
         }
 
-        # Desktop screenshot (default viewport)
-        logger.info("  Capturing desktop viewport...")
+        viewports = ["desktop", "mobile"] if include_mobile else ["desktop"]
+        captures = await asyncio.gather(
+            *[self._capture_viewport(url, output_dir, viewport) for viewport in viewports]
+        )
+        result.update(zip(viewports, captures))
+
+        return result
+
+    async def _capture_viewport(self, url: str, output_dir: Path, viewport: str) -> Optional[Dict[str, Any]]:
+        """Capture, save, hash and dedup one viewport's full-page screenshot"""
+        logger.info(f"  Capturing {viewport} viewport...")
         try:
-            desktop_result = await self.client.scrape(
+            options = {'mobile': True} if viewport == "mobile" else {}
+            response = await self.client.scrape(
                 url=url,
                 formats=['screenshot'],
-                wait_for=3000  # Wait for animations to load
+                wait_for=3000,  # Wait for animations to load
+                **options
             )
 
             # Screenshot is in data.screenshot, not top-level
-            data = desktop_result.get('data', {})
+            data = response.get('data', {})
             screenshot_data = data.get('screenshot') if isinstance(data, dict) else None
+            if not (response.get('success') and screenshot_data):
+                logger.warning(f"    {viewport.title()} screenshot not captured. Data keys: {data.keys() if isinstance(data, dict) else type(data)}")
+                return None
+
+            path = output_dir / f"{viewport}_fullpage.png"
+            digest = await self._save_screenshot(screenshot_data, path)
+            if digest is None:
+                return None
+            del screenshot_data, data, response
+
+            capture = {
+                "path": str(path),
+                "viewport": viewport,
+                "full_page": True
+            }
+            perceptual = self.dedup_screenshots and self.dedup_threshold is not None
+            if HAS_PIL and (perceptual or self.thumbnail_width):
+                try:
+                    capture.update(await self._process_screenshot(path))
+                except Exception as e:
+                    logger.warning(f"    Could not process {viewport} screenshot: {e}")
+
+            if self.dedup_screenshots:
+                capture = self._dedup_screenshot(capture, digest, url)
+            logger.info(f"    Saved: {capture['path']}")
+            return capture
 
-            if desktop_result.get('success') and screenshot_data:
+        except Exception as e:
+            logger.error(f"    {viewport.title()} screenshot failed: {e}")
+            return None
 
-                # Save screenshot
-                desktop_path = output_dir / "desktop_fullpage.png"
+    async def _save_screenshot(self, screenshot_data: str, path: Path) -> Optional[str]:
+        """
+        Write a screenshot to disk without holding a decoded copy in memory.
+
+        Base64 data URIs are decoded chunk by chunk; URLs are streamed from
+        the response. The file appears at `path` only once complete.
+
+        Returns:
+            SHA256 of the written bytes, or None if nothing was saved
+        """
+        digest = hashlib.sha256()
+        tmp_path = path.with_suffix(path.suffix + '.part')
+
+        try:
+            if screenshot_data.startswith('http'):
+                # URL - stream the image to disk
+                session = self._get_download_session()
+                async with session.get(screenshot_data) as resp:
+                    if resp.status != 200:
+                        logger.warning(f"    Failed to download screenshot: HTTP {resp.status}")
+                        return None
+                    with open(tmp_path, 'wb') as f:
+                        async for chunk in resp.content.iter_chunked(DOWNLOAD_CHUNK_SIZE):
+                            digest.update(chunk)
+                            f.write(chunk)
+            else:
                 if screenshot_data.startswith('data:image'):
                     # Base64 encoded
-                    img_data = screenshot_data.split(',')[1]
-                    with open(desktop_path, 'wb') as f:
-                        f.write(base64.b64decode(img_data))
-                elif screenshot_data.startswith('http'):
-                    # URL - download the image
-                    async with aiohttp.ClientSession() as session:
-                        async with session.get(screenshot_data) as resp:
-                            if resp.status == 200:
-                                with open(desktop_path, 'wb') as f:
-                                    f.write(await resp.read())
-                            else:
-                                logger.warning(f"    Failed to download screenshot: HTTP {resp.status}")
-                                desktop_path = None
+                    start = screenshot_data.index(',') + 1
+                    with open(tmp_path, 'wb') as f:
+                        for offset in range(start, len(screenshot_data), BASE64_CHUNK_SIZE):
+                            chunk = base64.b64decode(screenshot_data[offset:offset + BASE64_CHUNK_SIZE])
+                            digest.update(chunk)
+                            f.write(chunk)
                 else:
                     # Raw data
-                    with open(desktop_path, 'wb') as f:
-                        f.write(screenshot_data.encode() if isinstance(screenshot_data, str) else screenshot_data)
-
-                if desktop_path:
-                    result["desktop"] = {
-                        "path": str(desktop_path),
-                        "viewport": "desktop",
-                        "full_page": True
-                    }
-                    logger.info(f"    Saved: {desktop_path}")
-            else:
-                logger.warning(f"    Desktop screenshot not captured. Response keys: {desktop_result.keys()}, data keys: {data.keys() if isinstance(data, dict) else type(data)}")
-
-        except Exception as e:
-            logger.error(f"    Desktop screenshot failed: {e}")
-
-        # Mobile screenshot
-        if include_mobile:
-            logger.info("  Capturing mobile viewport...")
+                    raw = screenshot_data.encode() if isinstance(screenshot_data, str) else screenshot_data
+                    digest.update(raw)
+                    with open(tmp_path, 'wb') as f:
+                        f.write(raw)
+
+            os.replace(tmp_path, path)
+            return digest.hexdigest()
+
+        finally:
+            if tmp_path.exists():
+                tmp_path.unlink()
+
+    def _get_download_session(self) -> aiohttp.ClientSession:
+        """Pooled session for screenshot downloads, recreated per event loop"""
+        loop = asyncio.get_running_loop()
+        session = self._download_session
+        if session is not None and not session.closed and self._download_session_loop is loop:
+            return session
+
+        self._download_session = aiohttp.ClientSession(
+            timeout=aiohttp.ClientTimeout(total=300, sock_read=60)
+        )
+        self._download_session_loop = loop
+        return self._download_session
+
+    async def _process_screenshot(self, path: Path) -> Dict[str, Any]:
+        """Hash (and thumbnail) a saved screenshot off the event loop"""
+        loop = asyncio.get_running_loop()
+        if self._executor is None and self._use_processes:
             try:
-                mobile_result = await self.client.scrape(
-                    url=url,
-                    formats=['screenshot'],
-                    mobile=True,
-                    wait_for=3000
-                )
-
-                # Screenshot is in data.screenshot, not top-level
-                data = mobile_result.get('data', {})
-                screenshot_data = data.get('screenshot') if isinstance(data, dict) else None
-
-                if mobile_result.get('success') and screenshot_data:
-
-                    mobile_path = output_dir / "mobile_fullpage.png"
-                    if screenshot_data.startswith('data:image'):
-                        img_data = screenshot_data.split(',')[1]
-                        with open(mobile_path, 'wb') as f:
-                            f.write(base64.b64decode(img_data))
-                    elif screenshot_data.startswith('http'):
-                        # URL - download the image
-                        async with aiohttp.ClientSession() as session:
-                            async with session.get(screenshot_data) as resp:
-                                if resp.status == 200:
-                                    with open(mobile_path, 'wb') as f:
-                                        f.write(await resp.read())
-                                else:
-                                    logger.warning(f"    Failed to download mobile screenshot: HTTP {resp.status}")
-                                    mobile_path = None
-                    else:
-                        # Raw data
-                        with open(mobile_path, 'wb') as f:
-                            f.write(screenshot_data.encode() if isinstance(screenshot_data, str) else screenshot_data)
-
-                    if mobile_path:
-                        result["mobile"] = {
-                            "path": str(mobile_path),
-                            "viewport": "mobile",
-                            "full_page": True
-                        }
-                        logger.info(f"    Saved: {mobile_path}")
-                else:
-                    logger.warning(f"    Mobile screenshot not captured. Data keys: {data.keys() if isinstance(data, dict) else type(data)}")
+                self._executor = ProcessPoolExecutor(max_workers=self.max_workers)
+            except (OSError, NotImplementedError, ValueError) as e:
+                logger.warning(f"Process pool unavailable, processing screenshots in threads: {e}")
+                self._use_processes = False
 
-            except Exception as e:
-                logger.error(f"    Mobile screenshot failed: {e}")
+        try:
+            return await loop.run_in_executor(self._executor, _process_screenshot, str(path), self.thumbnail_width)
+        except BrokenProcessPool:
+            logger.warning("Screenshot worker pool broke, processing in threads")
+            self._executor = None
+            self._use_processes = False
+            return await loop.run_in_executor(None, _process_screenshot, str(path), self.thumbnail_width)
+
+    def _dedup_screenshot(self, capture: Dict[str, Any], digest: str, url: str) -> Dict[str, Any]:
+        """
+        Point a screenshot identical to an earlier one at the earlier file.
 
-        return result
+        Identical means the same bytes or, only if dedup_threshold is set,
+        the same size with perceptual hashes within dedup_threshold bits
+        (e.g. re-encoded PNGs).
+        """
+        original = self._screenshots_by_digest.get(digest)
+        if original is None and self.dedup_threshold is not None and capture.get("phash"):
+            original = next((
+                entry for entry in self._screenshots_by_phash
+                if (entry["width"], entry["height"]) == (capture["width"], capture["height"])
+                and _hamming(entry["phash"], capture["phash"]) <= self.dedup_threshold
+            ), None)
+
+        if original is not None and not Path(original["path"]).exists():
+            original = None  # Earlier copy was removed since
+
+        if original is None or original["path"] == capture["path"]:
+            entry = {**capture, "url": url}
+            self._screenshots_by_digest[digest] = entry
+            if capture.get("phash"):
+                self._screenshots_by_phash.append(entry)
+            return capture
+
+        for key in ("path", "thumbnail"):
+            duplicate = capture.get(key)
+            if duplicate and duplicate != original.get(key):
+                Path(duplicate).unlink(missing_ok=True)
+        logger.info(f"    Identical to screenshot of {original['url']} - keeping one copy")
+        deduped = {**capture, "path": original["path"], "duplicate_of": original["url"]}
+        deduped.pop("thumbnail", None)
+        if original.get("thumbnail"):
+            deduped["thumbnail"] = original["thumbnail"]
+        return deduped
 
     async def extract_design_system(self, url: str) -> Dict[str, Any]:
         """
@@ -423,14 +669,7 @@ class DesignAnalyzer:
         try:
             result = await self.client.extract(
                 urls=[url],
-                prompt="""Analyze this website and extract the complete design system.
-                Focus on:
-                1. Color palette (primary, secondary, accent, backgrounds, text colors)
-                2. Typography (fonts, sizes, weights, line heights)
-                3. Spacing patterns (padding, margins, container widths)
-                4. Overall visual style classification
-
-                Be specific with hex colors and exact font names where possible.""",
+                prompt=DESIGN_SYSTEM_PROMPT,
                 schema=DESIGN_SYSTEM_SCHEMA
             )
 
@@ -468,14 +707,7 @@ class DesignAnalyzer:
         try:
             result = await self.client.extract(
                 urls=[url],
-                prompt="""Analyze the UI components and layout patterns on this page.
-                Extract details about:
-                1. Navigation (type, style, items, mobile behavior)
-                2. Hero section (type, content, height, visual elements)
-                3. Content sections (layout, columns, backgrounds)
-                4. Footer (style, columns, features)
-
-                Focus on patterns that can be recreated in code.""",
+                prompt=COMPONENT_PROMPT,
                 schema=COMPONENT_SCHEMA
             )
 
@@ -510,15 +742,7 @@ class DesignAnalyzer:
         try:
             result = await self.client.extract(
                 urls=[url],
-                prompt="""Analyze all call-to-action elements and conversion points.
-                For each CTA identify:
-                1. Button/link text
-                2. Visual style (color, shape, size)
-                3. Position on page
-                4. Purpose/action
-                5. Whether it uses urgency language
-
-                Also analyze the booking/conversion flow if present.""",
+                prompt=CTA_PROMPT,
                 schema=CTA_SCHEMA
             )
 
@@ -549,16 +773,7 @@ class DesignAnalyzer:
         try:
             result = await self.client.extract(
                 urls=[url],
-                prompt="""Analyze the psychological design techniques used on this page.
-                Look for:
-                1. Emotional triggers (fear, excitement, curiosity elements)
-                2. Trust signals (reviews, badges, testimonials, awards)
-                3. Social proof elements (review counts, user photos)
-                4. Scarcity/urgency indicators (limited time, availability)
-                5. Cognitive load assessment (is the page overwhelming?)
-                6. User journey friction points (barriers to conversion)
-
-                Rate the visual hierarchy clarity from 1-10.""",
+                prompt=PSYCHOLOGY_PROMPT,
                 schema=PSYCHOLOGY_SCHEMA
             )
 
@@ -589,14 +804,7 @@ class DesignAnalyzer:
         try:
             result = await self.client.extract(
                 urls=[url],
-                prompt="""Analyze animations and interactive elements on this page.
-                Identify:
-                1. Page transition effects
-                2. Scroll-triggered animations (fade, slide, parallax)
-                3. Hover effects on buttons and cards
-                4. Micro-interactions (loading states, form feedback)
-                5. 3D elements (if any - Three.js, WebGL, CSS 3D)
-                6. Whether animations might cause performance issues""",
+                prompt=ANIMATION_PROMPT,
                 schema=ANIMATION_SCHEMA
             )
 
@@ -612,12 +820,73 @@ class DesignAnalyzer:
             logger.error(f"Animation extraction failed: {e}")
             return {"error": str(e)}
 
+    async def extract_all_sections(self, url: str) -> Dict[str, Dict[str, Any]]:
+        """
+        Extract every design section with a single composite extract job.
+
+        The combined result is split back into the per-section dicts the
+        individual extract_* methods return. Sections missing from it (or
+        all of them, if the job fails) fall back to their own extract job.
+
+        Args:
+            url: URL to analyze
+
+        Returns:
+            Dict of section name -> section dict
+        """
+        logger.info(f"Extracting all design sections from: {url}")
+
+        sections: Dict[str, Dict[str, Any]] = {}
+        try:
+            result = await self.client.extract(
+                urls=[url],
+                prompt=FUSED_DESIGN_PROMPT,
+                schema=FUSED_DESIGN_SCHEMA,
+                max_poll_time=240.0  # One larger job instead of five
+            )
+
+            if result.get('success') and result.get('data'):
+                data = result['data']
+                if isinstance(data, list) and len(data) > 0:
+                    data = data[0].get('extract', data[0])
+                if isinstance(data, dict):
+                    sections = {
+                        name: data[name] for name in DESIGN_SECTIONS
+                        if isinstance(data.get(name), dict)
+                    }
+
+        except Exception as e:
+            logger.error(f"Fused design extraction failed: {e}")
+
+        missing = [name for name in DESIGN_SECTIONS if name not in sections]
+        if missing:
+            logger.warning(f"Fused extraction missing {', '.join(missing)} - extracting separately")
+            sections.update(await self._extract_sections_separately(url, missing))
+
+        return {name: sections[name] for name in DESIGN_SECTIONS}
+
+    async def _extract_sections_separately(self, url: str, names: List[str]) -> Dict[str, Dict[str, Any]]:
+        """Run one extract job per section concurrently"""
+        extractors = {
+            "design_system": self.extract_design_system,
+            "components": self.extract_components,
+            "ctas": self.extract_ctas,
+            "psychology": self.extract_psychology,
+            "animations": self.extract_animations,
+        }
+        results = await asyncio.gather(*[extractors[name](url) for name in names], return_exceptions=True)
+        return {
+            name: result if not isinstance(result, Exception) else {"error": str(result)}
+            for name, result in zip(names, results)
+        }
+
     async def analyze_full_design(
         self,
         url: str,
         output_dir: Path,
         include_screenshots: bool = True,
-        include_mobile: bool = True
+        include_mobile: bool = True,
+        fused: Optional[bool] = None
     ) -> Dict[str, Any]:
         """
         Perform comprehensive design analysis.
@@ -627,6 +896,8 @@ class DesignAnalyzer:
             output_dir: Directory to save outputs
             include_screenshots: Whether to capture screenshots
             include_mobile: Whether to include mobile viewport
+            fused: One composite extract job instead of one per section
+                (defaults to the analyzer's setting)
 
         Returns:
             Complete design analysis
@@ -649,14 +920,13 @@ class DesignAnalyzer:
             "animations": None
         }
 
-        # Run extractions concurrently for efficiency
-        tasks = [
-            self.extract_design_system(url),
-            self.extract_components(url),
-            self.extract_ctas(url),
-            self.extract_psychology(url),
-            self.extract_animations(url)
-        ]
+        # Run extractions (and screenshots) concurrently for efficiency
+        fused = self.fused if fused is None else fused
+        if fused:
+            extraction = self.extract_all_sections(url)
+        else:
+            extraction = self._extract_sections_separately(url, list(DESIGN_SECTIONS))
+        tasks = [extraction]
 
         if include_screenshots:
             tasks.insert(0, self.capture_screenshots(url, screenshots_dir, include_mobile))
@@ -664,20 +934,20 @@ class DesignAnalyzer:
         results = await asyncio.gather(*tasks, return_exceptions=True)
 
         # Process results
-        idx = 0
         if include_screenshots:
-            result["screenshots"] = results[idx] if not isinstance(results[idx], Exception) else {"error": str(results[idx])}
-            idx += 1
+            result["screenshots"] = results[0] if not isinstance(results[0], Exception) else {"error": str(results[0])}
 
-        result["design_system"] = results[idx] if not isinstance(results[idx], Exception) else {"error": str(results[idx])}
-        result["components"] = results[idx + 1] if not isinstance(results[idx + 1], Exception) else {"error": str(results[idx + 1])}
-        result["ctas"] = results[idx + 2] if not isinstance(results[idx + 2], Exception) else {"error": str(results[idx + 2])}
-        result["psychology"] = results[idx + 3] if not isinstance(results[idx + 3], Exception) else {"error": str(results[idx + 3])}
-        result["animations"] = results[idx + 4] if not isinstance(results[idx + 4], Exception) else {"error": str(results[idx + 4])}
+        sections = results[-1]
+        if isinstance(sections, Exception):
+            sections = {name: {"error": str(sections)} for name in DESIGN_SECTIONS}
+        result.update(sections)
 
-        # Save full analysis
-        with open(output_dir / "design_analysis.json", 'w') as f:
+        # Save full analysis (atomically - multi-page runs resume from it)
+        analysis_path = output_dir / "design_analysis.json"
+        tmp_path = analysis_path.with_suffix('.json.tmp')
+        with open(tmp_path, 'w') as f:
             json.dump(result, f, indent=2, default=str)
+        os.replace(tmp_path, analysis_path)
         logger.info(f"Saved full analysis to: {output_dir / 'design_analysis.json'}")
 
         # Save individual components
@@ -744,6 +1014,8 @@ class DesignAnalyzer:
 
             await asyncio.sleep(1)  # Rate limiting between sites
 
+        await self.close()
+
         # Analyze patterns across competitors
         comparison["common_patterns"] = self._identify_common_patterns(comparison["competitors"])
         comparison["differentiation_opportunities"] = self._identify_differentiation(comparison["competitors"])
@@ -886,17 +1158,24 @@ class DesignAnalyzer:
         output_dir: Path,
         include_screenshots: bool = True,
         include_mobile: bool = True,
-        max_concurrent: int = 3
+        max_concurrent: int = 3,
+        resume: bool = True
     ) -> Dict[str, Any]:
         """
         Analyze design across multiple pages of a site.
 
+        Up to max_concurrent pages are analyzed at once; each page's
+        design_analysis.json is written as soon as it completes. With
+        resume, pages already written by an earlier (interrupted) run are
+        loaded instead of analyzed again.
+
         Args:
             urls: List of URLs to analyze (from site map)
             output_dir: Directory to save outputs
             include_screenshots: Whether to capture screenshots
             include_mobile: Whether to include mobile viewport
             max_concurrent: Max concurrent page analyses (rate limiting)
+            resume: Reuse completed per-page analyses found in output_dir
 
         Returns:
             Aggregated design analysis with cross-page consistency scoring
@@ -913,6 +1192,7 @@ class DesignAnalyzer:
             "analyzed_at": datetime.now().isoformat(),
             "total_pages": len(urls),
             "pages_analyzed": 0,
+            "pages_resumed": 0,
             "pages": {},
             "aggregated": {
                 "design_consistency": {},
@@ -926,49 +1206,50 @@ class DesignAnalyzer:
             "success": False
         }
 
-        # Analyze pages with rate limiting
-        import re
-        from urllib.parse import urlparse
-
-        for i, url in enumerate(urls):
-            logger.info(f"\n[{i+1}/{len(urls)}] Analyzing: {url}")
+        semaphore = asyncio.Semaphore(max(1, max_concurrent))
 
-            # Create safe directory name from URL
-            parsed = urlparse(url)
-            page_name = parsed.path.strip('/').replace('/', '_') or 'homepage'
-            page_name = re.sub(r'[^\w\-]', '_', page_name)
+        async def analyze_page(i: int, url: str) -> Tuple[int, Dict[str, Any]]:
+            page_name = self._page_name(url)
             page_dir = pages_dir / page_name
-
-            try:
-                analysis = await self.analyze_full_design(
-                    url=url,
-                    output_dir=page_dir,
-                    include_screenshots=include_screenshots,
-                    include_mobile=include_mobile
-                )
-
-                result["pages"][url] = {
-                    "page_name": page_name,
-                    "output_dir": str(page_dir),
-                    "analysis": analysis,
-                    "success": True
-                }
-                result["pages_analyzed"] += 1
-
-                # Aggregate data for cross-page analysis
-                self._aggregate_page_data(result["aggregated"], analysis, url)
-
-            except Exception as e:
-                logger.error(f"Failed to analyze {url}: {e}")
-                result["pages"][url] = {
-                    "page_name": page_name,
-                    "error": str(e),
-                    "success": False
-                }
-
-            # Rate limiting between pages
-            if i < len(urls) - 1:
-                await asyncio.sleep(1.5)
+            outcome = {"page_name": page_name, "page_dir": page_dir, "resumed": False}
+
+            if resume:
+                analysis = self._load_completed_page(page_dir, url)
+                if analysis is not None:
+                    logger.info(f"[{i+1}/{len(urls)}] Using saved analysis: {url}")
+                    return i, {**outcome, "analysis": analysis, "resumed": True}
+
+            async with semaphore:
+                logger.info(f"\n[{i+1}/{len(urls)}] Analyzing: {url}")
+                try:
+                    analysis = await self.analyze_full_design(
+                        url=url,
+                        output_dir=page_dir,
+                        include_screenshots=include_screenshots,
+                        include_mobile=include_mobile
+                    )
+                    return i, {**outcome, "analysis": analysis}
+                except Exception as e:
+                    logger.error(f"Failed to analyze {url}: {e}")
+                    return i, {**outcome, "error": e}
+
+        # Pages finish in any order; they are recorded and aggregated in
+        # URL order from this one loop, so aggregation never interleaves
+        tasks = [asyncio.ensure_future(analyze_page(i, url)) for i, url in enumerate(urls)]
+        finished: Dict[int, Dict[str, Any]] = {}
+        next_index = 0
+        try:
+            for next_done in asyncio.as_completed(tasks):
+                i, outcome = await next_done
+                finished[i] = outcome
+                while next_index in finished:
+                    self._record_page(result, urls[next_index], finished.pop(next_index))
+                    next_index += 1
+        finally:
+            # Interrupted: completed pages are on disk for the next run
+            for task in tasks:
+                task.cancel()
+            await self.close()
 
         # Generate cross-page insights
         result["cross_page_insights"] = self._generate_cross_page_insights(result["aggregated"])
@@ -999,6 +1280,54 @@ class DesignAnalyzer:
 
         return result
 
+    @staticmethod
+    def _page_name(url: str) -> str:
+        """Safe directory name for a page URL"""
+        parsed = urlparse(url)
+        page_name = parsed.path.strip('/').replace('/', '_') or 'homepage'
+        return re.sub(r'[^\w\-]', '_', page_name)
+
+    @staticmethod
+    def _load_completed_page(page_dir: Path, url: str) -> Optional[Dict[str, Any]]:
+        """Saved analysis of a page if an earlier run completed it without section errors"""
+        path = page_dir / "design_analysis.json"
+        if not path.exists():
+            return None
+        try:
+            with open(path) as f:
+                analysis = json.load(f)
+        except (OSError, ValueError):
+            return None
+        if not isinstance(analysis, dict) or analysis.get("url") != url:
+            return None
+        for name in DESIGN_SECTIONS:
+            section = analysis.get(name)
+            if not isinstance(section, dict) or section.get("error"):
+                return None
+        return analysis
+
+    def _record_page(self, result: Dict, url: str, outcome: Dict[str, Any]):
+        """Add one page outcome to the multi-page result and aggregate it"""
+        if "analysis" in outcome:
+            result["pages"][url] = {
+                "page_name": outcome["page_name"],
+                "output_dir": str(outcome["page_dir"]),
+                "analysis": outcome["analysis"],
+                "success": True
+            }
+            result["pages_analyzed"] += 1
+            if outcome["resumed"]:
+                result["pages_resumed"] += 1
+
+            # Aggregate data for cross-page analysis
+            self._aggregate_page_data(result["aggregated"], outcome["analysis"], url)
+        else:
+            result["pages"][url] = {
+                "page_name": outcome["page_name"],
+                "error": str(outcome["error"]),
+                "success": False
+            }
+
     def _aggregate_page_data(self, aggregated: Dict, analysis: Dict, url: str):
         """Aggregate data from a single page analysis into overall metrics."""
 
@@ -33,6 +33,18 @@ from ..models.seo_models import (
 logger = logging.getLogger(__name__)
 
 
+# On-page crawl polling bounds (seconds)
+ONPAGE_MIN_POLL_INTERVAL = 5.0
+ONPAGE_MAX_POLL_INTERVAL = 60.0
+
+# Page checks whose True value is good or neutral, not an issue
+ONPAGE_PASSING_CHECKS = frozenset({
+    'is_https', 'is_www', 'has_html_doctype', 'canonical', 'from_sitemap',
+    'seo_friendly_url', 'seo_friendly_url_characters_check', 'seo_friendly_url_dynamic_check',
+    'seo_friendly_url_keywords_check', 'seo_friendly_url_relative_length_check',
+})
+
+
 class SEOEnrichmentStrategy:
     """
     Strategy that combines Firecrawl content scraping with DataForSEO SEO data.
@@ -52,7 +64,8 @@ class SEOEnrichmentStrategy:
     def __init__(
         self,
         firecrawl_client: Optional[EnhancedFirecrawlClient] = None,
-        dataforseo_client: Optional[DataForSEOClient] = None
+        dataforseo_client: Optional[DataForSEOClient] = None,
+        queued: Optional[bool] = None
     ):
         """
         Initialize SEO enrichment strategy.
@@ -60,6 +73,8 @@ class SEOEnrichmentStrategy:
         Args:
             firecrawl_client: Firecrawl client instance
             dataforseo_client: DataForSEO client instance
+            queued: Run SERP/keyword queries through DataForSEO's standard
+                queue instead of live endpoints (default: DATAFORSEO_QUEUED)
         """
         self.firecrawl = firecrawl_client or EnhancedFirecrawlClient(Config.API_KEY)
         self.dataforseo = dataforseo_client or DataForSEOClient(
@@ -67,6 +82,7 @@ class SEOEnrichmentStrategy:
             password=Config.DATAFORSEO_PASSWORD
         ) if Config.DATAFORSEO_LOGIN else None
 
+        self.queued = Config.DATAFORSEO_QUEUED if queued is None else queued
         self.config = Config
 
     async def execute(self, source: Dict[str, Any]) -> Dict[str, Any]:
@@ -241,16 +257,33 @@ class SEOEnrichmentStrategy:
 
         rankings = {}
         total_cost = 0
+        keywords = keywords[:20]  # Limit to 20 keywords
+
+        async def fetch(keyword: str) -> Dict:
+            return await self.dataforseo.serp_google_organic(
+                keyword=keyword,
+                location_name=Config.SEO_DEFAULT_LOCATION,
+                language_code=Config.SEO_DEFAULT_LANGUAGE,
+                device=Config.SEO_DEFAULT_DEVICE,
+                depth=100,
+                queued=self.queued
+            )
 
-        for keyword in keywords[:20]:  # Limit to 20 keywords
+        queued_results = None
+        if self.queued:
+            # Queued tasks are posted together and collected as they complete
+            queued_results = await asyncio.gather(
+                *[fetch(keyword) for keyword in keywords], return_exceptions=True
+            )
+
+        for i, keyword in enumerate(keywords):
             try:
-                result = await self.dataforseo.serp_google_organic(
-                    keyword=keyword,
-                    location_name=Config.SEO_DEFAULT_LOCATION,
-                    language_code=Config.SEO_DEFAULT_LANGUAGE,
-                    device=Config.SEO_DEFAULT_DEVICE,
-                    depth=100
-                )
+                if queued_results is not None:
+                    result = queued_results[i]
+                    if isinstance(result, Exception):
+                        raise result
+                else:
+                    result = await fetch(keyword)
 
                 if result.get('success'):
                     data = result.get('data', {})
@@ -273,7 +306,8 @@ class SEOEnrichmentStrategy:
                     total_cost += result.get('cost', 0)
 
                 # Rate limiting
-                await asyncio.sleep(Config.SEO_REQUEST_DELAY)
+                if queued_results is None:
+                    await asyncio.sleep(Config.SEO_REQUEST_DELAY)
 
             except Exception as e:
                 logger.error(f"SERP query failed for '{keyword}': {e}")
@@ -304,7 +338,8 @@ class SEOEnrichmentStrategy:
                 target=domain,
                 location_code=Config.SEO_DEFAULT_LOCATION_CODE,
                 language_code=Config.SEO_DEFAULT_LANGUAGE_CODE,
-                include_serp_info=True
+                include_serp_info=True,
+                queued=self.queued
             )
 
             if domain_result.get('success'):
@@ -385,15 +420,29 @@ class SEOEnrichmentStrategy:
     async def _get_onpage_data(
         self,
         domain: str,
-        max_pages: int = 100
+        max_pages: int = 100,
+        max_wait: Optional[float] = None
     ) -> Dict[str, Any]:
-        """Run on-page SEO audit"""
+        """
+        Run on-page SEO audit.
+
+        Waits for the crawl with an adaptive poll interval, then streams
+        every crawled page (not just the first 100) and processes each batch
+        as it arrives: a compact record per page plus issue counts.
+
+        Args:
+            domain: Domain to audit
+            max_pages: Maximum pages to crawl
+            max_wait: Seconds to wait for the crawl (default: about 1s per
+                page, at least 5 minutes)
+        """
         logger.info(f"Running on-page audit for {domain} (max {max_pages} pages)")
 
         result = {
             'task_id': None,
             'summary': None,
             'pages': [],
+            'pages_total': 0,
             'issues': [],
             'cost': 0
         }
@@ -407,38 +456,18 @@ class SEOEnrichmentStrategy:
             )
 
             if task_result.get('success'):
-                task_id = task_result.get('data', {}).get('id')
+                task_id = self._first_task(task_result).get('id')
                 result['task_id'] = task_id
                 result['cost'] += task_result.get('cost', 0)
 
-                # Wait for crawl to complete (poll status)
-                max_wait = 300  # 5 minutes max
-                poll_interval = 10
-                waited = 0
-
-                while waited < max_wait:
-                    await asyncio.sleep(poll_interval)
-                    waited += poll_interval
-
-                    summary_result = await self.dataforseo.onpage_summary(task_id)
-                    if summary_result.get('success'):
-                        data = summary_result.get('data', {})
-                        crawl_progress = data.get('crawl_progress', 'in_progress')
-
-                        if crawl_progress == 'finished':
-                            result['summary'] = data
-                            result['cost'] += summary_result.get('cost', 0)
-                            break
+                if task_id:
+                    result['summary'] = await self._wait_for_crawl(
+                        task_id, max_wait or max(300, max_pages), result
+                    )
 
                 # Get pages data
                 if result['summary']:
-                    pages_result = await self.dataforseo.onpage_pages(
-                        task_id=task_id,
-                        limit=100
-                    )
-                    if pages_result.get('success'):
-                        result['pages'] = pages_result.get('data', {}).get('items', [])
-                        result['cost'] += pages_result.get('cost', 0)
+                    await self._collect_onpage_pages(task_id, result)
 
         except Exception as e:
             logger.error(f"On-page audit failed: {e}")
@@ -446,6 +475,103 @@ class SEOEnrichmentStrategy:
 
         return result
 
+    async def _wait_for_crawl(self, task_id: str, max_wait: float, result: Dict[str, Any]) -> Optional[Dict]:
+        """
+        Poll the crawl summary until the crawl finishes.
+
+        The interval grows while pages are being crawled (never past the
+        estimated time left) and backs off faster when progress stalls.
+        """
+        started = time.monotonic()
+        interval = ONPAGE_MIN_POLL_INTERVAL
+        last_crawled = 0
+
+        while time.monotonic() - started < max_wait:
+            await asyncio.sleep(min(interval, max(0.0, max_wait - (time.monotonic() - started))))
+
+            summary_result = await self.dataforseo.onpage_summary(task_id)
+            if not summary_result.get('success'):
+                continue
+            result['cost'] += summary_result.get('cost', 0)
+
+            summary = self._first_result(summary_result)
+            if summary.get('crawl_progress', 'in_progress') == 'finished':
+                return summary
+
+            status = summary.get('crawl_status') or {}
+            crawled = status.get('pages_crawled') or summary.get('pages_crawled') or 0
+            in_queue = status.get('pages_in_queue') or 0
+            if crawled > last_crawled:
+                interval *= 1.5
+                rate = crawled / max(time.monotonic() - started, 1e-6)
+                if in_queue and rate > 0:
+                    interval = min(interval, in_queue / rate)
+                last_crawled = crawled
+            else:
+                interval *= 1.5 ** 2
+            interval = max(ONPAGE_MIN_POLL_INTERVAL, min(ONPAGE_MAX_POLL_INTERVAL, interval))
+
+        logger.warning(f"On-page crawl {task_id} not finished after {max_wait:.0f}s")
+        result['error'] = f"Crawl not finished after {max_wait:.0f}s"
+        return None
+
+    async def _collect_onpage_pages(self, task_id: str, result: Dict[str, Any]):
+        """Stream all crawled pages into compact records and per-check issue counts"""
+        issue_pages: Dict[str, List[str]] = {}
+        issue_counts: Dict[str, int] = {}
+
+        async for page in self.dataforseo.iter_onpage_pages(task_id):
+            result['cost'] += page.get('cost', 0)
+            if not page['success']:
+                result['error'] = f"Page retrieval stopped at offset {page['offset']}: {page.get('error')}"
+                logger.error(f"On-page {result['error']}")
+                break
+            if page.get('total_items_count') is not None:
+                result['pages_total'] = page['total_items_count']
+
+            for item in page['items']:
+                url = item.get('url')
+                failed = [
+                    name for name, flag in (item.get('checks') or {}).items()
+                    if flag is True and name not in ONPAGE_PASSING_CHECKS
+                ]
+                result['pages'].append({
+                    'url': url,
+                    'status_code': item.get('status_code'),
+                    'resource_type': item.get('resource_type'),
+                    'onpage_score': item.get('onpage_score'),
+                    'failed_checks': failed
+                })
+                for name in failed:
+                    issue_counts[name] = issue_counts.get(name, 0) + 1
+                    examples = issue_pages.setdefault(name, [])
+                    if len(examples) < 5 and url:
+                        examples.append(url)
+
+            logger.info(f"On-page pages retrieved: {len(result['pages'])}/{result['pages_total'] or '?'}")
+
+        result['issues'] = [
+            {'check': name, 'pages_affected': count, 'example_urls': issue_pages.get(name, [])}
+            for name, count in sorted(issue_counts.items(), key=lambda kv: -kv[1])
+        ]
+
+    @staticmethod
+    def _first_task(response: Dict) -> Dict:
+        """First task of an API response ('data' is the task list)"""
+        data = response.get('data') or {}
+        if isinstance(data, list):
+            return data[0] if data else {}
+        return data
+
+    @classmethod
+    def _first_result(cls, response: Dict) -> Dict:
+        """First result object of an API response's first task"""
+        task = cls._first_task(response)
+        results = task.get('result')
+        if isinstance(results, list):
+            return results[0] if results else {}
+        return task
+
     async def _get_competitor_data(
         self,
         domain: str,
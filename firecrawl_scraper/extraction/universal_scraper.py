@@ -21,6 +21,7 @@ from firecrawl_scraper.config import Config
 # Import Enhanced Firecrawl Client (has async wrappers)
 sys.path.insert(0, str(Path(__file__).parent.parent))
 from firecrawl_scraper.core.firecrawl_client import EnhancedFirecrawlClient
+from firecrawl_scraper.core.rate_limiter import DomainLimiter
 
 # Configure logging
 logging.basicConfig(
@@ -576,13 +577,28 @@ class UniversalScraper:
 
         return validation
 
-    async def scrape_batch(self, sources: List[Dict[str, Any]], run_name: str = None) -> Dict[str, Any]:
+    async def scrape_batch(
+        self,
+        sources: List[Dict[str, Any]],
+        run_name: str = None,
+        max_workers: int = 5,
+        domain_delay: float = 2.0,
+        max_per_domain: int = 1
+    ) -> Dict[str, Any]:
         """
-        Scrape multiple sources with checkpoint recovery.
+        Scrape multiple sources concurrently with checkpoint recovery.
+
+        Workers pull sources from a shared queue; a per-domain limiter keeps
+        requests to the same site polite. Results go to a background writer
+        that saves each result file and appends one line to the JSONL
+        checkpoint, so an interrupted run resumes where it stopped.
 
         Args:
             sources: List of source dicts
             run_name: Optional run name for organizing outputs
+            max_workers: Sources scraped at the same time
+            domain_delay: Minimum seconds between requests to the same domain
+            max_per_domain: Maximum in-flight sources per domain
 
         Returns:
             Complete run report with statistics
@@ -595,22 +611,12 @@ class UniversalScraper:
         results_dir.mkdir(exist_ok=True)
 
         self.logger.info(f"🚀 Starting scraping run: {run_name}")
-        self.logger.info(f"📊 Total sources: {len(sources)}")
-
-        # Load checkpoint if exists
-        checkpoint_file = self.checkpoint_dir / f"{run_name}.json"
-        processed_urls = set()
-
-        if checkpoint_file.exists():
-            with open(checkpoint_file) as f:
-                checkpoint = json.load(f)
-                processed_urls = set(checkpoint.get('processed_urls', []))
-                self.logger.info(f"🔄 Resuming from checkpoint: {len(processed_urls)} sources already processed")
+        self.logger.info(f"📊 Total sources: {len(sources)} ({max_workers} workers)")
 
         # Track statistics
         stats = {
             'total_sources': len(sources),
-            'processed': len(processed_urls),
+            'processed': 0,
             'successful': 0,
             'failed': 0,
             'total_credits': 0,
@@ -619,49 +625,48 @@ class UniversalScraper:
             'quality_distribution': {'excellent': 0, 'good': 0, 'fair': 0, 'poor': 0}
         }
 
-        # Process sources
-        for idx, source in enumerate(sources, 1):
-            url = source['url']
+        # Load checkpoint if exists (stats are rebuilt from its entries)
+        checkpoint_file = self.checkpoint_dir / f"{run_name}.jsonl"
+        processed_urls = self._load_checkpoint(run_name, stats)
+        if processed_urls:
+            self.logger.info(f"🔄 Resuming from checkpoint: {len(processed_urls)} sources already processed")
 
-            # Skip if already processed
-            if url in processed_urls:
-                continue
+        pending = [source for source in sources if source['url'] not in processed_urls]
 
-            self.logger.info(f"\n[{idx}/{len(sources)}] Processing: {source.get('name', url)}")
+        source_queue: asyncio.Queue = asyncio.Queue()
+        for idx, source in enumerate(pending, 1):
+            source_queue.put_nowait((idx, source))
 
-            try:
-                # Scrape source
-                result = await self.scrape_source(source)
-
-                # Update stats
-                stats['processed'] += 1
-                stats['strategy_usage'][result['strategy']] += 1
-
-                if result.get('success'):
-                    stats['successful'] += 1
-                    stats['total_credits'] += result.get('credits_used', 0)
-                    stats['total_chars'] += result['validation'].get('total_chars', 0)
+        result_queue: asyncio.Queue = asyncio.Queue(maxsize=max(1, max_workers) * 2)
+        limiter = DomainLimiter(min_interval=domain_delay, max_per_domain=max_per_domain)
 
-                    quality_level = result['validation'].get('quality_level', 'poor')
-                    stats['quality_distribution'][quality_level] += 1
-                else:
+        async def worker():
+            while True:
+                try:
+                    idx, source = source_queue.get_nowait()
+                except asyncio.QueueEmpty:
+                    return
+                url = source['url']
+                self.logger.info(f"\n[{idx}/{len(pending)}] Processing: {source.get('name', url)}")
+                try:
+                    async with limiter.slot(urlparse(url).netloc.lower()):
+                        result = await self.scrape_source(source)
+                    await result_queue.put((url, result))
+                except Exception as e:
+                    self.logger.error(f"❌ Error processing {url}: {e}")
                     stats['failed'] += 1
 
-                # Save result
-                result_file = results_dir / f"{self._sanitize_filename(url)}.json"
-                with open(result_file, 'w') as f:
-                    json.dump(result, f, indent=2)
-
-                # Update checkpoint
-                processed_urls.add(url)
-                self._save_checkpoint(checkpoint_file, processed_urls, stats)
-
-                # Rate limiting (be respectful)
-                await asyncio.sleep(2)
-
-            except Exception as e:
-                self.logger.error(f"❌ Error processing {url}: {e}")
-                stats['failed'] += 1
+        with open(checkpoint_file, 'a') as checkpoint:
+            if checkpoint.tell() and not self._ends_with_newline(checkpoint_file):
+                checkpoint.write('\n')  # Terminate a line torn by an interrupted run
+            writer = asyncio.create_task(
+                self._write_results(result_queue, results_dir, checkpoint, stats)
+            )
+            try:
+                await asyncio.gather(*[worker() for _ in range(max(1, max_workers))])
+            finally:
+                await result_queue.put(None)
+                await writer
 
         # Generate final report
         report = {
@@ -687,14 +692,101 @@ class UniversalScraper:
 
         return report
 
-    def _save_checkpoint(self, checkpoint_file: Path, processed_urls: set, stats: Dict):
-        """Save checkpoint for recovery"""
-        with open(checkpoint_file, 'w') as f:
-            json.dump({
-                'processed_urls': list(processed_urls),
-                'stats': stats,
-                'timestamp': datetime.now().isoformat()
-            }, f, indent=2)
+    async def _write_results(
+        self,
+        result_queue: asyncio.Queue,
+        results_dir: Path,
+        checkpoint,
+        stats: Dict
+    ):
+        """Background writer: save result files, append checkpoint entries, update stats"""
+        while True:
+            item = await result_queue.get()
+            if item is None:
+                return
+            url, result = item
+
+            try:
+                # Result file first, so a checkpointed URL always has its result on disk
+                result_file = results_dir / f"{self._sanitize_filename(url)}.json"
+                await asyncio.get_running_loop().run_in_executor(
+                    None, self._write_json, result_file, result
+                )
+
+                entry = {
+                    'url': url,
+                    'success': bool(result.get('success')),
+                    'strategy': result.get('strategy'),
+                    'credits_used': result.get('credits_used', 0),
+                    'total_chars': result.get('validation', {}).get('total_chars', 0),
+                    'quality_level': result.get('validation', {}).get('quality_level'),
+                    'timestamp': datetime.now().isoformat()
+                }
+                checkpoint.write(json.dumps(entry) + '\n')
+                checkpoint.flush()
+            except Exception as e:
+                self.logger.error(f"❌ Failed to save result for {url}: {e}")
+                stats['failed'] += 1
+                continue
+
+            self._record_stats(stats, entry)
+
+    @staticmethod
+    def _ends_with_newline(path: Path) -> bool:
+        with open(path, 'rb') as f:
+            f.seek(-1, 2)
+            return f.read(1) == b'\n'
+
+    @staticmethod
+    def _write_json(path: Path, data: Dict):
+        with open(path, 'w') as f:
+            json.dump(data, f, indent=2)
+
+    @staticmethod
+    def _record_stats(stats: Dict, entry: Dict):
+        """Add one checkpoint entry to the run statistics"""
+        stats['processed'] += 1
+        if entry.get('strategy'):
+            stats['strategy_usage'][entry['strategy']] = stats['strategy_usage'].get(entry['strategy'], 0) + 1
+
+        if entry.get('success'):
+            stats['successful'] += 1
+            stats['total_credits'] += entry.get('credits_used') or 0
+            stats['total_chars'] += entry.get('total_chars') or 0
+            quality_level = entry.get('quality_level') or 'poor'
+            stats['quality_distribution'][quality_level] += 1
+        else:
+            stats['failed'] += 1
+
+    def _load_checkpoint(self, run_name: str, stats: Dict) -> set:
+        """
+        Load processed URLs from the run's checkpoint and replay its stats.
+
+        Reads the append-only `<run_name>.jsonl`; falls back to the older
+        `<run_name>.json` snapshot format (URLs only).
+        """
+        processed_urls = set()
+        checkpoint_file = self.checkpoint_dir / f"{run_name}.jsonl"
+
+        if checkpoint_file.exists():
+            with open(checkpoint_file) as f:
+                for line in f:
+                    try:
+                        entry = json.loads(line)
+                    except ValueError:
+                        continue  # Partial line from an interrupted write
+                    if entry.get('url') and entry['url'] not in processed_urls:
+                        processed_urls.add(entry['url'])
+                        self._record_stats(stats, entry)
+            return processed_urls
+
+        legacy_file = self.checkpoint_dir / f"{run_name}.json"
+        if legacy_file.exists():
+            with open(legacy_file) as f:
+                processed_urls = set(json.load(f).get('processed_urls', []))
+            stats['processed'] = len(processed_urls)
+
+        return processed_urls
 
     def _sanitize_filename(self, url: str) -> str:
         """Convert URL to safe filename"""
@@ -714,6 +806,9 @@ class BatchStrategy(ScrapingStrategy):
     - Known URL lists (no discovery needed)
     - Maximum throughput
 
+    Large lists are split into shard jobs (source keys: 'shard_size',
+    'max_concurrent_shards', 'max_credits', 'shard_retries').
+
     Cost: 1 credit per URL (processed in parallel)
     """
 
@@ -742,7 +837,11 @@ class BatchStrategy(ScrapingStrategy):
                 urls=urls,
                 formats=['markdown', 'html', 'links'],
                 only_main_content=True,
-                on_progress=on_progress
+                on_progress=on_progress,
+                shard_size=source.get('shard_size', 1000),
+                max_concurrent_shards=source.get('max_concurrent_shards', 4),
+                max_credits=source.get('max_credits'),
+                shard_retries=source.get('shard_retries', 2)
             )
 
             if result.get('success'):
@@ -761,6 +860,24 @@ class BatchStrategy(ScrapingStrategy):
                     'data': data,
                     'credits_used': result.get('creditsUsed', len(urls))
                 }
+            elif result.get('data'):
+                # Some shards failed or were skipped; keep what was scraped
+                data = result['data']
+                return {
+                    'success': True,
+                    'partial': True,
+                    'strategy': 'batch',
+                    'urls_requested': len(urls),
+                    'urls_scraped': len(data),
+                    'total_chars': sum(
+                        len(page.get('markdown', '')) if isinstance(page, dict)
+                        else len(str(page)) for page in data
+                    ),
+                    'data': data,
+                    'failed_urls': [url for shard in result.get('failed_shards', []) for url in shard['urls']],
+                    'skipped_urls': result.get('skipped_urls', []),
+                    'credits_used': result.get('creditsUsed', len(data))
+                }
             else:
                 return {
                     'success': False,
@@ -14,6 +14,8 @@ from .stage_3_normalize import NormalizeStage
 from .stage_4_score import ScoreStage
 from .stage_5_export import ExportStage
 from .orchestrator import PipelineOrchestrator
+from .source_store import SourceStore
+from .stage_cache import StageCache
 
 __all__ = [
     'PlanStage',
@@ -22,4 +24,6 @@ __all__ = [
     'ScoreStage',
     'ExportStage',
     'PipelineOrchestrator',
+    'SourceStore',
+    'StageCache',
 ]
@@ -7,11 +7,16 @@ Stage 2: COLLECT - DataForSEO + Firecrawl collection
 Stage 3: NORMALIZE - Raw → Competitor Profiles
 Stage 4: SCORE - Findings → Actionable Insights
 Stage 5: EXPORT - Output Specs generation
+
+With use_cache=True, re-runs are incremental: stage outputs are cached
+under a fingerprint of their inputs (see stage_cache.py), so unchanged
+stages are loaded instead of recomputed, and collection only refreshes
+stale or new data.
 """
 
 import logging
 import asyncio
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, Union
 from datetime import datetime
 from dataclasses import dataclass
 import json
@@ -32,6 +37,8 @@ from .stage_2_collect import CollectStage
 from .stage_3_normalize import NormalizeStage
 from .stage_4_score import ScoreStage
 from .stage_5_export import ExportStage
+from .source_store import SourceStore
+from .stage_cache import StageCache, fingerprint
 
 logger = logging.getLogger(__name__)
 
@@ -46,7 +53,7 @@ class PipelineResult:
 
     # Stage outputs
     matrix: Optional[IntentGeoMatrix] = None
-    sources: Optional[list] = None
+    sources: Optional[SourceStore] = None
     competitor_profiles: Optional[list] = None
     findings_report: Optional[FindingsReport] = None
     insights_report: Optional[InsightReport] = None
@@ -59,12 +66,17 @@ class PipelineResult:
     total_insights: int = 0
     total_pages: int = 0
 
+    # Stages loaded from the stage cache
+    cached_stages: list = None
+
     # Errors
     errors: list = None
 
     def __post_init__(self):
         if self.errors is None:
             self.errors = []
+        if self.cached_stages is None:
+            self.cached_stages = []
 
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary for serialization"""
@@ -80,6 +92,7 @@ class PipelineResult:
                 "total_insights": self.total_insights,
                 "total_pages": self.total_pages,
             },
+            "cached_stages": self.cached_stages,
             "errors": self.errors,
         }
 
@@ -92,12 +105,31 @@ class PipelineOrchestrator:
         client: Client,
         dataforseo_client=None,
         firecrawl_client=None,
-        output_dir: Optional[str] = None
+        output_dir: Optional[str] = None,
+        cache_dir: Optional[str] = None,
+        use_cache: bool = False,
+        dataforseo_queued: bool = False
     ):
+        """
+        Args:
+            client: Client to analyze
+            dataforseo_client: DataForSEO client for Stage 2
+            firecrawl_client: Firecrawl client for Stages 2-3
+            output_dir: Where outputs are saved
+            cache_dir: Stage cache location (default: <output_dir>/_stage_cache)
+            use_cache: Reuse unchanged stage outputs and fresh sources from
+                previous runs (default False: every stage runs from scratch)
+            dataforseo_queued: Collect SERP data through DataForSEO's
+                standard queue instead of live endpoints (cheaper, slower)
+        """
         self.client = client
         self.dataforseo_client = dataforseo_client
+        self.dataforseo_queued = dataforseo_queued
         self.firecrawl_client = firecrawl_client
         self.output_dir = Path(output_dir) if output_dir else Path("./output")
+        self.cache: Optional[StageCache] = None
+        if use_cache:
+            self.cache = StageCache(cache_dir or self.output_dir / "_stage_cache")
 
         # Pipeline state
         self.result = PipelineResult(
@@ -108,7 +140,7 @@ class PipelineOrchestrator:
     async def run(
         self,
         skip_collection: bool = False,
-        existing_sources: list = None
+        existing_sources: Optional[Union[SourceStore, list]] = None
     ) -> PipelineResult:
         """Run the complete pipeline"""
         logger.info(f"Starting pipeline for {self.client.name}")
@@ -119,8 +151,8 @@ class PipelineOrchestrator:
 
             # Stage 2: Collect (can be skipped if data exists)
             if skip_collection and existing_sources:
-                self.result.sources = existing_sources
-                self.result.total_sources = len(existing_sources)
+                self.result.sources = SourceStore.from_sources(existing_sources)
+                self.result.total_sources = len(self.result.sources)
                 logger.info("Stage 2: Using existing sources (skipped collection)")
             else:
                 await self._run_stage_2()
@@ -148,6 +180,12 @@ class PipelineOrchestrator:
             self.result.status = "failed"
             self.result.errors.append(str(e))
 
+        finally:
+            # Raw payloads are only read while stages run; release the
+            # spill file of a store the pipeline created
+            if self.result.sources is not None and self.result.sources is not existing_sources:
+                self.result.sources.close()
+
         return self.result
 
     async def _run_stage_1(self):
@@ -157,8 +195,16 @@ class PipelineOrchestrator:
         logger.info("=" * 50)
 
         try:
+            key = fingerprint('plan', self.client)
+            cached = self._cached('plan', key)
+            if cached is not None:
+                self.result.matrix = IntentGeoMatrix.model_validate(cached)
+                logger.info(f"Loaded cached matrix with {len(self.result.matrix.cells)} cells")
+                return
+
             stage = PlanStage(self.client)
             self.result.matrix = stage.run()
+            self._store('plan', key, self.result.matrix.model_dump(mode='json'))
             logger.info(f"Generated matrix with {len(self.result.matrix.cells)} cells")
         except Exception as e:
             logger.error(f"Stage 1 failed: {e}")
@@ -171,20 +217,32 @@ class PipelineOrchestrator:
         logger.info("STAGE 2: COLLECT")
         logger.info("=" * 50)
 
+        stage = None
+        previous = None
         try:
+            previous = self.cache.load_sources(self.client.id) if self.cache else None
             stage = CollectStage(
                 self.result.matrix,
                 dataforseo_client=self.dataforseo_client,
-                firecrawl_client=self.firecrawl_client
+                firecrawl_client=self.firecrawl_client,
+                previous_sources=previous,
+                dataforseo_queued=self.dataforseo_queued
             )
             self.result.sources = await stage.run()
             self.result.total_sources = len(self.result.sources)
+            if self.cache:
+                self.cache.save_sources(self.client.id, self.result.sources)
             logger.info(f"Collected {self.result.total_sources} sources")
         except Exception as e:
             logger.error(f"Stage 2 failed: {e}")
             self.result.errors.append(f"Stage 2: {e}")
             # Continue with empty sources if collection fails
-            self.result.sources = []
+            if stage is not None:
+                stage.sources.close()
+            self.result.sources = SourceStore()
+        finally:
+            if previous is not None:
+                previous.close()
 
     async def _run_stage_3(self):
         """Run Stage 3: Normalize"""
@@ -195,7 +253,8 @@ class PipelineOrchestrator:
         try:
             stage = NormalizeStage(
                 self.result.sources,
-                firecrawl_client=self.firecrawl_client
+                firecrawl_client=self.firecrawl_client,
+                cache=self.cache
             )
             self.result.competitor_profiles = await stage.run()
             self.result.total_competitors = len(self.result.competitor_profiles)
@@ -212,11 +271,21 @@ class PipelineOrchestrator:
         logger.info("=" * 50)
 
         try:
-            stage = ScoreStage(
-                self.client,
-                self.result.competitor_profiles
-            )
-            self.result.findings_report, self.result.insights_report = stage.run()
+            key = fingerprint('score', self.client, self.result.competitor_profiles)
+            cached = self._cached('score', key)
+            if cached is not None:
+                self.result.findings_report = FindingsReport.model_validate(cached['findings'])
+                self.result.insights_report = InsightReport.model_validate(cached['insights'])
+            else:
+                stage = ScoreStage(
+                    self.client,
+                    self.result.competitor_profiles
+                )
+                self.result.findings_report, self.result.insights_report = stage.run()
+                self._store('score', key, {
+                    'findings': self.result.findings_report.model_dump(mode='json'),
+                    'insights': self.result.insights_report.model_dump(mode='json'),
+                })
             self.result.total_findings = len(self.result.findings_report.findings)
             self.result.total_insights = len(self.result.insights_report.insights)
             logger.info(f"Generated {self.result.total_findings} findings, {self.result.total_insights} insights")
@@ -232,12 +301,18 @@ class PipelineOrchestrator:
         logger.info("=" * 50)
 
         try:
-            stage = ExportStage(
-                self.client,
-                self.result.matrix,
-                self.result.insights_report
-            )
-            self.result.output_spec = stage.run()
+            key = fingerprint('export', self.client, self.result.matrix, self.result.insights_report)
+            cached = self._cached('export', key)
+            if cached is not None:
+                self.result.output_spec = OutputSpec.model_validate(cached)
+            else:
+                stage = ExportStage(
+                    self.client,
+                    self.result.matrix,
+                    self.result.insights_report
+                )
+                self.result.output_spec = stage.run()
+                self._store('export', key, self.result.output_spec.model_dump(mode='json'))
             self.result.total_pages = len(self.result.output_spec.page_map)
             logger.info(f"Generated output spec with {self.result.total_pages} pages")
         except Exception as e:
@@ -245,6 +320,20 @@ class PipelineOrchestrator:
             self.result.errors.append(f"Stage 5: {e}")
             raise
 
+    def _cached(self, stage: str, key: str) -> Optional[Any]:
+        """Cached output of a stage for these inputs (None if caching is off or missed)"""
+        if self.cache is None:
+            return None
+        cached = self.cache.get(stage, key)
+        if cached is not None:
+            self.result.cached_stages.append(stage)
+            logger.info(f"Stage '{stage}' inputs unchanged - using cached output")
+        return cached
+
+    def _store(self, stage: str, key: str, data: Any):
+        if self.cache is not None:
+            self.cache.set(stage, key, data)
+
     async def _save_outputs(self):
         """Save all outputs to files"""
         self.output_dir.mkdir(parents=True, exist_ok=True)
@@ -0,0 +1,419 @@
+"""
+Columnar Source store for pipeline stages 2-4
+
+Stage 2 produces one source per SERP hit, local result and crawled page.
+Holding each as a pydantic `Source` with its full `raw_data` dict means
+tens of thousands of heavy objects that later stages only scan for a
+domain or type. SourceStore keeps:
+
+- Metadata in compact columns (type, domain, url, geo, status, position,
+  scraped_at, ...) with small integer codes for repeated values
+- Row indexes by domain and by source type
+- Raw payloads out of line as zlib-compressed JSON (in memory, or in an
+  append-only spill file), decoded only when a row's payload is read
+
+Rows are materialized as `Source` models on demand. A store with a spill
+file keeps it open until `close()` (or the end of a `with` block).
+
+Usage:
+    with SourceStore('run/payloads.bin') as store:
+        store.add(SourceType.SERP_ORGANIC, url, domain=domain, raw_data={...})
+        for row in store.rows_for_domain('example.com'):
+            source = store.get(row, with_raw=True)
+"""
+
+import json
+import math
+import uuid
+import zlib
+from array import array
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from ..models import (
+    Source,
+    SourceType,
+    ScrapeStatus,
+    DataFreshness,
+    SERPFeature,
+    GeoTag,
+)
+
+_NO_POSITION = -1
+
+# Enum values are stored as their index in these tuples
+_SOURCE_TYPES = tuple(SourceType)
+_STATUSES = tuple(ScrapeStatus)
+_FRESHNESS = tuple(DataFreshness)
+_TYPE_CODES = {member: code for code, member in enumerate(_SOURCE_TYPES)}
+_STATUS_CODES = {member: code for code, member in enumerate(_STATUSES)}
+_FRESHNESS_CODES = {member: code for code, member in enumerate(_FRESHNESS)}
+
+
+class _Interner:
+    """Maps repeated values to small integer codes"""
+
+    def __init__(self):
+        self.values: List[Any] = []
+        self._codes: Dict[Any, int] = {}
+
+    def code(self, key: Any, value: Any = None) -> int:
+        code = self._codes.get(key)
+        if code is None:
+            code = self._codes[key] = len(self.values)
+            self.values.append(key if value is None else value)
+        return code
+
+    def lookup(self, key: Any) -> Optional[int]:
+        return self._codes.get(key)
+
+
+class SourceStore:
+    """
+    Columnar collection of pipeline sources
+
+    Iterating yields `Source` models without raw_data; use `get(row,
+    with_raw=True)` or `raw(row)` where the payload is needed.
+    """
+
+    def __init__(self, payload_path: Optional[str] = None):
+        """
+        Args:
+            payload_path: File to spill raw payloads to (kept in memory,
+                compressed, when not given)
+        """
+        # Metadata columns (one entry per row)
+        self._ids: List[str] = []
+        self._urls: List[str] = []
+        self._types = array('B')
+        self._domains = array('I')
+        self._statuses = array('B')
+        self._freshness = array('B')
+        self._freshness_days = array('i')
+        self._positions = array('i')
+        self._scraped_at = array('d')  # Epoch seconds, NaN if never scraped
+        self._geos: List[Tuple[int, ...]] = []
+        self._keywords: List[Optional[Tuple[str, ...]]] = []
+        self._features: List[Optional[Tuple[SERPFeature, ...]]] = []
+        self._schemas = array('I')
+        self._competitor_ids: List[Optional[str]] = []
+        self._quality = array('d')  # NaN if unset
+
+        self._domain_table = _Interner()
+        self._domain_table.code('')  # Code 0: no domain
+        self._geo_table = _Interner()
+        self._schema_table = _Interner()
+        self._schema_table.code(None)
+
+        # Row indexes
+        self._by_domain: Dict[int, array] = {}
+        self._by_type: Dict[int, array] = {}
+
+        # Raw payloads: compressed blobs in memory, or (offset, length) in a spill file
+        self._payload_path = Path(payload_path) if payload_path else None
+        self._payloads: List[Optional[bytes]] = []
+        self._payload_offsets = array('q')
+        self._payload_lengths = array('q')
+        self._payload_file = None
+        if self._payload_path:
+            self._payload_path.parent.mkdir(parents=True, exist_ok=True)
+            self._payload_file = open(self._payload_path, 'w+b')
+
+    # ========================================================================
+    # WRITE
+    # ========================================================================
+
+    def add(
+        self,
+        source_type: SourceType,
+        url: str,
+        domain: Optional[str] = None,
+        scrape_status: ScrapeStatus = ScrapeStatus.PENDING,
+        scraped_at: Optional[datetime] = None,
+        geo_tags: Optional[List[GeoTag]] = None,
+        keywords_targeted: Optional[List[str]] = None,
+        serp_position: Optional[int] = None,
+        serp_features: Optional[List[SERPFeature]] = None,
+        raw_data: Optional[Dict[str, Any]] = None,
+        extraction_schema: Optional[str] = None,
+        competitor_id: Optional[str] = None,
+        quality_score: Optional[float] = None,
+        data_freshness: DataFreshness = DataFreshness.CURRENT,
+        freshness_days: Optional[int] = None,
+        source_id: Optional[str] = None
+    ) -> int:
+        """Append a source and return its row number"""
+        row = len(self._ids)
+        type_code = _TYPE_CODES[SourceType(source_type)]
+        domain_code = self._domain_table.code(domain or '')
+
+        self._ids.append(source_id or str(uuid.uuid4()))
+        self._urls.append(url)
+        self._types.append(type_code)
+        self._domains.append(domain_code)
+        self._statuses.append(_STATUS_CODES[ScrapeStatus(scrape_status)])
+        self._freshness.append(_FRESHNESS_CODES[DataFreshness(data_freshness)])
+        self._freshness_days.append(_NO_POSITION if freshness_days is None else freshness_days)
+        self._positions.append(_NO_POSITION if serp_position is None else serp_position)
+        self._scraped_at.append(scraped_at.timestamp() if scraped_at else math.nan)
+        self._geos.append(tuple(self._geo_code(geo) for geo in geo_tags or ()))
+        self._keywords.append(tuple(keywords_targeted) if keywords_targeted is not None else None)
+        self._features.append(tuple(serp_features) if serp_features is not None else None)
+        self._schemas.append(self._schema_table.code(extraction_schema))
+        self._competitor_ids.append(competitor_id)
+        self._quality.append(math.nan if quality_score is None else quality_score)
+        self._store_payload(raw_data)
+
+        if domain_code:
+            self._by_domain.setdefault(domain_code, array('I')).append(row)
+        self._by_type.setdefault(type_code, array('I')).append(row)
+        return row
+
+    def add_source(self, source: Source) -> int:
+        """Append an existing Source model"""
+        return self.add(
+            source.source_type,
+            source.url,
+            domain=source.domain,
+            scrape_status=source.scrape_status,
+            scraped_at=source.scraped_at,
+            geo_tags=source.geo_tags,
+            keywords_targeted=source.keywords_targeted,
+            serp_position=source.serp_position,
+            serp_features=source.serp_features,
+            raw_data=source.raw_data,
+            extraction_schema=source.extraction_schema,
+            competitor_id=source.competitor_id,
+            quality_score=source.quality_score,
+            data_freshness=source.data_freshness,
+            freshness_days=source.freshness_days,
+            source_id=source.id
+        )
+
+    def extend(self, other: 'SourceStore', rows: Optional[Iterable[int]] = None):
+        """
+        Append rows (all by default) of another store.
+
+        Payloads are copied compressed and source ids are kept.
+        """
+        for row in range(len(other)) if rows is None else rows:
+            new_row = self.add(
+                other.source_type(row),
+                other._urls[row],
+                domain=other.domain(row),
+                scrape_status=_STATUSES[other._statuses[row]],
+                scraped_at=other.scraped_at(row),
+                geo_tags=other.geo_tags(row),
+                keywords_targeted=other._keywords[row],
+                serp_position=other.serp_position(row),
+                serp_features=other._features[row],
+                extraction_schema=other._schema_table.values[other._schemas[row]],
+                competitor_id=other._competitor_ids[row],
+                quality_score=other._optional_float(other._quality[row]),
+                data_freshness=_FRESHNESS[other._freshness[row]],
+                freshness_days=other._optional_int(other._freshness_days[row]),
+                source_id=other._ids[row]
+            )
+            blob = other._payload_blob(row)
+            if blob is not None:
+                self._replace_payload_blob(new_row, blob)
+
+    @classmethod
+    def from_sources(cls, sources: Iterable[Source], payload_path: Optional[str] = None) -> 'SourceStore':
+        """Build a store from Source models (e.g. previously collected sources)"""
+        if isinstance(sources, cls):
+            return sources
+        store = cls(payload_path)
+        for source in sources:
+            store.add_source(source)
+        return store
+
+    def update_freshness(self, now: Optional[datetime] = None):
+        """Recompute freshness columns from scraped_at (see Source.update_freshness)"""
+        now_ts = (now or datetime.now()).timestamp()
+        for row, scraped in enumerate(self._scraped_at):
+            if math.isnan(scraped):
+                self._freshness[row] = _FRESHNESS_CODES[DataFreshness.STALE]
+                continue
+            days_old = int((now_ts - scraped) // 86400)
+            self._freshness_days[row] = days_old
+            if days_old < 7:
+                freshness = DataFreshness.CURRENT
+            elif days_old < 30:
+                freshness = DataFreshness.RECENT
+            else:
+                freshness = DataFreshness.STALE
+            self._freshness[row] = _FRESHNESS_CODES[freshness]
+
+    # ========================================================================
+    # INDEXES
+    # ========================================================================
+
+    def __len__(self) -> int:
+        return len(self._ids)
+
+    def __iter__(self) -> Iterator[Source]:
+        for row in range(len(self)):
+            yield self.get(row)
+
+    def domains(self) -> List[str]:
+        """Domains with at least one source, in first-seen order"""
+        return [self._domain_table.values[code] for code in self._by_domain]
+
+    def rows_for_domain(self, domain: str) -> array:
+        code = self._domain_table.lookup(domain or '')
+        return self._by_domain.get(code, array('I')) if code else array('I')
+
+    def rows_for_type(self, source_type: SourceType) -> array:
+        return self._by_type.get(_TYPE_CODES[SourceType(source_type)], array('I'))
+
+    def count_by_type(self) -> Dict[str, int]:
+        return {_SOURCE_TYPES[code].value: len(rows) for code, rows in self._by_type.items()}
+
+    # ========================================================================
+    # COLUMN ACCESS
+    # ========================================================================
+
+    def source_id(self, row: int) -> str:
+        return self._ids[row]
+
+    def source_type(self, row: int) -> SourceType:
+        return _SOURCE_TYPES[self._types[row]]
+
+    def domain(self, row: int) -> Optional[str]:
+        return self._domain_table.values[self._domains[row]] or None
+
+    def url(self, row: int) -> str:
+        return self._urls[row]
+
+    def scrape_status(self, row: int) -> ScrapeStatus:
+        return _STATUSES[self._statuses[row]]
+
+    def data_freshness(self, row: int) -> DataFreshness:
+        return _FRESHNESS[self._freshness[row]]
+
+    def keywords(self, row: int) -> Optional[Tuple[str, ...]]:
+        return self._keywords[row]
+
+    def serp_position(self, row: int) -> Optional[int]:
+        return self._optional_int(self._positions[row])
+
+    def scraped_at(self, row: int) -> Optional[datetime]:
+        scraped = self._scraped_at[row]
+        return None if math.isnan(scraped) else datetime.fromtimestamp(scraped)
+
+    def geo_tags(self, row: int) -> List[GeoTag]:
+        return [self._geo_table.values[code] for code in self._geos[row]]
+
+    def raw(self, row: int) -> Optional[Dict[str, Any]]:
+        """Decode a row's raw payload"""
+        blob = self._payload_blob(row)
+        if blob is None:
+            return None
+        return json.loads(zlib.decompress(blob).decode('utf-8'))
+
+    def get(self, row: int, with_raw: bool = False) -> Source:
+        """Materialize a row as a Source model (raw_data only if with_raw)"""
+        keywords = self._keywords[row]
+        features = self._features[row]
+        return Source(
+            id=self._ids[row],
+            source_type=self.source_type(row),
+            url=self._urls[row],
+            domain=self.domain(row),
+            scraped_at=self.scraped_at(row),
+            scrape_status=self.scrape_status(row),
+            data_freshness=self.data_freshness(row),
+            freshness_days=self._optional_int(self._freshness_days[row]),
+            geo_tags=self.geo_tags(row),
+            keywords_targeted=list(keywords) if keywords is not None else None,
+            serp_position=self.serp_position(row),
+            serp_features=list(features) if features is not None else None,
+            competitor_id=self._competitor_ids[row],
+            raw_data=self.raw(row) if with_raw else None,
+            extraction_schema=self._schema_table.values[self._schemas[row]],
+            quality_score=self._optional_float(self._quality[row]),
+        )
+
+    def to_sources(self, rows: Optional[Iterable[int]] = None, with_raw: bool = False) -> List[Source]:
+        """Materialize rows (all by default) as Source models"""
+        rows = range(len(self)) if rows is None else rows
+        return [self.get(row, with_raw) for row in rows]
+
+    def close(self):
+        """
+        Close the payload spill file.
+
+        Metadata stays readable; reading or adding raw payloads of a
+        spilled store raises ValueError afterwards.
+        """
+        if self._payload_file is not None:
+            self._payload_file.close()
+            self._payload_file = None
+
+    def __enter__(self) -> 'SourceStore':
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.close()
+
+    # ========================================================================
+    # INTERNALS
+    # ========================================================================
+
+    def _geo_code(self, geo: GeoTag) -> int:
+        return self._geo_table.code((geo.city, geo.state, geo.zip), geo)
+
+    @staticmethod
+    def _optional_int(value: int) -> Optional[int]:
+        return None if value == _NO_POSITION else value
+
+    @staticmethod
+    def _optional_float(value: float) -> Optional[float]:
+        return None if math.isnan(value) else value
+
+    def _store_payload(self, raw_data: Optional[Dict[str, Any]]):
+        blob = None
+        if raw_data is not None:
+            blob = zlib.compress(json.dumps(raw_data, default=str).encode('utf-8'))
+        self._append_payload_blob(blob)
+
+    def _spill_file(self):
+        if self._payload_file is None:
+            raise ValueError(f"SourceStore payload file {self._payload_path} is closed")
+        return self._payload_file
+
+    def _append_payload_blob(self, blob: Optional[bytes]):
+        if self._payload_path is None:
+            self._payloads.append(blob)
+            return
+        spill = self._spill_file()
+        if blob is None:
+            self._payload_offsets.append(-1)
+            self._payload_lengths.append(0)
+            return
+        spill.seek(0, 2)
+        self._payload_offsets.append(spill.tell())
+        self._payload_lengths.append(len(blob))
+        spill.write(blob)
+
+    def _replace_payload_blob(self, row: int, blob: bytes):
+        if self._payload_path is None:
+            self._payloads[row] = blob
+            return
+        spill = self._spill_file()
+        spill.seek(0, 2)
+        self._payload_offsets[row] = spill.tell()
+        self._payload_lengths[row] = len(blob)
+        spill.write(blob)
+
+    def _payload_blob(self, row: int) -> Optional[bytes]:
+        if self._payload_path is None:
+            return self._payloads[row]
+        offset = self._payload_offsets[row]
+        if offset < 0:
+            return None
+        spill = self._spill_file()
+        spill.seek(offset)
+        return spill.read(self._payload_lengths[row])
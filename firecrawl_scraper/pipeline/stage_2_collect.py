@@ -2,18 +2,24 @@
 Stage 2: COLLECT - DataForSEO + Firecrawl data collection
 
 Input: Intent/Geo Matrix
-Output: Source entities (SERP results, competitor URLs, GBP data)
+Output: SourceStore of Source entities (SERP results, competitor URLs, GBP data)
 
 This stage collects competitive intelligence data from:
 - DataForSEO: SERP rankings, local pack, keyword data
 - Firecrawl: Competitor website content
+
+Given the sources of a previous run, only keyword/location pairs, local
+pack keywords and competitor sites without fresh data are re-collected;
+`Source.needs_refresh` decides what is too old to reuse.
+
+With `dataforseo_queued`, SERP queries go through DataForSEO's standard
+queue (cheaper, results arrive minutes later) instead of live endpoints.
 """
 
 import logging
 import asyncio
-from typing import List, Dict, Optional, Any
+from typing import Iterable, List, Dict, Optional, Any
 from datetime import datetime
-import uuid
 
 from ..models import (
     IntentGeoMatrix,
@@ -21,12 +27,12 @@ from ..models import (
     Source,
     SourceType,
     ScrapeStatus,
-    DataFreshness,
     SERPFeature,
     GeoTag,
     SERPData,
     SERPResult,
 )
+from .source_store import SourceStore
 
 logger = logging.getLogger(__name__)
 
@@ -38,78 +44,204 @@ class CollectStage:
         self,
         matrix: IntentGeoMatrix,
         dataforseo_client=None,
-        firecrawl_client=None
+        firecrawl_client=None,
+        dataforseo_concurrency: int = 5,
+        firecrawl_concurrency: int = 3,
+        payload_path: Optional[str] = None,
+        previous_sources: Optional[SourceStore] = None,
+        dataforseo_queued: bool = False
     ):
         self.matrix = matrix
         self.dataforseo = dataforseo_client
+        self.dataforseo_queued = dataforseo_queued
         self.firecrawl = firecrawl_client
-        self.sources: List[Source] = []
+        # Raw payloads are spilled to payload_path when given
+        self.sources = SourceStore(payload_path)
         self.competitor_urls: Dict[str, str] = {}  # domain -> url
 
-    async def run(self) -> List[Source]:
+        # Rows of a previous run that are still fresh enough to reuse
+        self.previous = previous_sources
+        self._reusable_serp: Dict[tuple, List[int]] = {}   # (keyword, location) -> rows
+        self._reusable_local: Dict[str, List[int]] = {}    # keyword -> rows
+        self._reusable_sites: Dict[str, List[int]] = {}    # domain -> website/page rows
+        self.reused = {'serp': 0, 'local_pack': 0, 'competitors': 0}
+
+        # Separate in-flight budgets per API
+        self.dataforseo_concurrency = max(1, dataforseo_concurrency)
+        self.firecrawl_concurrency = max(1, firecrawl_concurrency)
+        self._dataforseo_semaphore: Optional[asyncio.Semaphore] = None
+        self._firecrawl_semaphore: Optional[asyncio.Semaphore] = None
+
+    async def run(self) -> SourceStore:
         """Execute Stage 2: Collect competitive data"""
         logger.info(f"Stage 2: Collecting data for {len(self.matrix.cells)} matrix cells")
 
-        # Collect SERP data for each cell's keyword cluster
-        await self._collect_serp_data()
+        self._dataforseo_semaphore = asyncio.Semaphore(self.dataforseo_concurrency)
+        self._firecrawl_semaphore = asyncio.Semaphore(self.firecrawl_concurrency)
+        self._index_previous_sources()
 
-        # Collect local pack data
-        await self._collect_local_pack_data()
+        # SERP and local pack data are fetched together, then processed in
+        # a fixed order so self.sources is deterministic
+        await self._collect_dataforseo_data()
 
-        # Collect competitor website data
+        # Collect competitor website data (needs SERP-discovered domains)
         await self._collect_competitor_data()
 
         # Update source freshness
-        for source in self.sources:
-            source.update_freshness()
+        self.sources.update_freshness()
 
+        if self.previous is not None:
+            logger.info(
+                f"Reused {self.reused['serp']} SERP queries, {self.reused['local_pack']} local pack "
+                f"queries and {self.reused['competitors']} competitor sites from the previous run"
+            )
         logger.info(f"Stage 2 Complete: Collected {len(self.sources)} sources")
         return self.sources
 
-    async def _collect_serp_data(self):
-        """Collect SERP rankings for keyword clusters"""
-        logger.info("Collecting SERP data...")
+    def _index_previous_sources(self):
+        """Index previous rows by the query (or site) that produced them, fresh ones only"""
+        if self.previous is None:
+            return
+        previous = self.previous
+        previous.update_freshness()
+
+        serp: Dict[tuple, List[int]] = {}
+        local: Dict[str, List[int]] = {}
+        sites: Dict[str, List[int]] = {}
+        stale_serp, stale_local, stale_sites = set(), set(), set()
+
+        for row in range(len(previous)):
+            source_type = previous.source_type(row)
+            keywords = previous.keywords(row) or ()
+            fresh = not previous.get(row).needs_refresh
+
+            if source_type == SourceType.SERP_ORGANIC and keywords:
+                geo_tags = previous.geo_tags(row)
+                key = (keywords[0], geo_tags[0].full_name if geo_tags else '')
+                serp.setdefault(key, []).append(row)
+                if not fresh:
+                    stale_serp.add(key)
+            elif source_type == SourceType.SERP_LOCAL_PACK and keywords:
+                local.setdefault(keywords[0], []).append(row)
+                if not fresh:
+                    stale_local.add(keywords[0])
+            elif source_type in (SourceType.COMPETITOR_WEBSITE, SourceType.COMPETITOR_PAGE):
+                domain = previous.domain(row)
+                sites.setdefault(domain, []).append(row)
+                # A failed main page scrape is retried, not reused
+                if not fresh or (
+                    source_type == SourceType.COMPETITOR_WEBSITE
+                    and previous.scrape_status(row) != ScrapeStatus.SUCCESS
+                ):
+                    stale_sites.add(domain)
+
+        # A query is reused whole or re-run whole
+        self._reusable_serp = {k: rows for k, rows in serp.items() if k not in stale_serp}
+        self._reusable_local = {k: rows for k, rows in local.items() if k not in stale_local}
+        self._reusable_sites = {k: rows for k, rows in sites.items() if k not in stale_sites}
+
+    def _reuse_rows(self, rows: List[int], track_competitors: bool = False):
+        """Copy previous rows into this run's sources"""
+        self.sources.extend(self.previous, rows)
+        if track_competitors:
+            for row in rows:
+                domain = self.previous.domain(row)
+                if domain not in self.competitor_urls:
+                    self.competitor_urls[domain] = self.previous.url(row)
+
+    async def _collect_dataforseo_data(self):
+        """Fetch SERP and local pack data concurrently"""
+        logger.info("Collecting SERP and local pack data...")
 
         # Get unique keyword/location combinations
         keyword_locations = self._get_keyword_location_pairs()
+        local_keywords = self._get_local_pack_keywords()
+
+        # Queries with fresh previous results are not sent again
+        reused_serp = {
+            i: self._reusable_serp[(keyword, geo_tag.full_name)]
+            for i, (keyword, geo_tag) in enumerate(keyword_locations)
+            if (keyword, geo_tag.full_name) in self._reusable_serp
+        }
+
+        async def fetch_local(keyword: str) -> Optional[Dict]:
+            if keyword in self._reusable_local:
+                return None
+            return await self._fetch_local_finder(keyword)
+
+        serp_batch, local_results = await asyncio.gather(
+            self._fetch_serp_batch(keyword_locations, skip=reused_serp.keys()),
+            asyncio.gather(*[fetch_local(keyword) for keyword in local_keywords])
+        )
 
-        for keyword, geo_tag in keyword_locations:
+        self._process_serp_batch(keyword_locations, serp_batch, reused_serp)
+        self._process_local_batch(local_keywords, local_results)
+
+    def _process_serp_batch(
+        self,
+        keyword_locations: List[tuple],
+        serp_batch: Dict[str, Dict],
+        reused: Optional[Dict[int, List[int]]] = None
+    ):
+        """Process batched SERP responses (or reused rows) in pair order"""
+        reused = reused or {}
+        for i, (keyword, geo_tag) in enumerate(keyword_locations):
+            if i in reused:
+                self._reuse_rows(reused[i], track_competitors=True)
+                self.reused['serp'] += 1
+                continue
             try:
-                serp_data = await self._fetch_serp(keyword, geo_tag)
+                serp_data = serp_batch.get(str(i))
                 if serp_data:
                     self._process_serp_results(serp_data, keyword, geo_tag)
             except Exception as e:
                 logger.error(f"Error fetching SERP for '{keyword}': {e}")
 
-    async def _collect_local_pack_data(self):
-        """Collect local pack/maps data"""
-        logger.info("Collecting local pack data...")
-
-        # Get primary locations
-        primary_cells = [c for c in self.matrix.cells if c.geo_bucket == "0-10"]
-
-        for cell in primary_cells:
-            keywords = cell.keyword_cluster[:3]  # Top 3 keywords
-            for keyword in keywords:
-                try:
-                    local_data = await self._fetch_local_finder(keyword)
-                    if local_data:
-                        self._process_local_results(local_data, keyword)
-                except Exception as e:
-                    logger.error(f"Error fetching local pack for '{keyword}': {e}")
+    def _process_local_batch(self, keywords: List[str], local_results: List[Optional[Dict]]):
+        """Process local finder responses in keyword order"""
+        for keyword, local_data in zip(keywords, local_results):
+            if keyword in self._reusable_local:
+                self._reuse_rows(self._reusable_local[keyword])
+                self.reused['local_pack'] += 1
+                continue
+            try:
+                if local_data:
+                    self._process_local_results(local_data, keyword)
+            except Exception as e:
+                logger.error(f"Error fetching local pack for '{keyword}': {e}")
 
     async def _collect_competitor_data(self):
         """Collect competitor website content via Firecrawl"""
         logger.info("Collecting competitor website data...")
 
-        # Get unique competitor domains
-        competitor_domains = list(set(self.competitor_urls.keys()))
+        # Unique competitor domains, in discovery order
+        competitor_domains = list(self.competitor_urls.keys())[:10]  # Limit to top 10 competitors
 
-        for domain in competitor_domains[:10]:  # Limit to top 10 competitors
+        async def scrape(domain: str) -> Optional[SourceStore]:
+            if domain in self._reusable_sites:
+                self.reused['competitors'] += 1
+                sources = SourceStore()
+                sources.extend(self.previous, self._reusable_sites[domain])
+                return sources
             try:
-                await self._scrape_competitor(domain, self.competitor_urls[domain])
+                return await self._scrape_competitor(domain, self.competitor_urls[domain])
             except Exception as e:
                 logger.error(f"Error scraping competitor {domain}: {e}")
+                return None
+
+        # Scrape concurrently, append in domain order
+        results = await asyncio.gather(*[scrape(domain) for domain in competitor_domains])
+        for domain_sources in results:
+            if domain_sources is not None:
+                self.sources.extend(domain_sources)
+
+    def _get_local_pack_keywords(self) -> List[str]:
+        """Get top keywords of the primary (0-10 mile) cells for local pack queries"""
+        keywords = []
+        for cell in self.matrix.cells:
+            if cell.geo_bucket == "0-10":
+                keywords.extend(cell.keyword_cluster[:3])  # Top 3 keywords
+        return keywords
 
     def _get_keyword_location_pairs(self) -> List[tuple]:
         """Get unique keyword/location pairs from matrix"""
@@ -136,24 +268,37 @@ class CollectStage:
 
         return pairs[:50]  # Limit to 50 pairs
 
-    async def _fetch_serp(self, keyword: str, geo_tag: GeoTag) -> Optional[Dict]:
-        """Fetch SERP data from DataForSEO"""
+    async def _fetch_serp_batch(self, keyword_locations: List[tuple], skip: Iterable[int] = ()) -> Dict[str, Dict]:
+        """
+        Fetch SERP data for keyword/location pairs as one tagged batch.
+
+        Responses are keyed by the pair's index; indexes in `skip` are not
+        fetched.
+        """
+        skip = set(skip)
+        queries = [{
+            "keyword": keyword,
+            "location_name": f"{geo_tag.city}, {geo_tag.state}",
+            "tag": str(i)
+        } for i, (keyword, geo_tag) in enumerate(keyword_locations) if i not in skip]
+
+        if not queries:
+            return {}
         if not self.dataforseo:
             logger.warning("DataForSEO client not configured")
-            return None
+            return {}
 
         try:
-            # Use DataForSEO organic search endpoint
-            result = await self.dataforseo.serp_google_organic(
-                keyword=keyword,
-                location_name=f"{geo_tag.city}, {geo_tag.state}",
+            return await self.dataforseo.serp_google_organic_batch(
+                queries,
                 language_code="en",
-                device="desktop"
+                device="desktop",
+                semaphore=self._dataforseo_semaphore,
+                queued=self.dataforseo_queued
             )
-            return result
         except Exception as e:
-            logger.error(f"DataForSEO SERP error: {e}")
-            return None
+            logger.error(f"DataForSEO SERP batch error: {e}")
+            return {}
 
     async def _fetch_local_finder(self, keyword: str) -> Optional[Dict]:
         """Fetch local finder/maps data from DataForSEO"""
@@ -161,10 +306,11 @@ class CollectStage:
             return None
 
         try:
-            result = await self.dataforseo.serp_google_local_finder(
-                keyword=keyword,
-                language_code="en"
-            )
+            async with self._dataforseo_semaphore:
+                result = await self.dataforseo.serp_google_local_finder(
+                    keyword=keyword,
+                    language_code="en"
+                )
             return result
         except Exception as e:
             logger.error(f"DataForSEO local finder error: {e}")
@@ -186,14 +332,12 @@ class CollectStage:
                 self.competitor_urls[domain] = url
 
             # Create source entity
-            source = Source(
-                id=str(uuid.uuid4()),
-                source_type=SourceType.SERP_ORGANIC,
-                url=url,
+            self.sources.add(
+                SourceType.SERP_ORGANIC,
+                url,
                 domain=domain,
                 scraped_at=datetime.now(),
                 scrape_status=ScrapeStatus.SUCCESS,
-                data_freshness=DataFreshness.CURRENT,
                 geo_tags=[geo_tag],
                 keywords_targeted=[keyword],
                 serp_position=item.get("position") or item.get("rank_absolute"),
@@ -203,7 +347,6 @@ class CollectStage:
                     "breadcrumb": item.get("breadcrumb"),
                 }
             )
-            self.sources.append(source)
 
     def _process_local_results(self, local_data: Dict, keyword: str):
         """Process local pack results into Source entities"""
@@ -211,14 +354,12 @@ class CollectStage:
 
         for item in items[:10]:
             # Create source for local pack result
-            source = Source(
-                id=str(uuid.uuid4()),
-                source_type=SourceType.SERP_LOCAL_PACK,
-                url=item.get("url", ""),
+            self.sources.add(
+                SourceType.SERP_LOCAL_PACK,
+                item.get("url", ""),
                 domain=self._extract_domain(item.get("url", "")),
                 scraped_at=datetime.now(),
                 scrape_status=ScrapeStatus.SUCCESS,
-                data_freshness=DataFreshness.CURRENT,
                 keywords_targeted=[keyword],
                 serp_position=item.get("position"),
                 serp_features=[SERPFeature.LOCAL_PACK],
@@ -230,63 +371,62 @@ class CollectStage:
                     "phone": item.get("phone"),
                 }
             )
-            self.sources.append(source)
 
-    async def _scrape_competitor(self, domain: str, url: str):
-        """Scrape competitor website via Firecrawl"""
+    async def _scrape_competitor(self, domain: str, url: str) -> Optional[SourceStore]:
+        """Scrape competitor website via Firecrawl and return its sources"""
         if not self.firecrawl:
             logger.warning("Firecrawl client not configured")
-            return
+            return None
 
+        sources = SourceStore()
         try:
             # Scrape main page
-            result = await self.firecrawl.scrape(
-                url=url,
-                formats=["markdown", "html"],
-                only_main_content=True
-            )
+            async with self._firecrawl_semaphore:
+                result = await self.firecrawl.scrape(
+                    url=url,
+                    formats=["markdown", "html"],
+                    only_main_content=True
+                )
 
-            source = Source(
-                id=str(uuid.uuid4()),
-                source_type=SourceType.COMPETITOR_WEBSITE,
-                url=url,
+            sources.add(
+                SourceType.COMPETITOR_WEBSITE,
+                url,
                 domain=domain,
                 scraped_at=datetime.now(),
                 scrape_status=ScrapeStatus.SUCCESS,
-                data_freshness=DataFreshness.CURRENT,
                 raw_data=result,
                 extraction_schema="website_full"
             )
-            self.sources.append(source)
 
             # Also crawl key pages
-            await self._crawl_competitor_pages(domain, url)
+            await self._crawl_competitor_pages(domain, url, sources)
 
         except Exception as e:
             logger.error(f"Firecrawl error for {domain}: {e}")
             # Create failed source
-            source = Source(
-                id=str(uuid.uuid4()),
-                source_type=SourceType.COMPETITOR_WEBSITE,
-                url=url,
+            sources.add(
+                SourceType.COMPETITOR_WEBSITE,
+                url,
                 domain=domain,
                 scrape_status=ScrapeStatus.FAILED,
             )
-            self.sources.append(source)
 
-    async def _crawl_competitor_pages(self, domain: str, base_url: str):
-        """Crawl additional competitor pages"""
+        return sources
+
+    async def _crawl_competitor_pages(self, domain: str, base_url: str, sources: SourceStore):
+        """Crawl additional competitor pages into `sources`"""
         if not self.firecrawl:
             return
 
         try:
             # Use Firecrawl crawl mode to get multiple pages
-            result = await self.firecrawl.crawl(
-                url=base_url,
-                max_depth=2,
-                limit=20,
-                formats=["markdown"]
-            )
+            async with self._firecrawl_semaphore:
+                result = await self.firecrawl.crawl(
+                    url=base_url,
+                    max_depth=2,
+                    limit=20,
+                    scrape_options={"formats": ["markdown"]}
+                )
 
             pages = result.get("data", []) if isinstance(result, dict) else result
 
@@ -295,21 +435,18 @@ class CollectStage:
                 if not page_url:
                     continue
 
-                source = Source(
-                    id=str(uuid.uuid4()),
-                    source_type=SourceType.COMPETITOR_PAGE,
-                    url=page_url,
+                sources.add(
+                    SourceType.COMPETITOR_PAGE,
+                    page_url,
                     domain=domain,
                     scraped_at=datetime.now(),
                     scrape_status=ScrapeStatus.SUCCESS,
-                    data_freshness=DataFreshness.CURRENT,
                     raw_data={
                         "markdown": page.get("markdown"),
                         "metadata": page.get("metadata"),
                     },
                     extraction_schema="page_content"
                 )
-                self.sources.append(source)
 
         except Exception as e:
             logger.error(f"Crawl error for {domain}: {e}")
@@ -327,10 +464,10 @@ class CollectStage:
         """Get list of discovered competitor domains"""
         return list(self.competitor_urls.keys())
 
-    def get_sources_by_domain(self, domain: str) -> List[Source]:
+    def get_sources_by_domain(self, domain: str, with_raw: bool = True) -> List[Source]:
         """Get all sources for a specific domain"""
-        return [s for s in self.sources if s.domain == domain]
+        return self.sources.to_sources(self.sources.rows_for_domain(domain), with_raw)
 
-    def get_sources_by_type(self, source_type: SourceType) -> List[Source]:
+    def get_sources_by_type(self, source_type: SourceType, with_raw: bool = True) -> List[Source]:
         """Get sources by type"""
-        return [s for s in self.sources if s.source_type == source_type]
+        return self.sources.to_sources(self.sources.rows_for_type(source_type), with_raw)
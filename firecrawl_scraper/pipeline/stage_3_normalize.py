@@ -8,9 +8,12 @@ This stage transforms raw scraped data into structured competitor profiles
 using Firecrawl EXTRACT strategy and normalization logic.
 """
 
+import asyncio
 import logging
 import re
-from typing import List, Dict, Optional, Any
+from concurrent.futures import Executor, ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Iterable, List, Dict, Optional, Any, Union
 from datetime import datetime
 import uuid
 
@@ -22,7 +25,7 @@ from ..models import (
     TrustSignals,
     ConversionMechanics,
     SEOStructure,
-    TechnicalSEO,
+    CompetitorTechnicalSEO,
     BacklinkProfile,
     SocialPresence,
     ServicePage,
@@ -33,32 +36,98 @@ from ..models import (
     ContentFreshness,
     ThreatLevel,
 )
+from .source_store import SourceStore
+from .stage_cache import StageCache, fingerprint
 
 logger = logging.getLogger(__name__)
 
 
+def _analyze_content(
+    website_source: Optional[Source],
+    page_sources: List[Source]
+) -> Dict[str, Any]:
+    """
+    Regex/text analysis of one domain's scraped content.
+
+    Module-level so it can run in a worker process; the analysis helpers
+    use no stage state.
+    """
+    analyzer = NormalizeStage(())
+    return {
+        'trust_signals': analyzer._extract_trust_signals(website_source, page_sources),
+        'conversion_mechanics': analyzer._extract_conversion_mechanics(website_source, page_sources),
+        'seo_structure': analyzer._extract_seo_structure(page_sources),
+        'technical_seo': analyzer._extract_technical_seo(website_source),
+        'social_presence': analyzer._extract_social_presence(website_source, page_sources),
+        'services_offered': analyzer._identify_services(page_sources),
+        'name': analyzer._extract_business_name(website_source),
+    }
+
+
 class NormalizeStage:
     """Normalize raw data into structured Competitor Profiles"""
 
-    def __init__(self, sources: List[Source], firecrawl_client=None):
-        self.sources = sources
+    def __init__(
+        self,
+        sources: Union[SourceStore, Iterable[Source]],
+        firecrawl_client=None,
+        max_concurrent: int = 8,
+        max_workers: Optional[int] = None,
+        use_processes: bool = True,
+        cache: Optional[StageCache] = None
+    ):
+        """
+        Args:
+            sources: SourceStore from Stage 2 (or Source models)
+            firecrawl_client: Optional client for follow-up scrapes
+            max_concurrent: Domains whose profiles are built at once
+            max_workers: Processes for content analysis (CPU count by default)
+            use_processes: Run content analysis in a process pool; when
+                False (or the pool cannot start) it runs in-process
+            cache: Stage cache; a competitor whose sources are unchanged
+                since a previous run reuses its stored profile
+        """
+        self.sources = SourceStore.from_sources(sources)
         self.firecrawl = firecrawl_client
         self.profiles: Dict[str, CompetitorProfile] = {}
 
+        self.max_concurrent = max(1, max_concurrent)
+        self.max_workers = max_workers
+        self.use_processes = use_processes
+        self._executor: Optional[Executor] = None
+        self.cache = cache
+
     async def run(self) -> List[CompetitorProfile]:
         """Execute Stage 3: Normalize into Competitor Profiles"""
         logger.info(f"Stage 3: Normalizing {len(self.sources)} sources into profiles")
 
-        # Group sources by domain
-        sources_by_domain = self._group_sources_by_domain()
+        domains = self.sources.domains()
+        semaphore = asyncio.Semaphore(self.max_concurrent)
+
+        async def build(domain: str) -> Optional[CompetitorProfile]:
+            async with semaphore:
+                try:
+                    return await self._build_competitor_profile(domain)
+                except Exception as e:
+                    logger.error(f"Error building profile for {domain}: {e}")
+                    return None
 
-        # Build profile for each competitor domain
-        for domain, domain_sources in sources_by_domain.items():
+        if self.use_processes and domains:
             try:
-                profile = await self._build_competitor_profile(domain, domain_sources)
+                self._executor = ProcessPoolExecutor(max_workers=self.max_workers)
+            except (OSError, NotImplementedError, ValueError) as e:
+                logger.warning(f"Process pool unavailable, analyzing in-process: {e}")
+        try:
+            # Build profiles concurrently, keep them in domain order
+            profiles = await asyncio.gather(*[build(domain) for domain in domains])
+        finally:
+            if self._executor is not None:
+                self._executor.shutdown(wait=False)
+                self._executor = None
+
+        for domain, profile in zip(domains, profiles):
+            if profile is not None:
                 self.profiles[domain] = profile
-            except Exception as e:
-                logger.error(f"Error building profile for {domain}: {e}")
 
         # Calculate threat levels
         for profile in self.profiles.values():
@@ -67,54 +136,58 @@ class NormalizeStage:
         logger.info(f"Stage 3 Complete: Built {len(self.profiles)} competitor profiles")
         return list(self.profiles.values())
 
-    def _group_sources_by_domain(self) -> Dict[str, List[Source]]:
-        """Group sources by domain"""
-        grouped = {}
-        for source in self.sources:
-            if source.domain:
-                if source.domain not in grouped:
-                    grouped[source.domain] = []
-                grouped[source.domain].append(source)
-        return grouped
-
-    async def _build_competitor_profile(
-        self,
-        domain: str,
-        sources: List[Source]
-    ) -> CompetitorProfile:
-        """Build a competitor profile from sources"""
-
-        # Get main website source
-        website_source = next(
-            (s for s in sources if s.source_type == SourceType.COMPETITOR_WEBSITE),
+    async def _build_competitor_profile(self, domain: str) -> CompetitorProfile:
+        """Build a competitor profile from the domain's sources"""
+        store = self.sources
+        rows = store.rows_for_domain(domain)
+
+        # Same sources (by id, with the same freshness and scrape status the
+        # confidence score reads) as a previous run -> same profile
+        cache_key = None
+        if self.cache is not None:
+            cache_key = fingerprint('normalize', domain, [
+                (store.source_id(row), store.data_freshness(row).value, store.scrape_status(row).value)
+                for row in rows
+            ])
+            cached = self.cache.get('normalize', cache_key)
+            if cached is not None:
+                return CompetitorProfile.model_validate(cached)
+
+        # Website and page sources need their raw payloads; SERP rows are
+        # read from the metadata columns only
+        website_row = next(
+            (row for row in rows if store.source_type(row) == SourceType.COMPETITOR_WEBSITE),
             None
         )
+        website_source = store.get(website_row, with_raw=True) if website_row is not None else None
 
-        # Get page sources
-        page_sources = [s for s in sources if s.source_type == SourceType.COMPETITOR_PAGE]
+        page_sources = [
+            store.get(row, with_raw=True)
+            for row in rows if store.source_type(row) == SourceType.COMPETITOR_PAGE
+        ]
 
-        # Get SERP sources
-        serp_sources = [s for s in sources if s.source_type in [
-            SourceType.SERP_ORGANIC, SourceType.SERP_LOCAL_PACK
-        ]]
+        serp_rows = [
+            row for row in rows
+            if store.source_type(row) in (SourceType.SERP_ORGANIC, SourceType.SERP_LOCAL_PACK)
+        ]
 
-        # Extract structured data
-        trust_signals = await self._extract_trust_signals(website_source, page_sources)
-        conversion_mechanics = await self._extract_conversion_mechanics(website_source, page_sources)
-        seo_structure = self._extract_seo_structure(page_sources)
-        technical_seo = self._extract_technical_seo(website_source)
-        grid_performance = self._extract_grid_performance(serp_sources)
-        backlinks = self._extract_backlink_data(sources)
-        social_presence = self._extract_social_presence(website_source, page_sources)
+        # Extract structured data (text analysis off the event loop)
+        content = await self._analyze_domain_content(website_source, page_sources)
+        trust_signals = content['trust_signals']
+        conversion_mechanics = content['conversion_mechanics']
+        seo_structure = content['seo_structure']
+        technical_seo = content['technical_seo']
+        social_presence = content['social_presence']
+        grid_performance = self._extract_grid_performance(serp_rows)
+        backlinks = self._extract_backlink_data(domain)
 
         # Get geo tags from sources
         geo_tags = []
-        for source in sources:
-            geo_tags.extend(source.geo_tags)
+        for row in rows:
+            geo_tags.extend(store.geo_tags(row))
         geo_tags = list({gt.full_name: gt for gt in geo_tags}.values())
 
-        # Identify services offered
-        services_offered = self._identify_services(page_sources)
+        services_offered = content['services_offered']
 
         # Identify strengths and weaknesses
         strengths, weaknesses = self._analyze_strengths_weaknesses(
@@ -124,9 +197,9 @@ class NormalizeStage:
         profile = CompetitorProfile(
             id=str(uuid.uuid4()),
             domain=domain,
-            name=self._extract_business_name(website_source),
+            name=content['name'],
             url=f"https://{domain}",
-            sources_scraped=sources,
+            sources_scraped=store.to_sources(rows),
             geo_tags=geo_tags,
             services_offered=services_offered,
             trust_signals=trust_signals,
@@ -139,16 +212,37 @@ class NormalizeStage:
             strengths=strengths,
             weaknesses=weaknesses,
             analyzed_at=datetime.now(),
-            confidence_score=self._calculate_confidence(sources),
+            confidence_score=self._calculate_confidence(rows),
         )
 
         # Calculate scores
         profile.trust_signals.calculate_trust_score()
         profile.conversion_mechanics.calculate_conversion_score()
 
+        if cache_key is not None:
+            self.cache.set('normalize', cache_key, profile.model_dump(mode='json'))
         return profile
 
-    async def _extract_trust_signals(
+    async def _analyze_domain_content(
+        self,
+        website_source: Optional[Source],
+        page_sources: List[Source]
+    ) -> Dict[str, Any]:
+        """Run _analyze_content in the process pool when there is content to scan"""
+        has_content = bool(page_sources) or bool(website_source and website_source.raw_data)
+        if self._executor is None or not has_content:
+            # SERP-only domains are cheaper to analyze than to ship to a worker
+            return _analyze_content(website_source, page_sources)
+
+        loop = asyncio.get_running_loop()
+        try:
+            return await loop.run_in_executor(self._executor, _analyze_content, website_source, page_sources)
+        except BrokenProcessPool as e:
+            logger.warning(f"Process pool failed, analyzing in-process: {e}")
+            self._executor = None
+            return _analyze_content(website_source, page_sources)
+
+    def _extract_trust_signals(
         self,
         website_source: Optional[Source],
         page_sources: List[Source]
@@ -213,7 +307,7 @@ class NormalizeStage:
 
         return signals
 
-    async def _extract_conversion_mechanics(
+    def _extract_conversion_mechanics(
         self,
         website_source: Optional[Source],
         page_sources: List[Source]
@@ -335,9 +429,9 @@ class NormalizeStage:
 
         return structure
 
-    def _extract_technical_seo(self, website_source: Optional[Source]) -> TechnicalSEO:
+    def _extract_technical_seo(self, website_source: Optional[Source]) -> CompetitorTechnicalSEO:
         """Extract technical SEO data"""
-        tech = TechnicalSEO()
+        tech = CompetitorTechnicalSEO()
 
         if not website_source or not website_source.raw_data:
             return tech
@@ -354,22 +448,24 @@ class NormalizeStage:
 
         return tech
 
-    def _extract_grid_performance(self, serp_sources: List[Source]) -> Dict[str, float]:
+    def _extract_grid_performance(self, serp_rows: Iterable[int]) -> Dict[str, float]:
         """Extract grid/ranking performance by location"""
         performance = {}
 
-        for source in serp_sources:
-            if source.serp_position and source.geo_tags:
-                for geo_tag in source.geo_tags:
-                    location = geo_tag.city
-                    if location not in performance:
-                        performance[location] = []
-                    performance[location].append(source.serp_position)
+        for row in serp_rows:
+            position = self.sources.serp_position(row)
+            if not position:
+                continue
+            for geo_tag in self.sources.geo_tags(row):
+                location = geo_tag.city
+                if location not in performance:
+                    performance[location] = []
+                performance[location].append(position)
 
         # Average rankings per location
         return {loc: sum(ranks)/len(ranks) for loc, ranks in performance.items()}
 
-    def _extract_backlink_data(self, sources: List[Source]) -> BacklinkProfile:
+    def _extract_backlink_data(self, domain: str) -> BacklinkProfile:
         """Extract backlink data (requires DataForSEO backlinks API)"""
         # This would be populated from DataForSEO backlinks API
         return BacklinkProfile()
@@ -497,20 +593,21 @@ class NormalizeStage:
 
         return strengths, weaknesses
 
-    def _calculate_confidence(self, sources: List[Source]) -> float:
+    def _calculate_confidence(self, rows: Iterable[int]) -> float:
         """Calculate confidence score based on data quality"""
-        if not sources:
+        rows = list(rows)
+        if not rows:
             return 0.0
 
         # More sources = higher confidence
-        source_score = min(len(sources) / 20, 0.5)
+        source_score = min(len(rows) / 20, 0.5)
 
         # Successful scrapes = higher confidence
-        successful = sum(1 for s in sources if s.scrape_status.value == "success")
-        success_score = (successful / len(sources)) * 0.3
+        successful = sum(1 for row in rows if self.sources.scrape_status(row).value == "success")
+        success_score = (successful / len(rows)) * 0.3
 
         # Fresh data = higher confidence
-        fresh = sum(1 for s in sources if s.data_freshness.value == "current")
-        freshness_score = (fresh / len(sources)) * 0.2
+        fresh = sum(1 for row in rows if self.sources.data_freshness(row).value == "current")
+        freshness_score = (fresh / len(rows)) * 0.2
 
         return min(source_score + success_score + freshness_score, 1.0)
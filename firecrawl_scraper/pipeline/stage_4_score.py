@@ -39,6 +39,7 @@ from ..models import (
     HEALTHCARE_VERTICALS,
     BLUE_COLLAR_VERTICALS,
 )
+from ..analysis.feature_table import FeatureTable
 from ..analysis.insight_rules import RuleEngine, get_rules_for_vertical
 
 logger = logging.getLogger(__name__)
@@ -56,6 +57,9 @@ class ScoreStage:
         self.competitors = competitor_profiles
         self.findings: List[Finding] = []
         self.insights: List[ActionableInsight] = []
+        # Competitor features are extracted once and shared by all rules
+        self.table = FeatureTable(competitor_profiles)
+        self.rule_timings: Dict[str, float] = {}
 
     def run(self) -> tuple[FindingsReport, InsightReport]:
         """Execute Stage 4: Score and generate insights"""
@@ -64,9 +68,10 @@ class ScoreStage:
 
         # Use vertical-aware rule engine if competitors exist
         if self.competitors:
-            rule_engine = RuleEngine(self.client, self.competitors)
+            rule_engine = RuleEngine(self.client, self.competitors, table=self.table)
             rule_findings = rule_engine.run_all_rules()
             self.findings.extend(rule_findings)
+            self.rule_timings = rule_engine.get_timings()
             logger.info(f"Vertical-aware rules generated {len(rule_findings)} findings")
         else:
             # Fallback to built-in rules when no competitor data
@@ -143,19 +148,10 @@ class ScoreStage:
         client_reviews = self.client.gbp_profile.review_count if self.client.gbp_profile else 0
         client_rating = self.client.gbp_profile.rating if self.client.gbp_profile else 0
 
-        competitor_reviews = []
-        competitor_ratings = []
-
-        for comp in self.competitors:
-            if comp.trust_signals.review_count:
-                competitor_reviews.append(comp.trust_signals.review_count)
-            if comp.trust_signals.rating:
-                competitor_ratings.append(comp.trust_signals.rating)
-
         # Review count analysis
-        if competitor_reviews:
-            avg_reviews = sum(competitor_reviews) / len(competitor_reviews)
-            max_reviews = max(competitor_reviews)
+        avg_reviews = self.table.mean('review_count')
+        if avg_reviews is not None:
+            max_reviews = self.table.value('review_count', self.table.leader('review_count'))
 
             if client_reviews < avg_reviews:
                 self._add_finding(
@@ -182,10 +178,7 @@ class ScoreStage:
 
     def _rule_certification_visibility(self):
         """Check certification/license visibility gaps"""
-        competitors_with_certs = sum(
-            1 for c in self.competitors
-            if c.trust_signals.certifications or c.trust_signals.licenses_shown
-        )
+        competitors_with_certs = self.table.count('certs_or_licenses')
 
         if competitors_with_certs >= len(self.competitors) * 0.6:
             self._add_finding(
@@ -199,10 +192,7 @@ class ScoreStage:
 
     def _rule_gallery_presence(self):
         """Check before/after gallery presence"""
-        competitors_with_gallery = sum(
-            1 for c in self.competitors
-            if c.trust_signals.before_after_gallery
-        )
+        competitors_with_gallery = self.table.count('before_after_gallery')
 
         if competitors_with_gallery >= len(self.competitors) * 0.5:
             self._add_finding(
@@ -216,10 +206,7 @@ class ScoreStage:
 
     def _rule_warranty_guarantee(self):
         """Check warranty/guarantee language"""
-        competitors_with_warranty = sum(
-            1 for c in self.competitors
-            if c.trust_signals.warranty_guarantee_language
-        )
+        competitors_with_warranty = self.table.count('warranty_language')
 
         if competitors_with_warranty >= len(self.competitors) * 0.5:
             self._add_finding(
@@ -232,10 +219,7 @@ class ScoreStage:
 
     def _rule_team_visibility(self):
         """Check team/owner visibility"""
-        competitors_with_team = sum(
-            1 for c in self.competitors
-            if c.trust_signals.team_photos or c.trust_signals.owner_visible
-        )
+        competitors_with_team = self.table.count('team_visible')
 
         if competitors_with_team >= len(self.competitors) * 0.4:
             self._add_finding(
@@ -257,10 +241,7 @@ class ScoreStage:
 
     def _rule_sticky_cta(self):
         """Check sticky CTA presence"""
-        competitors_with_sticky = sum(
-            1 for c in self.competitors
-            if c.conversion_mechanics.sticky_cta or c.conversion_mechanics.sticky_call
-        )
+        competitors_with_sticky = self.table.count('sticky_cta')
 
         if competitors_with_sticky >= len(self.competitors) * 0.5:
             self._add_finding(
@@ -274,10 +255,7 @@ class ScoreStage:
 
     def _rule_chat_widget(self):
         """Check chat widget adoption"""
-        competitors_with_chat = sum(
-            1 for c in self.competitors
-            if c.conversion_mechanics.chat_widget
-        )
+        competitors_with_chat = self.table.count('chat_widget')
 
         if competitors_with_chat >= 2:
             self._add_finding(
@@ -290,14 +268,8 @@ class ScoreStage:
 
     def _rule_form_friction(self):
         """Analyze form friction across competitors"""
-        form_lengths = [
-            c.conversion_mechanics.form_length
-            for c in self.competitors
-            if c.conversion_mechanics.form_length
-        ]
-
-        if form_lengths:
-            avg_length = sum(form_lengths) / len(form_lengths)
+        avg_length = self.table.mean('form_length')
+        if avg_length is not None:
             self._add_finding(
                 finding_type=FindingType.PATTERN,
                 category=FindingCategory.CONVERSION,
@@ -309,10 +281,7 @@ class ScoreStage:
 
     def _rule_phone_prominence(self):
         """Check phone prominence patterns"""
-        competitors_phone_clickable = sum(
-            1 for c in self.competitors
-            if c.conversion_mechanics.phone_clickable
-        )
+        competitors_phone_clickable = self.table.count('phone_clickable')
 
         if competitors_phone_clickable >= len(self.competitors) * 0.8:
             self._add_finding(
@@ -332,7 +301,7 @@ class ScoreStage:
 
     def _rule_service_page_depth(self):
         """Analyze service page content depth"""
-        for comp in self.competitors:
+        for comp in self.table.profiles('deep_service_pages'):
             for page in comp.seo_structure.service_pages:
                 if page.word_count and page.word_count > 1500:
                     self._add_finding(
@@ -346,10 +315,7 @@ class ScoreStage:
 
     def _rule_blog_activity(self):
         """Check blog activity patterns"""
-        active_blogs = sum(
-            1 for c in self.competitors
-            if c.seo_structure.blog_active
-        )
+        active_blogs = self.table.count('blog_active')
 
         if active_blogs >= len(self.competitors) * 0.3:
             self._add_finding(
@@ -369,14 +335,8 @@ class ScoreStage:
 
     def _rule_authority_gap(self):
         """Check domain authority gaps"""
-        authorities = [
-            c.backlinks.domain_authority
-            for c in self.competitors
-            if c.backlinks.domain_authority
-        ]
-
-        if authorities:
-            avg_authority = sum(authorities) / len(authorities)
+        avg_authority = self.table.mean('domain_authority')
+        if avg_authority is not None:
             self._add_finding(
                 finding_type=FindingType.PATTERN,
                 category=FindingCategory.BACKLINKS,
@@ -400,34 +360,33 @@ class ScoreStage:
 
     def _rule_service_area_coverage(self):
         """Check service area page coverage"""
-        for comp in self.competitors:
-            if comp.seo_structure.service_area_pages:
-                count = len(comp.seo_structure.service_area_pages)
-                if count >= 5:
-                    self._add_finding(
-                        finding_type=FindingType.PATTERN,
-                        category=FindingCategory.LOCAL_SEO,
-                        observation=f"{comp.domain} has {count} service area pages",
-                        severity=Severity.HIGH,
-                        competitor_refs=[comp.id],
-                        rule_id="service_area_coverage"
-                    )
+        for row in self.table.rows('service_area_pages'):
+            count = self.table.value('service_area_pages', row)
+            if count >= 5:
+                comp = self.table.competitors[row]
+                self._add_finding(
+                    finding_type=FindingType.PATTERN,
+                    category=FindingCategory.LOCAL_SEO,
+                    observation=f"{comp.domain} has {count} service area pages",
+                    severity=Severity.HIGH,
+                    competitor_refs=[comp.id],
+                    rule_id="service_area_coverage"
+                )
 
     def _rule_grid_rankings(self):
         """Analyze grid/local pack rankings"""
-        for comp in self.competitors:
-            if comp.grid_performance:
-                avg_rank = sum(comp.grid_performance.values()) / len(comp.grid_performance)
-                if avg_rank <= 3:
-                    self._add_finding(
-                        finding_type=FindingType.THREAT,
-                        category=FindingCategory.LOCAL_SEO,
-                        observation=f"{comp.domain} dominates local pack (avg rank: {avg_rank:.1f})",
-                        severity=Severity.CRITICAL,
-                        competitor_refs=[comp.id],
-                        data_points=DataPoints(competitor_values={comp.domain: avg_rank}),
-                        rule_id="grid_threat"
-                    )
+        for row in self.table.rows('avg_grid_rank', at_most=3):
+            comp = self.table.competitors[row]
+            avg_rank = self.table.value('avg_grid_rank', row)
+            self._add_finding(
+                finding_type=FindingType.THREAT,
+                category=FindingCategory.LOCAL_SEO,
+                observation=f"{comp.domain} dominates local pack (avg rank: {avg_rank:.1f})",
+                severity=Severity.CRITICAL,
+                competitor_refs=[comp.id],
+                data_points=DataPoints(competitor_values={comp.domain: avg_rank}),
+                rule_id="grid_threat"
+            )
 
     # ==================== STRUCTURE RULES ====================
 
@@ -455,7 +414,7 @@ class ScoreStage:
 
     def _rule_schema_usage(self):
         """Check schema markup usage"""
-        for comp in self.competitors:
+        for comp in self.table.profiles('schema_markup'):
             if comp.seo_structure.schema_markup:
                 self._add_finding(
                     finding_type=FindingType.PATTERN,
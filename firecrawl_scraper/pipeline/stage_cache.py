@@ -0,0 +1,154 @@
+"""
+Stage cache for incremental pipeline re-runs
+
+Stage outputs are stored under a fingerprint of the stage's inputs
+(client config, matrix, profiles, ...). A re-run with unchanged inputs
+loads the previous output instead of recomputing it:
+
+- Stage 1 (plan): keyed by the client config
+- Stage 3 (normalize): one entry per competitor, keyed by its sources
+- Stage 4 (score): keyed by client config + competitor profiles
+- Stage 5 (export): keyed by client config + matrix + insights
+
+Stage 2 is not memoized by hash - collected data goes stale with time,
+not with inputs. Its previous sources are kept per client instead, and
+CollectStage re-collects only what `Source.needs_refresh` flags or what
+the current matrix newly asks for.
+
+Entries are gzip-compressed JSON, written atomically.
+
+Usage:
+    cache = StageCache('./output/_stage_cache')
+    key = fingerprint('plan', client)
+    cached = cache.get('plan', key)
+    if cached is None:
+        cache.set('plan', key, matrix.model_dump(mode='json'))
+"""
+
+import gzip
+import hashlib
+import json
+import logging
+import os
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+from ..models import Source
+from .source_store import SourceStore
+
+logger = logging.getLogger(__name__)
+
+
+# Bump when stage logic changes so older entries stop matching
+CACHE_VERSION = 1
+
+# Timestamps of when an object was built, not what it contains
+VOLATILE_FIELDS = frozenset({
+    'created_at', 'updated_at', 'generated_at', 'analyzed_at', 'discovered_at', 'last_updated',
+})
+
+
+def _canonical(value: Any) -> Any:
+    """JSON-ready form of a value with volatile timestamps removed"""
+    if hasattr(value, 'model_dump'):
+        value = value.model_dump(mode='json')
+    if isinstance(value, dict):
+        return {str(k): _canonical(v) for k, v in value.items() if k not in VOLATILE_FIELDS}
+    if isinstance(value, (list, tuple)):
+        return [_canonical(v) for v in value]
+    return value
+
+
+def fingerprint(*parts: Any) -> str:
+    """SHA256 over the canonical JSON of all parts (models, dicts, lists, scalars)"""
+    canonical = json.dumps(
+        [CACHE_VERSION, *(_canonical(part) for part in parts)],
+        sort_keys=True,
+        separators=(',', ':'),
+        default=str
+    )
+    return hashlib.sha256(canonical.encode('utf-8')).hexdigest()
+
+
+class StageCache:
+    """On-disk store of stage outputs keyed by input fingerprints"""
+
+    def __init__(self, cache_dir: str):
+        """
+        Args:
+            cache_dir: Directory for cache entries (created if missing)
+        """
+        self.cache_dir = Path(cache_dir)
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self.stats = {'hits': 0, 'misses': 0, 'writes': 0}
+
+    # ========================================================================
+    # STAGE OUTPUTS
+    # ========================================================================
+
+    def get(self, stage: str, key: str) -> Optional[Any]:
+        """Stored output for a stage and input fingerprint, or None"""
+        data = self._read(self._path(stage, key))
+        self.stats['hits' if data is not None else 'misses'] += 1
+        return data
+
+    def set(self, stage: str, key: str, data: Any) -> None:
+        """Store a stage output (must be JSON-serializable)"""
+        if self._write(self._path(stage, key), data):
+            self.stats['writes'] += 1
+
+    # ========================================================================
+    # COLLECTED SOURCES
+    # ========================================================================
+
+    def load_sources(self, client_id: str, payload_path: Optional[str] = None) -> Optional[SourceStore]:
+        """Sources collected by the client's previous run, or None"""
+        data = self._read(self._path('collect', client_id))
+        if data is None:
+            return None
+        store = SourceStore(payload_path)
+        for item in data:
+            store.add_source(Source.model_validate(item))
+        return store
+
+    def save_sources(self, client_id: str, sources: SourceStore) -> None:
+        """Keep the client's collected sources (with raw payloads) for the next run"""
+        data = [
+            sources.get(row, with_raw=True).model_dump(mode='json')
+            for row in range(len(sources))
+        ]
+        self._write(self._path('collect', client_id), data)
+
+    def get_stats(self) -> Dict:
+        return {'cache_dir': str(self.cache_dir), **self.stats}
+
+    # ========================================================================
+    # FILES
+    # ========================================================================
+
+    def _path(self, stage: str, key: str) -> Path:
+        return self.cache_dir / stage / f"{key}.json.gz"
+
+    @staticmethod
+    def _read(path: Path) -> Optional[Any]:
+        if not path.exists():
+            return None
+        try:
+            with gzip.open(path, 'rt', encoding='utf-8') as f:
+                return json.load(f)
+        except (OSError, ValueError) as e:
+            logger.warning(f"Ignoring unreadable stage cache entry {path.name}: {e}")
+            return None
+
+    @staticmethod
+    def _write(path: Path, data: Any) -> bool:
+        tmp_path = path.with_suffix('.tmp')
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            with gzip.open(tmp_path, 'wt', encoding='utf-8') as f:
+                json.dump(data, f, default=str)
+            os.replace(tmp_path, path)
+            return True
+        except (OSError, TypeError, ValueError) as e:
+            logger.warning(f"Failed to write stage cache entry {path.name}: {e}")
+            return False
@@ -0,0 +1,29 @@
+"""
+Shared pytest setup
+
+Config requires FIRECRAWL_API_KEY at import time; tests never reach the
+real API, so a placeholder key is enough. Config.OUTPUT_DIR (and the
+directories and log file derived from it at import) points at a
+temporary directory, so test runs never write into the repo's data/.
+"""
+
+import os
+import shutil
+import sys
+import tempfile
+from pathlib import Path
+
+import pytest
+
+os.environ.setdefault('FIRECRAWL_API_KEY', 'fc-test-key')
+
+TEST_OUTPUT_DIR = tempfile.mkdtemp(prefix='firecrawl-tests-')
+os.environ['FIRECRAWL_OUTPUT_DIR'] = TEST_OUTPUT_DIR
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+
+@pytest.fixture(scope='session', autouse=True)
+def _remove_test_output_dir():
+    yield
+    shutil.rmtree(TEST_OUTPUT_DIR, ignore_errors=True)
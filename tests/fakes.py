@@ -0,0 +1,109 @@
+"""
+In-process stand-ins for the Firecrawl job API
+
+FakeFirecrawlAPI replaces EnhancedFirecrawlClient._execute_with_retry.
+Jobs started with POST /crawl or /batch/scrape complete `step` documents
+per status poll; status responses honour `skip` and page their data
+through absolute `next` URLs, like the v2 API.
+"""
+
+import asyncio
+import itertools
+from urllib.parse import parse_qs, urlparse
+
+from firecrawl_scraper.core.firecrawl_client import EnhancedFirecrawlClient
+
+BASE_URL = EnhancedFirecrawlClient.BASE_URL
+
+
+class FakeFirecrawlAPI:
+
+    def __init__(self, step: int = 2, page_size: int = 1000, delay: float = 0.0, fail_urls=()):
+        """
+        Args:
+            step: Documents a job completes per status poll
+            page_size: Documents per status response before `next` is set
+            delay: Seconds each request takes
+            fail_urls: Batch jobs containing any of these URLs end 'failed'
+        """
+        self.step = step
+        self.page_size = page_size
+        self.delay = delay
+        self.fail_urls = set(fail_urls)
+        self.jobs = {}
+        self.requests = []
+        self.documents_sent = 0
+        self.running = 0
+        self.peak_running = 0
+        self._ids = itertools.count(1)
+
+    def install(self, client: EnhancedFirecrawlClient) -> EnhancedFirecrawlClient:
+        client._execute_with_retry = self.execute
+        return client
+
+    async def execute(self, endpoint, payload, method='POST', credits=0, **_):
+        self.requests.append((method, endpoint))
+        if self.delay:
+            await asyncio.sleep(self.delay)
+
+        if method == 'POST' and endpoint in ('/crawl', '/batch/scrape'):
+            return self._start(endpoint, payload)
+        if method == 'DELETE':
+            self.jobs[endpoint.rsplit('/', 1)[-1]]['status'] = 'cancelled'
+            return {'success': True}
+        return self._status(endpoint)
+
+    def _start(self, endpoint, payload):
+        job_id = f'job-{next(self._ids)}'
+        if endpoint == '/crawl':
+            urls = [f"{payload['url'].rstrip('/')}/page-{i}" for i in range(payload.get('limit', 100))]
+        else:
+            urls = list(payload['urls'])
+        self.jobs[job_id] = {
+            'endpoint': endpoint,
+            'docs': [{'markdown': f'# {url}', 'metadata': {'sourceURL': url}} for url in urls],
+            'completed': 0,
+            'status': 'scraping',
+            'failed': bool(self.fail_urls & set(urls))
+        }
+        self.running += 1
+        self.peak_running = max(self.peak_running, self.running)
+        return {'success': True, 'id': job_id}
+
+    def _status(self, endpoint):
+        parsed = urlparse(endpoint)
+        job_id = parsed.path.rstrip('/').rsplit('/', 1)[-1]
+        skip = int(parse_qs(parsed.query).get('skip', ['0'])[0])
+        job = self.jobs[job_id]
+
+        if not parsed.netloc and job['status'] == 'scraping':
+            # A status poll (not a `next` page) advances the job
+            if job['failed']:
+                job['status'] = 'failed'
+            else:
+                job['completed'] = min(len(job['docs']), job['completed'] + self.step)
+                if job['completed'] == len(job['docs']):
+                    job['status'] = 'completed'
+            if job['status'] != 'scraping':
+                self.running -= 1
+
+        page = job['docs'][skip:min(job['completed'], skip + self.page_size)]
+        self.documents_sent += len(page)
+        response = {
+            'success': True,
+            'status': job['status'],
+            'total': len(job['docs']),
+            'completed': job['completed'],
+            'data': page
+        }
+        if skip + len(page) < job['completed']:
+            response['next'] = f"{BASE_URL}{parsed.path}?skip={skip + len(page)}"
+        return response
+
+
+def make_client(api: FakeFirecrawlAPI, **kwargs) -> EnhancedFirecrawlClient:
+    """Client with fast polling whose HTTP layer is `api`"""
+    kwargs.setdefault('poll_min_interval', 0.001)
+    kwargs.setdefault('poll_max_interval', 0.01)
+    kwargs.setdefault('retry_delay', 1)
+    return api.install(EnhancedFirecrawlClient(api_key='fc-test', **kwargs))
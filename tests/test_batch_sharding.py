@@ -0,0 +1,61 @@
+"""
+Tests for sharded batch scraping (EnhancedFirecrawlClient.batch_scrape_sharded)
+"""
+
+import asyncio
+
+from tests.fakes import FakeFirecrawlAPI, make_client
+
+
+def urls(count):
+    return [f'https://example.com/{i}' for i in range(count)]
+
+
+def slow_jobs(api, delays):
+    """Make status polls of the given jobs take {job_id: seconds}"""
+    async def execute(endpoint, payload, method='POST', credits=0, **kwargs):
+        await asyncio.sleep(delays.get(endpoint.rsplit('/', 1)[-1], 0))
+        return await api.execute(endpoint, payload, method, credits, **kwargs)
+    return execute
+
+
+def test_results_are_yielded_in_shard_order():
+    api = FakeFirecrawlAPI(step=5)
+    client = make_client(api)
+    client._execute_with_retry = slow_jobs(api, {'job-1': 0.02})
+
+    result = asyncio.run(client.batch_scrape(urls(25), shard_size=10, max_concurrent_shards=3))
+
+    assert [doc['metadata']['sourceURL'] for doc in result['data']] == urls(25)
+    assert result['shards'] == 3
+    assert result['creditsUsed'] == 25
+    assert api.peak_running == 3
+
+
+def test_budget_counts_shards_that_finish_out_of_order():
+    api = FakeFirecrawlAPI(step=10)
+    client = make_client(api)
+    # Shard 2 finishes first; shard 3 is considered while shard 1 still runs
+    client._execute_with_retry = slow_jobs(api, {'job-1': 0.02, 'job-2': 0.1})
+
+    result = asyncio.run(client.batch_scrape(
+        urls(50), shard_size=10, max_concurrent_shards=3, max_credits=30
+    ))
+
+    assert result['creditsUsed'] == 30
+    assert len(api.jobs) == 3
+    assert result['skipped_urls'] == urls(50)[30:]
+    assert result['success'] is False
+
+
+def test_failed_shard_is_retried_alone_then_reported():
+    api = FakeFirecrawlAPI(step=10, fail_urls={'https://example.com/12'})
+    client = make_client(api)
+
+    result = asyncio.run(client.batch_scrape(urls(30), shard_size=10, shard_retries=1))
+
+    assert len(result['data']) == 20
+    assert [shard['index'] for shard in result['failed_shards']] == [1]
+    assert result['failed_shards'][0]['urls'] == urls(30)[10:20]
+    # Two shards once, the failing shard twice
+    assert len(api.jobs) == 4
@@ -0,0 +1,123 @@
+"""
+Tests for the SQLite ChangeTracker store (core/change_store.py)
+"""
+
+import hashlib
+import json
+import sqlite3
+
+from firecrawl_scraper.core.change_store import ChangeStore
+
+
+def legacy_file(directory, url, snapshots=3, changes=1, **fields):
+    """Write one file of the pre-SQLite one-JSON-per-URL layout"""
+    data = {
+        'url': url,
+        'check_interval': 3600,
+        'last_checked': '2024-01-02T03:04:05',
+        'last_hash': f'hash-{snapshots - 1}',
+        'last_content_length': 42,
+        'change_count': changes,
+        'snapshots': [
+            {'url': url, 'content_hash': f'hash-{i}', 'content_length': 40 + i,
+             'timestamp': f'2024-01-0{i + 1}T00:00:00', 'markdown_preview': f'v{i}'}
+            for i in range(snapshots)
+        ],
+        'changes': [
+            {'url': url, 'detected_at': '2024-01-02T00:00:00', 'previous_hash': 'hash-0',
+             'current_hash': 'hash-1', 'content_length_change': 1, 'diff_summary': 'changed'}
+            for _ in range(changes)
+        ],
+        **fields
+    }
+    path = directory / f"{hashlib.sha256(url.encode()).hexdigest()[:16]}.json"
+    path.write_text(json.dumps(data))
+    return path
+
+
+def test_tracked_url_upsert_and_listing(tmp_path):
+    store = ChangeStore(tmp_path / 'tracking.db')
+    store.upsert_tracked({'url': 'https://a.example', 'check_interval': 60})
+    store.upsert_tracked({'url': 'https://b.example'})
+    store.upsert_tracked({'url': 'https://a.example', 'check_interval': 120, 'change_count': 2})
+
+    assert store.list_urls() == ['https://a.example', 'https://b.example']
+    assert store.get_tracked('https://a.example')['check_interval'] == 120
+    assert store.get_tracked('https://a.example')['change_count'] == 2
+    assert store.get_tracked('https://b.example')['check_interval'] == 86400
+    assert store.get_summary() == {'total_tracked': 2, 'total_changes_detected': 2, 'urls_with_changes': 1}
+    store.close()
+
+
+def test_snapshots_are_pruned_to_max(tmp_path):
+    store = ChangeStore(tmp_path / 'tracking.db', max_snapshots=3)
+    for i in range(5):
+        store.add_snapshot({'url': 'https://a.example', 'content_hash': f'h{i}',
+                            'content_length': i, 'timestamp': f't{i}'})
+
+    hashes = [s['content_hash'] for s in store.get_snapshots('https://a.example')]
+    assert hashes == ['h4', 'h3', 'h2']
+    store.close()
+
+
+def test_delete_url_removes_history(tmp_path):
+    store = ChangeStore(tmp_path / 'tracking.db')
+    store.upsert_tracked({'url': 'https://a.example'})
+    store.add_snapshot({'url': 'https://a.example', 'content_hash': 'h', 'content_length': 1, 'timestamp': 't'})
+    store.add_change({'url': 'https://a.example', 'detected_at': 't', 'previous_hash': 'g',
+                      'current_hash': 'h', 'content_length_change': 1})
+
+    assert store.delete_url('https://a.example') is True
+    assert store.delete_url('https://a.example') is False
+    assert store.get_snapshots('https://a.example') == []
+    assert store.get_changes('https://a.example') == []
+    store.close()
+
+
+def test_json_migration_imports_once(tmp_path):
+    legacy_file(tmp_path, 'https://a.example', snapshots=12, changes=2)
+    legacy_file(tmp_path, 'https://b.example', snapshots=1, changes=0)
+    (tmp_path / 'broken.json').write_text('{not json')
+    (tmp_path / 'no_url.json').write_text('{}')
+
+    store = ChangeStore(tmp_path / 'tracking.db', max_snapshots=10)
+    assert store.migrate_json_dir(tmp_path) == 2
+
+    row = store.get_tracked('https://a.example')
+    assert row['check_interval'] == 3600
+    assert row['last_hash'] == 'hash-11'
+    assert row['change_count'] == 2
+    # Only the newest max_snapshots are kept
+    snapshots = store.get_snapshots('https://a.example', limit=20)
+    assert len(snapshots) == 10
+    assert snapshots[0]['content_hash'] == 'hash-11'
+    assert len(store.get_changes('https://a.example')) == 2
+
+    # Recorded as done: a second run imports nothing, force re-imports
+    legacy_file(tmp_path, 'https://c.example')
+    assert store.migrate_json_dir(tmp_path) == 0
+    assert not store.has_url('https://c.example')
+    assert store.migrate_json_dir(tmp_path, force=True) == 3
+    assert len(store.get_changes('https://a.example')) == 2  # Not duplicated
+    store.close()
+
+
+def test_opens_database_from_older_schema(tmp_path):
+    db_path = tmp_path / 'tracking.db'
+    conn = sqlite3.connect(str(db_path))
+    conn.execute(
+        "CREATE TABLE tracked_urls (url TEXT PRIMARY KEY, check_interval INTEGER NOT NULL DEFAULT 86400, "
+        "last_checked TEXT, last_hash TEXT, last_content_length INTEGER NOT NULL DEFAULT 0, "
+        "change_count INTEGER NOT NULL DEFAULT 0)"
+    )
+    conn.execute("INSERT INTO tracked_urls (url) VALUES ('https://old.example')")
+    conn.commit()
+    conn.close()
+
+    store = ChangeStore(db_path)
+    row = store.get_tracked('https://old.example')
+    assert row['consecutive_failures'] == 0
+    assert row['next_check_at'] is None
+    store.upsert_tracked({**row, 'next_check_at': 123.0})
+    assert store.get_tracked('https://old.example')['next_check_at'] == 123.0
+    store.close()
@@ -0,0 +1,172 @@
+"""
+Tests for ChangeTracker scheduling (core/change_tracker.py)
+
+The Firecrawl client is replaced by a fake `scrape` so no request leaves
+the process.
+"""
+
+import asyncio
+import time
+
+import pytest
+
+from firecrawl_scraper.core.change_tracker import ChangeTracker
+
+
+class FakeScraper:
+    """Stand-in for EnhancedFirecrawlClient.scrape with per-URL content"""
+
+    def __init__(self, delay: float = 0.01):
+        self.delay = delay
+        self.content = {}
+        self.failing = set()
+        self.calls = []
+        self.in_flight = 0
+        self.peak = 0
+
+    async def scrape(self, url, formats=None, cache_policy=None, **_):
+        self.calls.append(url)
+        self.in_flight += 1
+        self.peak = max(self.peak, self.in_flight)
+        try:
+            await asyncio.sleep(self.delay)
+        finally:
+            self.in_flight -= 1
+        if url in self.failing:
+            return {'success': False, 'error': 'HTTP 500'}
+        return {'success': True, 'data': {'markdown': self.content.get(url, f'# {url}')}}
+
+
+@pytest.fixture
+def tracker(tmp_path):
+    tracker = ChangeTracker(api_key='fc-test', storage_dir=tmp_path, max_concurrent=3, jitter=0)
+    tracker.client = FakeScraper()
+    yield tracker
+    tracker.close()
+
+
+def test_check_all_runs_due_urls_with_bounded_concurrency(tracker):
+    urls = [f'https://example.com/{i}' for i in range(10)]
+    for url in urls:
+        tracker.track_url(url, check_interval=3600)
+
+    asyncio.run(tracker.check_all_tracked())
+    assert sorted(tracker.client.calls) == sorted(urls)
+    assert tracker.client.peak <= 3
+
+    # Nothing is due again until the interval passes
+    tracker.client.calls.clear()
+    asyncio.run(tracker.check_all_tracked())
+    assert tracker.client.calls == []
+
+    asyncio.run(tracker.check_all_tracked(force=True))
+    assert len(tracker.client.calls) == 10
+
+
+def test_changes_are_returned_in_tracking_order(tracker):
+    urls = [f'https://example.com/{i}' for i in range(4)]
+    for url in urls:
+        tracker.track_url(url)
+    asyncio.run(tracker.check_all_tracked())
+
+    for url in reversed(urls):
+        tracker.client.content[url] = f'# {url}\n\nupdated'
+    changes = asyncio.run(tracker.check_all_tracked(force=True))
+
+    assert [change.url for change in changes] == urls
+
+
+def test_failing_url_backs_off_up_to_max(tracker):
+    url = 'https://example.com/down'
+    tracker.track_url(url, check_interval=100)
+    tracker.max_backoff = 500
+    tracker.client.failing.add(url)
+
+    delays = []
+    for _ in range(4):
+        before = time.time()
+        asyncio.run(tracker.check_url(url, force=True))
+        delays.append(tracker._get_tracked(url).next_check_at - before)
+
+    assert tracker._get_tracked(url).consecutive_failures == 4
+    assert delays[0] == pytest.approx(200, abs=1)
+    assert delays[1] == pytest.approx(400, abs=1)
+    assert delays[2] == pytest.approx(500, abs=1)  # capped
+    assert delays[3] == pytest.approx(500, abs=1)
+
+    # Recovery resets the failure count and returns to the normal interval
+    tracker.client.failing.clear()
+    before = time.time()
+    asyncio.run(tracker.check_url(url, force=True))
+    tracked = tracker._get_tracked(url)
+    assert tracked.consecutive_failures == 0
+    assert tracked.next_check_at - before == pytest.approx(100, abs=1)
+
+
+def test_schedule_persists_across_instances(tmp_path):
+    first = ChangeTracker(api_key='fc-test', storage_dir=tmp_path, jitter=0)
+    first.client = FakeScraper()
+    first.track_url('https://example.com/a', check_interval=3600)
+    first.track_url('https://example.com/b', check_interval=3600)
+    asyncio.run(first.check_url('https://example.com/a', force=True))
+    first.close()
+
+    second = ChangeTracker(api_key='fc-test', storage_dir=tmp_path, jitter=0)
+    second.client = FakeScraper()
+    asyncio.run(second.check_all_tracked())
+    assert second.client.calls == ['https://example.com/b']
+    second.close()
+
+
+def test_monitor_checks_due_urls_each_cycle(tracker):
+    for i in range(3):
+        tracker.track_url(f'https://example.com/{i}', check_interval=3600)
+
+    asyncio.run(tracker.monitor_continuously(interval=1, max_iterations=1))
+
+    assert len(tracker.client.calls) == 3
+    assert tracker._schedule is None
+
+
+def test_url_untracked_mid_monitor_stays_untracked(tracker):
+    kept, dropped = 'https://example.com/kept', 'https://example.com/dropped'
+    tracker.track_url(kept, check_interval=0.05)
+    tracker.track_url(dropped, check_interval=0.05)
+    tracker.client.delay = 0.02
+
+    async def run():
+        monitor = asyncio.ensure_future(tracker.monitor_continuously(interval=1, max_iterations=3))
+        while dropped not in tracker.client.calls:
+            await asyncio.sleep(0.001)
+        tracker.untrack_url(dropped)  # Its first check is still in flight
+        await monitor
+
+    asyncio.run(run())
+
+    assert tracker.client.calls.count(kept) == 3
+    assert tracker.client.calls.count(dropped) == 1
+    assert tracker.get_tracked_urls() == [kept]
+    assert tracker.get_snapshots(dropped) == []
+
+
+def test_due_urls_come_from_the_next_check_index(tracker):
+    now = time.time()
+    for i, due_in in enumerate([-10, 100, -20]):
+        tracker.track_url(f'https://example.com/{i}')
+        tracker._get_tracked(f'https://example.com/{i}').next_check_at = now + due_in
+        tracker._save_tracking_data(f'https://example.com/{i}')
+    tracker.track_url('https://example.com/new')  # Never checked: due now
+
+    assert [row[0] for row in tracker.store.iter_due(now)] == [
+        'https://example.com/new', 'https://example.com/2', 'https://example.com/0'
+    ]
+    plan = tracker.store.conn.execute(
+        "EXPLAIN QUERY PLAN SELECT url FROM tracked_urls "
+        "WHERE next_check_at IS NULL OR next_check_at <= ? ORDER BY next_check_at, rowid", (now,)
+    ).fetchall()
+    assert any('idx_tracked_next_check' in str(tuple(row)) for row in plan)
+
+    asyncio.run(tracker.check_all_tracked())
+    assert sorted(tracker.client.calls) == [
+        'https://example.com/0', 'https://example.com/2', 'https://example.com/new'
+    ]
@@ -0,0 +1,143 @@
+"""
+Tests for concurrent collection in pipeline/stage_2_collect.py
+(CollectStage._collect_dataforseo_data and the competitor scrapes after it)
+"""
+
+import asyncio
+import itertools
+
+from firecrawl_scraper.models import GeoBucket, IntentGeoMatrix, MatrixCell, MatrixColumn, ScrapeStatus, SourceType
+from firecrawl_scraper.pipeline.stage_2_collect import CollectStage
+
+KEYWORDS = ['drain cleaning', 'water heater', 'sewer repair']
+LOCATIONS = ['Austin, TX', 'Round Rock, TX']
+DOMAINS = ['alpha', 'bravo', 'charlie', 'delta']
+
+
+def make_matrix():
+    return IntentGeoMatrix(
+        client_id='client',
+        columns=[MatrixColumn(geo_bucket=GeoBucket.BUCKET_0_10, label='Primary', locations=LOCATIONS)],
+        cells=[MatrixCell(service_id='s1', geo_bucket='0-10', keyword_cluster=KEYWORDS)]
+    )
+
+
+class InFlight:
+    """Counts concurrent calls; later calls finish sooner"""
+
+    def __init__(self):
+        self.running = 0
+        self.peak_running = 0
+        self._calls = itertools.count()
+
+    async def call(self):
+        delay = 0.02 / (next(self._calls) + 1)
+        self.running += 1
+        self.peak_running = max(self.peak_running, self.running)
+        try:
+            await asyncio.sleep(delay)
+        finally:
+            self.running -= 1
+
+
+class FakeDataForSEO(InFlight):
+    """
+    Live SERP and local finder calls. The SERP batch sends one query per
+    POST under the caller's semaphore, like batch_request on a live endpoint.
+    """
+
+    def __init__(self, fail_tags=(), fail_keywords=()):
+        super().__init__()
+        self.fail_tags = set(fail_tags)
+        self.fail_keywords = set(fail_keywords)
+
+    async def serp_google_organic_batch(self, queries, language_code, device, semaphore, queued):
+        async def send(i, query):
+            async with semaphore:
+                await self.call()
+            if query['tag'] in self.fail_tags:
+                return {'success': False, 'error': 'HTTP 500'}
+            slug = f"{query['keyword']}-{query['location_name']}".lower().replace(', ', '-').replace(' ', '-')
+            return {'success': True, 'items': [
+                {'url': f'https://{DOMAINS[(i + n) % len(DOMAINS)]}.example/{slug}', 'position': n + 1}
+                for n in range(2)
+            ]}
+
+        responses = await asyncio.gather(*[send(i, query) for i, query in enumerate(queries)])
+        return {query['tag']: response for query, response in zip(queries, responses)}
+
+    async def serp_google_local_finder(self, keyword, language_code):
+        await self.call()
+        if keyword in self.fail_keywords:
+            raise RuntimeError('connection reset')
+        return {'items': [{'url': f'https://{domain}.example/', 'position': n + 1, 'title': domain}
+                          for n, domain in enumerate(DOMAINS[:2])]}
+
+
+class FakeFirecrawl(InFlight):
+
+    def __init__(self, fail_domains=()):
+        super().__init__()
+        self.fail_domains = set(fail_domains)
+
+    async def scrape(self, url, formats, only_main_content):
+        await self.call()
+        if any(f'//{domain}.' in url for domain in self.fail_domains):
+            raise RuntimeError('HTTP 502')
+        return {'markdown': f'# {url}'}
+
+    async def crawl(self, url, max_depth, limit, scrape_options):
+        await self.call()
+        return {'data': [{'url': f'{url}#about', 'markdown': 'About us'}]}
+
+
+def collect(dataforseo, firecrawl, **kwargs):
+    stage = CollectStage(make_matrix(), dataforseo_client=dataforseo, firecrawl_client=firecrawl, **kwargs)
+    return asyncio.run(stage.run())
+
+
+def rows(sources):
+    return [(sources.source_type(row), sources.url(row), sources.keywords(row),
+             [tag.full_name for tag in sources.geo_tags(row)], sources.scrape_status(row))
+            for row in range(len(sources))]
+
+
+def test_per_api_semaphores_cap_in_flight_calls():
+    dataforseo, firecrawl = FakeDataForSEO(), FakeFirecrawl()
+    collect(dataforseo, firecrawl, dataforseo_concurrency=2, firecrawl_concurrency=3)
+
+    assert dataforseo.peak_running == 2
+    assert firecrawl.peak_running == 3
+
+
+def test_sources_match_sequential_collection():
+    concurrent = collect(FakeDataForSEO(), FakeFirecrawl(), dataforseo_concurrency=5, firecrawl_concurrency=3)
+    sequential = collect(FakeDataForSEO(), FakeFirecrawl(), dataforseo_concurrency=1, firecrawl_concurrency=1)
+
+    assert rows(concurrent) == rows(sequential)
+    assert [row[0] for row in rows(concurrent)[:12]] == [SourceType.SERP_ORGANIC] * 12
+    assert [row[2] for row in rows(concurrent)[:12:4]] == [(keyword,) for keyword in KEYWORDS]
+    assert [row[3] for row in rows(concurrent)[:4:2]] == [[location] for location in LOCATIONS]
+    assert concurrent.domains() == [f'{domain}.example' for domain in DOMAINS]
+
+
+def test_one_failing_call_does_not_drop_the_others():
+    sources = collect(
+        FakeDataForSEO(fail_tags={'1'}, fail_keywords={'water heater'}),
+        FakeFirecrawl(fail_domains={'charlie'})
+    )
+
+    organic = sources.rows_for_type(SourceType.SERP_ORGANIC)
+    assert len(organic) == 10  # 5 of 6 queries, 2 results each
+    assert ('drain cleaning',) in {sources.keywords(row) for row in organic}
+    local = sources.rows_for_type(SourceType.SERP_LOCAL_PACK)
+    assert [sources.keywords(row) for row in local] == [('drain cleaning',)] * 2 + [('sewer repair',)] * 2
+
+    websites = sources.rows_for_type(SourceType.COMPETITOR_WEBSITE)
+    assert [(sources.domain(row), sources.scrape_status(row)) for row in websites] == [
+        ('alpha.example', ScrapeStatus.SUCCESS),
+        ('bravo.example', ScrapeStatus.SUCCESS),
+        ('charlie.example', ScrapeStatus.FAILED),
+        ('delta.example', ScrapeStatus.SUCCESS),
+    ]
+    assert len(sources.rows_for_type(SourceType.COMPETITOR_PAGE)) == 3
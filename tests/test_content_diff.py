@@ -0,0 +1,114 @@
+"""
+Tests for block-level diffing and stored snapshot content
+(core/content_diff.py, core/change_store.py blobs, ChangeTracker.diff_snapshots)
+"""
+
+import asyncio
+import random
+import string
+
+from firecrawl_scraper.core.change_store import ChangeStore
+from firecrawl_scraper.core.change_tracker import ChangeTracker
+from firecrawl_scraper.core.content_diff import diff_blocks, format_diff, split_blocks, summarize_diff
+
+
+def paragraphs(count, seed=0):
+    rng = random.Random(seed)
+    return [''.join(rng.choices(string.ascii_lowercase + ' ', k=80)) for _ in range(count)]
+
+
+def test_split_blocks_cuts_long_paragraphs_stably():
+    text = ''.join(random.Random(1).choices(string.ascii_letters + ' ', k=20000))
+    blocks = split_blocks(f"intro\n\n{text}\n\n\noutro", max_block=1024)
+
+    assert blocks[0] == 'intro' and blocks[-1] == 'outro'
+    assert all(len(block) <= 1024 for block in blocks)
+    assert ''.join(blocks[1:-1]) == text
+
+    # A local insertion only disturbs the blocks around it
+    edited = text[:10000] + 'INSERTED' + text[10000:]
+    before = split_blocks(text, max_block=1024)
+    after = split_blocks(edited, max_block=1024)
+    assert len(set(before) & set(after)) >= len(before) - 2
+
+
+def test_diff_and_summary_of_edited_document():
+    old = paragraphs(6)
+    new = old[:1] + ['brand new'] + old[1:3] + ['rewritten'] + old[4:5]
+
+    ops = diff_blocks('\n\n'.join(old), '\n\n'.join(new))
+    assert summarize_diff(ops) == {
+        'blocks_added': 1, 'blocks_removed': 1, 'blocks_changed': 1,
+        'chars_added': len('brand new') + len('rewritten'),
+        'chars_removed': len(old[3]) + len(old[5])
+    }
+
+    rendered = format_diff(ops, context=1).split('\n')
+    assert '+ brand new' in rendered
+    assert '- ' + old[3] in rendered and '+ rewritten' in rendered
+    assert '- ' + old[5] in rendered
+
+
+def test_format_diff_elides_unchanged_runs():
+    old = paragraphs(10)
+    new = old[:5] + ['changed'] + old[6:]
+
+    rendered = format_diff(diff_blocks('\n\n'.join(old), '\n\n'.join(new)), context=1).split('\n')
+    assert rendered == ['@@', '  ' + old[4], '- ' + old[5], '+ changed', '  ' + old[6], '@@']
+    assert format_diff(diff_blocks('same', 'same')) == ''
+
+
+def test_blobs_are_shared_and_pruned_with_their_snapshots(tmp_path):
+    store = ChangeStore(tmp_path / 'tracking.db', max_snapshots=2)
+
+    def snapshot(url, content_hash):
+        return {'url': url, 'content_hash': content_hash, 'content_length': 1, 'timestamp': 't'}
+
+    store.add_snapshot(snapshot('https://a.example', 'h1'), 'one')
+    store.add_snapshot(snapshot('https://b.example', 'h1'), 'one')  # same content, one blob
+    store.add_snapshot(snapshot('https://a.example', 'h2'), 'two')
+    assert store.get_blob_stats()['blobs'] == 2
+
+    # 'h1' drops out of a's history but b still references it
+    store.add_snapshot(snapshot('https://a.example', 'h3'), 'three')
+    assert store.get_blob('h1') == 'one'
+
+    store.delete_url('https://b.example')
+    assert store.get_blob('h1') is None
+    assert store.get_blob('h2') == 'two'
+    stats = store.get_blob_stats()
+    assert stats['blobs'] == 2
+    assert stats['content_bytes'] == len('two') + len('three')
+    store.close()
+
+
+class FakeScraper:
+    def __init__(self):
+        self.content = ''
+
+    async def scrape(self, url, **_):
+        return {'success': True, 'data': {'markdown': self.content}}
+
+
+def test_tracker_records_and_diffs_full_content(tmp_path):
+    tracker = ChangeTracker(api_key='fc-test', storage_dir=tmp_path, jitter=0)
+    tracker.client = FakeScraper()
+    url = 'https://example.com'
+    old = paragraphs(5)
+
+    tracker.client.content = '\n\n'.join(old)
+    assert asyncio.run(tracker.check_url(url, force=True)) is None
+    assert tracker.diff_snapshots(url) is None  # Only one snapshot yet
+
+    tracker.client.content = '\n\n'.join(old[:2] + ['changed'] + old[3:])
+    change = asyncio.run(tracker.check_url(url, force=True))
+    assert '1 blocks changed' in change.diff_summary
+    assert '+ changed' in change.full_diff
+
+    diff = tracker.diff_snapshots(url)
+    assert diff['from_hash'] == change.previous_hash
+    assert diff['to_hash'] == change.current_hash
+    assert diff['blocks_changed'] == 1
+    assert '- ' + old[2] in diff['diff']
+    assert tracker.diff_snapshots(url, from_hash='unknown') is None
+    tracker.close()
@@ -0,0 +1,120 @@
+"""
+Tests for multi-task DataForSEO batching (DataForSEOClient.batch_request and
+_split_batch_response)
+"""
+
+import asyncio
+
+from firecrawl_scraper.core.dataforseo_client import DataForSEOClient
+
+LIVE = '/serp/google/organic/live/advanced'
+TASK_POST = '/serp/google/organic/task_post'
+
+
+class FakeBatchAPI(DataForSEOClient):
+    """
+    Echoes each posted task back with its tag.
+
+    Args:
+        reverse: Return a chunk's results in reverse order
+        drop_tags: Leave these tasks out of the response
+        fail_tags: Fail the whole POST if it carries one of these tasks
+    """
+
+    def __init__(self, reverse=False, drop_tags=(), fail_tags=()):
+        super().__init__(login='batch@example.com', password='secret')
+        self.reverse = reverse
+        self.drop_tags = set(drop_tags)
+        self.fail_tags = set(fail_tags)
+        self.posts = []
+
+    async def _send(self, endpoint, method, data, cost_key):
+        self.posts.append([task['tag'] for task in data])
+        await asyncio.sleep(0.001)
+
+        if self.fail_tags & {task['tag'] for task in data}:
+            return {'success': False, 'error': 'HTTP 500', 'status_code': 500}
+        tasks = [{'id': f"id-{task['tag']}", 'status_code': 20000, 'status_message': 'Ok.', 'cost': 0.002,
+                  'data': dict(task), 'result': [{'keyword': task['keyword']}]}
+                 for task in data if task['tag'] not in self.drop_tags]
+        if self.reverse:
+            tasks.reverse()
+        return {'success': True, 'cost': 0.002 * len(tasks), 'data': tasks}
+
+
+def keywords(count):
+    return [{'keyword': f'kw{i}', 'location_name': 'Austin,Texas,United States'} for i in range(count)]
+
+
+def batch(api, endpoint, tasks, **kwargs):
+    return asyncio.run(api.batch_request(endpoint, tasks, queued=False, **kwargs))
+
+
+def result_keyword(response):
+    return response['data'][0]['result'][0]['keyword']
+
+
+def test_tasks_are_chunked_at_the_endpoint_task_limit():
+    api = FakeBatchAPI()
+    results = batch(api, TASK_POST, keywords(250))
+
+    assert sorted(len(post) for post in api.posts) == [50, 100, 100]
+    assert sorted(tag for post in api.posts for tag in post) == sorted(str(i) for i in range(250))
+    assert len(results) == 250
+    assert all(result_keyword(results[str(i)]) == f'kw{i}' for i in range(250))
+
+    live_api = FakeBatchAPI()
+    batch(live_api, LIVE, keywords(3))
+    assert sorted(live_api.posts) == [['0'], ['1'], ['2']]
+
+    capped_api = FakeBatchAPI()
+    batch(capped_api, TASK_POST, keywords(5), max_tasks_per_request=2)
+    assert sorted(len(post) for post in capped_api.posts) == [1, 2, 2]
+
+
+def test_results_are_matched_by_tag_when_out_of_order_or_missing():
+    api = FakeBatchAPI(reverse=True, drop_tags={'3'})
+    results = batch(api, TASK_POST, keywords(5))
+
+    for i in (0, 1, 2, 4):
+        response = results[str(i)]
+        assert response['success'] is True
+        assert result_keyword(response) == f'kw{i}'
+        assert response['data'][0]['id'] == f'id-{i}'
+        assert response['cost'] == 0.002 and response['status_code'] == 20000
+    assert results['3'] == {'success': False, 'error': 'Task missing from batch response'}
+
+
+def test_failed_post_fans_out_to_every_tag_in_its_chunk():
+    api = FakeBatchAPI(fail_tags={'3'})
+    results = batch(api, TASK_POST, keywords(5), max_tasks_per_request=2)
+
+    failed = {'success': False, 'error': 'HTTP 500', 'status_code': 500}
+    assert results['2'] == failed and results['3'] == failed
+    assert all(results[tag]['success'] for tag in ('0', '1', '4'))
+
+
+def test_caller_supplied_tags_are_kept():
+    api = FakeBatchAPI(reverse=True)
+    tasks = [{**task, 'tag': f'cell-{i}'} for i, task in enumerate(keywords(3))]
+    tasks.append({'keyword': 'untagged', 'location_name': 'Austin,Texas,United States'})
+
+    results = batch(api, TASK_POST, tasks)
+
+    assert set(results) == {'cell-0', 'cell-1', 'cell-2', '3'}
+    assert result_keyword(results['cell-1']) == 'kw1'
+    assert result_keyword(results['3']) == 'untagged'
+    assert api.posts == [['cell-0', 'cell-1', 'cell-2', '3']]
+    assert 'tag' not in tasks[3]  # The caller's task objects are not modified
+
+
+def test_split_single_task_response_uses_the_request_tag():
+    # A coalesced single-task call may echo the tag of the caller that sent it
+    response = {'success': True, 'coalesced': True, 'cost': 0, 'data': [
+        {'id': 'id-0', 'status_code': 20000, 'status_message': 'Ok.', 'cost': 0.002, 'data': {'tag': 'other'}}
+    ]}
+
+    split = DataForSEOClient._split_batch_response(response, [{'keyword': 'kw0', 'tag': 'mine'}])
+
+    assert list(split) == ['mine']
+    assert split['mine']['cost'] == 0 and split['mine']['data'][0]['id'] == 'id-0'
@@ -0,0 +1,312 @@
+"""
+Tests for DesignAnalyzer extraction, multi-page runs and screenshot capture
+(extraction/design_analyzer.py)
+"""
+
+import asyncio
+import base64
+import json
+
+import pytest
+from aiohttp import web
+
+from firecrawl_scraper.extraction import design_analyzer
+from firecrawl_scraper.extraction.design_analyzer import (
+    DESIGN_SECTIONS,
+    FUSED_DESIGN_PROMPT,
+    DesignAnalyzer,
+)
+
+SECTION_BY_PROMPT = {prompt: name for name, (prompt, _) in DESIGN_SECTIONS.items()}
+
+
+def section_data(name, url):
+    """Recognizable extract result for one section of a page"""
+    if name == 'design_system':
+        return {'color_palette': {'primary': '#123456'}, 'typography': {'heading_font': url}}
+    if name == 'ctas':
+        return {'ctas': [{'text': f'Call {url}', 'type': 'button'}]}
+    return {'source': url, 'section': name}
+
+
+class FakeDesignClient:
+    """Stands in for EnhancedFirecrawlClient.extract/scrape"""
+
+    def __init__(self, fused_sections=None, fail=(), delays=None):
+        self.fused_sections = list(DESIGN_SECTIONS) if fused_sections is None else fused_sections
+        self.fail = set(fail)
+        self.delays = delays or {}
+        self.jobs = []
+        self.running = 0
+        self.peak_running = 0
+
+    async def extract(self, urls, prompt, schema, **_):
+        url = urls[0]
+        job = 'fused' if prompt == FUSED_DESIGN_PROMPT else SECTION_BY_PROMPT[prompt]
+        self.jobs.append((url, job))
+        self.running += 1
+        self.peak_running = max(self.peak_running, self.running)
+        try:
+            await asyncio.sleep(self.delays.get(url, 0.001))
+            if job in self.fail or url in self.fail:
+                raise RuntimeError(f'{job} failed')
+            if job == 'fused':
+                data = {name: section_data(name, url) for name in self.fused_sections}
+            else:
+                data = section_data(job, url)
+            return {'success': True, 'data': [{'extract': data}]}
+        finally:
+            self.running -= 1
+
+
+def analyze(client, tmp_path, **kwargs):
+    analyzer = DesignAnalyzer(client, **kwargs)
+    return asyncio.run(analyzer.analyze_full_design(
+        'https://a.example/', tmp_path, include_screenshots=False
+    ))
+
+
+def test_fused_mode_runs_one_extract_job_per_page(tmp_path):
+    client = FakeDesignClient()
+    result = analyze(client, tmp_path)
+
+    assert client.jobs == [('https://a.example/', 'fused')]
+    for name in DESIGN_SECTIONS:
+        assert result[name] == section_data(name, 'https://a.example/')
+        assert json.loads((tmp_path / f'{name}.json').read_text()) == result[name]
+    saved = json.loads((tmp_path / 'design_analysis.json').read_text())
+    assert saved['ctas'] == result['ctas']
+
+
+def test_missing_sections_fall_back_to_their_own_jobs(tmp_path):
+    client = FakeDesignClient(fused_sections=['design_system', 'components', 'psychology'])
+    result = analyze(client, tmp_path)
+
+    assert sorted(job for _, job in client.jobs) == ['animations', 'ctas', 'fused']
+    assert result['ctas'] == section_data('ctas', 'https://a.example/')
+
+
+def test_failed_fused_job_falls_back_to_every_section(tmp_path):
+    client = FakeDesignClient(fail={'fused', 'animations'})
+    result = analyze(client, tmp_path)
+
+    assert sorted(job for _, job in client.jobs) == sorted(['fused', *DESIGN_SECTIONS])
+    assert result['components'] == section_data('components', 'https://a.example/')
+    assert result['animations'] == {'error': 'animations failed'}
+    assert not (tmp_path / 'animations.json').exists()
+
+
+def test_unfused_mode_runs_one_job_per_section(tmp_path):
+    client = FakeDesignClient()
+    result = analyze(client, tmp_path, fused=False)
+
+    assert sorted(job for _, job in client.jobs) == sorted(DESIGN_SECTIONS)
+    assert result['psychology'] == section_data('psychology', 'https://a.example/')
+
+
+URLS = [f'https://a.example/page-{i}' for i in range(6)]
+
+
+def analyze_site(client, tmp_path, **kwargs):
+    analyzer = DesignAnalyzer(client)
+    return asyncio.run(analyzer.analyze_site_design(URLS, tmp_path, include_screenshots=False, **kwargs))
+
+
+def test_pages_run_concurrently_and_aggregate_in_url_order(tmp_path):
+    # Later pages finish first
+    client = FakeDesignClient(delays={url: 0.05 - i * 0.008 for i, url in enumerate(URLS)})
+    result = analyze_site(client, tmp_path, max_concurrent=3)
+
+    assert client.peak_running == 3
+    assert result['pages_analyzed'] == 6 and result['pages_resumed'] == 0
+    assert list(result['pages']) == URLS
+    assert [entry['url'] for entry in result['aggregated']['cta_patterns']] == URLS
+    assert [entry['heading_font'] for entry in result['aggregated']['typography_fonts']] == URLS
+    for url in URLS:
+        page_dir = tmp_path / 'pages' / DesignAnalyzer._page_name(url)
+        assert json.loads((page_dir / 'design_analysis.json').read_text())['url'] == url
+
+
+def test_resume_skips_pages_completed_by_an_earlier_run(tmp_path):
+    first = FakeDesignClient(fail={URLS[2]})  # Page 2 is saved with section errors
+    analyze_site(first, tmp_path)
+    (tmp_path / 'pages' / DesignAnalyzer._page_name(URLS[4]) / 'design_analysis.json').unlink()
+
+    again = FakeDesignClient()
+    result = analyze_site(again, tmp_path)
+
+    assert sorted({url for url, _ in again.jobs}) == [URLS[2], URLS[4]]
+    assert result['pages_analyzed'] == 6 and result['pages_resumed'] == 4
+    assert [entry['url'] for entry in result['aggregated']['cta_patterns']] == URLS
+
+    fresh = FakeDesignClient()
+    analyze_site(fresh, tmp_path, resume=False)
+    assert len(fresh.jobs) == 6
+
+
+class FakeScreenshotClient:
+    """Stands in for EnhancedFirecrawlClient.scrape with screenshot output"""
+
+    def __init__(self, screenshots):
+        self.screenshots = screenshots  # (url, viewport) -> screenshot data or None
+        self.running = 0
+        self.peak_running = 0
+
+    async def scrape(self, url, formats, wait_for=0, mobile=False, **_):
+        self.running += 1
+        self.peak_running = max(self.peak_running, self.running)
+        try:
+            await asyncio.sleep(0.01)
+            screenshot = self.screenshots.get((url, 'mobile' if mobile else 'desktop'))
+            return {'success': screenshot is not None, 'data': {'screenshot': screenshot}}
+        finally:
+            self.running -= 1
+
+
+def data_uri(payload):
+    return 'data:image/png;base64,' + base64.b64encode(payload).decode()
+
+
+def capture(analyzer, url, output_dir, **kwargs):
+    return asyncio.run(analyzer.capture_screenshots(url, output_dir, **kwargs))
+
+
+def test_viewports_are_captured_concurrently_and_decoded_in_chunks(tmp_path, monkeypatch):
+    monkeypatch.setattr(design_analyzer, 'BASE64_CHUNK_SIZE', 8)
+    desktop, mobile = bytes(range(256)) * 3, b'mobile-bytes' * 50
+    client = FakeScreenshotClient({
+        ('https://a.example/', 'desktop'): data_uri(desktop),
+        ('https://a.example/', 'mobile'): data_uri(mobile),
+    })
+
+    result = capture(DesignAnalyzer(client), 'https://a.example/', tmp_path)
+
+    assert client.peak_running == 2
+    assert (tmp_path / 'desktop_fullpage.png').read_bytes() == desktop
+    assert (tmp_path / 'mobile_fullpage.png').read_bytes() == mobile
+    assert result['mobile']['viewport'] == 'mobile'
+    assert not list(tmp_path.glob('*.part'))
+
+
+def test_identical_screenshots_across_pages_keep_one_file(tmp_path):
+    shared, other = data_uri(b'same page chrome' * 20), data_uri(b'different' * 20)
+    client = FakeScreenshotClient({
+        ('https://a.example/', 'desktop'): shared,
+        ('https://a.example/about', 'desktop'): shared,
+        ('https://a.example/contact', 'desktop'): other,
+    })
+    analyzer = DesignAnalyzer(client)
+
+    first = capture(analyzer, 'https://a.example/', tmp_path / 'home', include_mobile=False)
+    second = capture(analyzer, 'https://a.example/about', tmp_path / 'about', include_mobile=False)
+    third = capture(analyzer, 'https://a.example/contact', tmp_path / 'contact', include_mobile=False)
+
+    assert second['desktop']['path'] == first['desktop']['path']
+    assert second['desktop']['duplicate_of'] == 'https://a.example/'
+    assert not (tmp_path / 'about' / 'desktop_fullpage.png').exists()
+    assert 'duplicate_of' not in third['desktop']
+    assert (tmp_path / 'contact' / 'desktop_fullpage.png').exists()
+
+    kept = DesignAnalyzer(client, dedup_screenshots=False)
+    capture(kept, 'https://a.example/', tmp_path / 'home2', include_mobile=False)
+    capture(kept, 'https://a.example/about', tmp_path / 'about2', include_mobile=False)
+    assert (tmp_path / 'about2' / 'desktop_fullpage.png').exists()
+
+
+def test_lookalike_screenshots_are_kept_unless_perceptual_dedup_is_enabled(tmp_path, monkeypatch):
+    monkeypatch.setattr(design_analyzer, 'HAS_PIL', True)  # Same size and hash for every capture
+    client = FakeScreenshotClient({
+        ('https://a.example/', 'desktop'): data_uri(b'services template: drains' * 20),
+        ('https://a.example/about', 'desktop'): data_uri(b'services template: heaters' * 20),
+    })
+
+    def run(name, **kwargs):
+        analyzer = DesignAnalyzer(client, **kwargs)
+
+        async def process(path):
+            return {'width': 1280, 'height': 6000, 'phash': 'f' * 64}
+
+        analyzer._process_screenshot = process
+        capture(analyzer, 'https://a.example/', tmp_path / name / 'home', include_mobile=False)
+        return capture(analyzer, 'https://a.example/about', tmp_path / name / 'about', include_mobile=False)
+
+    kept = run('default')
+    assert 'duplicate_of' not in kept['desktop']
+    assert (tmp_path / 'default' / 'about' / 'desktop_fullpage.png').exists()
+
+    deduped = run('perceptual', dedup_threshold=0)
+    assert deduped['desktop']['duplicate_of'] == 'https://a.example/'
+    assert not (tmp_path / 'perceptual' / 'about' / 'desktop_fullpage.png').exists()
+
+
+def test_missing_screenshot_is_reported_as_none(tmp_path):
+    result = capture(DesignAnalyzer(FakeScreenshotClient({})), 'https://a.example/', tmp_path)
+
+    assert result['desktop'] is None and result['mobile'] is None
+    assert not list(tmp_path.iterdir())
+
+
+def test_screenshot_urls_are_streamed_without_api_credentials(tmp_path):
+    payload = b'\x89PNG' + b'\x00' * 600_000
+    seen_headers = []
+
+    async def image(request):
+        seen_headers.append(dict(request.headers))
+        return web.Response(body=payload, content_type='image/png')
+
+    async def run():
+        app = web.Application()
+        app.router.add_get('/shot.png', image)
+        runner = web.AppRunner(app)
+        await runner.setup()
+        site = web.TCPSite(runner, '127.0.0.1', 0)
+        await site.start()
+        port = site._server.sockets[0].getsockname()[1]
+        client = FakeScreenshotClient({
+            ('https://a.example/', 'desktop'): f'http://127.0.0.1:{port}/shot.png',
+            ('https://a.example/', 'mobile'): f'http://127.0.0.1:{port}/missing.png',
+        })
+        analyzer = DesignAnalyzer(client)
+        try:
+            return await analyzer.capture_screenshots('https://a.example/', tmp_path)
+        finally:
+            await analyzer.close()
+            await runner.cleanup()
+
+    result = asyncio.run(run())
+
+    assert (tmp_path / 'desktop_fullpage.png').read_bytes() == payload
+    assert result['mobile'] is None  # HTTP 404
+    assert not list(tmp_path.glob('*.part'))
+    assert 'Authorization' not in seen_headers[0]
+
+
+@pytest.mark.skipif(not design_analyzer.HAS_PIL, reason="Pillow not installed")
+def test_reencoded_screenshots_dedup_by_perceptual_hash_with_thumbnails(tmp_path):
+    from PIL import Image
+
+    image = Image.linear_gradient('L').resize((400, 300)).convert('RGB')
+    png, jpeg = tmp_path / 'a.png', tmp_path / 'b.jpg'
+    image.save(png)
+    image.save(jpeg, quality=95)
+    client = FakeScreenshotClient({
+        ('https://a.example/', 'desktop'): data_uri(png.read_bytes()),
+        ('https://a.example/about', 'desktop'): data_uri(jpeg.read_bytes()),
+    })
+    analyzer = DesignAnalyzer(client, thumbnail_width=100, dedup_threshold=8, max_workers=1)
+
+    async def run():
+        try:
+            return [
+                await analyzer.capture_screenshots(url, tmp_path / name, include_mobile=False)
+                for url, name in (('https://a.example/', 'home'), ('https://a.example/about', 'about'))
+            ]
+        finally:
+            await analyzer.close()
+
+    first, second = asyncio.run(run())
+
+    assert first['desktop']['width'] == 400
+    assert Image.open(first['desktop']['thumbnail']).width == 100
+    assert second['desktop']['duplicate_of'] == 'https://a.example/'
+    assert second['desktop']['thumbnail'] == first['desktop']['thumbnail']
@@ -10,7 +10,10 @@ from pathlib import Path
 # Add project to path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
-from data.clients.escape_exe import create_escape_exe_client
+import pytest
+
+# Client definitions live in the local data directory, which is not versioned
+create_escape_exe_client = pytest.importorskip("data.clients.escape_exe").create_escape_exe_client
 from firecrawl_scraper.pipeline.orchestrator import PipelineOrchestrator
 from firecrawl_scraper.models import Vertical
 from firecrawl_scraper.models.entities import ENTERTAINMENT_VERTICALS, get_business_model, BusinessModel
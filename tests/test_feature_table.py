@@ -0,0 +1,134 @@
+"""
+Tests for the shared competitor feature table and rule evaluation
+(analysis/feature_table.py, analysis/insight_rules.py RuleEngine)
+"""
+
+import math
+
+import pytest
+
+from firecrawl_scraper.analysis import feature_table
+from firecrawl_scraper.analysis.feature_table import FEATURES, FeatureTable
+from firecrawl_scraper.analysis.insight_rules import InsightRule, RuleEngine
+from firecrawl_scraper.models import (
+    BacklinkProfile,
+    Client,
+    CompetitorProfile,
+    ConversionMechanics,
+    TrustSignals,
+    Vertical,
+)
+
+BACKENDS = [False] + ([True] if feature_table.HAS_NUMPY else [])
+
+
+@pytest.fixture(params=BACKENDS, ids=lambda numpy: 'numpy' if numpy else 'lists')
+def backend(request, monkeypatch):
+    monkeypatch.setattr(feature_table, 'HAS_NUMPY', request.param)
+
+
+def competitor(domain, reviews=None, rating=None, chat=False, authority=None, grid=None):
+    return CompetitorProfile(
+        id=f'comp-{domain}',
+        domain=domain,
+        name=domain,
+        trust_signals=TrustSignals(review_count=reviews, rating=rating),
+        conversion_mechanics=ConversionMechanics(chat_widget=chat),
+        backlinks=BacklinkProfile(domain_authority=authority),
+        grid_performance=grid or {}
+    )
+
+
+COMPETITORS = [
+    competitor('a.example', reviews=40, rating=4.8, chat=True, authority=30, grid={'Austin': 2, 'Round Rock': 4}),
+    competitor('b.example', reviews=0, rating=4.6, authority=30),
+    competitor('c.example', reviews=120, chat=True),
+    competitor('d.example'),
+]
+
+
+def test_aggregates_over_present_values(backend):
+    table = FeatureTable(COMPETITORS, ['review_count', 'chat_widget'])
+
+    assert table.count('review_count') == 2  # 0 and missing are absent
+    assert table.mean('review_count') == 80
+    assert table.mean('review_count', present_only=False) == 40
+    assert table.max('review_count') == 120
+    assert table.leader('review_count') == 2
+    assert table.rows('review_count', at_most=100) == [0]
+    assert [c.domain for c in table.profiles('chat_widget')] == ['a.example', 'c.example']
+    assert table.value('review_count', 3) is None
+    assert math.isnan(table.column('review_count')[3])
+
+
+def test_ties_missing_features_and_lazy_extraction(backend):
+    table = FeatureTable(COMPETITORS, [])
+
+    assert table.features == []
+    assert table.leader('domain_authority') == 0  # First on ties
+    assert table.mean('avg_grid_rank') == 3
+    assert table.mean('rating') == pytest.approx(4.7)
+    assert table.leader('experience_count') is None
+    assert table.max('experience_count') is None
+    assert table.mean('experience_count') is None
+    assert set(table.features) == {'domain_authority', 'avg_grid_rank', 'rating', 'experience_count'}
+    with pytest.raises(ValueError):
+        table.ensure(['shoe_size'])
+
+
+def test_default_table_extracts_every_feature():
+    table = FeatureTable(COMPETITORS)
+    assert table.features == list(FEATURES)
+    assert len(table) == 4
+
+
+def make_client(vertical=Vertical.PLUMBING):
+    return Client(id='client', name='Acme', vertical=vertical)
+
+
+def test_rule_engine_shares_one_table_across_rules():
+    table = FeatureTable(COMPETITORS, [])
+    engine = RuleEngine(make_client(), COMPETITORS, table=table)
+
+    findings = engine.run_all_rules()
+
+    declared = {f for rule in engine.rules for f in rule.features}
+    assert declared <= set(table.features)
+    assert set(engine.get_timings()) == {'feature_table'} | {rule.rule_id for rule in engine.rules}
+    observations = [finding.observation for finding in findings]
+    assert 'Average competitor review count: 80' in observations
+    assert 'c.example leads with 120 reviews' in observations
+    assert 'High rating standard in market (avg: 4.7)' in observations
+    assert 'a.example leads with authority 30/100' in observations
+
+
+def test_undeclared_features_are_extracted_on_use():
+    class SneakyRule(InsightRule):
+        rule_id = 'sneaky'
+        features = ()
+
+        def evaluate(self):
+            self.table.count('gift_cards')
+            return []
+
+    engine = RuleEngine(make_client(), COMPETITORS)
+    assert engine._evaluate([SneakyRule]) == []
+    assert 'gift_cards' in engine.table.features
+
+
+def test_failing_rule_does_not_stop_the_others():
+    class BrokenRule(InsightRule):
+        rule_id = 'broken'
+        features = ('review_count',)
+
+        def evaluate(self):
+            raise RuntimeError('boom')
+
+    engine = RuleEngine(make_client(), COMPETITORS)
+    expected = [finding.observation for finding in engine.run_all_rules()]
+
+    findings = engine._evaluate([BrokenRule, *engine.rules])
+
+    assert expected
+    assert [finding.observation for finding in findings] == expected
+    assert 'broken' in engine.get_timings()
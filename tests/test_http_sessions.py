@@ -0,0 +1,217 @@
+"""
+Tests for the pooled HTTP sessions of the API clients
+(core/firecrawl_client.py, core/dataforseo_client.py)
+"""
+
+import asyncio
+import gc
+import warnings
+from argparse import Namespace
+from contextlib import asynccontextmanager
+
+from aiohttp import web
+
+from firecrawl_scraper import cli
+from firecrawl_scraper.core.dataforseo_client import DataForSEOClient
+from firecrawl_scraper.core.firecrawl_client import EnhancedFirecrawlClient
+
+
+@asynccontextmanager
+async def local_api():
+    """Local HTTP server answering every path with JSON; yields its base URL and client ports"""
+    peers = []
+
+    async def handle(request):
+        peers.append(request.transport.get_extra_info('peername')[1])
+        return web.json_response({'success': True, 'data': [], 'path': request.path,
+                                  'status_message': request.path, 'tasks': []})
+
+    app = web.Application()
+    app.router.add_route('*', '/{tail:.*}', handle)
+    runner = web.AppRunner(app)
+    await runner.setup()
+    site = web.TCPSite(runner, '127.0.0.1', 0)
+    await site.start()
+    try:
+        yield f"http://127.0.0.1:{site._server.sockets[0].getsockname()[1]}", peers
+    finally:
+        await runner.cleanup()
+
+
+def test_firecrawl_requests_share_one_pooled_connection():
+    client = EnhancedFirecrawlClient(api_key='fc-test')
+
+    async def run():
+        async with local_api() as (base_url, peers):
+            first = await client._execute_with_retry(f"{base_url}/v2/scrape/a", {}, method='GET')
+            session = client._http_session
+            second = await client._execute_with_retry(f"{base_url}/v2/scrape/b", {}, method='GET')
+            assert client._http_session is session
+            await client.close()
+            return first, second, peers, session
+
+    first, second, peers, session = asyncio.run(run())
+
+    assert first['path'] == '/v2/scrape/a' and second['path'] == '/v2/scrape/b'
+    assert len(set(peers)) == 1  # Keep-alive: the second request reused the connection
+    assert session.closed and client._http_session is None
+
+
+def test_firecrawl_session_is_reopened_after_close():
+    client = EnhancedFirecrawlClient(api_key='fc-test')
+
+    async def run():
+        first = client._get_http_session()
+        assert client._get_http_session() is first
+        await client.close()
+        second = client._get_http_session()
+        await client.close()
+        return first, second
+
+    first, second = asyncio.run(run())
+
+    assert first is not second
+    assert first.closed and second.closed
+
+
+def test_firecrawl_session_from_a_finished_loop_is_released():
+    client = EnhancedFirecrawlClient(api_key='fc-test')
+
+    async def open_session():
+        return client._get_http_session()
+
+    stale = asyncio.run(open_session())  # Loop closes with the session still open
+
+    async def reopen():
+        session = client._get_http_session()
+        await client.close()
+        return session
+
+    with warnings.catch_warnings(record=True) as caught:
+        warnings.simplefilter('always')
+        fresh = asyncio.run(reopen())
+        gc.collect()
+
+    assert fresh is not stale
+    assert stale.closed and stale.connector is None
+    assert not [w for w in caught if 'Unclosed' in str(w.message)]
+
+
+def test_firecrawl_session_of_an_open_loop_is_closed_there():
+    client = EnhancedFirecrawlClient(api_key='fc-test')
+    loop = asyncio.new_event_loop()
+
+    async def open_session():
+        return client._get_http_session()
+
+    async def reopen():
+        session = client._get_http_session()
+        await client.close()
+        return session
+
+    try:
+        stale = loop.run_until_complete(open_session())
+        fresh = asyncio.run(reopen())
+        loop.run_until_complete(asyncio.sleep(0.01))  # Runs the scheduled close
+        assert stale.closed and fresh is not stale
+    finally:
+        loop.close()
+
+
+def test_cli_command_closes_pooled_sessions():
+    clients = []
+
+    async def command(args):
+        client = EnhancedFirecrawlClient(api_key='fc-test')
+        clients.append((client, client._get_http_session()))
+        return 0
+
+    assert asyncio.run(cli._run_command(command, Namespace())) == 0
+
+    client, session = clients[0]
+    assert session.closed and client._http_session is None
+
+
+def dataforseo_client():
+    return DataForSEOClient(login='session@example.com', password='secret', retry_delay=0.01)
+
+
+def test_dataforseo_requests_share_one_pooled_connection():
+    client = dataforseo_client()
+
+    async def run():
+        async with local_api() as (base_url, peers):
+            client.BASE_URL = base_url
+            first = await client._send('/serp/a', 'GET', None, None)
+            session = client._session
+            second = await client._send('/serp/b', 'POST', [{'keyword': 'plumber'}], None)
+            assert client._session is session
+            await client.aclose()
+            return first, second, peers, session
+
+    first, second, peers, session = asyncio.run(run())
+
+    assert first['status_message'] == '/serp/a' and second['status_message'] == '/serp/b'
+    assert len(set(peers)) == 1  # Keep-alive: the second request reused the connection
+    assert session.closed and client._session is None
+
+
+def test_dataforseo_session_is_reopened_after_close_and_per_loop():
+    client = dataforseo_client()
+
+    async def open_session():
+        first = client._get_session()
+        assert client._get_session() is first
+        await client.aclose()
+        return first, client._get_session()  # Second one is left open
+
+    closed, stale = asyncio.run(open_session())
+
+    async def reopen():
+        session = client._get_session()
+        await client.aclose()
+        return session
+
+    with warnings.catch_warnings(record=True) as caught:
+        warnings.simplefilter('always')
+        fresh = asyncio.run(reopen())
+        gc.collect()
+
+    assert closed.closed and stale is not closed
+    assert fresh is not stale and stale.closed and stale.connector is None
+    assert not [w for w in caught if 'Unclosed' in str(w.message)]
+
+
+def test_dataforseo_session_of_an_open_loop_is_closed_there():
+    client = dataforseo_client()
+    loop = asyncio.new_event_loop()
+
+    async def open_session():
+        return client._get_session()
+
+    async def reopen():
+        session = client._get_session()
+        await client.aclose()
+        return session
+
+    try:
+        stale = loop.run_until_complete(open_session())
+        fresh = asyncio.run(reopen())
+        loop.run_until_complete(asyncio.sleep(0.01))  # Runs the scheduled close
+        assert stale.closed and fresh is not stale
+    finally:
+        loop.close()
+
+
+def test_cli_command_closes_dataforseo_sessions():
+    clients = []
+
+    async def command(args):
+        client = dataforseo_client()
+        clients.append((client, client._get_session()))
+        return 0
+
+    assert asyncio.run(cli._run_command(command, Namespace())) == 0
+
+    client, session = clients[0]
+    assert session.closed and client._session is None
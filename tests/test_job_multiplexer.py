@@ -0,0 +1,94 @@
+"""
+Tests for the shared adaptive job poller (core/job_multiplexer.py)
+"""
+
+import asyncio
+import time
+
+import pytest
+
+from firecrawl_scraper.core.job_multiplexer import JobMultiplexer, WatchedJob
+from tests.fakes import FakeFirecrawlAPI, make_client
+
+
+def job(interval, last_completed=0, age=10.0):
+    return WatchedJob(
+        endpoint='/crawl/x', job_type='crawl', future=None,
+        interval=interval, last_completed=last_completed,
+        started_at=time.monotonic() - age
+    )
+
+
+def test_interval_grows_with_progress_capped_by_eta_and_backs_off_when_stalled():
+    mux = JobMultiplexer(client=None, min_interval=1.0, max_interval=30.0, backoff_factor=1.5)
+
+    # 10 pages in 10s, 90 left: ETA 90s, so plain growth applies
+    assert mux._next_interval(job(2.0), {'completed': 10, 'total': 100}) == pytest.approx(3.0)
+    # 99 pages in 10s, 1 left: ETA ~0.1s, clamped to min_interval
+    assert mux._next_interval(job(2.0), {'completed': 99, 'total': 100}) == pytest.approx(1.0)
+    # No progress since the last poll
+    assert mux._next_interval(job(2.0, last_completed=10), {'completed': 10, 'total': 100}) == pytest.approx(4.5)
+    assert mux._next_interval(job(20.0, last_completed=10), {'completed': 10, 'total': 100}) == 30.0
+
+
+def test_many_jobs_share_one_bounded_poller():
+    api = FakeFirecrawlAPI(step=3, delay=0.002)
+    client = make_client(api)
+    client.jobs.max_concurrent_polls = 3
+    in_flight, peak = [0], [0]
+
+    async def counting(*args, **kwargs):
+        in_flight[0] += 1
+        peak[0] = max(peak[0], in_flight[0])
+        try:
+            return await api.execute(*args, **kwargs)
+        finally:
+            in_flight[0] -= 1
+
+    async def run():
+        job_ids = [await client.crawl_async(f'https://site{i}.example', limit=9) for i in range(12)]
+        client._execute_with_retry = counting
+        return await asyncio.gather(*[client.jobs.watch(f'/crawl/{job_id}', 'crawl') for job_id in job_ids])
+
+    statuses = asyncio.run(run())
+
+    assert all(status['status'] == 'completed' and len(status['data']) == 9 for status in statuses)
+    assert peak[0] <= 3
+    assert client.jobs.active_jobs == 0
+
+
+def test_watch_times_out_with_collected_data():
+    api = FakeFirecrawlAPI(step=0)
+    client = make_client(api)
+
+    async def run():
+        job_id = await client.crawl_async('https://example.com', limit=5)
+        return await client.jobs.watch(f'/crawl/{job_id}', 'crawl', timeout=0.05)
+
+    started = time.monotonic()
+    status = asyncio.run(run())
+
+    assert status['status'] == 'timeout'
+    assert status['data'] == []
+    assert time.monotonic() - started < 1
+
+
+def test_cancelling_the_future_stops_polling():
+    api = FakeFirecrawlAPI(step=0)
+    client = make_client(api)
+
+    async def run():
+        job_id = await client.crawl_async('https://example.com', limit=5)
+        future = client.jobs.watch(f'/crawl/{job_id}', 'crawl')
+        await asyncio.sleep(0.02)
+        future.cancel()
+        await asyncio.sleep(0.02)
+        polls = len(api.requests)
+        await asyncio.sleep(0.05)
+        return polls, client.jobs._runner.done()
+
+    polls, runner_done = asyncio.run(run())
+
+    assert polls > 2
+    assert len(api.requests) == polls
+    assert runner_done
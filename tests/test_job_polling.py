@@ -0,0 +1,72 @@
+"""
+Tests for incremental job status polling by offset (core/firecrawl_client.py)
+"""
+
+import asyncio
+
+from tests.fakes import FakeFirecrawlAPI, make_client
+
+
+def test_fetch_job_update_follows_next_pages_from_offset():
+    api = FakeFirecrawlAPI(step=10, page_size=3)
+    client = make_client(api)
+
+    async def run():
+        job_id = await client.batch_scrape_async([f'https://example.com/{i}' for i in range(10)])
+        return await client.get_batch_status(job_id, offset=4)
+
+    status = asyncio.run(run())
+
+    assert [doc['metadata']['sourceURL'] for doc in status['data']] == \
+        [f'https://example.com/{i}' for i in range(4, 10)]
+    assert 'next' not in status
+    assert api.requests[1:] == [
+        ('GET', '/batch/scrape/job-1?skip=4'),
+        ('GET', 'https://api.firecrawl.dev/v2/batch/scrape/job-1?skip=7'),
+    ]
+
+
+def test_each_document_is_transferred_once():
+    api = FakeFirecrawlAPI(step=7, page_size=5)
+    client = make_client(api)
+
+    result = asyncio.run(client.crawl('https://example.com', limit=40))
+
+    assert result['success'] is True
+    assert len(result['data']) == 40
+    assert len({doc['metadata']['sourceURL'] for doc in result['data']}) == 40
+    assert api.documents_sent == 40
+
+
+def test_failed_result_page_is_fetched_again_on_next_poll():
+    api = FakeFirecrawlAPI(step=6, page_size=2)
+    client = make_client(api)
+    failures = []
+
+    async def flaky(endpoint, payload, method='POST', credits=0, **kwargs):
+        if endpoint.startswith('http') and not failures:
+            failures.append(endpoint)
+            return {'success': False, 'error': 'HTTP 502'}
+        return await api.execute(endpoint, payload, method, credits, **kwargs)
+
+    client._execute_with_retry = flaky
+    result = asyncio.run(client.batch_scrape([f'https://example.com/{i}' for i in range(12)]))
+
+    assert failures
+    assert [doc['metadata']['sourceURL'] for doc in result['data']] == \
+        [f'https://example.com/{i}' for i in range(12)]
+
+
+def test_status_without_offset_is_one_raw_request():
+    api = FakeFirecrawlAPI(step=10, page_size=3)
+    client = make_client(api)
+
+    async def run():
+        job_id = await client.crawl_async('https://example.com', limit=10)
+        return await client.get_crawl_status(job_id)
+
+    status = asyncio.run(run())
+
+    assert len(status['data']) == 3
+    assert status['next'].endswith('?skip=3')
+    assert len(api.requests) == 2
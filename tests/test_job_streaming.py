@@ -0,0 +1,79 @@
+"""
+Tests for crawl_stream / batch_scrape_stream (core/firecrawl_client.py)
+"""
+
+import asyncio
+
+from tests.fakes import FakeFirecrawlAPI, make_client
+
+
+def test_crawl_stream_yields_every_page_in_order():
+    api = FakeFirecrawlAPI(step=3)
+    client = make_client(api)
+    progress, summary = [], {}
+
+    async def run():
+        return [doc async for doc in client.crawl_stream(
+            'https://example.com', limit=10,
+            on_progress=lambda done, total: progress.append((done, total)),
+            on_complete=summary.update
+        )]
+
+    docs = asyncio.run(run())
+
+    assert [doc['metadata']['sourceURL'] for doc in docs] == \
+        [f'https://example.com/page-{i}' for i in range(10)]
+    assert progress[-1] == (10, 10)
+    assert summary == {'success': True, 'creditsUsed': 10, 'status': 'completed', 'total': 10, 'completed': 10}
+    assert 'data' not in summary
+
+
+def test_batch_stream_reports_failed_job():
+    api = FakeFirecrawlAPI(fail_urls={'https://b.example'})
+    client = make_client(api)
+    summary = {}
+
+    async def run():
+        return [doc async for doc in client.batch_scrape_stream(
+            ['https://a.example', 'https://b.example'], on_complete=summary.update
+        )]
+
+    assert asyncio.run(run()) == []
+    assert summary['success'] is False
+    assert summary['status'] == 'failed'
+
+
+def test_slow_consumer_pauses_polling():
+    api = FakeFirecrawlAPI(step=5)
+    client = make_client(api)
+    ahead = []
+
+    async def run():
+        consumed = 0
+        async for _ in client.batch_scrape_stream([f'https://example.com/{i}' for i in range(50)], buffer_size=4):
+            consumed += 1
+            ahead.append(api.documents_sent - consumed)
+            await asyncio.sleep(0.002)
+        return consumed
+
+    assert asyncio.run(run()) == 50
+    # Queue (4) plus at most one poll's documents waiting to be put
+    assert max(ahead) <= 4 + 5
+
+
+def test_breaking_out_stops_polling():
+    api = FakeFirecrawlAPI(step=1)
+    client = make_client(api)
+
+    async def run():
+        async for doc in client.crawl_stream('https://example.com', limit=100, buffer_size=2):
+            break
+        polls = len(api.requests)
+        await asyncio.sleep(0.05)
+        return doc, polls
+
+    doc, polls = asyncio.run(run())
+
+    assert doc['metadata']['sourceURL'] == 'https://example.com/page-0'
+    assert len(api.requests) == polls
+    assert client.jobs.active_jobs == 0
@@ -0,0 +1,90 @@
+"""
+Tests for concurrent local search grids (DataForSEOClient.query_local_search_grid
+and _aggregate_grid_competitors)
+"""
+
+import asyncio
+
+from firecrawl_scraper.core.dataforseo_client import DataForSEOClient
+
+GRID = [(30.0 + i / 100, -97.0 - i / 100) for i in range(6)]
+
+# Businesses listed at each grid point, best rank first. Echo (point 1) and
+# Delta (point 5) tie on presence and average rank.
+LISTINGS = [
+    ['Alpha', 'Bravo'],
+    ['Echo', 'Alpha', 'Bravo'],
+    ['Bravo', 'Alpha'],
+    ['Alpha'],
+    ['Alpha', 'Charlie'],
+    ['Delta', 'Bravo', 'Charlie'],
+]
+
+
+class FakeMapsAPI(DataForSEOClient):
+    """
+    Answers maps-by-coordinates tasks from LISTINGS; later grid points
+    answer sooner, so concurrent points complete in reverse order.
+    """
+
+    def __init__(self, fail_points=()):
+        super().__init__(login='grid@example.com', password='secret')
+        self.fail_points = set(fail_points)
+        self.completed = []
+
+    async def _send(self, endpoint, method, data, cost_key):
+        (task,) = data
+        index = int(task['tag'])
+        await asyncio.sleep(0.005 * (len(GRID) - index))
+        self.completed.append(index)
+
+        if index in self.fail_points:
+            return {'success': False, 'error': 'HTTP 500'}
+        items = [{'type': 'maps_search', 'title': title, 'domain': f'{title.lower()}.example',
+                  'rating': {'value': 4.5, 'votes_count': 10}}
+                 for title in LISTINGS[index]]
+        return {'success': True, 'cost': 0.002, 'data': [{
+            'status_code': 20000, 'data': {'tag': task['tag']}, 'result': [{'items': items}]
+        }]}
+
+
+def query_grid(api, **kwargs):
+    return asyncio.run(api.query_local_search_grid('plumber', GRID, **kwargs))
+
+
+def test_grid_output_follows_grid_index_not_completion_order():
+    api = FakeMapsAPI(fail_points={3})
+    result = query_grid(api, max_concurrent=6)
+
+    assert api.completed == [5, 4, 3, 2, 1, 0]
+    assert [point['grid_index'] for point in result['grid_results']] == list(range(6))
+    assert [(point['lat'], point['lng']) for point in result['grid_results']] == GRID
+    assert result['grid_results'][3] == {'lat': GRID[3][0], 'lng': GRID[3][1], 'grid_index': 3,
+                                         'success': False, 'rankings': []}
+    assert [ranking['title'] for ranking in result['grid_results'][1]['rankings']] == LISTINGS[1]
+
+    competitors = result['competitors']
+    assert [c['name'] for c in competitors] == ['Alpha', 'Bravo', 'Charlie', 'Echo', 'Delta']
+    assert [(c['grid_presence'], c['avg_position']) for c in competitors] == [
+        (4, 1.5), (4, 2.0), (2, 2.5), (1, 1.0), (1, 1.0)
+    ]
+    assert [p['grid_index'] for p in competitors[0]['positions']] == [0, 1, 2, 4]
+    assert [p['position'] for p in competitors[1]['positions']] == [2, 3, 1, 2]
+    assert result['total_competitors_found'] == 5
+
+
+def test_concurrent_grid_matches_sequential_execution():
+    concurrent = query_grid(FakeMapsAPI(fail_points={3}), max_concurrent=6)
+    sequential_api = FakeMapsAPI(fail_points={3})
+    sequential = query_grid(sequential_api, max_concurrent=1)
+
+    assert sequential_api.completed == list(range(6))
+    assert concurrent['grid_results'] == sequential['grid_results']
+    assert concurrent['competitors'] == sequential['competitors']
+
+
+def test_competitor_ranking_ignores_result_order():
+    results = query_grid(FakeMapsAPI(), max_concurrent=6)['grid_results']
+
+    assert (DataForSEOClient._aggregate_grid_competitors(results[::-1])
+            == DataForSEOClient._aggregate_grid_competitors(results))
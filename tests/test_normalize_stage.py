@@ -0,0 +1,106 @@
+"""
+Tests for concurrent competitor profile building (pipeline/stage_3_normalize.py)
+"""
+
+import asyncio
+from concurrent.futures.process import BrokenProcessPool
+
+from firecrawl_scraper.models import SourceType
+from firecrawl_scraper.pipeline.source_store import SourceStore
+from firecrawl_scraper.pipeline.stage_3_normalize import NormalizeStage
+
+PAGE = (
+    "# {name}\n\nLicensed and insured plumbers. Certified technicians with a "
+    "satisfaction guarantee. See our before and after gallery.\n\n"
+    "Call now: (512) 555-0100 - Free estimate! Drain cleaning, water heater repair."
+)
+
+
+def make_store(domains=6):
+    store = SourceStore()
+    for i in range(domains):
+        domain = f'plumber{i}.example'
+        store.add(SourceType.SERP_ORGANIC, f'https://{domain}/', domain=domain, serp_position=i + 1)
+        if i % 2 == 0:  # Every other competitor has scraped content
+            store.add(SourceType.COMPETITOR_WEBSITE, f'https://{domain}/', domain=domain, raw_data={
+                'markdown': PAGE.format(name=f'Plumber {i}'),
+                'metadata': {'title': f'Plumber {i} | Austin Plumbing'}
+            })
+            store.add(SourceType.COMPETITOR_PAGE, f'https://{domain}/services', domain=domain, raw_data={
+                'markdown': '## Drain cleaning\n\nSame-day service.', 'metadata': {'title': 'Services'}
+            })
+    return store
+
+
+def comparable(profiles):
+    return [
+        profile.model_dump(exclude={'id', 'analyzed_at', 'sources_scraped'})
+        for profile in profiles
+    ]
+
+
+def test_profiles_keep_domain_order_and_match_in_process_analysis():
+    store = make_store()
+
+    in_process = asyncio.run(NormalizeStage(store, use_processes=False).run())
+    pooled = asyncio.run(NormalizeStage(store, max_workers=2).run())
+
+    assert [p.domain for p in in_process] == store.domains()
+    assert comparable(pooled) == comparable(in_process)
+    assert in_process[0].trust_signals.licenses_shown is True
+    assert in_process[1].trust_signals.licenses_shown is False  # SERP only
+
+
+def test_domains_are_built_with_bounded_concurrency():
+    stage = NormalizeStage(make_store(10), max_concurrent=3, use_processes=False)
+    analyze = stage._analyze_domain_content
+    running, peak = [0], [0]
+
+    async def counting(*args):
+        running[0] += 1
+        peak[0] = max(peak[0], running[0])
+        try:
+            await asyncio.sleep(0.01)
+            return await analyze(*args)
+        finally:
+            running[0] -= 1
+
+    stage._analyze_domain_content = counting
+    profiles = asyncio.run(stage.run())
+
+    assert len(profiles) == 10
+    assert peak[0] == 3
+
+
+class BrokenPool:
+    def submit(self, *args, **kwargs):
+        raise BrokenProcessPool('worker died')
+
+    def shutdown(self, wait=True):
+        pass
+
+
+def test_broken_pool_falls_back_to_in_process_analysis():
+    store = make_store(2)
+    stage = NormalizeStage(store, use_processes=False)
+    stage._executor = BrokenPool()
+
+    profiles = asyncio.run(stage.run())
+
+    assert comparable(profiles) == comparable(asyncio.run(NormalizeStage(store, use_processes=False).run()))
+    assert stage._executor is None
+
+
+def test_failing_domain_is_skipped():
+    stage = NormalizeStage(make_store(3), use_processes=False)
+    build = stage._build_competitor_profile
+
+    async def flaky(domain):
+        if domain == 'plumber1.example':
+            raise RuntimeError('bad data')
+        return await build(domain)
+
+    stage._build_competitor_profile = flaky
+    profiles = asyncio.run(stage.run())
+
+    assert [p.domain for p in profiles] == ['plumber0.example', 'plumber2.example']
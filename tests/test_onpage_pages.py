@@ -0,0 +1,149 @@
+"""
+Tests for paginated OnPage retrieval (DataForSEOClient.iter_onpage_pages)
+and the on-page audit built on it (SEOEnrichmentStrategy._get_onpage_data)
+"""
+
+import asyncio
+
+import pytest
+
+from firecrawl_scraper.core.dataforseo_client import DataForSEOClient
+from firecrawl_scraper.extraction import seo_enrichment
+from firecrawl_scraper.extraction.seo_enrichment import SEOEnrichmentStrategy
+
+
+def crawled_page(i):
+    checks = {'is_https': True, 'no_description': i % 2 == 0, 'is_broken': i % 5 == 0}
+    return {'url': f'https://a.example/{i}', 'status_code': 200, 'resource_type': 'html',
+            'onpage_score': 90, 'checks': checks}
+
+
+class FakeOnPageAPI(DataForSEOClient):
+    """
+    Serves `total` crawled pages; later offsets answer sooner so
+    concurrent requests complete out of order.
+    """
+
+    def __init__(self, total, report_total=True, fail_offsets=(), summaries=('finished',)):
+        super().__init__(login='onpage@example.com', password='secret')
+        self.total = total
+        self.report_total = report_total
+        self.fail_offsets = set(fail_offsets)
+        self.summaries = list(summaries)
+        self.page_requests = []
+        self.running = 0
+        self.peak_running = 0
+
+    async def _send(self, endpoint, method, data, cost_key):
+        if endpoint == '/on_page/task_post':
+            return {'success': True, 'cost': 0.125, 'data': [{'id': 'audit-1', 'status_code': 20100}]}
+
+        if endpoint.startswith('/on_page/summary/'):
+            progress = self.summaries.pop(0) if len(self.summaries) > 1 else self.summaries[0]
+            return {'success': True, 'cost': 0, 'data': [{'result': [{
+                'crawl_progress': progress,
+                'crawl_status': {'pages_crawled': 10, 'pages_in_queue': 5}
+            }]}]}
+
+        task = data[0]
+        self.page_requests.append(task)
+        self.running += 1
+        self.peak_running = max(self.peak_running, self.running)
+        try:
+            await asyncio.sleep(0.02 - min(task['offset'], 10_000) / 1_000_000)
+        finally:
+            self.running -= 1
+
+        if task['offset'] in self.fail_offsets:
+            return {'success': False, 'error': 'HTTP 500'}
+        stop = min(task['offset'] + task['limit'], self.total)
+        return {'success': True, 'cost': 0.001, 'data': [{'status_code': 20000, 'result': [{
+            'total_items_count': self.total if self.report_total else None,
+            'items': [crawled_page(i) for i in range(task['offset'], stop)]
+        }]}]}
+
+
+def collect(api, **kwargs):
+    async def run():
+        return [page async for page in api.iter_onpage_pages('audit-1', **kwargs)]
+    return asyncio.run(run())
+
+
+def test_pages_stream_in_offset_order_with_bounded_concurrency():
+    api = FakeOnPageAPI(total=950)
+    pages = collect(api, page_size=100, max_concurrent=3)
+
+    assert [page['offset'] for page in pages] == list(range(0, 1000, 100))
+    urls = [item['url'] for page in pages for item in page['items']]
+    assert urls == [f'https://a.example/{i}' for i in range(950)]
+    assert api.peak_running == 3
+    assert sum(page['cost'] for page in pages) == pytest.approx(10 * 0.001)
+
+
+def test_max_items_and_resource_type_shape_the_requests():
+    api = FakeOnPageAPI(total=950)
+    pages = collect(api, page_size=100, max_items=250, resource_type='broken')
+
+    assert [len(page['items']) for page in pages] == [100, 100, 50]
+    assert [(task['offset'], task['limit']) for task in api.page_requests] == [(0, 100), (100, 100), (200, 50)]
+    assert all(task['filters'] == [['resource_type', '=', 'broken']] for task in api.page_requests)
+
+
+def test_unknown_total_stops_at_the_first_short_page():
+    api = FakeOnPageAPI(total=250, report_total=False)
+    pages = collect(api, page_size=100, max_concurrent=2)
+
+    assert [len(page['items']) for page in pages] == [100, 100, 50]
+
+
+def test_failed_request_ends_the_stream_visibly():
+    api = FakeOnPageAPI(total=950, fail_offsets={300})
+    pages = collect(api, page_size=100)
+
+    assert [page['offset'] for page in pages] == [0, 100, 200, 300]
+    assert pages[-1] == {'success': False, 'offset': 300, 'error': 'HTTP 500'}
+
+
+def make_strategy(api):
+    strategy = SEOEnrichmentStrategy()
+    strategy.dataforseo = api
+    return strategy
+
+
+def test_onpage_audit_polls_until_finished_and_counts_issues(monkeypatch):
+    monkeypatch.setattr(seo_enrichment, 'ONPAGE_MIN_POLL_INTERVAL', 0.001)
+    monkeypatch.setattr(seo_enrichment, 'ONPAGE_MAX_POLL_INTERVAL', 0.005)
+    api = FakeOnPageAPI(total=1500, summaries=['in_progress', 'in_progress', 'finished'])
+
+    result = asyncio.run(make_strategy(api)._get_onpage_data('a.example', max_pages=1500))
+
+    assert result['task_id'] == 'audit-1'
+    assert result['pages_total'] == 1500
+    assert len(result['pages']) == 1500
+    assert result['pages'][3] == {'url': 'https://a.example/3', 'status_code': 200, 'resource_type': 'html',
+                                  'onpage_score': 90, 'failed_checks': []}
+    assert result['issues'] == [
+        {'check': 'no_description', 'pages_affected': 750,
+         'example_urls': [f'https://a.example/{i}' for i in (0, 2, 4, 6, 8)]},
+        {'check': 'is_broken', 'pages_affected': 300,
+         'example_urls': [f'https://a.example/{i}' for i in (0, 5, 10, 15, 20)]},
+    ]
+    assert result['cost'] == pytest.approx(0.125 + 2 * 0.001)
+    assert 'error' not in result
+
+
+def test_onpage_audit_reports_truncated_retrieval_and_unfinished_crawls(monkeypatch):
+    monkeypatch.setattr(seo_enrichment, 'ONPAGE_MIN_POLL_INTERVAL', 0.001)
+    monkeypatch.setattr(seo_enrichment, 'ONPAGE_MAX_POLL_INTERVAL', 0.005)
+
+    truncated = asyncio.run(make_strategy(FakeOnPageAPI(total=2500, fail_offsets={1000}))._get_onpage_data(
+        'a.example', max_pages=2500
+    ))
+    assert len(truncated['pages']) == 1000
+    assert truncated['error'] == 'Page retrieval stopped at offset 1000: HTTP 500'
+
+    unfinished = asyncio.run(make_strategy(FakeOnPageAPI(total=10, summaries=['in_progress']))._get_onpage_data(
+        'a.example', max_wait=0.05
+    ))
+    assert unfinished['summary'] is None and unfinished['pages'] == []
+    assert unfinished['error'] == 'Crawl not finished after 0s'
@@ -0,0 +1,112 @@
+"""
+Tests for TokenBucket, RateGovernor and the shared governors (core/rate_limiter.py)
+"""
+
+import asyncio
+import logging
+import os
+import subprocess
+import sys
+import time
+
+import pytest
+
+from firecrawl_scraper.core import rate_limiter
+from firecrawl_scraper.core.rate_limiter import RateGovernor, TokenBucket, get_governor, parse_retry_after
+
+
+@pytest.fixture
+def fresh_governors(monkeypatch):
+    """Isolate tests from the process-wide governors"""
+    monkeypatch.setattr(rate_limiter, '_GOVERNORS', {})
+
+
+def test_token_bucket_paces_after_burst():
+    bucket = TokenBucket(rate=50, capacity=2)
+
+    async def run():
+        started = time.monotonic()
+        await asyncio.gather(*[bucket.acquire() for _ in range(7)])
+        return time.monotonic() - started
+
+    # 2 from the burst, 5 more at 50/s
+    assert asyncio.run(run()) >= 0.09
+    with pytest.raises(ValueError):
+        TokenBucket(rate=0)
+
+
+def test_governor_bounds_concurrent_requests_and_jobs():
+    governor = RateGovernor('test', max_concurrent=3, max_concurrent_jobs=1)
+    peak = {'requests': 0, 'jobs': 0}
+    running = {'requests': 0, 'jobs': 0}
+
+    async def hold(kind, context):
+        async with context:
+            running[kind] += 1
+            peak[kind] = max(peak[kind], running[kind])
+            await asyncio.sleep(0.01)
+            running[kind] -= 1
+
+    async def run():
+        await asyncio.gather(
+            *[hold('requests', governor.request()) for _ in range(10)],
+            *[hold('jobs', governor.job()) for _ in range(3)]
+        )
+
+    asyncio.run(run())
+
+    assert peak == {'requests': 3, 'jobs': 1}
+    assert governor.get_stats()['requests'] == 10
+
+
+def test_pause_holds_every_caller():
+    governor = RateGovernor('test')
+
+    async def run():
+        governor.pause(0.05)
+        started = time.monotonic()
+        async with governor.request():
+            return time.monotonic() - started
+
+    assert asyncio.run(run()) >= 0.045
+    assert governor.stats['rate_limit_pauses'] == 1
+
+
+def test_parse_retry_after():
+    assert parse_retry_after('12') == 12.0
+    assert parse_retry_after('-3') == 0.0
+    assert parse_retry_after('Wed, 21 Oct 2015 07:28:00 GMT') == 0.0
+    assert parse_retry_after('soon') is None
+    assert parse_retry_after(None) is None
+
+
+def test_governor_limits_come_from_env(monkeypatch, fresh_governors):
+    monkeypatch.setenv('FIRECRAWL_REQUESTS_PER_SECOND', '2.5')
+    monkeypatch.setenv('FIRECRAWL_MAX_CONCURRENT', '0')  # disables the limit
+
+    governor = get_governor('firecrawl')
+
+    assert governor.requests_per_second == 2.5
+    assert governor.max_concurrent is None
+    assert governor.max_concurrent_jobs == 10
+    assert get_governor('firecrawl') is governor
+
+
+def test_malformed_env_value_falls_back_to_default(monkeypatch, fresh_governors, caplog):
+    monkeypatch.setenv('DATAFORSEO_MAX_CONCURRENT', 'thirty')
+
+    with caplog.at_level(logging.WARNING, logger=rate_limiter.__name__):
+        governor = get_governor('dataforseo')
+
+    assert governor.max_concurrent == 30
+    assert 'DATAFORSEO_MAX_CONCURRENT' in caplog.text
+
+
+def test_malformed_env_value_does_not_break_import():
+    env = {**os.environ, 'FIRECRAWL_REQUESTS_PER_SECOND': 'fast'}
+    result = subprocess.run(
+        [sys.executable, '-c', 'import firecrawl_scraper.core.rate_limiter'],
+        env=env, capture_output=True, text=True,
+        cwd=os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    )
+    assert result.returncode == 0, result.stderr
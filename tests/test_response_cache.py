@@ -0,0 +1,128 @@
+"""
+Tests for the persistent Firecrawl response cache (core/response_cache.py)
+"""
+
+import asyncio
+import gzip
+import json
+import os
+import time
+
+from firecrawl_scraper.core.firecrawl_client import EnhancedFirecrawlClient
+from firecrawl_scraper.core.response_cache import ResponseCache
+
+
+def make_client(tmp_path, **kwargs):
+    client = EnhancedFirecrawlClient(api_key='fc-test', cache_dir=str(tmp_path / 'cache'), **kwargs)
+    calls = []
+
+    async def fake_execute(endpoint, payload, method='POST', credits=1, **_):
+        calls.append((endpoint, payload))
+        return {'success': True, 'data': {'markdown': f"# {payload['url']}"}}
+
+    client._execute_with_retry = fake_execute
+    return client, calls
+
+
+def test_key_ignores_url_case_fragment_and_format_order():
+    a = ResponseCache.make_key('scrape', {'url': 'https://Example.com/page#top', 'formats': ['html', 'markdown']})
+    b = ResponseCache.make_key('scrape', {'url': 'https://example.com/page', 'formats': ['markdown', 'html']})
+    c = ResponseCache.make_key('scrape', {'url': 'https://example.com/other', 'formats': ['markdown', 'html']})
+
+    assert a == b
+    assert a != c
+    assert ResponseCache.make_key('map', {'url': 'https://example.com/page'}) != \
+        ResponseCache.make_key('scrape', {'url': 'https://example.com/page'})
+
+
+def test_roundtrip_and_ttl_expiry(tmp_path):
+    cache = ResponseCache(str(tmp_path))
+    cache.set('k', {'success': True, 'data': [1, 2]})
+
+    assert cache.get('k') == {'success': True, 'data': [1, 2]}
+    assert cache.get('k', ttl=60) is not None
+
+    # Age the entry past its TTL
+    path = tmp_path / 'k.json.gz'
+    entry_age = time.time() - 120
+    with gzip.open(path, 'wt', encoding='utf-8') as f:
+        json.dump({'stored_at': entry_age, 'response': {'stale': True}}, f)
+
+    assert cache.get('k', ttl=60) is None
+    assert not path.exists()
+
+
+def two_entry_bound(tmp_path, payload):
+    """Size bound (MB) that fits two entries of payload but not three"""
+    probe = ResponseCache(str(tmp_path / 'probe'))
+    probe.set('x', payload)
+    return probe.get_stats()['size_bytes'] * 2.5 / (1024 * 1024)
+
+
+def test_lru_eviction_keeps_recently_read_entries(tmp_path):
+    payload = {'data': os.urandom(4096).hex()}
+    cache = ResponseCache(str(tmp_path / 'cache'), max_size_mb=two_entry_bound(tmp_path, payload))
+
+    cache.set('a', payload)
+    cache.set('b', payload)
+    assert cache.get('a') is not None  # 'a' becomes most recently used
+    cache.set('c', payload)
+
+    stats = cache.get_stats()
+    assert stats['size_bytes'] <= stats['max_bytes']
+    assert cache.get('b') is None
+    assert cache.get('a') is not None
+    assert cache.get('c') is not None
+
+
+def test_lru_order_survives_restart(tmp_path):
+    payload = {'data': os.urandom(4096).hex()}
+    bound = two_entry_bound(tmp_path, payload)
+    cache_dir = tmp_path / 'cache'
+    cache = ResponseCache(str(cache_dir), max_size_mb=bound)
+    cache.set('a', payload)
+    cache.set('b', payload)
+    now = time.time()
+    os.utime(cache_dir / 'a.json.gz', (now + 10, now + 10))  # 'a' read most recently
+
+    reopened = ResponseCache(str(cache_dir), max_size_mb=bound)
+    reopened.set('c', payload)
+
+    assert reopened.get('b') is None
+    assert reopened.get('a') is not None
+
+
+def test_client_serves_repeat_scrape_from_cache(tmp_path):
+    client, calls = make_client(tmp_path)
+
+    async def run():
+        first = await client.scrape('https://example.com')
+        second = await client.scrape('https://EXAMPLE.com/')
+        return first, second
+
+    first, second = asyncio.run(run())
+
+    assert len(calls) == 1
+    assert first['creditsUsed'] == 1
+    assert second['fromCache'] is True
+    assert second['creditsUsed'] == 0
+    assert second['data'] == first['data']
+    assert client.stats.cache_hits == 1
+
+
+def test_client_refresh_and_bypass_policies(tmp_path):
+    client, calls = make_client(tmp_path)
+
+    async def run():
+        await client.scrape('https://example.com')
+        refreshed = await client.scrape('https://example.com', cache_policy='refresh')
+        bypassed = await client.scrape('https://example.com/new', cache_policy='bypass')
+        cached_after_bypass = await client.scrape('https://example.com/new')
+        return refreshed, bypassed, cached_after_bypass
+
+    refreshed, bypassed, cached_after_bypass = asyncio.run(run())
+
+    assert 'fromCache' not in refreshed
+    assert 'fromCache' not in bypassed
+    assert 'fromCache' not in cached_after_bypass  # bypass did not write
+    assert len(calls) == 4
@@ -0,0 +1,137 @@
+"""
+Tests for in-flight request coalescing (core/single_flight.py and its use
+by both API clients)
+"""
+
+import asyncio
+
+import pytest
+
+from firecrawl_scraper.core.dataforseo_client import DataForSEOClient
+from firecrawl_scraper.core.firecrawl_client import EnhancedFirecrawlClient
+from firecrawl_scraper.core.single_flight import SingleFlight
+
+
+def test_concurrent_calls_with_one_key_share_one_execution():
+    flights = SingleFlight('test')
+    calls = []
+
+    async def fetch(name):
+        calls.append(name)
+        await asyncio.sleep(0.01)
+        return {'value': name}
+
+    async def run():
+        return await asyncio.gather(
+            flights.do('a', lambda: fetch('first')),
+            flights.do('a', lambda: fetch('second')),
+            flights.do('b', lambda: fetch('other')),
+        )
+
+    (first, first_shared), (second, second_shared), (other, _) = asyncio.run(run())
+
+    assert calls == ['first', 'other']
+    assert first == second == {'value': 'first'}
+    assert (first_shared, second_shared) == (False, True)
+    assert second is not first  # Shared results are copies
+    assert other == {'value': 'other'}
+    assert flights.in_flight == 0
+    assert flights.get_stats()['coalesced'] == 1
+
+
+def test_cancelled_waiter_does_not_cancel_shared_call():
+    flights = SingleFlight('test')
+
+    async def fetch():
+        await asyncio.sleep(0.02)
+        return 'done'
+
+    async def run():
+        leader = asyncio.ensure_future(flights.do('k', fetch))
+        follower = asyncio.ensure_future(flights.do('k', fetch))
+        await asyncio.sleep(0.005)
+        leader.cancel()
+        return await follower
+
+    assert asyncio.run(run()) == ('done', True)
+
+
+def test_failure_reaches_every_waiter_and_is_not_kept():
+    flights = SingleFlight('test')
+    attempts = []
+
+    async def fetch():
+        attempts.append(1)
+        await asyncio.sleep(0.01)
+        raise RuntimeError('boom')
+
+    async def run():
+        results = await asyncio.gather(flights.do('k', fetch), flights.do('k', fetch), return_exceptions=True)
+        with pytest.raises(RuntimeError):
+            await flights.do('k', fetch)
+        return results
+
+    results = asyncio.run(run())
+
+    assert all(isinstance(r, RuntimeError) for r in results)
+    assert len(attempts) == 2
+
+
+def firecrawl_client(api_key, calls):
+    client = EnhancedFirecrawlClient(api_key=api_key)
+
+    async def fake_execute(endpoint, payload, method='POST', credits=1, **_):
+        calls.append(api_key)
+        await asyncio.sleep(0.01)
+        return {'success': True, 'data': {'markdown': '# page'}}
+
+    client._execute_with_retry = fake_execute
+    return client
+
+
+def test_firecrawl_coalesces_only_within_one_api_key():
+    calls = []
+    a1, a2 = firecrawl_client('fc-a', calls), firecrawl_client('fc-a', calls)
+    b = firecrawl_client('fc-b', calls)
+
+    async def run():
+        return await asyncio.gather(*[
+            client.scrape('https://example.com', cache_policy='bypass') for client in (a1, a2, b)
+        ])
+
+    first, second, other = asyncio.run(run())
+
+    assert sorted(calls) == ['fc-a', 'fc-b']
+    assert second['coalesced'] is True and second['creditsUsed'] == 0
+    assert 'coalesced' not in other
+    assert other['creditsUsed'] == first['creditsUsed']
+
+
+class FakeDataForSEO(DataForSEOClient):
+    def __init__(self, login, calls):
+        super().__init__(login=login, password='secret')
+        self.calls = calls
+
+    async def _send(self, endpoint, method, data, cost_key):
+        self.calls.append(self.login)
+        await asyncio.sleep(0.01)
+        return {'success': True, 'data': [{'id': f'{self.login}-task'}], 'cost': 0.002}
+
+
+def test_dataforseo_coalesces_only_within_one_account():
+    calls = []
+    clients = [FakeDataForSEO('a@example.com', calls), FakeDataForSEO('a@example.com', calls),
+               FakeDataForSEO('b@example.com', calls)]
+    task = [{'keyword': 'plumber', 'location_name': 'Austin,Texas,United States'}]
+
+    async def run():
+        return await asyncio.gather(*[client._request('/serp/google/organic/task_post', data=task)
+                                      for client in clients])
+
+    first, second, other = asyncio.run(run())
+
+    assert sorted(calls) == ['a@example.com', 'b@example.com']
+    assert second['coalesced'] is True and second['cost'] == 0
+    assert first['data'] == second['data']
+    assert other['data'] == [{'id': 'b@example.com-task'}]
+    assert other['cost'] == 0.002
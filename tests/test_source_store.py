@@ -0,0 +1,100 @@
+"""
+Tests for the columnar pipeline source store (pipeline/source_store.py)
+"""
+
+from datetime import datetime, timedelta
+
+import pytest
+
+from firecrawl_scraper.models import DataFreshness, GeoTag, ScrapeStatus, SourceType
+from firecrawl_scraper.pipeline.source_store import SourceStore
+
+
+def fill(store):
+    austin = GeoTag(city='Austin', state='TX')
+    store.add(SourceType.SERP_ORGANIC, 'https://a.example/', domain='a.example',
+              serp_position=1, geo_tags=[austin], keywords_targeted=['plumber'],
+              raw_data={'rank': 1})
+    store.add(SourceType.COMPETITOR_WEBSITE, 'https://a.example/', domain='a.example',
+              scrape_status=ScrapeStatus.SUCCESS, raw_data={'markdown': '# A ' * 100})
+    store.add(SourceType.SERP_ORGANIC, 'https://b.example/', domain='b.example',
+              serp_position=2, geo_tags=[austin])
+    store.add(SourceType.SERP_LOCAL_PACK, 'https://maps.example/', raw_data={'title': 'No domain'})
+    return store
+
+
+def test_rows_roundtrip_through_columns_and_indexes():
+    store = fill(SourceStore())
+
+    assert len(store) == 4
+    assert store.domains() == ['a.example', 'b.example']
+    assert list(store.rows_for_domain('a.example')) == [0, 1]
+    assert list(store.rows_for_domain('missing.example')) == []
+    assert list(store.rows_for_type(SourceType.SERP_ORGANIC)) == [0, 2]
+    assert store.count_by_type() == {'serp_organic': 2, 'competitor_website': 1, 'serp_local_pack': 1}
+
+    source = store.get(0, with_raw=True)
+    assert source.serp_position == 1
+    assert source.keywords_targeted == ['plumber']
+    assert source.geo_tags[0].city == 'Austin'
+    assert source.raw_data == {'rank': 1}
+    assert store.get(0).raw_data is None
+    assert store.get(2).raw_data is None and store.raw(2) is None
+    assert store.get(3).domain is None
+    assert store.scrape_status(1) is ScrapeStatus.SUCCESS
+
+
+def test_from_sources_keeps_ids_and_payloads():
+    original = fill(SourceStore())
+    copy = SourceStore.from_sources(original.to_sources(with_raw=True))
+
+    assert [s.id for s in copy] == [s.id for s in original]
+    assert copy.raw(1) == original.raw(1)
+    assert SourceStore.from_sources(original) is original
+
+
+def test_spilled_payloads_and_extend_between_modes(tmp_path):
+    with SourceStore(str(tmp_path / 'payloads.bin')) as spilled:
+        fill(spilled)
+        assert spilled._payloads == []
+        assert (tmp_path / 'payloads.bin').stat().st_size > 0
+        assert spilled.raw(1)['markdown'].startswith('# A')
+
+        in_memory = SourceStore()
+        in_memory.extend(spilled, rows=spilled.rows_for_domain('a.example'))
+        assert [in_memory.source_id(row) for row in range(2)] == [spilled.source_id(0), spilled.source_id(1)]
+        assert in_memory.raw(1) == spilled.raw(1)
+
+        spilled.extend(in_memory)
+        assert len(spilled) == 6
+        assert spilled.raw(5) == spilled.raw(1)
+
+
+def test_closed_spill_file_keeps_metadata_readable(tmp_path):
+    store = fill(SourceStore(str(tmp_path / 'payloads.bin')))
+    with store:
+        pass
+
+    assert store._payload_file is None
+    assert store.url(1) == 'https://a.example/'
+    assert store.get(1).domain == 'a.example'
+    with pytest.raises(ValueError):
+        store.raw(1)
+    with pytest.raises(ValueError):
+        store.add(SourceType.SERP_ORGANIC, 'https://c.example/', raw_data={})
+    store.close()  # Idempotent
+
+
+def test_update_freshness_from_scraped_at():
+    now = datetime(2024, 6, 30)
+    store = SourceStore()
+    for days in (1, 10, 45):
+        store.add(SourceType.COMPETITOR_PAGE, f'https://a.example/{days}', scraped_at=now - timedelta(days=days))
+    store.add(SourceType.COMPETITOR_PAGE, 'https://a.example/never')
+
+    store.update_freshness(now)
+
+    assert [store.data_freshness(row) for row in range(4)] == [
+        DataFreshness.CURRENT, DataFreshness.RECENT, DataFreshness.STALE, DataFreshness.STALE
+    ]
+    assert store.get(1).freshness_days == 10
@@ -0,0 +1,97 @@
+"""
+Tests for incremental pipeline re-runs (pipeline/stage_cache.py and its use
+by the orchestrator and the normalize stage)
+"""
+
+import asyncio
+from datetime import datetime, timedelta
+
+from firecrawl_scraper.models import Client, SourceType, Vertical
+from firecrawl_scraper.models.entities import Service
+from firecrawl_scraper.models.geo import GeoBucket, GeoScope, Location
+from firecrawl_scraper.pipeline import PipelineOrchestrator
+from firecrawl_scraper.pipeline.source_store import SourceStore
+from firecrawl_scraper.pipeline.stage_3_normalize import NormalizeStage
+from firecrawl_scraper.pipeline.stage_cache import StageCache, fingerprint
+
+
+def make_client(services=('Drain cleaning',)):
+    return Client(
+        id='client', name='Acme Plumbing', vertical=Vertical.PLUMBING,
+        services=[
+            Service(id=f's{i}', name=name, slug=name.lower().replace(' ', '-'), is_money_service=True)
+            for i, name in enumerate(services)
+        ],
+        locations=[Location(id='l1', name='Austin, TX', geo_scope=GeoScope.LOCAL_RADIUS,
+                            geo_bucket=GeoBucket.BUCKET_0_10, is_primary=True)]
+    )
+
+
+def test_fingerprint_ignores_build_timestamps():
+    client = make_client()
+    rebuilt = client.model_copy(update={'created_at': datetime(2020, 1, 1)})
+
+    assert fingerprint('plan', client) == fingerprint('plan', rebuilt)
+    assert fingerprint('plan', client) != fingerprint('plan', make_client(('Water heaters',)))
+    assert fingerprint('plan', client) != fingerprint('score', client)
+
+
+def test_entries_and_sources_roundtrip(tmp_path):
+    cache = StageCache(str(tmp_path))
+    cache.set('plan', 'abc', {'cells': [1, 2]})
+
+    assert cache.get('plan', 'abc') == {'cells': [1, 2]}
+    assert cache.get('plan', 'missing') is None
+    (tmp_path / 'plan' / 'bad.json.gz').write_bytes(b'not gzip')
+    assert cache.get('plan', 'bad') is None
+    assert cache.get_stats()['hits'] == 1 and cache.get_stats()['misses'] == 2
+
+    store = SourceStore()
+    store.add(SourceType.COMPETITOR_WEBSITE, 'https://a.example/', domain='a.example',
+              raw_data={'markdown': '# A'})
+    cache.save_sources('client', store)
+    loaded = cache.load_sources('client')
+
+    assert loaded.source_id(0) == store.source_id(0)
+    assert loaded.raw(0) == {'markdown': '# A'}
+    assert cache.load_sources('other') is None
+
+
+def test_orchestrator_caches_only_when_asked(tmp_path):
+    def run(**kwargs):
+        return asyncio.run(PipelineOrchestrator(make_client(), output_dir=str(tmp_path), **kwargs).run())
+
+    assert run().cached_stages == []
+    assert run().cached_stages == []
+    assert not (tmp_path / '_stage_cache').exists()
+
+    assert run(use_cache=True).cached_stages == []
+    assert run(use_cache=True).cached_stages == ['plan', 'score', 'export']
+
+    changed = asyncio.run(PipelineOrchestrator(
+        make_client(('Drain cleaning', 'Water heaters')), output_dir=str(tmp_path), use_cache=True
+    ).run())
+    assert 'plan' not in changed.cached_stages
+
+
+def test_normalize_cache_follows_source_freshness(tmp_path):
+    cache = StageCache(str(tmp_path))
+    scraped = datetime(2024, 6, 1)
+    store = SourceStore()
+    store.add(SourceType.COMPETITOR_WEBSITE, 'https://a.example/', domain='a.example',
+              scraped_at=scraped, raw_data={'markdown': '# Licensed plumbers'})
+    store.add(SourceType.SERP_ORGANIC, 'https://a.example/', domain='a.example',
+              scraped_at=scraped, serp_position=1)
+
+    def normalize():
+        return asyncio.run(NormalizeStage(store, cache=cache, use_processes=False).run())[0]
+
+    store.update_freshness(scraped + timedelta(days=1))
+    fresh = normalize()
+    assert normalize().confidence_score == fresh.confidence_score
+    assert cache.stats['hits'] == 1
+
+    store.update_freshness(scraped + timedelta(days=60))
+    stale = normalize()
+    assert cache.stats['hits'] == 1  # Same source ids, new freshness -> rebuilt
+    assert stale.confidence_score < fresh.confidence_score
@@ -0,0 +1,105 @@
+"""
+Tests for DataForSEO standard-queue execution (core/task_queue.py)
+"""
+
+import asyncio
+
+from firecrawl_scraper.core.dataforseo_client import DataForSEOClient
+
+SERP = '/serp/google/organic/live/advanced'
+BASE = '/serp/google/organic'
+
+
+class FakeQueueAPI(DataForSEOClient):
+    """
+    Scripted task_post / tasks_ready / task_get responses.
+
+    `gets` lists what successive task_get calls do: 'error' (unsuccessful
+    response), 'raise', 'pending' or 'ready'; the last entry repeats.
+    """
+
+    def __init__(self, gets=('ready',), **kwargs):
+        super().__init__(login='queue@example.com', password='secret',
+                         queue_poll_interval=0.005, **kwargs)
+        self.queue.flush_delay = 0.001
+        self.gets = list(gets)
+        self.requests = []
+        self.posted = 0
+
+    async def _send(self, endpoint, method, data, cost_key):
+        self.requests.append(endpoint)
+        await asyncio.sleep(0.001)
+
+        if endpoint.endswith('/task_post'):
+            tasks = []
+            for task in data:
+                self.posted += 1
+                tasks.append({'id': f"task-{task['keyword']}", 'status_code': 20100, 'cost': 0.0006})
+            return {'success': True, 'data': tasks, 'cost': 0.0006 * len(data)}
+
+        if endpoint.endswith('/tasks_ready'):
+            ids = {path.rsplit('/', 1)[1] for path in self.requests if '/task_get/' in path}
+            ids.update(f"task-{keyword}" for keyword in ('plumber', 'drain'))
+            return {'success': True, 'data': [{'result': [{'id': task_id} for task_id in sorted(ids)]}]}
+
+        task_id = endpoint.rsplit('/', 1)[1]
+        outcome = self.gets.pop(0) if len(self.gets) > 1 else self.gets[0]
+        if outcome == 'raise':
+            raise RuntimeError('connection reset')
+        if outcome == 'error':
+            return {'success': False, 'error': 'HTTP 500'}
+        if outcome == 'pending':
+            return {'success': True, 'data': [{'id': task_id, 'status_code': 40602,
+                                               'status_message': 'Task In Queue.'}]}
+        return {'success': True, 'data': [{'id': task_id, 'status_code': 20000,
+                                           'status_message': 'Ok.', 'result': [{'keyword': task_id}]}]}
+
+
+def submit_all(api, keywords):
+    async def run():
+        futures = [api.queue.submit(SERP, {'keyword': keyword}) for keyword in keywords]
+        try:
+            return await asyncio.wait_for(asyncio.gather(*futures), timeout=5)
+        finally:
+            await api.queue.close()
+
+    return asyncio.run(run())
+
+
+def task_gets(api):
+    return [endpoint for endpoint in api.requests if '/task_get/' in endpoint]
+
+
+def test_tasks_post_together_and_resolve_when_ready():
+    api = FakeQueueAPI()
+    plumber, drain = submit_all(api, ['plumber', 'drain'])
+
+    assert api.requests.count(f'{BASE}/task_post') == 1
+    assert plumber['success'] and plumber['data'][0]['result'] == [{'keyword': 'task-plumber'}]
+    assert drain['data'][0]['id'] == 'task-drain'
+    assert plumber['cost'] == 0.0006
+    assert api.queue.stats['collected'] == 2 and api.queue.stats['failed'] == 0
+
+
+def test_transient_task_get_failures_are_retried_without_reposting():
+    api = FakeQueueAPI(gets=['error', 'raise', 'pending', 'ready'])
+    (result,) = submit_all(api, ['plumber'])
+
+    assert result['success'] is True
+    assert result['status_code'] == 20000
+    assert api.posted == 1
+    assert len(task_gets(api)) == 4
+    assert api.queue.stats['failed'] == 0
+    assert api.queue.outstanding == 0
+
+
+def test_task_fails_once_it_expires():
+    api = FakeQueueAPI(gets=['pending'], queue_max_wait=0.05)
+    (result,) = submit_all(api, ['plumber'])
+
+    assert result['success'] is False
+    assert result['error'] == 'Task not ready after 0s'
+    assert result['task_id'] == 'task-plumber'
+    assert api.posted == 1
+    assert len(task_gets(api)) > 1
+    assert api.queue.stats['expired'] == 1